@@ -0,0 +1,152 @@
+"""
+示例近邻索引基准测试
+
+用风险词汇、模式示例片段和无风险短语生成合成示例库，查询为随机改写过的示例（近似重复的改写），
+对比 IVF 近似检索在不同探查列表数下的召回率（对精确检索前 k 名）、来源示例命中率、
+单次查询延迟与精确检索（与全部示例逐一比较）。
+
+用法（在项目根目录执行）:
+    python -m benchmarks.bench_ann                         # 默认 50000 条示例，500 条查询
+    python -m benchmarks.bench_ann --examples 200000 --probes 4 8 16
+"""
+import argparse
+import os
+import random
+import re
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
+
+from src.risk_analyzer.ann_index import ExampleIndex, pattern_examples
+from src.risk_analyzer.filler import FillerTable
+from src.risk_analyzer.similarity import NgramHasher
+from src.utils import serialization
+from benchmarks.bench_pipeline import percentile
+from benchmarks.synthetic import FILLER_PHRASES, load_risk_terms
+
+ROOT_DIR = os.path.abspath(os.path.dirname(os.path.dirname(__file__)))
+DEFAULT_PATTERNS = os.path.join(ROOT_DIR, "data", "risk_patterns.json")
+
+_CLAUSE_RE = re.compile(r"[，。、；,;]")
+
+
+def synthetic_library(count, seed=0, patterns_file=DEFAULT_PATTERNS):
+    """
+    生成合成示例库
+
+    Args:
+        count (int): 示例数
+        seed (int): 随机种子
+        patterns_file (str): 风险模式定义文件，示例片段和模式ID取自其中
+
+    Returns:
+        tuple: ([(模式ID, 文本)], [每条示例的片段列表])
+    """
+    rng = random.Random(seed)
+    patterns = serialization.load_file(patterns_file) if os.path.exists(patterns_file) else {}
+    clauses = {}
+    for pattern_id, text in pattern_examples(patterns):
+        clauses.setdefault(pattern_id, []).extend(c for c in _CLAUSE_RE.split(text) if c.strip())
+    pattern_ids = sorted(clauses) or ["P0"]
+    terms = load_risk_terms() or ["风险"]
+
+    examples = []
+    pieces = []
+    for _ in range(count):
+        pattern_id = rng.choice(pattern_ids)
+        parts = rng.sample(clauses.get(pattern_id, [""]), 1) + rng.sample(terms, min(len(terms), rng.randint(4, 8)))
+        parts.append(rng.choice(FILLER_PHRASES))
+        rng.shuffle(parts)
+        examples.append((pattern_id, "，".join(parts)))
+        pieces.append(parts)
+    return examples, pieces
+
+
+def rewrite_queries(pieces, count, seed=1):
+    """
+    随机取示例，删掉约四分之一的片段、加入一个新的风险词汇并打乱顺序，作为查询
+
+    Returns:
+        tuple: (查询文本列表, 各查询改写自的示例下标)
+    """
+    rng = random.Random(seed)
+    terms = load_risk_terms() or ["风险"]
+    queries = []
+    sources = []
+    for _ in range(count):
+        source = rng.randrange(len(pieces))
+        parts = list(pieces[source])
+        keep = max(1, len(parts) - max(1, len(parts) // 4))
+        parts = rng.sample(parts, keep) + rng.sample(terms, 1)
+        rng.shuffle(parts)
+        queries.append("，".join(parts))
+        sources.append(source)
+    return queries, sources
+
+
+def recall(approximate, exact):
+    """近似结果对精确结果的召回率，相似度与精确结果第 k 名相同的示例也算命中"""
+    hits = total = 0
+    for found, expected in zip(approximate, exact):
+        if not expected:
+            continue
+        threshold = expected[-1][1]
+        expected_ids = {example for example, _ in expected}
+        hits += sum(1 for example, score in found if example in expected_ids or score >= threshold)
+        total += len(expected)
+    return hits / total if total else 1.0
+
+
+def source_recall(found, sources):
+    """结果中包含查询改写来源示例的比例"""
+    hits = sum(1 for results, source in zip(found, sources) if any(example == source for example, _ in results))
+    return hits / len(sources) if sources else 1.0
+
+
+def time_queries(search, queries):
+    """逐条查询，返回 (结果, 各次查询耗时毫秒)"""
+    results = []
+    latencies = []
+    for query in queries:
+        start = time.perf_counter()
+        results.extend(search([query]))
+        latencies.append((time.perf_counter() - start) * 1000)
+    return results, latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description="示例近邻索引基准测试")
+    parser.add_argument("--examples", type=int, default=50000, help="合成示例数 (默认: 50000)")
+    parser.add_argument("--queries", type=int, default=500, help="查询数 (默认: 500)")
+    parser.add_argument("--top-k", type=int, default=5, help="每条查询返回的示例数 (默认: 5)")
+    parser.add_argument("--lists", type=int, help="倒排列表数 (默认: 示例数的平方根)")
+    parser.add_argument("--probes", type=int, nargs="+", default=[1, 2, 4, 8, 16, 32], help="探查列表数")
+    args = parser.parse_args()
+
+    examples, pieces = synthetic_library(args.examples)
+    queries, sources = rewrite_queries(pieces, args.queries)
+
+    start = time.perf_counter()
+    index = ExampleIndex.build(examples, NgramHasher(filler=FillerTable()), lists=args.lists)
+    build_seconds = time.perf_counter() - start
+    with tempfile.TemporaryDirectory() as path:
+        index.save(path)
+        start = time.perf_counter()
+        index = ExampleIndex.load(path, FillerTable())
+        load_ms = (time.perf_counter() - start) * 1000
+
+        print(f"示例: {index.size}，倒排列表: {index.lists}，构建: {build_seconds:.2f}s，内存映射加载: {load_ms:.1f}ms")
+        exact, latencies = time_queries(lambda texts: index.exact_search(texts, args.top_k), queries)
+        print(f"{'检索方式':<12}{'召回率':>8}{'来源命中':>10}{'p50(ms)':>10}{'p99(ms)':>10}")
+        print(f"{'exact':<12}{1.0:>8.3f}{source_recall(exact, sources):>10.3f}"
+              f"{percentile(latencies, 50):>10.3f}{percentile(latencies, 99):>10.3f}")
+        for probes in args.probes:
+            found, latencies = time_queries(lambda texts: index.search(texts, args.top_k, probes), queries)
+            print(f"{f'ivf/{probes}':<12}{recall(found, exact):>8.3f}{source_recall(found, sources):>10.3f}"
+                  f"{percentile(latencies, 50):>10.3f}{percentile(latencies, 99):>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
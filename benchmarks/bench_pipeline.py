@@ -0,0 +1,276 @@
+"""
+检测流程性能基准测试
+
+分别统计各阶段（关键词扫描、风险类别、风险模式、语义网络、多角色、评分）和端到端分析的
+延迟分位数、吞吐量和内存峰值，并与保存的基线对比以发现性能回退。
+
+用法（在项目根目录执行）:
+    python -m benchmarks.bench_pipeline                   # 运行并输出报告
+    python -m benchmarks.bench_pipeline --save-baseline   # 运行并保存为基线
+    python -m benchmarks.bench_pipeline --check           # 与基线对比，出现回退时返回非零退出码
+"""
+import argparse
+import glob
+import logging
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
+
+from src.risk_analyzer.risk_detector import RiskDetector
+from src.risk_analyzer.conversation_analyzer import ConversationAnalyzer
+from src.risk_analyzer.term_index import turn_contents
+from src.utils import serialization
+from benchmarks.synthetic import load_risk_terms, synthetic_workloads
+
+ROOT_DIR = os.path.abspath(os.path.dirname(os.path.dirname(__file__)))
+DEFAULT_BASELINE = os.path.join(ROOT_DIR, "benchmarks", "baselines", "pipeline.json")
+
+STAGES = ("scan", "categories", "patterns", "semantic", "multi_role", "scoring", "total")
+
+logger = logging.getLogger(__name__)
+
+
+def percentile(values, pct):
+    """计算分位数（最近秩法）"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100.0 * len(ordered) + 0.5)) - 1))
+    return ordered[index]
+
+
+def load_example_workloads(examples_dir):
+    """加载examples目录下的会话文件作为工作负载"""
+    workloads = {}
+    for path in sorted(glob.glob(os.path.join(examples_dir, "*.json"))):
+        name = "example_" + os.path.splitext(os.path.basename(path))[0]
+        workloads[name] = serialization.load_file(path)
+    return workloads
+
+
+def run_stages(detector, analyzer, conversation):
+    """
+    依次执行检测流程各阶段，返回各阶段耗时（秒）
+
+    阶段划分与 RiskDetector.detect_conversation_risks 一致
+    """
+    timings = {}
+    ruleset = detector.ruleset
+    texts = [turn.get("content", "").strip() for turn in conversation
+             if isinstance(turn, dict) and turn.get("content", "").strip()]
+
+    start = time.perf_counter()
+    hits = ruleset.term_index.scan(turn_contents(conversation), token_positions=ruleset.rule_engine.needs_tokens)
+    timings["scan"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    risk_categories = detector._detect_risk_categories(texts, ruleset, hits=hits)
+    timings["categories"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    risk_patterns, _ = detector._detect_risk_patterns_with_details(conversation, risk_categories, ruleset, hits=hits)
+    timings["patterns"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    semantic_risks = detector._detect_semantic_risks(conversation, ruleset)
+    timings["semantic"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    multi_role_risks = detector._detect_multi_role_risks(conversation, ruleset)
+    timings["multi_role"] = time.perf_counter() - start
+
+    combined = list(risk_patterns)
+    for pattern in multi_role_risks.get("risk_patterns", []):
+        if pattern["pattern_id"] not in combined:
+            combined.append(pattern["pattern_id"])
+    risk_result = {
+        "risk_categories": risk_categories,
+        "risk_patterns": combined,
+        "semantic_risks": semantic_risks,
+        "multi_role_risks": multi_role_risks,
+    }
+    start = time.perf_counter()
+    analyzer._calculate_enhanced_risk_score(conversation, risk_result)
+    timings["scoring"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    analyzer.analyze_conversation(conversation)
+    timings["total"] = time.perf_counter() - start
+
+    return timings
+
+
+def measure_memory(analyzer, conversation):
+    """测量一次端到端分析的内存峰值（KB）"""
+    tracemalloc.start()
+    try:
+        analyzer.analyze_conversation(conversation)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return round(peak / 1024.0, 1)
+
+
+def benchmark_workload(detector, analyzer, conversation, iterations, warmup=1):
+    """
+    对单个工作负载运行基准测试
+
+    Returns:
+        dict: 各阶段延迟统计、吞吐量和内存峰值
+    """
+    for _ in range(warmup):
+        run_stages(detector, analyzer, conversation)
+
+    samples = {stage: [] for stage in STAGES}
+    for _ in range(iterations):
+        for stage, seconds in run_stages(detector, analyzer, conversation).items():
+            samples[stage].append(seconds)
+
+    stages = {}
+    for stage, values in samples.items():
+        stages[stage] = {
+            "mean_ms": round(sum(values) / len(values) * 1000, 4),
+            "p50_ms": round(percentile(values, 50) * 1000, 4),
+            "p95_ms": round(percentile(values, 95) * 1000, 4),
+            "p99_ms": round(percentile(values, 99) * 1000, 4),
+        }
+
+    total_mean = sum(samples["total"]) / len(samples["total"])
+    return {
+        "turns": len(conversation),
+        "stages": stages,
+        "throughput_conversations_per_s": round(1.0 / total_mean, 2) if total_mean else 0.0,
+        "throughput_turns_per_s": round(len(conversation) / total_mean, 1) if total_mean else 0.0,
+        "peak_memory_kb": measure_memory(analyzer, conversation),
+    }
+
+
+def run_benchmarks(iterations=5, include_examples=True, include_synthetic=True, name_filter=None):
+    """
+    运行全部工作负载的基准测试
+
+    Returns:
+        dict: 基准测试报告
+    """
+    detector = RiskDetector(patterns_file=os.path.join(ROOT_DIR, "data", "risk_patterns.json"),
+                            vocabulary_file=os.path.join(ROOT_DIR, "data", "vocabulary.json"))
+    analyzer = ConversationAnalyzer(risk_detector=detector)
+
+    workloads = {}
+    if include_examples:
+        workloads.update(load_example_workloads(os.path.join(ROOT_DIR, "examples")))
+    if include_synthetic:
+        workloads.update(synthetic_workloads(load_risk_terms(detector.config_loader)))
+    if name_filter:
+        workloads = {name: conv for name, conv in workloads.items() if name_filter in name}
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "iterations": iterations,
+        },
+        "workloads": {}
+    }
+    for name, conversation in workloads.items():
+        report["workloads"][name] = benchmark_workload(detector, analyzer, conversation, iterations)
+    return report
+
+
+def compare_with_baseline(report, baseline, tolerance=0.25, min_delta_ms=0.05):
+    """
+    与基线对比，找出性能回退
+
+    Args:
+        report (dict): 本次基准测试报告
+        baseline (dict): 基线报告
+        tolerance (float): 允许的相对增幅
+        min_delta_ms (float): 绝对增幅低于该值时忽略（避免微秒级噪声）
+
+    Returns:
+        list: 回退描述列表
+    """
+    regressions = []
+    for name, current in report["workloads"].items():
+        previous = baseline.get("workloads", {}).get(name)
+        if not previous:
+            continue
+        for stage in STAGES:
+            now = current["stages"][stage]["p50_ms"]
+            before = previous.get("stages", {}).get(stage, {}).get("p50_ms")
+            if before is None:
+                continue
+            if now > before * (1 + tolerance) and now - before > min_delta_ms:
+                regressions.append(f"{name}/{stage}: p50 {before:.3f}ms -> {now:.3f}ms")
+        before_mem = previous.get("peak_memory_kb")
+        if before_mem and current["peak_memory_kb"] > before_mem * (1 + tolerance):
+            regressions.append(f"{name}/memory: {before_mem}KB -> {current['peak_memory_kb']}KB")
+    return regressions
+
+
+def print_report(report):
+    """打印基准测试报告"""
+    header = f"{'workload':<48}{'turns':>6}  " + "".join(f"{stage:>12}" for stage in STAGES) + \
+             f"{'p95 total':>12}{'conv/s':>10}{'peak KB':>10}"
+    print(header)
+    print("-" * len(header))
+    for name, result in report["workloads"].items():
+        stage_cols = "".join(f"{result['stages'][stage]['p50_ms']:>12.3f}" for stage in STAGES)
+        print(f"{name:<48}{result['turns']:>6}  {stage_cols}"
+              f"{result['stages']['total']['p95_ms']:>12.3f}"
+              f"{result['throughput_conversations_per_s']:>10.1f}{result['peak_memory_kb']:>10.1f}")
+    print("\n(各阶段列为p50延迟，单位ms)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="检测流程性能基准测试")
+    parser.add_argument("--iterations", "-n", type=int, default=5, help="每个工作负载的迭代次数 (默认: 5)")
+    parser.add_argument("--filter", "-k", help="只运行名称包含该字符串的工作负载")
+    parser.add_argument("--no-examples", action="store_true", help="不使用examples目录中的会话")
+    parser.add_argument("--no-synthetic", action="store_true", help="不使用合成会话")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="基线文件路径")
+    parser.add_argument("--save-baseline", action="store_true", help="将本次结果保存为基线")
+    parser.add_argument("--check", action="store_true", help="与基线对比，出现回退时返回非零退出码")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="允许的相对增幅 (默认: 0.25)")
+    parser.add_argument("--output", "-o", help="报告输出文件路径")
+    args = parser.parse_args()
+
+    # 基准测试关注检测本身的开销，屏蔽INFO日志
+    logging.disable(logging.INFO)
+
+    report = run_benchmarks(
+        iterations=args.iterations,
+        include_examples=not args.no_examples,
+        include_synthetic=not args.no_synthetic,
+        name_filter=args.filter
+    )
+    print_report(report)
+
+    if args.output:
+        serialization.dump_file(report, args.output, pretty=True)
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(os.path.abspath(args.baseline)), exist_ok=True)
+        serialization.dump_file(report, args.baseline, pretty=True)
+        print(f"\n基线已保存到: {args.baseline}")
+
+    if args.check:
+        if not os.path.exists(args.baseline):
+            print(f"\n基线文件不存在: {args.baseline}")
+            return 1
+        regressions = compare_with_baseline(report, serialization.load_file(args.baseline), args.tolerance)
+        if regressions:
+            print("\n检测到性能回退:")
+            for item in regressions:
+                print(f"  - {item}")
+            return 1
+        print("\n未检测到性能回退")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+import random
+
+from src.utils.config import ConfigLoader
+
+# 填充用的无风险文本片段
+FILLER_PHRASES = [
+    "今天的天气不错", "我们继续讨论这个问题", "请再解释一下", "这一点很有意思",
+    "谢谢你的回答", "我想了解更多细节", "从另一个角度来看", "总体而言",
+    "let me think about it", "that makes sense", "could you clarify", "in general",
+]
+
+DEFAULT_ROLES = [
+    "user", "assistant", "chemistry_student", "electronics_expert", "mining_engineer",
+    "hobbyist", "security_expert", "hacker", "lawyer", "financial_advisor",
+]
+
+
+def load_risk_terms(config_loader=None):
+    """
+    从配置文件收集风险词汇，用于生成含风险内容的合成会话
+
+    Args:
+        config_loader (ConfigLoader, optional): 配置加载器
+
+    Returns:
+        list: 去重后的风险词汇列表
+    """
+    config_loader = config_loader or ConfigLoader()
+    terms = set()
+
+    for keywords in config_loader.load_config("risk_categories_keywords.json").values():
+        terms.update(keywords)
+
+    domains = config_loader.load_config("domains.json")
+    for keywords in domains.get("domain_keywords", {}).values():
+        terms.update(keywords)
+
+    semantic = config_loader.load_config("semantic.json")
+    terms.update(semantic.get("technical_terms", []))
+
+    return sorted(t for t in terms if isinstance(t, str) and t)
+
+
+def generate_conversation(turns, roles=2, turn_length=100, risk_ratio=0.1, risk_terms=None, seed=0):
+    """
+    生成合成会话
+
+    Args:
+        turns (int): 回合数
+        roles (int): 参与的角色数量
+        turn_length (int): 每个回合的近似字符数
+        risk_ratio (float): 回合中插入风险词汇的比例
+        risk_terms (list, optional): 风险词汇列表
+        seed (int): 随机种子，保证基准测试可重复
+
+    Returns:
+        list: 会话列表，格式为 [{"role": "...", "content": "..."}, ...]
+    """
+    rng = random.Random(seed)
+    risk_terms = risk_terms or []
+    role_names = DEFAULT_ROLES[:max(1, min(roles, len(DEFAULT_ROLES)))]
+
+    conversation = []
+    for i in range(turns):
+        parts = []
+        length = 0
+        while length < turn_length:
+            if risk_terms and rng.random() < risk_ratio:
+                piece = rng.choice(risk_terms)
+            else:
+                piece = rng.choice(FILLER_PHRASES)
+            parts.append(piece)
+            length += len(piece) + 1
+        conversation.append({
+            "role": role_names[i % len(role_names)],
+            "content": "，".join(parts) + "。"
+        })
+    return conversation
+
+
+def synthetic_workloads(risk_terms=None, turn_counts=(8, 64, 256), role_counts=(2, 5), turn_lengths=(50, 400)):
+    """
+    生成不同规模的合成会话工作负载
+
+    Args:
+        risk_terms (list, optional): 风险词汇列表
+        turn_counts (tuple): 回合数取值
+        role_counts (tuple): 角色数取值
+        turn_lengths (tuple): 回合长度取值
+
+    Returns:
+        dict: {工作负载名称: 会话}
+    """
+    workloads = {}
+    for turns in turn_counts:
+        for roles in role_counts:
+            for length in turn_lengths:
+                name = f"synthetic_t{turns}_r{roles}_l{length}"
+                workloads[name] = generate_conversation(
+                    turns, roles=roles, turn_length=length, risk_terms=risk_terms,
+                    seed=turns * 1000 + roles * 10 + length
+                )
+    return workloads
@@ -10,6 +10,10 @@ setup(
         "flask>=2.0.0",
         "numpy>=1.19.0",
     ],
+    extras_require={
+        # 可选的快速JSON编码/解码后端
+        "fast": ["orjson>=3.6.0"],
+    },
     entry_points={
         'console_scripts': [
             'risk-analyzer=src.main:main',
@@ -1,9 +1,8 @@
-import json
 import os
 import logging
 from ..utils.config import ConfigLoader
+from ..utils import serialization
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 class DataManager:
@@ -26,22 +25,27 @@ class DataManager:
     def load_json(self, file_path):
         """加载JSON文件"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = serialization.load_file(file_path)
             logger.info(f"已加载JSON文件: {file_path}")
             return data
         except Exception as e:
             logger.error(f"加载JSON文件失败: {file_path}, 错误: {str(e)}")
             return None
     
-    def save_json(self, data, file_path):
-        """保存数据到JSON文件"""
+    def save_json(self, data, file_path, pretty=False):
+        """
+        保存数据到JSON文件
+        
+        Args:
+            data: 要保存的数据
+            file_path (str): 文件路径
+            pretty (bool): 是否缩进输出，默认紧凑格式
+        """
         try:
             # 确保目录存在
             os.makedirs(os.path.dirname(os.path.abspath(file_path)), exist_ok=True)
             
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=4)
+            serialization.dump_file(data, file_path, pretty=pretty)
             logger.info(f"已保存数据到: {file_path}")
             return True
         except Exception as e:
@@ -1,5 +1,4 @@
 import argparse
-import json
 import logging
 import os
 import sys
@@ -7,13 +6,10 @@ import sys
 # 添加项目根目录到系统路径
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-from src.scraper.wiki_scraper import WikiScraper
-from src.risk_analyzer.pattern_builder import PatternBuilder
-from src.risk_analyzer.risk_detector import RiskDetector
-from src.risk_analyzer.conversation_analyzer import ConversationAnalyzer
-from src.data.data_manager import DataManager
+# 各子命令依赖的模块在命令函数内导入，analyze 不会加载爬虫等模块
+from src.utils import serialization
+from src.utils.logging_utils import configure_logging
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 def main():
@@ -47,6 +43,7 @@ def main():
     
     # 解析命令行参数
     args = parser.parse_args()
+    configure_logging()
     
     # 确保数据目录存在
     os.makedirs("data", exist_ok=True)
@@ -82,6 +79,8 @@ def main():
 
 def scrape_wiki(topics, lang, output):
     """爬取维基百科内容"""
+    from src.scraper.wiki_scraper import WikiScraper
+
     logger.info(f"开始爬取主题: {', '.join(topics)}, 语言: {lang}")
     
     scraper = WikiScraper(base_url=f"https://{lang}.wikipedia.org/wiki/")
@@ -90,23 +89,23 @@ def scrape_wiki(topics, lang, output):
     # 确保输出目录存在
     os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
     
-    # 保存爬取结果
-    with open(output, 'w', encoding='utf-8') as f:
-        json.dump(result, f, ensure_ascii=False, indent=4)
+    # 保存爬取结果（词汇库供人工查看和编辑，保持缩进格式）
+    serialization.dump_file(result, output, pretty=True)
     
     logger.info(f"爬取完成，结果已保存到: {output}")
     return output
 
 def build_patterns(vocabulary_file, output):
     """构建风险模式库"""
+    from src.risk_analyzer.pattern_builder import PatternBuilder
+
     logger.info("开始构建风险模式库")
     
     # 加载词汇库
     vocabulary_data = None
     if vocabulary_file:
         try:
-            with open(vocabulary_file, 'r', encoding='utf-8') as f:
-                vocabulary_data = json.load(f)
+            vocabulary_data = serialization.load_file(vocabulary_file)
             logger.info(f"已加载词汇库: {vocabulary_file}")
         except Exception as e:
             logger.warning(f"加载词汇库失败: {str(e)}")
@@ -126,6 +125,8 @@ def build_patterns(vocabulary_file, output):
 
 def analyze_conversation(conversation_file, patterns_file, vocabulary_file, output):
     """分析会话风险"""
+    from src.risk_analyzer.conversation_analyzer import ConversationAnalyzer
+
     logger.info("开始分析会话风险")
     
     # 检查文件是否存在
@@ -136,8 +137,7 @@ def analyze_conversation(conversation_file, patterns_file, vocabulary_file, outp
     
     # 加载会话
     try:
-        with open(conversation_file, 'r', encoding='utf-8') as f:
-            conversation = json.load(f)
+        conversation = serialization.load_file(conversation_file)
         logger.info(f"已加载会话: {conversation_file}, {len(conversation)} 轮对话")
     except Exception as e:
         logger.error(f"加载会话失败: {str(e)}")
@@ -152,8 +152,7 @@ def analyze_conversation(conversation_file, patterns_file, vocabulary_file, outp
         # 确保输出目录存在
         os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
         
-        with open(output, 'w', encoding='utf-8') as f:
-            json.dump(result, f, ensure_ascii=False, indent=4)
+        serialization.dump_file(result, output)
         logger.info(f"分析结果已保存到: {output}")
     
     # 打印摘要
@@ -1,5 +1,4 @@
 import argparse
-import json
 import os
 import logging
 import sys
@@ -7,18 +6,17 @@ import sys
 # 修复导入路径问题
 sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
 
-from src.scraper.wiki_scraper import WikiScraper
-from src.risk_analyzer.pattern_builder import PatternBuilder
-from src.risk_analyzer.risk_detector import RiskDetector
-from src.risk_analyzer.conversation_analyzer import ConversationAnalyzer
-from src.data.data_manager import DataManager
+# 各子命令依赖的模块在命令函数内导入，analyze 不会加载爬虫等模块
+from src.utils import serialization
+from src.utils.logging_utils import configure_logging
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 def main():
     """内容风险分析工具主函数"""
     parser = argparse.ArgumentParser(description="维基百科内容风险分析工具")
+    parser.add_argument("--log-level", default="INFO", choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+                        help="日志级别 (默认: INFO)")
     subparsers = parser.add_subparsers(dest="command", help="可用命令")
     
     # 爬取维基百科内容
@@ -32,15 +30,46 @@ def main():
     build_parser.add_argument("--vocabulary", "-v", help="词汇库文件路径")
     build_parser.add_argument("--output", "-o", default="data/risk_patterns.json", help="输出文件路径 (默认: data/risk_patterns.json)")
     
+    # 构建风险示例近邻索引
+    index_parser = subparsers.add_parser("build-index", help="构建风险示例的近似最近邻索引")
+    index_parser.add_argument("--examples", "-e", help="标注的风险示例库 (JSONL，每行 {\"pattern_id\": ..., \"text\": ...})")
+    index_parser.add_argument("--patterns", "-p", default="data/risk_patterns.json", help="风险模式库文件路径，模式的描述和示例也作为示例 (默认: data/risk_patterns.json)")
+    index_parser.add_argument("--output", "-o", default="data/example_index", help="索引输出目录 (默认: data/example_index)")
+    index_parser.add_argument("--dimensions", type=int, default=256, help="嵌入维度，2的幂 (默认: 256)")
+    index_parser.add_argument("--lists", type=int, help="倒排列表数 (默认: 示例数的平方根)")
+    
+    # 构建概念共现图
+    graph_parser = subparsers.add_parser("build-graph", help="从爬取的维基百科语料统计技术术语共现，构建概念共现图")
+    graph_parser.add_argument("--input", "-i", nargs="+", default=["data/vocabulary.json", "data/wikidump"], help="爬取结果文件或缓存目录 (默认: data/vocabulary.json data/wikidump)")
+    graph_parser.add_argument("--output", "-o", default="data/concept_graph.json", help="输出文件路径 (默认: data/concept_graph.json)")
+    graph_parser.add_argument("--min-count", type=int, default=2, help="概念对的共现文档数下限 (默认: 2)")
+    
     # 分析会话
     analyze_parser = subparsers.add_parser("analyze", help="分析会话风险")
     analyze_parser.add_argument("--conversation", "-c", required=True, help="会话文件路径")
     analyze_parser.add_argument("--patterns", "-p", default="data/risk_patterns.json", help="风险模式库文件路径 (默认: data/risk_patterns.json)")
     analyze_parser.add_argument("--vocabulary", "-v", default="data/vocabulary.json", help="词汇库文件路径 (默认: data/vocabulary.json)")
     analyze_parser.add_argument("--output", "-o", help="输出文件路径")
+    analyze_parser.add_argument("--no-summary", action="store_true", help="不生成可读的风险摘要，只输出分数和模式")
+    analyze_parser.add_argument("--pretty", action="store_true", help="以缩进格式输出结果文件 (默认紧凑格式)")
+    analyze_parser.add_argument("--prefilter", action="store_true", help="开启预筛选，不包含任何规则词汇的会话直接判定为无风险")
+    analyze_parser.add_argument("--similarity", action="store_true", help="列出与各回合最相似的风险模式（按模式名称、描述和示例）")
+    
+    # 分片批量分析
+    batch_parser = subparsers.add_parser("batch", help="分片批量分析JSONL会话目录，支持中断后继续")
+    batch_parser.add_argument("--input-dir", "-i", required=True, help="输入目录，包含 *.jsonl 文件，每行一个会话")
+    batch_parser.add_argument("--output-dir", "-o", required=True, help="输出目录，包含清单文件和分片结果")
+    batch_parser.add_argument("--shard-size", type=int, default=1000, help="每个分片的会话数 (默认: 1000)")
+    batch_parser.add_argument("--workers", "-w", type=int, default=1, help="并行处理分片的进程数 (默认: 1)")
+    batch_parser.add_argument("--patterns", "-p", default="data/risk_patterns.json", help="风险模式库文件路径 (默认: data/risk_patterns.json)")
+    batch_parser.add_argument("--vocabulary", "-v", default="data/vocabulary.json", help="词汇库文件路径 (默认: data/vocabulary.json)")
+    batch_parser.add_argument("--dedup-threshold", type=float, help="分片内近似重复会话的相似度阈值，例如0.9 (默认不去重)")
+    batch_parser.add_argument("--summary", action="store_true", help="生成可读的风险摘要 (默认不生成)")
+    batch_parser.add_argument("--prefilter", action="store_true", help="开启预筛选，不包含任何规则词汇的会话直接判定为无风险")
     
     # 解析命令行参数
     args = parser.parse_args()
+    configure_logging(args.log_level)
     
     # 确保数据目录存在
     os.makedirs("data", exist_ok=True)
@@ -53,15 +82,31 @@ def main():
         # 构建风险模式库
         build_patterns(args.vocabulary, args.output)
     
+    elif args.command == "build-index":
+        # 构建风险示例近邻索引
+        build_example_index(args.examples, args.patterns, args.output, args.dimensions, args.lists)
+    
+    elif args.command == "build-graph":
+        # 构建概念共现图
+        build_concept_graph(args.input, args.output, args.min_count)
+    
     elif args.command == "analyze":
         # 分析会话
-        analyze_conversation(args.conversation, args.patterns, args.vocabulary, args.output)
+        analyze_conversation(args.conversation, args.patterns, args.vocabulary, args.output,
+                             include_summary=not args.no_summary, pretty=args.pretty, prefilter=args.prefilter,
+                             similarity=args.similarity)
+    
+    elif args.command == "batch":
+        # 分片批量分析
+        run_batch(args)
     
     else:
         parser.print_help()
 
 def scrape_wiki(topics, lang, output):
     """爬取维基百科内容"""
+    from src.scraper.wiki_scraper import WikiScraper
+
     logger.info(f"开始处理主题: {', '.join(topics)}, 语言: {lang}")
     
     # 创建WikiScraper实例
@@ -75,9 +120,8 @@ def scrape_wiki(topics, lang, output):
     # 确保输出目录存在
     os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
     
-    # 保存结果
-    with open(output, 'w', encoding='utf-8') as f:
-        json.dump(result, f, ensure_ascii=False, indent=4)
+    # 保存结果（词汇库供人工查看和编辑，保持缩进格式）
+    serialization.dump_file(result, output, pretty=True)
     
     logger.info(f"处理完成，结果已保存到: {output}")
     logger.info(f"找到 {len(result['vocabulary'])} 个风险类别")
@@ -94,14 +138,15 @@ def scrape_wiki(topics, lang, output):
 
 def build_patterns(vocabulary_file, output):
     """构建风险模式库"""
+    from src.risk_analyzer.pattern_builder import PatternBuilder
+
     logger.info("开始构建风险模式库")
     
     # 加载词汇库
     vocabulary_data = None
     if vocabulary_file:
         try:
-            with open(vocabulary_file, 'r', encoding='utf-8') as f:
-                vocabulary_data = json.load(f)
+            vocabulary_data = serialization.load_file(vocabulary_file)
             logger.info(f"已加载词汇库: {vocabulary_file}")
         except Exception as e:
             logger.warning(f"加载词汇库失败: {str(e)}")
@@ -121,8 +166,89 @@ def build_patterns(vocabulary_file, output):
     logger.info(f"构建完成，共生成 {total_patterns} 个风险模式，已保存到: {output}")
     return output
 
-def analyze_conversation(conversation_file, patterns_file, vocabulary_file, output=None):
+def build_example_index(examples_file, patterns_file, output, dimensions=256, lists=None):
+    """构建风险示例的近似最近邻索引"""
+    from src.risk_analyzer.ann_index import ExampleIndex, load_examples, pattern_examples
+    from src.risk_analyzer.filler import FillerTable
+    from src.risk_analyzer.similarity import NgramHasher, DEFAULT_HASH_BITS, DEFAULT_NGRAM_SIZES
+    from src.utils.config import ConfigLoader
+
+    examples = []
+    if patterns_file and os.path.exists(patterns_file):
+        examples.extend(pattern_examples(serialization.load_file(patterns_file)))
+    if examples_file:
+        examples.extend(load_examples(examples_file))
+    if not examples:
+        logger.error("没有可用的示例，请通过 --examples 或 --patterns 提供")
+        return None
+
+    # n 元组参数和填充字符与检测时相同，见 semantic.json 的 pattern_similarity 和 domains.json 的 text_matching
+    config_loader = ConfigLoader()
+    options = config_loader.load_config("semantic.json").get("pattern_similarity", {})
+    filler = FillerTable.from_config(config_loader.load_config("domains.json").get("text_matching"))
+    hasher = NgramHasher(options.get("ngram_sizes", DEFAULT_NGRAM_SIZES),
+                         options.get("hash_bits", DEFAULT_HASH_BITS), filler)
+
+    index = ExampleIndex.build(examples, hasher, dimensions=dimensions, lists=lists)
+    index.save(output)
+    logger.info(f"示例索引已保存到: {output}")
+    print(f"\n示例: {index.size} 条，倒排列表: {index.lists} 个，嵌入维度: {index.dimensions}")
+    print(f"在 config/semantic.json 的 pattern_similarity 中设置 \"example_index\": \"{output}\" 后生效")
+    return output
+
+def build_concept_graph(inputs, output, min_count=2):
+    """从爬取的语料构建概念共现图"""
+    from src.risk_analyzer.cooccurrence import build_concept_graph as build_graph, iter_scraped_documents
+    from src.risk_analyzer.filler import FillerTable
+    from src.utils.config import ConfigLoader
+
+    # 技术术语和填充字符与语义网络分析相同，见 semantic.json 的 technical_terms 和 domains.json 的 text_matching
+    config_loader = ConfigLoader()
+    terms = config_loader.load_config("semantic.json").get("technical_terms", [])
+    if not terms:
+        logger.error("semantic.json 中没有配置技术术语 technical_terms")
+        return None
+    filler = FillerTable.from_config(config_loader.load_config("domains.json").get("text_matching"))
+
+    graph = build_graph(iter_scraped_documents([path for path in inputs if os.path.exists(path)]),
+                        terms, filler, min_count=min_count)
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    graph.save(output)
+    logger.info(f"概念共现图已保存到: {output}")
+    print(f"\n文档: {graph.documents} 个，概念: {len(graph.terms)} 个，共现边: {graph.pair_count} 条")
+    print(f"在 config/semantic.json 中设置 \"concept_graph\": {{\"path\": \"{output}\"}} 后生效")
+    return output
+
+def run_batch(args):
+    """分片批量分析会话目录"""
+    from src.risk_analyzer.batch_runner import BatchRunner
+    
+    runner = BatchRunner(
+        args.input_dir, args.output_dir,
+        shard_size=args.shard_size,
+        workers=args.workers,
+        patterns_file=args.patterns if os.path.exists(args.patterns) else None,
+        vocabulary_file=args.vocabulary if os.path.exists(args.vocabulary) else None,
+        include_summary=args.summary,
+        dedup_threshold=args.dedup_threshold,
+        prefilter=args.prefilter
+    )
+    stats = runner.run()
+    print(f"\n分片: 共 {stats['total']} 个，本次完成 {stats['completed']} 个，"
+          f"跳过已完成 {stats['skipped']} 个，失败 {stats['failed']} 个")
+    print(f"本次分析会话: {stats['processed']} 个，错误: {stats['errors']} 个")
+    if args.prefilter and stats['processed']:
+        print(f"预筛选直接判定无风险: {stats['prefiltered']} 个，"
+              f"放行比例: {1 - stats['prefiltered'] / stats['processed']:.1%}")
+    print(f"清单文件: {runner.manifest_path}")
+    return stats
+
+def analyze_conversation(conversation_file, patterns_file, vocabulary_file, output=None, include_summary=True,
+                         pretty=False, prefilter=False, similarity=False):
     """分析会话风险"""
+    from src.risk_analyzer.risk_detector import RiskDetector
+    from src.risk_analyzer.conversation_analyzer import ConversationAnalyzer
+
     logger.info("开始分析会话风险")
     
     # 检查文件是否存在
@@ -137,8 +263,7 @@ def analyze_conversation(conversation_file, patterns_file, vocabulary_file, outp
     
     # 加载会话
     try:
-        with open(conversation_file, 'r', encoding='utf-8') as f:
-            conversation = json.load(f)
+        conversation = serialization.load_file(conversation_file)
         logger.info(f"已加载会话: {conversation_file}, {len(conversation)} 轮对话")
     except Exception as e:
         logger.error(f"加载会话失败: {str(e)}")
@@ -146,8 +271,9 @@ def analyze_conversation(conversation_file, patterns_file, vocabulary_file, outp
     
     # 创建风险检测器和分析器
     try:
-        risk_detector = RiskDetector(patterns_file=patterns_file, vocabulary_file=vocabulary_file)
-        analyzer = ConversationAnalyzer(risk_detector=risk_detector)
+        risk_detector = RiskDetector(patterns_file=patterns_file, vocabulary_file=vocabulary_file,
+                                     prefilter=prefilter, similarity=similarity)
+        analyzer = ConversationAnalyzer(risk_detector=risk_detector, include_summary=include_summary)
         result = analyzer.analyze_conversation(conversation)
     except Exception as e:
         logger.error(f"分析会话时发生错误: {str(e)}")
@@ -158,8 +284,7 @@ def analyze_conversation(conversation_file, patterns_file, vocabulary_file, outp
     # 保存分析结果
     if output:
         try:
-            with open(output, 'w', encoding='utf-8') as f:
-                json.dump(result, f, ensure_ascii=False, indent=4)
+            serialization.dump_file(result, output, pretty=pretty)
             logger.info(f"分析结果已保存到: {output}")
         except Exception as e:
             logger.error(f"保存分析结果失败: {str(e)}")
@@ -246,8 +371,9 @@ def analyze_conversation(conversation_file, patterns_file, vocabulary_file, outp
                     category = combo.get('category', '未知')
                     print(f"    - {category}: {concepts}")
         
-        print("\n摘要:")
-        print(result['summary'])
+        if result['summary'] is not None:
+            print("\n摘要:")
+            print(result['summary'])
     
     return result
     
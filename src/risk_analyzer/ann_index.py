@@ -0,0 +1,338 @@
+import logging
+import os
+
+import numpy as np
+
+from ..utils import serialization
+from .similarity import NgramHasher, DEFAULT_TOP_K
+
+logger = logging.getLogger(__name__)
+
+# 默认参数：256维嵌入，倒排列表数为示例数的平方根，查询时探查8个列表
+DEFAULT_DIMENSIONS = 256
+DEFAULT_PROBES = 8
+DEFAULT_ITERATIONS = 10
+# 训练聚类中心时每个列表最多使用的样本数，示例更多时随机抽样
+TRAINING_SAMPLES_PER_LIST = 64
+
+# 索引目录的文件，meta.json 最后写入，读取时先检查
+INDEX_FORMAT = 1
+META_FILE = "meta.json"
+LABELS_FILE = "labels.json"
+ARRAY_NAMES = ("idf", "centroids", "offsets", "vectors", "ids")
+
+# 每批计算相似度的向量数，限制相似度矩阵的内存
+_BATCH = 4096
+
+
+def pattern_examples(patterns, fields=("description", "example")):
+    """
+    从风险模式定义中取出示例文本
+
+    Args:
+        patterns (dict): 风险模式定义 {大类: [模式]}
+        fields (tuple): 作为示例的字段，每个字段单独作为一条示例
+
+    Returns:
+        list: [(模式ID, 文本)]
+    """
+    examples = []
+    for patterns_list in patterns.values():
+        if not isinstance(patterns_list, list):
+            continue
+        for pattern in patterns_list:
+            if not isinstance(pattern, dict) or "id" not in pattern:
+                continue
+            for field in fields:
+                text = pattern.get(field)
+                if isinstance(text, str) and text.strip():
+                    examples.append((pattern["id"], text))
+    return examples
+
+
+def load_examples(path):
+    """
+    读取标注的风险示例库
+
+    Args:
+        path (str): JSONL文件，每行 {"pattern_id": "...", "text": "..."}
+
+    Returns:
+        list: [(模式ID, 文本)]，格式不正确的行跳过
+    """
+    examples = []
+    with open(path, "rb") as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                record = serialization.loads(line)
+            except ValueError as e:
+                logger.warning(f"示例库第 {line_number} 行解析失败: {e}")
+                continue
+            if isinstance(record, dict) and isinstance(record.get("text"), str) and record.get("pattern_id"):
+                examples.append((record["pattern_id"], record["text"]))
+    return examples
+
+
+def spherical_kmeans(vectors, lists, iterations=DEFAULT_ITERATIONS, seed=0):
+    """
+    按余弦相似度聚类
+
+    Args:
+        vectors (numpy.ndarray): L2 归一化的向量
+        lists (int): 聚类数
+        iterations (int): 迭代次数
+        seed (int): 随机种子
+
+    Returns:
+        numpy.ndarray: (聚类数 × 维度) 的 L2 归一化聚类中心
+    """
+    rng = np.random.RandomState(seed)
+    centroids = vectors[rng.choice(len(vectors), lists, replace=False)].copy()
+    for _ in range(iterations):
+        assignment = _nearest(vectors, centroids)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assignment, vectors)
+        # 空聚类重新取一个随机样本
+        empty = ~sums.any(axis=1)
+        sums[empty] = vectors[rng.choice(len(vectors), int(empty.sum()))]
+        norms = np.linalg.norm(sums, axis=1)
+        norms[norms == 0] = 1.0
+        centroids = (sums / norms[:, None]).astype(np.float32)
+    return centroids
+
+
+def _nearest(vectors, centroids):
+    """每个向量最相似的聚类中心"""
+    return np.concatenate([np.argmax(vectors[start:start + _BATCH] @ centroids.T, axis=1)
+                           for start in range(0, len(vectors), _BATCH)]) if len(vectors) else np.zeros(0, np.int64)
+
+
+class ExampleIndex:
+    """
+    风险示例的近似最近邻索引（IVF 倒排聚类）
+
+    示例文本转换为字符 n 元组 TF-IDF 向量后，按维度编号做带符号的特征哈希，
+    压缩为稠密向量（余弦相似度近似不变）。向量按余弦 k-means 分为若干倒排列表，
+    同一列表的向量在文件中连续存放；查询时只与最相似的 probes 个列表中的示例计算相似度，
+    每个列表是一段连续切片，内存映射时只读取需要的页。
+
+    召回率和延迟可调：构建时的列表数（越多每个列表越小）和查询时的探查列表数（越多召回越高、候选越多），
+    探查全部列表等同于精确检索。索引由 build 离线构建并保存为目录，load 以内存映射方式打开，
+    多个进程共享同一份页缓存，加载时间与示例数量无关。
+    """
+
+    __slots__ = ("labels", "hasher", "dimensions", "_idf", "_centroids", "_offsets", "_vectors", "_ids")
+
+    def __init__(self, labels, hasher, dimensions, arrays):
+        """
+        初始化索引，通常通过 build 或 load 创建
+
+        Args:
+            labels (list): 各示例的模式ID
+            hasher (NgramHasher): n 元组哈希
+            dimensions (int): 嵌入维度
+            arrays (dict): {数组名: 数组}，见 ARRAY_NAMES
+        """
+        self.labels = labels
+        self.hasher = hasher
+        self.dimensions = dimensions
+        self._idf = arrays["idf"]
+        self._centroids = arrays["centroids"]
+        self._offsets = arrays["offsets"]
+        self._vectors = arrays["vectors"]
+        self._ids = arrays["ids"]
+
+    @classmethod
+    def build(cls, examples, hasher=None, dimensions=DEFAULT_DIMENSIONS, lists=None,
+              iterations=DEFAULT_ITERATIONS, seed=0):
+        """
+        构建索引
+
+        Args:
+            examples (list): [(模式ID, 文本)]
+            hasher (NgramHasher, optional): n 元组哈希，查询时使用同样的参数
+            dimensions (int): 嵌入维度，2的幂
+            lists (int, optional): 倒排列表数，默认为示例数的平方根
+            iterations (int): 聚类迭代次数
+            seed (int): 随机种子
+
+        Returns:
+            ExampleIndex: 索引
+        """
+        hasher = hasher or NgramHasher()
+        if dimensions & (dimensions - 1) or not 1 < dimensions < (1 << hasher.bits):
+            raise ValueError(f"嵌入维度必须是小于 2^{hasher.bits} 的2的幂: {dimensions}")
+        labels = [label for label, _ in examples]
+        texts = [text for _, text in examples]
+
+        # 平滑的逆文档频率，按维度编号直接查表；示例中没有出现的维度记为0
+        _, columns, _ = hasher.hash(texts)
+        frequencies = np.bincount(columns, minlength=1 << hasher.bits)
+        idf = (np.log((1 + len(texts)) / (1 + frequencies)) + 1).astype(np.float32)
+        idf[frequencies == 0] = 0
+        index = cls(labels, hasher, dimensions, {"idf": idf, "centroids": None, "offsets": None,
+                                                 "vectors": None, "ids": None})
+        vectors = index.embed(texts)
+
+        lists = max(1, min(lists or int(round(np.sqrt(len(texts)))), len(texts))) if texts else 0
+        rng = np.random.RandomState(seed)
+        training = vectors
+        if len(vectors) > lists * TRAINING_SAMPLES_PER_LIST:
+            training = vectors[rng.choice(len(vectors), lists * TRAINING_SAMPLES_PER_LIST, replace=False)]
+        centroids = spherical_kmeans(training, lists, iterations, seed) if len(texts) else \
+            np.zeros((0, dimensions), dtype=np.float32)
+
+        # 按所属列表排序，同一列表的向量连续存放
+        assignment = _nearest(vectors, centroids)
+        ids = np.argsort(assignment, kind="stable").astype(np.int32)
+        offsets = np.zeros(lists + 1, dtype=np.int64)
+        np.cumsum(np.bincount(assignment, minlength=lists), out=offsets[1:])
+        index._centroids = centroids
+        index._offsets = offsets
+        index._vectors = vectors[ids]
+        index._ids = ids
+        logger.info(f"已构建示例索引: {len(labels)} 条示例，{lists} 个倒排列表，{dimensions} 维")
+        return index
+
+    def save(self, path):
+        """
+        保存索引目录
+
+        Args:
+            path (str): 目录路径
+        """
+        os.makedirs(path, exist_ok=True)
+        for name in ARRAY_NAMES:
+            np.save(os.path.join(path, f"{name}.npy"), getattr(self, f"_{name}"))
+        serialization.dump_file(self.labels, os.path.join(path, LABELS_FILE))
+        serialization.dump_file({
+            "format": INDEX_FORMAT,
+            "count": len(self.labels),
+            "dimensions": self.dimensions,
+            "lists": self.lists,
+            "ngram_sizes": list(self.hasher.ngram_sizes),
+            "hash_bits": self.hasher.bits,
+        }, os.path.join(path, META_FILE), pretty=True)
+
+    @classmethod
+    def load(cls, path, filler=None, mmap=True):
+        """
+        打开索引目录
+
+        Args:
+            path (str): 目录路径
+            filler (FillerTable, optional): 填充字符表，应与构建时相同
+            mmap (bool): 是否以内存映射方式打开数组
+
+        Returns:
+            ExampleIndex: 索引
+        """
+        meta = serialization.load_file(os.path.join(path, META_FILE))
+        if meta.get("format") != INDEX_FORMAT:
+            raise ValueError(f"不支持的示例索引格式: {meta.get('format')}")
+        arrays = {name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode="r" if mmap else None)
+                  for name in ARRAY_NAMES}
+        labels = serialization.load_file(os.path.join(path, LABELS_FILE))
+        hasher = NgramHasher(meta["ngram_sizes"], meta["hash_bits"], filler)
+        return cls(labels, hasher, meta["dimensions"], arrays)
+
+    @property
+    def size(self):
+        """示例数量"""
+        return len(self.labels)
+
+    @property
+    def lists(self):
+        """倒排列表数"""
+        return len(self._centroids)
+
+    def embed(self, texts):
+        """
+        把一批文本转换为稠密向量，内积近似为 TF-IDF 余弦相似度
+
+        Args:
+            texts (list): 文本
+
+        Returns:
+            numpy.ndarray: (文本数 × 嵌入维度)，按完整的 TF-IDF 向量归一化；
+                空文本或不含示例中任何 n 元组的文本为零向量
+        """
+        rows, columns, counts = self.hasher.hash(texts)
+        idf = self._idf[columns]
+        known = idf > 0
+        # 示例中没有出现的 n 元组不可能增加相似度，只计入范数（取最大的逆文档频率），不参与哈希，
+        # 避免与无关示例的哈希碰撞产生噪声
+        norms = np.sqrt(np.bincount(rows, weights=(counts * np.where(known, idf, np.log(1 + self.size) + 1)) ** 2,
+                                    minlength=len(texts)))
+        norms[norms == 0] = 1.0
+        rows, columns, weights = rows[known], columns[known], counts[known] * idf[known]
+        # 带符号的特征哈希：维度编号的低位选择嵌入维度，下一位决定符号
+        shift = self.dimensions.bit_length() - 1
+        buckets = rows * self.dimensions + (columns & (self.dimensions - 1))
+        signs = 1 - 2 * ((columns >> shift) & 1)
+        vectors = np.bincount(buckets, weights=weights * signs, minlength=len(texts) * self.dimensions)
+        return (vectors.reshape(len(texts), self.dimensions) / norms[:, None]).astype(np.float32)
+
+    def search(self, texts, top_k=DEFAULT_TOP_K, probes=DEFAULT_PROBES):
+        """
+        近似检索每条文本最相似的示例
+
+        Args:
+            texts (list): 文本
+            top_k (int): 每条文本返回的示例数上限
+            probes (int): 探查的倒排列表数，越大召回越高、候选越多
+
+        Returns:
+            list: 与输入一一对应，每项为 [(示例下标, 相似度)]，按相似度从高到低排列
+        """
+        vectors = self.embed(texts)
+        probes = max(1, min(probes, self.lists))
+        offsets = self._offsets
+        results = []
+        for start in range(0, len(vectors), _BATCH):
+            batch = vectors[start:start + _BATCH]
+            nearest = np.argpartition(-(batch @ self._centroids.T), probes - 1, axis=1)[:, :probes] \
+                if self.lists else np.zeros((len(batch), 0), dtype=np.int64)
+            for vector, lists in zip(batch, nearest.tolist()):
+                if not vector.any():
+                    results.append([])
+                    continue
+                ranges = [(offsets[i], offsets[i + 1]) for i in lists]
+                scores = np.concatenate([self._vectors[a:b] @ vector for a, b in ranges]) if ranges else \
+                    np.zeros(0, dtype=np.float32)
+                positions = np.concatenate([np.arange(a, b) for a, b in ranges]) if ranges else \
+                    np.zeros(0, dtype=np.int64)
+                results.append(self._rank(scores, positions, top_k))
+        return results
+
+    def exact_search(self, texts, top_k=DEFAULT_TOP_K):
+        """
+        精确检索每条文本最相似的示例，与全部示例逐一比较，用于评估近似检索的召回率
+
+        Args:
+            texts (list): 文本
+            top_k (int): 每条文本返回的示例数上限
+
+        Returns:
+            list: 格式与 search 相同
+        """
+        vectors = self.embed(texts)
+        positions = np.arange(self.size)
+        results = []
+        for vector in vectors:
+            results.append(self._rank(self._vectors @ vector, positions, top_k) if vector.any() else [])
+        return results
+
+    def _rank(self, scores, positions, top_k):
+        """按相似度取前 top_k 个候选，只保留相似度为正的示例，存放位置转换为示例下标"""
+        if len(scores) > top_k:
+            top = np.argpartition(-scores, top_k - 1)[:top_k]
+        else:
+            top = np.arange(len(scores))
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(int(self._ids[positions[i]]), round(float(scores[i]), 4)) for i in top.tolist() if scores[i] > 0]
+
+    def __repr__(self):
+        return f"ExampleIndex(size={self.size}, dimensions={self.dimensions}, lists={self.lists})"
@@ -0,0 +1,272 @@
+import os
+import glob
+import time
+import logging
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from ..utils import serialization
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILE = "manifest.json"
+MANIFEST_VERSION = 1
+
+# 工作进程内复用的分析器，键为 (模式库, 词汇库, 是否生成摘要, 是否预筛选)
+_worker_analyzers = {}
+
+
+def _atomic_write(path, data_bytes):
+    """先写临时文件再替换，进程被杀死时不会留下写了一半的文件"""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data_bytes)
+    os.replace(tmp_path, path)
+
+
+def _count_lines(path):
+    """统计JSONL文件中的非空行数"""
+    with open(path, "rb") as f:
+        return sum(1 for line in f if line.strip())
+
+
+def _read_shard_lines(path, start, count):
+    """读取文件中第start个非空行开始的count行"""
+    lines = []
+    index = 0
+    with open(path, "rb") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            if index >= start:
+                lines.append(line)
+                if len(lines) >= count:
+                    break
+            index += 1
+    return lines
+
+
+def _get_analyzer(options):
+    """获取当前进程的分析器实例"""
+    key = (options.get("patterns_file"), options.get("vocabulary_file"), options.get("include_summary", False),
+           options.get("prefilter", False))
+    analyzer = _worker_analyzers.get(key)
+    if analyzer is None:
+        from .conversation_analyzer import ConversationAnalyzer
+        analyzer = ConversationAnalyzer(patterns_file=key[0], vocabulary_file=key[1], include_summary=key[2])
+        if key[3]:
+            analyzer.risk_detector.enable_prefilter()
+        _worker_analyzers[key] = analyzer
+    return analyzer
+
+
+def process_shard(shard, options):
+    """
+    处理一个分片并写出结果文件
+
+    单个会话解析或分析失败时记录错误并继续，不影响分片内其他会话。
+
+    Args:
+        shard (dict): 分片信息 {"id", "file", "start", "count", "output"}
+        options (dict): 分析选项
+
+    Returns:
+        dict: {"id", "processed", "errors", "duplicates", "prefiltered"}
+    """
+    analyzer = _get_analyzer(options)
+    backend = serialization.get_backend()
+    prefilter_stats = analyzer.risk_detector.prefilter_stats
+    skipped_before = prefilter_stats.skipped
+
+    ids = []
+    conversations = []
+    errors = []
+    for offset, line in enumerate(_read_shard_lines(shard["file"], shard["start"], shard["count"])):
+        record_id = f"{os.path.basename(shard['file'])}:{shard['start'] + offset + 1}"
+        try:
+            record = backend.loads(line)
+        except Exception as e:
+            errors.append({"id": record_id, "error": f"解析失败: {e}"})
+            continue
+        # 每行可以直接是会话列表，也可以是 {"id": ..., "conversation": [...]}
+        if isinstance(record, dict):
+            record_id = record.get("id", record_id)
+            record = record.get("conversation")
+        ids.append(record_id)
+        conversations.append(record)
+
+    results = []
+    try:
+        results = analyzer.analyze_conversations(conversations, dedup_threshold=options.get("dedup_threshold"))
+    except Exception:
+        # 整批失败时逐个分析，定位出错的会话
+        results = []
+        for conversation in conversations:
+            try:
+                results.append(analyzer.analyze_conversation(conversation))
+            except Exception as e:
+                results.append({"error": f"分析失败: {e}"})
+
+    chunks = []
+    for record_id, result in zip(ids, results):
+        chunks.append(backend.dumps({"id": record_id, "result": result}))
+    for error in errors:
+        chunks.append(backend.dumps(error))
+    _atomic_write(shard["output"], b"\n".join(chunks) + (b"\n" if chunks else b""))
+
+    return {
+        "id": shard["id"],
+        "processed": len(ids),
+        "errors": len(errors) + sum(1 for r in results if isinstance(r, dict) and "error" in r),
+        "duplicates": sum(1 for r in results if isinstance(r, dict) and "duplicate_of" in r),
+        "prefiltered": prefilter_stats.skipped - skipped_before,
+    }
+
+
+class BatchRunner:
+    """
+    分片批量分析
+
+    将输入目录中的JSONL文件按行数切分为分片，每个分片的结果写入独立文件，
+    并在清单文件中记录分片状态。任务中断后重新运行时跳过已完成的分片。
+    """
+
+    def __init__(self, input_dir, output_dir, shard_size=1000, workers=1, patterns_file=None,
+                 vocabulary_file=None, include_summary=False, dedup_threshold=None, prefilter=False):
+        """
+        初始化批量分析任务
+
+        Args:
+            input_dir (str): 输入目录，包含 *.jsonl 文件，每行一个会话
+            output_dir (str): 输出目录，包含清单文件和 shards/ 下的分片结果
+            shard_size (int): 每个分片的会话数
+            workers (int): 并行处理分片的进程数，1表示在当前进程中处理
+            patterns_file (str, optional): 风险模式库文件路径
+            vocabulary_file (str, optional): 词汇库文件路径
+            include_summary (bool): 是否生成风险摘要
+            dedup_threshold (float, optional): 分片内近似重复去重的相似度阈值
+            prefilter (bool): 是否开启预筛选，不包含任何规则词汇的会话直接返回无风险结果
+        """
+        self.input_dir = input_dir
+        self.output_dir = output_dir
+        self.shard_size = max(1, shard_size)
+        self.workers = max(1, workers)
+        self.options = {
+            "patterns_file": patterns_file,
+            "vocabulary_file": vocabulary_file,
+            "include_summary": include_summary,
+            "dedup_threshold": dedup_threshold,
+            "prefilter": prefilter,
+        }
+        self.manifest_path = os.path.join(output_dir, MANIFEST_FILE)
+        self.shards_dir = os.path.join(output_dir, "shards")
+
+    def plan_shards(self):
+        """
+        根据输入文件生成分片计划
+
+        Returns:
+            list: 分片信息列表
+        """
+        shards = []
+        for path in sorted(glob.glob(os.path.join(self.input_dir, "*.jsonl"))):
+            stem = os.path.splitext(os.path.basename(path))[0]
+            total = _count_lines(path)
+            for index, start in enumerate(range(0, total, self.shard_size)):
+                shard_id = f"{stem}-{index:05d}"
+                shards.append({
+                    "id": shard_id,
+                    "file": os.path.abspath(path),
+                    "start": start,
+                    "count": min(self.shard_size, total - start),
+                    "output": os.path.join(os.path.abspath(self.shards_dir), f"{shard_id}.jsonl"),
+                })
+        return shards
+
+    def load_manifest(self):
+        """读取清单文件，不存在时返回None"""
+        if not os.path.exists(self.manifest_path):
+            return None
+        return serialization.load_file(self.manifest_path)
+
+    def _save_manifest(self, manifest):
+        _atomic_write(self.manifest_path, serialization.get_backend().dumps(manifest, pretty=True))
+
+    def _init_manifest(self):
+        """读取或创建清单，已有清单的分片计划必须与当前输入一致"""
+        shards = self.plan_shards()
+        manifest = self.load_manifest()
+        if manifest is not None:
+            planned = [(s["id"], s["start"], s["count"]) for s in shards]
+            recorded = [(s["id"], s["start"], s["count"]) for s in manifest.get("shards", [])]
+            if manifest.get("shard_size") != self.shard_size or planned != recorded:
+                raise ValueError(f"输入文件或分片大小与清单不一致，请使用新的输出目录: {self.manifest_path}")
+            return manifest
+
+        for shard in shards:
+            shard["status"] = "pending"
+        manifest = {
+            "version": MANIFEST_VERSION,
+            "input_dir": os.path.abspath(self.input_dir),
+            "shard_size": self.shard_size,
+            "shards": shards,
+        }
+        self._save_manifest(manifest)
+        return manifest
+
+    def run(self):
+        """
+        运行批量分析，跳过清单中已完成的分片
+
+        Returns:
+            dict: {"total", "completed", "skipped", "failed", "processed", "errors", "prefiltered"}
+        """
+        os.makedirs(self.shards_dir, exist_ok=True)
+        manifest = self._init_manifest()
+        by_id = {shard["id"]: shard for shard in manifest["shards"]}
+
+        pending = [shard for shard in manifest["shards"]
+                   if shard.get("status") != "done" or not os.path.exists(shard["output"])]
+        stats = {"total": len(by_id), "completed": 0, "skipped": len(by_id) - len(pending),
+                 "failed": 0, "processed": 0, "errors": 0, "prefiltered": 0}
+        logger.info(f"批量分析: 共 {stats['total']} 个分片，待处理 {len(pending)} 个，并行度 {self.workers}")
+
+        def finish(shard_id, outcome=None, error=None):
+            shard = by_id[shard_id]
+            if error is None:
+                shard.update(status="done", processed=outcome["processed"], errors=outcome["errors"],
+                             duplicates=outcome["duplicates"], prefiltered=outcome["prefiltered"],
+                             finished_at=time.time())
+                stats["completed"] += 1
+                stats["processed"] += outcome["processed"]
+                stats["errors"] += outcome["errors"]
+                stats["prefiltered"] += outcome["prefiltered"]
+            else:
+                shard.update(status="failed", error=error)
+                stats["failed"] += 1
+                logger.error(f"分片 {shard_id} 处理失败: {error}")
+            # 每完成一个分片更新一次清单，中断后从这里继续
+            self._save_manifest(manifest)
+
+        if self.workers == 1:
+            for shard in pending:
+                try:
+                    finish(shard["id"], process_shard(shard, self.options))
+                except Exception as e:
+                    logger.debug(traceback.format_exc())
+                    finish(shard["id"], error=str(e))
+        else:
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                futures = {executor.submit(process_shard, shard, self.options): shard["id"] for shard in pending}
+                for future in as_completed(futures):
+                    try:
+                        finish(futures[future], future.result())
+                    except Exception as e:
+                        finish(futures[future], error=str(e))
+
+        logger.info(f"批量分析完成: 完成 {stats['completed']} 个分片，跳过 {stats['skipped']} 个，"
+                    f"失败 {stats['failed']} 个，共分析 {stats['processed']} 个会话")
+        if self.options["prefilter"] and stats["processed"]:
+            pass_through = 1 - stats["prefiltered"] / stats["processed"]
+            logger.info(f"预筛选放行比例 {pass_through:.1%}，直接判定无风险 {stats['prefiltered']} 个会话")
+        return stats
@@ -0,0 +1,216 @@
+import logging
+import os
+
+from ..utils import serialization
+from .normalization import normalize_text
+
+logger = logging.getLogger(__name__)
+
+# 概念共现图文件格式版本
+GRAPH_FORMAT = 1
+# 运行时建立共现关联的默认权重下限（归一化点互信息）
+DEFAULT_MIN_WEIGHT = 0.2
+
+
+class CombinationIndex:
+    """
+    危险组合的查找表
+
+    语义网络中的概念节点与组合关键词的子串关系在首次遇到该节点时计算并缓存，
+    之后每个会话只需按节点查表，得到它命中的 (组合, 关键词) 位置，
+    不再对每个会话逐一扫描全部组合和全部概念。规则集共享同一个查找表，缓存随之跨会话复用。
+    """
+
+    __slots__ = ("combinations", "keywords", "_keywords", "_matches")
+
+    def __init__(self, dangerous_combinations):
+        """
+        编译危险组合
+
+        Args:
+            dangerous_combinations (dict): {类别: [{"keywords": [...], "score": 分数}]}，见 semantic.json
+        """
+        # [(类别, 分数)]，按配置顺序
+        self.combinations = []
+        # [(归一化关键词, 组合编号, 关键词在组合中的位置)]
+        self._keywords = []
+        keywords = set()
+        for category, combinations in dangerous_combinations.items():
+            for combo in combinations:
+                combination = len(self.combinations)
+                self.combinations.append((category, combo["score"]))
+                for position, keyword in enumerate(combo["keywords"]):
+                    self._keywords.append((normalize_text(keyword), combination, position))
+                    keywords.add(keyword)
+        # 全部组合关键词（原始写法）
+        self.keywords = frozenset(keywords)
+        self._matches = {}
+
+    def lookup(self, node):
+        """
+        查找节点命中的组合关键词
+
+        Args:
+            node (str): 概念节点，归一化后包含组合关键词即为命中
+
+        Returns:
+            tuple: ((组合编号, 关键词位置), ...)
+        """
+        matches = self._matches.get(node)
+        if matches is None:
+            text = normalize_text(node)
+            matches = tuple((combination, position) for keyword, combination, position in self._keywords
+                            if keyword in text)
+            self._matches[node] = matches
+        return matches
+
+    def relations(self, nodes):
+        """
+        找出节点集合中成立的危险组合
+
+        Args:
+            nodes (list): 概念节点，按加入语义网络的顺序
+
+        Yields:
+            tuple: (命中的节点列表, 类别, 分数)，按配置顺序；节点按组合关键词顺序排列，
+                同一关键词命中的节点保持输入顺序，命中多个关键词的节点重复出现
+        """
+        found = {}
+        for node in nodes:
+            for combination, position in self.lookup(node):
+                found.setdefault(combination, {}).setdefault(position, []).append(node)
+        for combination in sorted(found):
+            by_position = found[combination]
+            concepts = [node for position in sorted(by_position) for node in by_position[position]]
+            if len(concepts) >= 2:
+                category, score = self.combinations[combination]
+                yield concepts, category, score
+
+
+class ConceptGraph:
+    """
+    离线挖掘的概念共现图
+
+    由 cooccurrence.build_concept_graph 统计爬取语料中技术术语的共现得到，
+    边权为归一化点互信息 (NPMI)。文件中以上三角的压缩稀疏行格式保存，
+    加载时展开为 {概念对编号: 权重} 的字典，运行时按概念对 O(1) 查找。
+    """
+
+    __slots__ = ("terms", "documents", "_ids", "_weights")
+
+    def __init__(self, terms, indptr, indices, weights, documents=0):
+        """
+        初始化共现图
+
+        Args:
+            terms (list): 概念名称，下标为概念编号
+            indptr (list): 各行在 indices/weights 中的起始位置，长度为概念数+1
+            indices (list): 各条边的列编号（大于行编号）
+            weights (list): 各条边的权重
+            documents (int): 统计时的文档数
+        """
+        self.terms = list(terms)
+        self.documents = documents
+        self._ids = {}
+        for term_id, term in enumerate(self.terms):
+            self._ids.setdefault(term, term_id)
+        count = len(self.terms)
+        self._weights = {}
+        for row in range(count):
+            for k in range(indptr[row], indptr[row + 1]):
+                self._weights[row * count + indices[k]] = weights[k]
+
+    @classmethod
+    def load(cls, path):
+        """
+        读取共现图文件
+
+        Args:
+            path (str): 文件路径
+
+        Returns:
+            ConceptGraph: 共现图
+        """
+        data = serialization.load_file(path)
+        if not isinstance(data, dict) or data.get("format") != GRAPH_FORMAT:
+            raise ValueError(f"不支持的概念共现图格式: {path}")
+        return cls(data["terms"], data["indptr"], data["indices"], data["weights"], data.get("documents", 0))
+
+    @classmethod
+    def from_config(cls, options):
+        """
+        按 semantic.json 的 concept_graph 配置加载共现图
+
+        Args:
+            options (dict): {"path": 文件路径, "min_weight": 权重下限}
+
+        Returns:
+            ConceptGraph: 共现图，未配置或读取失败时为None
+        """
+        path = (options or {}).get("path")
+        if not path:
+            return None
+        if not os.path.exists(path):
+            logger.warning(f"概念共现图文件不存在: {path}")
+            return None
+        try:
+            graph = cls.load(path)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"加载概念共现图失败: {path}, 错误: {e}")
+            return None
+        logger.info(f"已加载概念共现图: {path}，{len(graph.terms)} 个概念，{graph.pair_count} 条边")
+        return graph
+
+    def save(self, path):
+        """
+        保存共现图文件
+
+        Args:
+            path (str): 文件路径
+        """
+        count = len(self.terms)
+        indptr = [0] * (count + 1)
+        indices = []
+        weights = []
+        for key in sorted(self._weights):
+            row, column = divmod(key, count)
+            indptr[row + 1] += 1
+            indices.append(column)
+            weights.append(self._weights[key])
+        for row in range(count):
+            indptr[row + 1] += indptr[row]
+        serialization.dump_file({
+            "format": GRAPH_FORMAT,
+            "documents": self.documents,
+            "terms": self.terms,
+            "indptr": indptr,
+            "indices": indices,
+            "weights": weights,
+        }, path)
+
+    @property
+    def pair_count(self):
+        """边数"""
+        return len(self._weights)
+
+    def weight(self, first, second):
+        """
+        查找两个概念的共现权重
+
+        Args:
+            first (str): 概念名称
+            second (str): 概念名称
+
+        Returns:
+            float: 归一化点互信息，未共现或概念不在图中时为0
+        """
+        i = self._ids.get(first)
+        j = self._ids.get(second)
+        if i is None or j is None or i == j:
+            return 0.0
+        if i > j:
+            i, j = j, i
+        return self._weights.get(i * len(self.terms) + j, 0.0)
+
+    def __repr__(self):
+        return f"ConceptGraph(terms={len(self.terms)}, pairs={self.pair_count})"
@@ -1,15 +1,19 @@
-import json
 import logging
+import functools
 from collections import Counter
 from .risk_detector import RiskDetector
+from .results import Verdict
+from ..utils import serialization
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# 快速判定模式的默认拦截阈值（风险分数0-100）
+DEFAULT_BLOCK_THRESHOLD = 60
+
 class ConversationAnalyzer:
     """会话风险分析器"""
     
-    def __init__(self, risk_detector=None, patterns_file=None, vocabulary_file=None):
+    def __init__(self, risk_detector=None, patterns_file=None, vocabulary_file=None, include_summary=True):
         """
         初始化会话风险分析器
         
@@ -17,24 +21,33 @@ class ConversationAnalyzer:
             risk_detector (RiskDetector, optional): 风险检测器实例
             patterns_file (str, optional): 风险模式库文件路径
             vocabulary_file (str, optional): 风险词汇库文件路径
+            include_summary (bool): 是否在分析结果中生成可读的风险摘要，
+                批量处理只需要分数和模式ID时可关闭以跳过摘要生成
         """
         if risk_detector:
             self.risk_detector = risk_detector
         else:
             self.risk_detector = RiskDetector(patterns_file, vocabulary_file)
+        
+        self.include_summary = include_summary
             
-        logger.info("会话风险分析器初始化完成")
+        logger.debug("会话风险分析器初始化完成")
     
-    def analyze_conversation(self, conversation):
+    def analyze_conversation(self, conversation, include_summary=None):
         """
         分析会话风险 - 增强版，支持分散式风险和多角色场景
         
         Args:
             conversation (list): 会话列表，格式为 [{"role": "...", "content": "..."}, ...]
+            include_summary (bool, optional): 是否生成风险摘要，默认使用初始化时的设置；
+                为False时结果中的summary为None
             
         Returns:
             dict: 分析结果
         """
+        if include_summary is None:
+            include_summary = self.include_summary
+        
         # 检查会话格式
         if not isinstance(conversation, list):
             logger.error("会话必须是列表格式")
@@ -67,15 +80,126 @@ class ConversationAnalyzer:
             "risk_score": risk_score,
             "risk_categories": risk_result.get("risk_categories", []),
             "risk_patterns": risk_result.get("risk_patterns", []),
-            "summary": risk_result.get("risk_summary", ""),
+            "summary": risk_result.get("risk_summary", "") if include_summary else None,
             "semantic_risks": risk_result.get("semantic_risks", {}),
             "multi_role_risks": risk_result.get("multi_role_risks", {})
         }
+        if "similar_patterns" in risk_result:
+            result["similar_patterns"] = risk_result["similar_patterns"]
         
-        logger.info(f"会话分析完成，风险检测结果: {'有风险' if result['risk_detected'] else '无风险'}")
-        
+        logger.debug("会话分析完成，风险分数: %s", result["risk_score"])
+
         return result
 
+    def analyze_conversations(self, conversations, dedup_threshold=None, include_summary=None):
+        """
+        批量分析会话，可选先对近似重复会话聚类
+
+        开启去重时，每个簇只完整分析代表会话，其余会话复用代表会话的检测结果，
+        会话统计信息按各自内容计算，并通过 duplicate_of 标明代表会话的下标。
+
+        Args:
+            conversations (list): 会话列表的列表
+            dedup_threshold (float, optional): 近似重复的相似度阈值（0-1），为None时不去重
+            include_summary (bool, optional): 是否生成风险摘要，默认使用初始化时的设置
+
+        Returns:
+            list: 与输入一一对应的分析结果
+        """
+        if dedup_threshold is None:
+            return [self.analyze_conversation(conversation, include_summary) for conversation in conversations]
+
+        from .dedup import NearDuplicateIndex
+        index = NearDuplicateIndex(threshold=dedup_threshold)
+
+        results = []
+        for i, conversation in enumerate(conversations):
+            duplicate = None
+            if isinstance(conversation, list) and conversation:
+                duplicate = index.add(i, conversation)
+
+            if duplicate is None:
+                results.append(self.analyze_conversation(conversation, include_summary))
+                continue
+
+            representative, similarity = duplicate
+            result = dict(results[representative])
+            result["conversation_stats"] = self._get_conversation_stats(conversation)
+            result["duplicate_of"] = representative
+            result["duplicate_similarity"] = similarity
+            results.append(result)
+
+        logger.info(f"批量分析完成: {len(conversations)} 个会话，{index.clusters} 个簇，"
+                    f"近似重复占比 {index.duplicate_rate:.1%}")
+        return results
+
+    def assess_conversation(self, conversation, block_threshold=DEFAULT_BLOCK_THRESHOLD):
+        """
+        快速判定会话是否达到拦截阈值
+
+        按开销从低到高依次运行风险类别、风险模式、语义网络和多角色检测，
+        每个阶段后用已有结果计算分数，达到阈值即停止，后续阶段不再运行。
+        各阶段只会增加分数（语义网络阶段之前的分数不超过之后的分数），
+        因此提前结束时的判定与完整分析一致。
+
+        Args:
+            conversation (list): 会话列表，格式为 [{"role": "...", "content": "..."}, ...]
+            block_threshold (int): 拦截阈值
+
+        Returns:
+            Verdict: 判定结果，details 属性按需生成完整分析结果
+        """
+        details_loader = functools.partial(self.analyze_conversation, conversation)
+        if not isinstance(conversation, list) or not conversation:
+            return Verdict(False, 0, block_threshold, [], True, details_loader)
+
+        detector = self.risk_detector
+        ruleset = detector.ruleset
+
+        # 开启预筛选时，没有命中任何词汇的会话不运行任何检测阶段
+        if detector.prefilter_enabled:
+            passed = ruleset.prefilter.should_analyze(conversation)
+            detector.prefilter_stats.record(passed)
+            if not passed:
+                return Verdict(False, 0, block_threshold, ["prefilter"], True, details_loader)
+
+        texts = [turn.get("content", "").strip() for turn in conversation
+                 if isinstance(turn, dict) and turn.get("content", "").strip()]
+
+        risk_result = {"risk_categories": [], "risk_patterns": [], "semantic_risks": {}, "multi_role_risks": {}}
+        stages = []
+
+        def settled():
+            score = self._calculate_enhanced_risk_score(conversation, risk_result)
+            return score, score >= block_threshold
+
+        risk_result["risk_categories"] = detector._detect_risk_categories(texts, ruleset)
+        stages.append("categories")
+        score, blocked = settled()
+
+        if not blocked:
+            risk_patterns, _ = detector._detect_risk_patterns_with_details(
+                conversation, risk_result["risk_categories"], ruleset)
+            risk_result["risk_patterns"] = list(risk_patterns)
+            stages.append("patterns")
+            score, blocked = settled()
+
+        if not blocked:
+            risk_result["semantic_risks"] = detector._detect_semantic_risks(conversation, ruleset)
+            stages.append("semantic")
+            score, blocked = settled()
+
+        if not blocked:
+            multi_role_risks = detector._detect_multi_role_risks(conversation, ruleset)
+            risk_result["multi_role_risks"] = multi_role_risks
+            for pattern in multi_role_risks.get("risk_patterns", []):
+                if pattern["pattern_id"] not in risk_result["risk_patterns"]:
+                    risk_result["risk_patterns"].append(pattern["pattern_id"])
+            stages.append("multi_role")
+            score, blocked = settled()
+
+        return Verdict(blocked, score, block_threshold, stages, len(stages) == 4, details_loader)
+
     def _calculate_enhanced_risk_score(self, conversation, risk_result):
         """
         计算增强的风险评分，考虑多角色和分散式风险
@@ -275,11 +399,17 @@ class ConversationAnalyzer:
         
         return summary
     
-    def save_analysis_result(self, result, output_file):
-        """将分析结果保存到文件"""
+    def save_analysis_result(self, result, output_file, pretty=False):
+        """
+        将分析结果保存到文件
+        
+        Args:
+            result (dict): 分析结果
+            output_file (str): 输出文件路径
+            pretty (bool): 是否缩进输出，默认紧凑格式
+        """
         try:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(result, f, ensure_ascii=False, indent=4)
+            serialization.dump_file(result, output_file, pretty=pretty)
             logger.info(f"分析结果已保存到: {output_file}")
             return True
         except Exception as e:
@@ -298,8 +428,7 @@ class ConversationAnalyzer:
             dict: 分析结果
         """
         try:
-            with open(conversation_file, 'r', encoding='utf-8') as f:
-                conversation = json.load(f)
+            conversation = serialization.load_file(conversation_file)
                 
             result = self.analyze_conversation(conversation)
             
@@ -0,0 +1,174 @@
+import glob
+import logging
+import os
+from array import array
+
+import numpy as np
+
+from ..utils import serialization
+from .concept_graph import ConceptGraph
+from .normalization import normalize_text
+from .prefilter import KeywordAutomaton
+
+logger = logging.getLogger(__name__)
+
+# 默认参数：至少在2个文档中共现，保留正的归一化点互信息
+DEFAULT_MIN_COUNT = 2
+# 每累积这么多个概念对就合并一次计数，限制待合并数组的内存
+DEFAULT_CHUNK_PAIRS = 1 << 20
+
+
+def iter_scraped_documents(paths):
+    """
+    读取 WikiScraper 输出中的文本片段
+
+    Args:
+        paths (list): 爬取结果文件（如 data/vocabulary.json）或目录（如 data/wikidump，读取其中的 *.json 缓存）
+
+    Yields:
+        str: related_content 中的每个片段，作为一个共现文档
+    """
+    for path in paths:
+        files = sorted(glob.glob(os.path.join(path, "*.json"))) if os.path.isdir(path) else [path]
+        for file_path in files:
+            try:
+                data = serialization.load_file(file_path)
+            except (OSError, ValueError) as e:
+                logger.warning(f"读取爬取结果失败: {file_path}, 错误: {e}")
+                continue
+            related = data.get("related_content") if isinstance(data, dict) else None
+            if not isinstance(related, dict):
+                continue
+            for snippets in related.values():
+                if isinstance(snippets, list):
+                    for snippet in snippets:
+                        if isinstance(snippet, str):
+                            yield snippet
+
+
+class CooccurrenceCounter:
+    """
+    概念共现的流式计数
+
+    每个文档只记录出现了哪些概念。概念对编号为 行×概念数+列（行<列），先追加到缓冲区，
+    累积到 chunk_pairs 个后与已有计数合并为按编号排序、不重复的稀疏矩阵（坐标格式），
+    内存只与不同概念对的数量和缓冲区大小有关，与语料规模无关。
+    """
+
+    __slots__ = ("term_count", "chunk_pairs", "documents", "_term_counts", "_pending", "_keys", "_counts")
+
+    def __init__(self, term_count, chunk_pairs=DEFAULT_CHUNK_PAIRS):
+        """
+        初始化计数
+
+        Args:
+            term_count (int): 概念数
+            chunk_pairs (int): 合并计数前缓冲的概念对数量
+        """
+        self.term_count = term_count
+        self.chunk_pairs = chunk_pairs
+        self.documents = 0
+        self._term_counts = np.zeros(term_count, dtype=np.int64)
+        self._pending = array("q")
+        self._keys = np.zeros(0, dtype=np.int64)
+        self._counts = np.zeros(0, dtype=np.int64)
+
+    def add(self, term_ids):
+        """
+        记录一个文档
+
+        Args:
+            term_ids (iterable): 文档中出现的概念编号，重复的只计一次
+        """
+        ids = sorted(set(term_ids))
+        self.documents += 1
+        if not ids:
+            return
+        self._term_counts[ids] += 1
+        count = self.term_count
+        for i, first in enumerate(ids):
+            base = first * count
+            self._pending.extend(base + second for second in ids[i + 1:])
+        if len(self._pending) >= self.chunk_pairs:
+            self._merge()
+
+    def _merge(self):
+        """把缓冲区合并进稀疏计数"""
+        if not self._pending:
+            return
+        pending = np.frombuffer(self._pending, dtype=np.int64)
+        keys, inverse = np.unique(np.concatenate([self._keys, pending]), return_inverse=True)
+        weights = np.concatenate([self._counts, np.ones(len(pending), dtype=np.int64)])
+        self._counts = np.bincount(inverse, weights=weights, minlength=len(keys)).astype(np.int64)
+        self._keys = keys
+        self._pending = array("q")
+
+    def pairs(self):
+        """
+        全部概念对的共现次数
+
+        Returns:
+            tuple: (行编号, 列编号, 共现文档数)，按 (行, 列) 排序，行<列
+        """
+        self._merge()
+        rows, columns = np.divmod(self._keys, self.term_count)
+        return rows, columns, self._counts
+
+    def npmi(self, min_count=DEFAULT_MIN_COUNT):
+        """
+        计算归一化点互信息 NPMI = log(p(a,b) / (p(a)p(b))) / -log p(a,b)
+
+        Args:
+            min_count (int): 共现文档数下限，低于下限的概念对不计算
+
+        Returns:
+            tuple: (行编号, 列编号, NPMI)，只包含 NPMI 为正的概念对
+        """
+        rows, columns, counts = self.pairs()
+        keep = counts >= max(1, min_count)
+        rows, columns, counts = rows[keep], columns[keep], counts[keep].astype(np.float64)
+        total = float(self.documents)
+        joint = np.log(counts / total)
+        pmi = joint - np.log(self._term_counts[rows] / total) - np.log(self._term_counts[columns] / total)
+        # 两个概念出现在全部文档中时 -log p(a,b) 为0，视为完全相关
+        with np.errstate(divide="ignore", invalid="ignore"):
+            npmi = np.where(joint < 0, pmi / -joint, 1.0)
+        positive = npmi > 0
+        return rows[positive], columns[positive], npmi[positive]
+
+
+def build_concept_graph(documents, terms, filler=None, min_count=DEFAULT_MIN_COUNT,
+                        chunk_pairs=DEFAULT_CHUNK_PAIRS):
+    """
+    统计语料中技术术语的共现，构建概念共现图
+
+    概念按与语义网络分析相同的规则匹配（归一化、跳过填充字符），
+    同一归一化形式的术语合并为一个概念，名称取配置中第一次出现的写法。
+
+    Args:
+        documents (iterable): 文档文本，可以是生成器
+        terms (list): 技术术语，见 semantic.json 的 technical_terms
+        filler (FillerTable, optional): 填充字符表
+        min_count (int): 共现文档数下限
+        chunk_pairs (int): 合并计数前缓冲的概念对数量
+
+    Returns:
+        ConceptGraph: 共现图，边权为正的 NPMI
+    """
+    automaton = KeywordAutomaton(terms, filler)
+    names = {}
+    for term in terms:
+        if isinstance(term, str):
+            names.setdefault(normalize_text(term), term)
+    concepts = [names.get(keyword, keyword) for keyword in automaton.keywords]
+
+    counter = CooccurrenceCounter(len(concepts), chunk_pairs)
+    for text in documents:
+        counter.add(keyword_id for _, _, keyword_id in automaton.iter_matches(text))
+
+    rows, columns, weights = counter.npmi(min_count)
+    indptr = np.zeros(len(concepts) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=len(concepts)), out=indptr[1:])
+    logger.info(f"已统计概念共现: {counter.documents} 个文档，{len(concepts)} 个概念，{len(rows)} 条边")
+    return ConceptGraph(concepts, indptr.tolist(), columns.tolist(), np.round(weights, 4).tolist(),
+                        documents=counter.documents)
@@ -0,0 +1,196 @@
+import re
+import zlib
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# 默认参数：估计Jaccard相似度不低于阈值的会话视为近似重复
+DEFAULT_SIMILARITY_THRESHOLD = 0.9
+DEFAULT_NUM_PERM = 64
+DEFAULT_SHINGLE_SIZE = 5
+
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64(0xFFFFFFFF)
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def conversation_shingles(conversation, shingle_size=DEFAULT_SHINGLE_SIZE):
+    """
+    提取会话的字符片段（shingle）哈希集合
+
+    每轮内容归一化（小写、合并空白）后取定长字符片段，片段不跨越对话轮次。
+
+    Args:
+        conversation (list): 会话列表
+        shingle_size (int): 片段长度
+
+    Returns:
+        set: 片段的32位哈希值集合
+    """
+    hashes = set()
+    for turn in conversation:
+        if not isinstance(turn, dict):
+            continue
+        content = _WHITESPACE_RE.sub(" ", str(turn.get("content", "")).lower()).strip()
+        if not content:
+            continue
+        if len(content) <= shingle_size:
+            hashes.add(zlib.crc32(content.encode("utf-8")))
+            continue
+        for i in range(len(content) - shingle_size + 1):
+            hashes.add(zlib.crc32(content[i:i + shingle_size].encode("utf-8")))
+    return hashes
+
+
+def choose_bands(num_perm, threshold):
+    """
+    选择LSH分段数，使候选概率的拐点接近相似度阈值
+
+    Args:
+        num_perm (int): 签名长度
+        threshold (float): 相似度阈值
+
+    Returns:
+        tuple: (分段数, 每段行数)
+    """
+    best = None
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows:
+            continue
+        bands = num_perm // rows
+        # 分段数为b、每段r行时，候选概率曲线的拐点约为 (1/b)^(1/r)
+        error = abs((1.0 / bands) ** (1.0 / rows) - threshold)
+        if best is None or error < best[0]:
+            best = (error, bands, rows)
+    return best[1], best[2]
+
+
+class MinHasher:
+    """MinHash签名计算，使用固定随机种子保证同一批次内结果可比较"""
+
+    def __init__(self, num_perm=DEFAULT_NUM_PERM, seed=1):
+        """
+        初始化MinHash
+
+        Args:
+            num_perm (int): 签名长度（哈希函数个数）
+            seed (int): 随机种子
+        """
+        rng = np.random.RandomState(seed)
+        self.num_perm = num_perm
+        self._a = rng.randint(1, 1 << 61, size=num_perm, dtype=np.uint64)
+        self._b = rng.randint(0, 1 << 61, size=num_perm, dtype=np.uint64)
+
+    def signature(self, hashes):
+        """
+        计算MinHash签名
+
+        Args:
+            hashes (set): 片段哈希集合
+
+        Returns:
+            numpy.ndarray: 长度为 num_perm 的签名
+        """
+        if not hashes:
+            return np.full(self.num_perm, _MAX_HASH, dtype=np.uint64)
+        values = np.fromiter(hashes, dtype=np.uint64, count=len(hashes))
+        # 乘法在uint64上按2^64回绕，与常见MinHash实现一致
+        with np.errstate(over="ignore"):
+            permuted = (np.outer(self._a, values) + self._b[:, None]) % _MERSENNE_PRIME
+        return (permuted & _MAX_HASH).min(axis=1)
+
+
+class NearDuplicateIndex:
+    """
+    近似重复会话索引
+
+    每个簇只有代表会话写入LSH索引；新会话先按分段查找候选代表，
+    再用完整签名估计相似度，达到阈值即归入该簇，否则成为新簇的代表。
+    """
+
+    def __init__(self, threshold=DEFAULT_SIMILARITY_THRESHOLD, num_perm=DEFAULT_NUM_PERM,
+                 shingle_size=DEFAULT_SHINGLE_SIZE, seed=1):
+        """
+        初始化近似重复索引
+
+        Args:
+            threshold (float): 相似度阈值
+            num_perm (int): MinHash签名长度
+            shingle_size (int): 字符片段长度
+            seed (int): MinHash随机种子
+        """
+        self.threshold = threshold
+        self.shingle_size = shingle_size
+        self.hasher = MinHasher(num_perm, seed)
+        self.bands, self.rows = choose_bands(num_perm, threshold)
+        self._buckets = {}
+        self._signatures = {}
+        self.total = 0
+        self.duplicates = 0
+
+    def _band_keys(self, signature):
+        rows = self.rows
+        return [(band, signature[band * rows:(band + 1) * rows].tobytes()) for band in range(self.bands)]
+
+    def add(self, key, conversation):
+        """
+        加入一个会话
+
+        Args:
+            key: 会话标识
+            conversation (list): 会话列表
+
+        Returns:
+            tuple|None: 近似重复时返回 (代表会话标识, 估计相似度)，否则返回None
+        """
+        self.total += 1
+        signature = self.hasher.signature(conversation_shingles(conversation, self.shingle_size))
+        band_keys = self._band_keys(signature)
+
+        best = None
+        checked = set()
+        for band_key in band_keys:
+            for candidate in self._buckets.get(band_key, ()):
+                if candidate in checked:
+                    continue
+                checked.add(candidate)
+                similarity = float(np.mean(self._signatures[candidate] == signature))
+                if similarity >= self.threshold and (best is None or similarity > best[1]):
+                    best = (candidate, similarity)
+
+        if best is not None:
+            self.duplicates += 1
+            return best[0], round(best[1], 4)
+
+        self._signatures[key] = signature
+        for band_key in band_keys:
+            self._buckets.setdefault(band_key, []).append(key)
+        return None
+
+    @property
+    def clusters(self):
+        """簇（代表会话）数量"""
+        return len(self._signatures)
+
+    @property
+    def duplicate_rate(self):
+        """近似重复会话占比"""
+        return self.duplicates / self.total if self.total else 0.0
+
+
+def cluster_near_duplicates(conversations, threshold=DEFAULT_SIMILARITY_THRESHOLD, **kwargs):
+    """
+    对一批会话做近似重复聚类
+
+    Args:
+        conversations (list): 会话列表的列表
+        threshold (float): 相似度阈值
+        **kwargs: 传给 NearDuplicateIndex 的其他参数
+
+    Returns:
+        list: 与输入一一对应，代表会话为None，重复会话为 (代表会话下标, 估计相似度)
+    """
+    index = NearDuplicateIndex(threshold=threshold, **kwargs)
+    return [index.add(i, conversation) for i, conversation in enumerate(conversations)]
@@ -0,0 +1,172 @@
+import functools
+import itertools
+import logging
+import re
+import unicodedata
+
+from .normalization import ASTRAL_RE, char_class, normalize_text, precomputed_chars
+
+logger = logging.getLogger(__name__)
+
+# 默认视为填充字符的Unicode类别：空白(Z)、标点(P)、符号(S)、格式字符(Cf，含零宽字符)、控制字符(Cc)
+DEFAULT_FILLER_CATEGORIES = ("Z", "P", "S", "Cf", "Cc")
+# 默认不视为填充字符的字符，关键词不跨越这些字符匹配：
+# 句末和分句标点、顿号和冒号（中英文），如"天气好，毒，品尝美食"、"电脑病毒、品牌手机"不是"毒品"；
+# 换行符（与 str.splitlines 相同）；成对的引号和括号，如 他说：“病毒”品种很多。
+# 英文撇号 ' 也是拼音的隔音符号（如 xi'an），仍视为填充字符
+DEFAULT_KEEP_CHARACTERS = (
+    "。！？；，．.!?;,、：:"
+    "\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029"
+    "“”‘’「」『』\"()（）[]［］{}｛｝【】〔〕〖〗《》〈〉<>＜＞"
+)
+
+
+class FillerTable(dict):
+    """
+    填充字符表
+
+    攻击者常在关键词中插入空格、标点或零宽字符（如"炸 弹"、"炸*弹"）规避子串匹配。
+    关键词匹配时跳过填充字符：pattern 为预先计算的填充字符正则，整段文本一次删除；
+    单个字符的查询按字符首次出现时计算并缓存。
+
+    句末和分句标点、顿号、冒号、换行符和成对的引号括号（见 DEFAULT_KEEP_CHARACTERS）默认不是填充字符，
+    匹配不跨越句子、分句、并列的词语和引用。
+
+    可在 domains.json 的 text_matching 中配置（keep_characters 替换默认的不跳过字符）:
+    {"filler_categories": ["Z", "P", "S", "Cf", "Cc"], "filler_characters": "", "keep_characters": "。！？；，．.!?;,"}
+    """
+
+    def __init__(self, categories=DEFAULT_FILLER_CATEGORIES, extra="", keep=DEFAULT_KEEP_CHARACTERS):
+        """
+        初始化填充字符表
+
+        Args:
+            categories (iterable): 视为填充字符的Unicode类别，可以是大类（如"P"）或具体类别（如"Cf"）
+            extra (str): 额外视为填充字符的字符
+            keep (str): 不视为填充字符的字符，优先于 categories 和 extra
+        """
+        super().__init__()
+        self.categories = tuple(categories)
+        self.extra = extra
+        self.keep = keep
+        for char in extra:
+            self[char] = True
+        for char in keep:
+            self[char] = False
+
+    @classmethod
+    def from_config(cls, options):
+        """
+        从配置创建填充字符表
+
+        Args:
+            options (dict): text_matching 配置
+
+        Returns:
+            FillerTable: 填充字符表，配置 "ignore_filler": false 时返回None（按原文精确匹配）
+        """
+        options = options or {}
+        if not options.get("ignore_filler", True):
+            return None
+        return cls(options.get("filler_categories", DEFAULT_FILLER_CATEGORIES),
+                   options.get("filler_characters", ""), options.get("keep_characters", DEFAULT_KEEP_CHARACTERS))
+
+    def __missing__(self, char):
+        category = unicodedata.category(char)
+        value = self[char] = category in self.categories or category[0] in self.categories
+        return value
+
+    @property
+    def pattern(self):
+        """匹配基本多文种平面中连续填充字符的正则，相同配置的填充字符表共用"""
+        return _filler_pattern(self.categories, self.extra, self.keep)
+
+    def strip(self, text):
+        """
+        归一化并去掉文本中的填充字符
+
+        Args:
+            text (str): 文本
+
+        Returns:
+            str: 归一化并去掉填充字符后的文本
+        """
+        return self.remove(normalize_text(text))
+
+    def remove(self, text):
+        """
+        去掉已归一化文本中的填充字符
+
+        Args:
+            text (str): 归一化后的文本
+
+        Returns:
+            str: 去掉填充字符后的文本
+        """
+        if ASTRAL_RE.search(text):
+            return "".join(self.split(text)[0])
+        return self.pattern.sub("", text)
+
+    def split(self, text):
+        """
+        按连续填充字符切分已归一化的文本
+
+        Args:
+            text (str): 归一化后的文本
+
+        Returns:
+            tuple: (填充字符之间的片段, 各段连续填充字符)，片段比填充字符段多一个
+        """
+        if not ASTRAL_RE.search(text):
+            pattern = self.pattern
+            pieces = pattern.split(text)
+            return pieces, (pattern.findall(text) if len(pieces) > 1 else [])
+        # 辅助平面字符不在预先计算的正则中，逐字符判断
+        pieces = [[]]
+        runs = []
+        for char in text:
+            if self[char]:
+                if len(runs) < len(pieces):
+                    runs.append([])
+                runs[-1].append(char)
+            else:
+                if len(runs) == len(pieces):
+                    pieces.append([])
+                pieces[-1].append(char)
+        if len(runs) == len(pieces):
+            pieces.append([])
+        return ["".join(piece) for piece in pieces], ["".join(run) for run in runs]
+
+    def offsets(self, text):
+        """
+        各段连续填充字符在去掉填充字符的文本中的位置，用于把命中位置换算回原文
+
+        Args:
+            text (str): 归一化后的文本
+
+        Returns:
+            tuple: (各段填充字符之后第一个字符在去掉填充字符的文本中的位置, 截至各段删除的字符数)
+        """
+        if ASTRAL_RE.search(text):
+            pieces, runs = self.split(text)
+            return list(itertools.accumulate(map(len, pieces[:-1]))), list(itertools.accumulate(map(len, runs)))
+        gaps = []
+        removed = []
+        total = 0
+        for match in self.pattern.finditer(text):
+            start, end = match.span()
+            gaps.append(start - total)
+            total += end - start
+            removed.append(total)
+        return gaps, removed
+
+    def __repr__(self):
+        return f"FillerTable(categories={self.categories!r})"
+
+
+
+@functools.lru_cache(maxsize=8)
+def _filler_pattern(categories, extra, keep):
+    """预先计算填充字符正则，只在第一次使用时扫描码位范围"""
+    filler = FillerTable(categories, extra, keep)
+    return re.compile(char_class(char for char in precomputed_chars() if filler[char]) + "+")
@@ -0,0 +1,198 @@
+import time
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+# 阶段耗时直方图的默认分桶（秒）
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class StageTimer:
+    """
+    单次检测请求的阶段计时器
+
+    每个阶段结束时调用 lap(阶段名)，记录自上一次 lap（或创建计时器）以来的耗时，
+    每个阶段只需一次时钟读取。嵌套流程通过 child() 取得带前缀的子计时器，
+    子计时器与父计时器共享结果字典，但各自维护起始时间。
+    """
+
+    __slots__ = ("timings", "counters", "_prefix", "_last")
+
+    enabled = True
+
+    def __init__(self, prefix="", timings=None, counters=None):
+        """
+        初始化计时器
+
+        Args:
+            prefix (str): 阶段名前缀，子计时器使用
+            timings (dict, optional): 共享的 {阶段名: 耗时秒数}
+            counters (dict, optional): 共享的 {计数名: 数值}
+        """
+        self.timings = timings if timings is not None else {}
+        self.counters = counters if counters is not None else {}
+        self._prefix = prefix
+        self._last = time.perf_counter()
+
+    def lap(self, stage):
+        """记录阶段耗时，同名阶段累加"""
+        now = time.perf_counter()
+        key = self._prefix + stage
+        self.timings[key] = self.timings.get(key, 0.0) + (now - self._last)
+        self._last = now
+
+    def count(self, name, value=1):
+        """累加计数器"""
+        key = self._prefix + name
+        self.counters[key] = self.counters.get(key, 0) + value
+
+    def child(self, prefix):
+        """创建共享结果的子计时器，阶段名为 "前缀.阶段" """
+        return StageTimer(self._prefix + prefix + ".", self.timings, self.counters)
+
+    def as_dict(self):
+        """返回 {"timings": {...}, "counters": {...}}"""
+        return {"timings": dict(self.timings), "counters": dict(self.counters)}
+
+
+class NullTimer:
+    """计时关闭时使用的空计时器，所有操作都是空操作"""
+
+    __slots__ = ()
+
+    enabled = False
+
+    def lap(self, stage):
+        pass
+
+    def count(self, name, value=1):
+        pass
+
+    def child(self, prefix):
+        return self
+
+    def as_dict(self):
+        return None
+
+
+NULL_TIMER = NullTimer()
+
+
+class MetricsRegistry:
+    """
+    检测指标汇总
+
+    汇总每次请求的阶段耗时（直方图）和计数器，可输出Prometheus文本格式，
+    也可以注册回调，在每次请求结束时收到该请求的计时结果。
+    """
+
+    def __init__(self, namespace="risk_analyzer", buckets=DEFAULT_BUCKETS):
+        """
+        初始化指标汇总
+
+        Args:
+            namespace (str): 指标名前缀
+            buckets (tuple): 阶段耗时直方图分桶上界（秒）
+        """
+        self.namespace = namespace
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._callbacks = []
+        self._requests = 0
+        # {阶段名: [各分桶计数..., 总次数, 耗时总和]}
+        self._histograms = {}
+        self._counters = {}
+
+    def new_timer(self):
+        """为一次请求创建计时器"""
+        return StageTimer()
+
+    def add_callback(self, callback):
+        """
+        注册回调
+
+        Args:
+            callback (callable): callback(timings, counters)，每次请求结束时调用
+        """
+        self._callbacks.append(callback)
+
+    def observe(self, timer):
+        """
+        记录一次请求的计时结果
+
+        Args:
+            timer (StageTimer): 请求使用的计时器
+        """
+        if not timer.enabled:
+            return
+        with self._lock:
+            self._requests += 1
+            for stage, seconds in timer.timings.items():
+                histogram = self._histograms.get(stage)
+                if histogram is None:
+                    histogram = self._histograms[stage] = [0] * len(self.buckets) + [0, 0.0]
+                for i, bound in enumerate(self.buckets):
+                    if seconds <= bound:
+                        histogram[i] += 1
+                histogram[-2] += 1
+                histogram[-1] += seconds
+            for name, value in timer.counters.items():
+                self._counters[name] = self._counters.get(name, 0) + value
+
+        for callback in list(self._callbacks):
+            try:
+                callback(timer.timings, timer.counters)
+            except Exception as e:
+                logger.error(f"指标回调失败: {e}")
+
+    def snapshot(self):
+        """
+        获取汇总数据
+
+        Returns:
+            dict: {"requests": 请求数, "stages": {阶段: {"count", "sum"}}, "counters": {...}}
+        """
+        with self._lock:
+            return {
+                "requests": self._requests,
+                "stages": {stage: {"count": h[-2], "sum": h[-1]} for stage, h in self._histograms.items()},
+                "counters": dict(self._counters),
+            }
+
+    def reset(self):
+        """清空汇总数据"""
+        with self._lock:
+            self._requests = 0
+            self._histograms.clear()
+            self._counters.clear()
+
+    def to_prometheus(self):
+        """
+        输出Prometheus文本格式
+
+        Returns:
+            str: 指标文本
+        """
+        ns = self.namespace
+        with self._lock:
+            lines = [
+                f"# HELP {ns}_requests_total Number of instrumented detection requests.",
+                f"# TYPE {ns}_requests_total counter",
+                f"{ns}_requests_total {self._requests}",
+                f"# HELP {ns}_stage_duration_seconds Detection stage duration in seconds.",
+                f"# TYPE {ns}_stage_duration_seconds histogram",
+            ]
+            for stage in sorted(self._histograms):
+                histogram = self._histograms[stage]
+                for bound, count in zip(self.buckets, histogram):
+                    lines.append(f'{ns}_stage_duration_seconds_bucket{{stage="{stage}",le="{bound}"}} {count}')
+                lines.append(f'{ns}_stage_duration_seconds_bucket{{stage="{stage}",le="+Inf"}} {histogram[-2]}')
+                lines.append(f'{ns}_stage_duration_seconds_sum{{stage="{stage}"}} {histogram[-1]}')
+                lines.append(f'{ns}_stage_duration_seconds_count{{stage="{stage}"}} {histogram[-2]}')
+            if self._counters:
+                lines.append(f"# HELP {ns}_stage_items_total Items processed by detection stages.")
+                lines.append(f"# TYPE {ns}_stage_items_total counter")
+                for name in sorted(self._counters):
+                    lines.append(f'{ns}_stage_items_total{{name="{name}"}} {self._counters[name]}')
+        return "\n".join(lines) + "\n"
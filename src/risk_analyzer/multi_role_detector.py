@@ -4,36 +4,74 @@ import os
 import networkx as nx
 from collections import defaultdict, Counter
 from ..utils.config import ConfigLoader
+from .ruleset import RoleRuleIndex, normalize_keyword_lists
+from .instrumentation import NULL_TIMER
+from .normalization import normalize_text
+from .tokenizer import Tokenizer
+from .topic_shift import TopicShiftTracker, DEFAULT_WINDOW, DEFAULT_SIMILARITY_THRESHOLD
 
 logger = logging.getLogger(__name__)
 
+# 评估会话整体敏感度的主题关键词，不局限于特定领域；关键词预先归一化
+OVERALL_SENSITIVE_TOPICS = normalize_keyword_lists({
+    "暴力": ["暴力", "攻击", "伤害", "杀害", "殴打", "斗殴", "伤害", "武力"],
+    "毒品": ["毒品", "吸毒", "贩毒", "成瘾", "戒毒", "戒断", "药物滥用"],
+    "色情": ["色情", "露骨", "性行为", "性内容", "情色", "成人内容"],
+    "歧视": ["歧视", "种族", "性别", "仇恨", "偏见", "刻板印象", "冒犯"],
+    "极端主义": ["极端", "激进", "恐怖", "极化", "偏激", "煽动", "暴乱"],
+    "欺诈": ["欺诈", "诈骗", "骗局", "假冒", "盗用", "非法", "违法"],
+    "自杀": ["自杀", "自残", "伤害自己", "轻生", "结束生命", "死亡"],
+    "虐待": ["虐待", "侵犯", "骚扰", "霸凌", "威胁", "恐吓", "强迫"]
+})
+
 class MultiRolePatternDetector:
     """多角色会话风险模式检测器，专门针对跨角色的信息拼图风险"""
     
-    def __init__(self, risk_detector=None):
-        """初始化多角色模式检测器"""
+    def __init__(self, risk_detector=None, ruleset=None):
+        """
+        初始化多角色模式检测器
+        
+        Args:
+            risk_detector (RiskDetector, optional): 所属的风险检测器
+            ruleset (Ruleset, optional): 预先构建的规则集，提供时不再读取配置文件
+        """
         self.risk_detector = risk_detector
         
+        if ruleset is not None:
+            # 直接使用规则集中已解析的配置
+            self.config_loader = getattr(risk_detector, "config_loader", None)
+            self.domain_keywords = ruleset.domains_config.get("domain_keywords", {})
+            self.domain_keyword_lists = ruleset.domain_keyword_lists
+            self.sensitive_topics = ruleset.domains_config.get("sensitive_topics", {})
+            self.topic_shift_options = ruleset.domains_config.get("topic_shift", {})
+            self.role_specific_contributions = ruleset.roles_config.get("role_specific_contributions", {})
+            self.role_rules = ruleset.role_rules
+            self.role_interaction_risk = ruleset.role_interaction_risk
+            self.tokenizer = ruleset.tokenizer
+            return
+        
         # 创建配置加载器
         self.config_loader = ConfigLoader()
         
         # 从配置文件加载域关键词
         domains_config = self.config_loader.load_config("domains.json")
         self.domain_keywords = domains_config.get("domain_keywords", {})
+        self.domain_keyword_lists = normalize_keyword_lists(self.domain_keywords)
         self.sensitive_topics = domains_config.get("sensitive_topics", {})
+        self.topic_shift_options = domains_config.get("topic_shift", {})
         
         # 从配置文件加载角色定义
         roles_config = self.config_loader.load_config("roles.json")
         self.role_specific_contributions = roles_config.get("role_specific_contributions", {})
         
-        # 加载角色交互风险 - 配置文件中以字符串键存储，需要转换回元组
-        role_interaction_risk_config = roles_config.get("role_interaction_risk", {})
-        self.role_interaction_risk = {}
-        for key_str, value in role_interaction_risk_config.items():
-            # 将字符串键"role1,role2"转换为元组(role1, role2)
-            roles = key_str.split(",")
-            if len(roles) == 2:
-                self.role_interaction_risk[(roles[0], roles[1])] = value
+        # 加载角色规则 - 交互风险配置中以字符串键存储，索引中转换为元组
+        self.role_rules = RoleRuleIndex(roles_config)
+        self.role_interaction_risk = self.role_rules.interaction_risk
+
+        # 分词器，词典使用领域关键词
+        self.tokenizer = Tokenizer(
+            keyword for keywords in self.domain_keywords.values() for keyword in keywords
+        )
         
         # 将配置保存到默认文件(如果不存在)
         self._save_default_configs_if_not_exist()
@@ -57,27 +95,32 @@ class MultiRolePatternDetector:
             
             roles_config = {
                 "role_specific_contributions": self.role_specific_contributions,
-                "role_interaction_risk": role_interaction_risk_str
+                "role_interaction_risk": role_interaction_risk_str,
+                "high_risk_combinations": self.role_rules.combinations,
+                "sensitive_roles": self.role_rules.sensitive_roles
             }
             self.config_loader.save_config(roles_config, "roles.json")
     
-    def detect_multi_role_risks(self, conversation):
+    def detect_multi_role_risks(self, conversation, timer=NULL_TIMER):
         """
         检测多角色会话中的风险模式 - 增强泛化版本
         
         Args:
             conversation (list): 会话列表，格式为 [{"role": "...", "content": "..."}, ...]
+            timer (StageTimer, optional): 阶段计时器，默认不计时
             
         Returns:
             dict: 风险检测结果
         """
         # 提取所有角色
         roles = self._extract_roles(conversation)
-        logger.info(f"检测到会话中的角色: {', '.join(roles)}")
+        timer.count("roles", len(roles))
+        timer.lap("extract_roles")
+        logger.debug("检测到会话中的角色: %s", roles)
         
         # 角色数量检查 - 降低阈值以提高泛化性
         if len(roles) < 2:  # 从3降为2，增强泛化性
-            logger.info(f"角色数量({len(roles)})小于2，不符合多角色信息拼图风险模式")
+            logger.debug("角色数量(%d)小于2，不符合多角色信息拼图风险模式", len(roles))
             return {
                 "multi_role_risk_detected": False,
                 "risk_score": 0,
@@ -90,24 +133,31 @@ class MultiRolePatternDetector:
         
         # 会话整体风险评估 - 检查是否包含敏感主题，不局限于特定领域
         overall_domain_risk = self._assess_overall_domain_risk(all_texts)
+        timer.lap("domain_risk")
         
         # 构建角色-主题映射
         role_topics = self._map_roles_to_topics(conversation)
+        timer.lap("role_topics")
         
         # 检测危险信息拼图
         info_puzzle = self._detect_information_puzzle(role_topics)
+        timer.lap("info_puzzle")
         
         # 角色交互序列分析
         interaction_risk = self._analyze_role_interaction_sequence(conversation)
+        timer.lap("interaction")
         
         # 角色身份敏感性评估
         role_sensitivity = self._evaluate_role_sensitivity(roles)
+        timer.lap("role_sensitivity")
         
         # 话题转移检测 - 新增功能
         topic_shift_risk = self._detect_topic_shifts(conversation)
+        timer.lap("topic_shift")
         
         # 信息补充模式检测 - 新增功能
         complementary_info_risk = self._detect_complementary_information(conversation)
+        timer.lap("complementary")
         
         # 综合风险评估 - 整合更多风险因素
         overall_risk = self._calculate_enhanced_overall_risk(
@@ -118,29 +168,18 @@ class MultiRolePatternDetector:
             complementary_info_risk,
             overall_domain_risk
         )
+        timer.lap("overall")
         
         return overall_risk
 
     def _assess_overall_domain_risk(self, text):
-        """评估会话整体涉及的敏感度，不局限于特定领域"""
-        # 更全面的敏感主题关键词
-        sensitive_topics = {
-            "暴力": ["暴力", "攻击", "伤害", "杀害", "殴打", "斗殴", "伤害", "武力"],
-            "毒品": ["毒品", "吸毒", "贩毒", "成瘾", "戒毒", "戒断", "药物滥用"],
-            "色情": ["色情", "露骨", "性行为", "性内容", "情色", "成人内容"],
-            "歧视": ["歧视", "种族", "性别", "仇恨", "偏见", "刻板印象", "冒犯"],
-            "极端主义": ["极端", "激进", "恐怖", "极化", "偏激", "煽动", "暴乱"],
-            "欺诈": ["欺诈", "诈骗", "骗局", "假冒", "盗用", "非法", "违法"],
-            "自杀": ["自杀", "自残", "伤害自己", "轻生", "结束生命", "死亡"],
-            "虐待": ["虐待", "侵犯", "骚扰", "霸凌", "威胁", "恐吓", "强迫"]
-        }
-        
+        """评估会话整体涉及的敏感度，不局限于特定领域，主题关键词见 OVERALL_SENSITIVE_TOPICS"""
         # 评估文本中敏感主题的出现情况
-        lower_text = text.lower()
+        lower_text = normalize_text(text)
         topic_scores = {}
         
-        for topic, keywords in sensitive_topics.items():
-            matches = sum(1 for keyword in keywords if keyword.lower() in lower_text)
+        for topic, keywords in OVERALL_SENSITIVE_TOPICS.items():
+            matches = sum(1 for _, key in keywords if key in lower_text)
             if matches > 0:
                 # 计算主题风险分数，与匹配词数量相关
                 score = min(1.0, matches / len(keywords) * 1.5)
@@ -186,15 +225,13 @@ class MultiRolePatternDetector:
             content = turn.get("content", "")
             
             # 检查内容中是否包含各个领域的关键词
-            for domain, keywords in self.domain_keywords.items():
-                matches = sum(1 for keyword in keywords if keyword.lower() in content.lower())
+            content = normalize_text(content)
+            for domain, keywords in self.domain_keyword_lists.items():
+                matches = sum(1 for _, key in keywords if key in content)
                 if matches > 0:
                     role_topics[role][domain] += matches
         
-        # 统计结果
-        for role, domains in role_topics.items():
-            logger.info(f"角色 '{role}' 讨论的危险领域: " + 
-                      ", ".join([f"{domain}({count})" for domain, count in domains.items()]))
+        logger.debug("角色讨论的危险领域: %s", role_topics)
         
         return role_topics
     
@@ -286,15 +323,14 @@ class MultiRolePatternDetector:
         interaction_patterns = []
         risk_score = 0
         
-        # 检查特定的高风险角色交互
-        for (role1, role2), risk_value in self.role_interaction_risk.items():
-            if G.has_edge(role1, role2) or G.has_edge(role2, role1):
-                interaction_patterns.append({
-                    "roles": [role1, role2],
-                    "risk_score": risk_value,
-                    "description": f"检测到 {role1} 和 {role2} 之间的高风险交互"
-                })
-                risk_score = max(risk_score, risk_value)
+        # 检查特定的高风险角色交互，只查找实际发生交互的角色对
+        for (role1, role2), risk_value in self.role_rules.match_interactions(G.edges()):
+            interaction_patterns.append({
+                "roles": [role1, role2],
+                "risk_score": risk_value,
+                "description": f"检测到 {role1} 和 {role2} 之间的高风险交互"
+            })
+            risk_score = max(risk_score, risk_value)
         
         # 检查是否存在中心角色(信息汇总者)
         centrality = nx.in_degree_centrality(G)
@@ -316,36 +352,21 @@ class MultiRolePatternDetector:
         }
     
     def _evaluate_role_sensitivity(self, roles):
-        """评估角色组合的敏感性"""
-        # 高风险角色组合
-        high_risk_combinations = [
-            {"roles": ["chemistry_student", "electronics_expert"], "score": 0.8},
-            {"roles": ["chemistry_student", "mechanical_engineer"], "score": 0.7},
-            {"roles": ["mining_engineer", "electronics_expert"], "score": 0.9},
-            {"roles": ["chemistry_teacher", "hobbyist"], "score": 0.6}
-        ]
-        
-        # 特定敏感角色
-        sensitive_roles = {
-            "chemistry_student": 0.5,
-            "mining_engineer": 0.6,
-            "hobbyist": 0.4,
-            "anonymous": 0.7
-        }
+        """评估角色组合的敏感性，高风险组合和敏感角色在 roles.json 中配置"""
+        sensitive_roles = self.role_rules.sensitive_roles
         
         # 检查角色组合
         risk_combinations = []
         max_risk_score = 0
         
-        # 检查预定义的高风险组合
-        for combo in high_risk_combinations:
-            if all(role in roles for role in combo["roles"]):
-                risk_combinations.append({
-                    "combination": combo["roles"],
-                    "risk_score": combo["score"],
-                    "description": f"检测到高风险角色组合: {', '.join(combo['roles'])}"
-                })
-                max_risk_score = max(max_risk_score, combo["score"])
+        # 检查预定义的高风险组合，只查找包含会话角色的组合
+        for combo in self.role_rules.match_combinations(roles):
+            risk_combinations.append({
+                "combination": combo["roles"],
+                "risk_score": combo["score"],
+                "description": f"检测到高风险角色组合: {', '.join(combo['roles'])}"
+            })
+            max_risk_score = max(max_risk_score, combo["score"])
         
         # 检查敏感角色
         sensitive_found = []
@@ -431,60 +452,35 @@ class MultiRolePatternDetector:
             }
         }
     
+    def create_topic_shift_tracker(self):
+        """
+        创建增量式话题转移检测器，用于实时会话逐轮检测
+
+        窗口大小和阈值可在 domains.json 的 topic_shift 中配置:
+        {"window": 3, "similarity_threshold": 0.2}
+
+        Returns:
+            TopicShiftTracker: 话题转移检测器
+        """
+        options = self.topic_shift_options
+        return TopicShiftTracker(
+            self.tokenizer,
+            window=options.get("window", DEFAULT_WINDOW),
+            similarity_threshold=options.get("similarity_threshold", DEFAULT_SIMILARITY_THRESHOLD)
+        )
+
     def _detect_topic_shifts(self, conversation):
         """检测会话中的话题突然转移，这可能是分散式风险模式的特征"""
-        if len(conversation) < 4:  # 至少需要4轮对话才能检测出有意义的话题转移
+        tracker = self.create_topic_shift_tracker()
+        # 至少需要窗口轮数加一轮对话才能检测出有意义的话题转移
+        if len(conversation) <= tracker.window.size:
             return {"risk_detected": False, "risk_score": 0, "shifts": []}
         
-        # 提取每轮对话的关键词
-        turn_keywords = []
         for turn in conversation:
             if isinstance(turn, dict) and "content" in turn:
-                # 提取关键词（简化实现，实际应使用NLP技术）
-                content = turn.get("content", "").lower()
-                # 这里可以使用更复杂的关键词提取算法
-                keywords = set(word for word in content.split() if len(word) > 3)
-                turn_keywords.append({
-                    "role": turn.get("role", "unknown"),
-                    "keywords": keywords
-                })
+                tracker.add_turn(turn.get("role", "unknown"), turn.get("content", ""))
         
-        # 检测话题转移
-        shifts = []
-        for i in range(3, len(turn_keywords)):
-            # 比较当前轮次与前几轮的关键词重叠度
-            current_keywords = turn_keywords[i]["keywords"]
-            previous_keywords = set()
-            for j in range(i-3, i):
-                previous_keywords.update(turn_keywords[j]["keywords"])
-            
-            # 计算关键词重叠度
-            if not current_keywords or not previous_keywords:
-                continue
-            
-            overlap = len(current_keywords.intersection(previous_keywords))
-            similarity = overlap / max(1, min(len(current_keywords), len(previous_keywords)))
-            
-            # 如果重叠度很低，可能是话题突然转移
-            if similarity < 0.2:  # 阈值可调整
-                shifts.append({
-                    "turn_index": i,
-                    "role": turn_keywords[i]["role"],
-                    "similarity": round(similarity, 2),
-                    "previous_roles": [turn_keywords[j]["role"] for j in range(i-3, i)]
-                })
-        
-        # 计算风险分数
-        risk_score = 0
-        if shifts:
-            # 评估风险 - 考虑话题转移次数和幅度
-            risk_score = min(1.0, len(shifts) / 3 * 0.7)  # 3次明显转移达到70%风险
-        
-        return {
-            "risk_detected": risk_score > 0.3,
-            "risk_score": round(risk_score, 2),
-            "shifts": shifts
-        }
+        return tracker.result()
 
     def _detect_complementary_information(self, conversation):
         """检测角色之间提供互补信息的模式"""
@@ -500,14 +496,14 @@ class MultiRolePatternDetector:
                 role_contents[role].append(content)
         
         # 合并每个角色的所有内容
-        role_combined_content = {role: " ".join(contents) for role, contents in role_contents.items()}
+        role_combined_content = {role: normalize_text(" ".join(contents)) for role, contents in role_contents.items()}
         
         # 对每个危险领域，检查是否有多个角色共同贡献了信息
         domain_contributions = defaultdict(list)
-        for domain, keywords in self.domain_keywords.items():
+        for domain, keywords in self.domain_keyword_lists.items():
             for role, content in role_combined_content.items():
                 # 检查该角色在此领域的贡献度
-                matched_keywords = [k for k in keywords if k.lower() in content.lower()]
+                matched_keywords = [k for k, key in keywords if key in content]
                 if matched_keywords:
                     domain_contributions[domain].append({
                         "role": role,
@@ -592,7 +588,7 @@ class MultiRolePatternDetector:
                     "pattern_id": "REP-COMBO-ROLES",
                     "pattern_type": "role_sensitivity",
                     "description": combo["description"],
-                    "risk_score": combo["score"],
+                    "risk_score": combo["risk_score"],
                     "roles_involved": combo["combination"]
                 })
         
@@ -0,0 +1,180 @@
+import functools
+import logging
+import re
+import unicodedata
+
+logger = logging.getLogger(__name__)
+
+# 与拉丁字母外形相同的西里尔字母和希腊字母（小写形式，大写字母先转小写再查表）
+HOMOGLYPHS = {
+    "а": "a", "в": "b", "е": "e", "ё": "e", "к": "k", "м": "m", "н": "h", "о": "o", "р": "p",
+    "с": "c", "т": "t", "у": "y", "х": "x", "ѕ": "s", "і": "i", "ї": "i", "ј": "j", "ԁ": "d",
+    "ӏ": "l", "ԛ": "q", "ԝ": "w", "ɡ": "g",
+    "α": "a", "β": "b", "ε": "e", "ζ": "z", "ι": "i", "κ": "k", "ο": "o", "ρ": "p", "τ": "t",
+    "υ": "u", "χ": "x",
+}
+
+# 常用繁体字到简体字（只收一对一的字，"乾"、"著"等一对多的字不做转换）
+_TRADITIONAL_SIMPLIFIED_PAIRS = """
+萬万 與与 專专 業业 東东 絲丝 兩两 嚴严 個个 豐丰 臨临 為为 麗丽 舉举 義义 烏乌 樂乐 習习 鄉乡 書书
+買买 亂乱 爭争 於于 虧亏 雲云 亞亚 產产 親亲 億亿 僅仅 從从 倉仓 儀仪 們们 價价 眾众 優优 會会 傘伞
+偉伟 傳传 傷伤 倫伦 偽伪 體体 餘余 傭佣 俠侠 偵侦 側侧 僑侨 債债 傾倾 償偿 儲储 兒儿 黨党 蘭兰 關关
+興兴 養养 獸兽 岡冈 冊册 寫写 軍军 農农 馮冯 沖冲 決决 況况 凍冻 淨净 涼凉 減减 幾几 鳳凤 憑凭 凱凯
+擊击 劃划 劉刘 則则 剛刚 創创 刪删 別别 劍剑 劑剂 剝剥 勸劝 辦办 務务 動动 勵励 勁劲 勞劳 勢势 勳勋
+匯汇 區区 醫医 華华 協协 單单 賣卖 衛卫 卻却 廠厂 廳厅 曆历 厲厉 壓压 厭厌 廁厕 縣县 參参 雙双 發发
+變变 敘叙 疊叠 葉叶 號号 嘆叹 嚇吓 嗎吗 啟启 吳吴 嘔呕 員员 嗆呛 嗚呜 響响 啞哑 嘩哗 喪丧 喚唤 嚨咙
+噴喷 囑嘱 團团 園园 圍围 圖图 圓圆 聖圣 場场 壞坏 塊块 堅坚 壇坛 墳坟 墜坠 墾垦 塗涂 牆墙 壯壮 聲声
+殼壳 壺壶 處处 備备 復复 夠够 頭头 誇夸 夾夹 奪夺 奮奋 獎奖 婦妇 媽妈 嬌娇 娛娱 嬰婴 孫孙 學学 寧宁
+寶宝 實实 寵宠 審审 憲宪 宮宫 寬宽 賓宾 寢寝 對对 尋寻 導导 壽寿 將将 爾尔 塵尘 嘗尝 屍尸 盡尽 層层
+屬属 屢屡 歲岁 豈岂 島岛 嶺岭 崗岗 峽峡 鞏巩 幣币 帥帅 師师 帳帐 帶带 幫帮 幹干 廣广 莊庄 慶庆 庫库
+應应 廟庙 龐庞 廢废 開开 異异 棄弃 張张 彌弥 彎弯 彈弹 強强 歸归 當当 錄录 彙汇 徹彻 徑径 憶忆 憂忧
+懷怀 態态 總总 戀恋 懇恳 惡恶 惱恼 悅悦 懸悬 驚惊 懼惧 慘惨 懲惩 慚惭 慣惯 憤愤 憫悯 願愿 懾慑 戲戏
+戶户 撲扑 執执 擴扩 掃扫 揚扬 擾扰 撫抚 拋抛 搶抢 護护 報报 擔担 擬拟 揀拣 擁拥 攔拦 撥拨 擇择 掛挂
+揮挥 擋挡 擠挤 損损 撿捡 換换 搗捣 據据 擄掳 擲掷 攜携 攝摄 擺摆 搖摇 攤摊 撐撑 斂敛 數数 鬥斗 斬斩
+斷断 無无 舊旧 時时 曠旷 晝昼 顯显 晉晋 曬晒 曉晓 暈晕 暫暂 術术 樸朴 機机 殺杀 雜杂 權权 條条 來来
+楊杨 傑杰 極极 構构 樞枢 棗枣 槍枪 楓枫 櫃柜 檸柠 柵栅 標标 棧栈 棟栋 欄栏 樹树 棲栖 樣样 檔档 橋桥
+樁桩 夢梦 檢检 樓楼 欖榄 檳槟 橫横 櫻樱 櫥橱 歡欢 歐欧 殲歼 殘残 毆殴 毀毁 畢毕 斃毙 氣气 氫氢 漢汉
+湯汤 溝沟 沒没 瀝沥 淪沦 滄沧 滬沪 淚泪 瀉泻 潑泼 澤泽 潔洁 灑洒 淺浅 漿浆 澆浇 濁浊 測测 濟济 瀏浏
+渾浑 濃浓 濤涛 澇涝 漣涟 渦涡 滌涤 潤润 漲涨 澀涩 淵渊 漬渍 漸渐 漁渔 滲渗 溫温 遊游 灣湾 濕湿 潰溃
+濺溅 滯滞 滿满 濾滤 濫滥 濱滨 灘滩 瀟潇 瀾澜 潛潜 燈灯 靈灵 災灾 燦灿 爐炉 燉炖 點点 煉炼 熾炽 爍烁
+爛烂 燭烛 煙烟 煩烦 燒烧 燙烫 燼烬 熱热 煥焕 愛爱 爺爷 牽牵 犧牺 狀状 猶犹 獰狞 獨独 狹狭 獅狮 獄狱
+獻献 獵猎 豬猪 貓猫 環环 現现 瑪玛 瑣琐 瓊琼 瑤瑶 瑩莹 電电 畫画 暢畅 療疗 瘧疟 瘍疡 瘡疮 瘋疯 癢痒
+癆痨 瘓痪 癇痫 癡痴 癱瘫 癮瘾 癩癞 癬癣 癲癫 皺皱 盜盗 盞盏 鹽盐 監监 蓋盖 盤盘 睜睁 瞞瞒 矚瞩 矯矫
+礦矿 碼码 磚砖 碩硕 確确 礙碍 禮礼 禍祸 禪禅 離离 禿秃 種种 積积 稱称 穢秽 穩稳 穀谷 窮穷 竊窃 竅窍
+窯窑 竄窜 窩窝 競竞 筆笔 筍笋 籌筹 簽签 簡简 籃篮 籬篱 類类 糧粮 糾纠 紀纪 約约 紅红 紋纹 納纳 紐纽
+純纯 紗纱 紙纸 級级 紛纷 紡纺 緊紧 細细 紳绅 紹绍 終终 組组 絆绊 結结 絕绝 絞绞 絡络 給给 絨绒 統统
+經经 綁绑 綜综 綠绿 維维 綱纲 網网 綴缀 綿绵 緒绪 線线 緝缉 締缔 編编 緩缓 緯纬 練练 縛缚 縫缝 縮缩
+縱纵 績绩 織织 繞绕 繩绳 繪绘 繳缴 繼继 續续 纏缠 纖纤 纜缆 罰罚 罵骂 罷罢 羅罗 羈羁 聞闻 聯联 聰聪
+聳耸 職职 聽听 肅肃 腸肠 膚肤 腫肿 脹胀 膽胆 勝胜 脈脉 脅胁 臉脸 腦脑 腳脚 膠胶 臘腊 臟脏 艙舱 艦舰
+艷艳 節节 蘆芦 莖茎 蘇苏 蘋苹 範范 藥药 薦荐 萊莱 蓮莲 獲获 營营 蕭萧 藍蓝 蟲虫 蝦虾 螞蚂 雖虽 蠶蚕
+蠻蛮 衝冲 補补 裝装 製制 複复 褲裤 襲袭 見见 規规 視视 覽览 覺觉 觀观 觸触 計计 訂订 認认 討讨 讓让
+訓训 議议 記记 講讲 許许 論论 設设 訪访 證证 評评 識识 詐诈 訴诉 診诊 詞词 試试 詩诗 話话 該该 詳详
+誠诚 誤误 說说 請请 諸诸 讀读 課课 誰谁 調调 談谈 謀谋 謊谎 謎谜 謝谢 謹谨 譜谱 譯译 譽誉 讚赞 貝贝
+負负 財财 責责 貢贡 貨货 販贩 貪贪 貧贫 購购 貫贯 貴贵 費费 貿贸 賀贺 資资 賊贼 賄贿 賞赏 賠赔 賭赌
+賴赖 質质 贈赠 贏赢 趕赶 趙赵 躍跃 踐践 車车 軌轨 軟软 轉转 輪轮 輸输 辭辞 運运 遠远 違违 連连 週周
+進进 過过 達达 選选 遲迟 遺遗 邊边 郵邮 鄰邻 醜丑 釋释 針针 釣钓 鈔钞 鉛铅 銀银 銅铜 鋁铝 銷销 鋒锋
+鋼钢 錢钱 錯错 鍋锅 鍵键 鎖锁 鏈链 鏡镜 鐘钟 鐵铁 鑰钥 長长 門门 閃闪 閉闭 問问 閒闲 間间 閱阅 闖闯
+隊队 陽阳 陰阴 陣阵 陳陈 陸陆 際际 險险 隨随 隱隐 雞鸡 難难 霧雾 靜静 韓韩 頁页 項项 順顺 須须 預预
+領领 頻频 題题 顏颜 額额 風风 飛飞 飯饭 飲饮 飽饱 飾饰 餅饼 餓饿 館馆 馬马 駕驾 駭骇 騎骑 騙骗 驗验
+驅驱 髮发 鬆松 魚鱼 鳥鸟 鴉鸦 麥麦 黃黄 齊齐 齒齿 龍龙 龜龟 後后 裡里 裏里 麼么 這这 還还 適适 麵面
+""".split()
+TRADITIONAL_TO_SIMPLIFIED = {pair[0]: pair[1] for pair in _TRADITIONAL_SIMPLIFIED_PAIRS}
+
+
+def _fold_char(char):
+    """
+    单个字符的归一化形式：NFKC（全角转半角、兼容字符）、小写、同形字、繁体转简体
+
+    归一化结果不是单个字符时（如连字"ﬁ"）退回小写或原字符，保证归一化前后文本长度不变，
+    命中位置可以直接对应原文。
+    """
+    folded = unicodedata.normalize("NFKC", char).lower()
+    if len(folded) != 1:
+        lowered = char.lower()
+        folded = lowered if len(lowered) == 1 else char
+    folded = HOMOGLYPHS.get(folded, folded)
+    return TRADITIONAL_TO_SIMPLIFIED.get(folded, folded)
+
+
+# 预先计算的码位范围为基本多文种平面，正则引擎对其中的字符类使用位图，逐字符判断为常数时间；
+# 含辅助平面字符（数学字母数字、表情等）的文本逐字符查表
+PRECOMPUTED_RANGE = (0x0, 0x10000)
+ASTRAL_RE = re.compile("[\U00010000-\U0010FFFF]")
+
+# 中文文本中常见的全角标点，几乎每个回合都有，用 str.replace 直接替换，不经过正则的逐次回调
+COMMON_FULLWIDTH = "，：；！？（）"
+
+
+def precomputed_chars():
+    """按码位顺序列出预先计算范围内的全部字符"""
+    for code in range(*PRECOMPUTED_RANGE):
+        if not 0xD800 <= code < 0xE000:
+            yield chr(code)
+
+
+def char_class(chars):
+    """
+    把字符集合转换为正则字符类，连续码位合并为区间
+
+    Args:
+        chars (iterable): 字符
+
+    Returns:
+        str: 形如 "[a-z...]" 的字符类，字符集合为空时返回不匹配任何字符的正则
+    """
+    codes = sorted(set(ord(char) for char in chars))
+    if not codes:
+        return "(?!)"
+    parts = []
+    start = previous = codes[0]
+    for code in codes[1:] + [None]:
+        if code is not None and code == previous + 1:
+            previous = code
+            continue
+        parts.append(re.escape(chr(start)) if start == previous
+                     else f"{re.escape(chr(start))}-{re.escape(chr(previous))}")
+        if code is not None:
+            start = previous = code
+    return "[" + "".join(parts) + "]"
+
+
+class NormalizationTable(dict):
+    """
+    str.translate 使用的归一化翻译表 {字符编码: 归一化后的字符编码}，按字符首次出现时计算并缓存
+
+    只在文本含辅助平面字符或 str.lower 改变文本长度的少见情况下使用，通常路径见 normalize_text。
+    """
+
+    def __missing__(self, code):
+        value = self[code] = ord(_fold_char(chr(code)))
+        return value
+
+
+NORMALIZATION_TABLE = NormalizationTable()
+
+
+@functools.lru_cache(maxsize=1)
+def _folding():
+    """
+    预先计算小写之后仍需归一化的字符 {字符: 归一化字符} 及其正则，首次使用时创建
+
+    大部分文本（简体中文、小写英文）在 str.lower 之后只含常见全角标点，逐个 str.replace 之后
+    正则扫描一遍即可返回。
+
+    Returns:
+        tuple: (归一化映射, 其余字符的正则, 常见全角标点的 (字符, 归一化字符))
+    """
+    fold_map = {}
+    for char in precomputed_chars():
+        if (unicodedata.is_normalized("NFKC", char) and char.lower() == char
+                and char not in HOMOGLYPHS and char not in TRADITIONAL_TO_SIMPLIFIED):
+            continue
+        folded = _fold_char(char)
+        if folded != char:
+            fold_map[char] = folded
+    replacements = tuple((char, fold_map[char]) for char in COMMON_FULLWIDTH if char in fold_map)
+    pattern = re.compile(char_class(char for char in fold_map if char not in COMMON_FULLWIDTH))
+    return fold_map, pattern, replacements
+
+
+def normalize_text(text):
+    """
+    归一化文本，用于关键词匹配，文本和词汇表使用同一套归一化规则
+
+    Args:
+        text (str): 文本
+
+    Returns:
+        str: 归一化后的文本，长度与原文相同
+    """
+    lowered = text.lower()
+    if len(lowered) != len(text) or ASTRAL_RE.search(lowered):
+        # 小写改变了长度（如"İ"）时逐字符翻译保证位置不变；辅助平面字符不在预先计算的表中
+        return text.translate(NORMALIZATION_TABLE)
+    fold_map, pattern, replacements = _folding()
+    for char, folded in replacements:
+        if char in lowered:
+            lowered = lowered.replace(char, folded)
+    if pattern.search(lowered) is None:
+        return lowered
+    return pattern.sub(lambda match: fold_map[match.group()], lowered)
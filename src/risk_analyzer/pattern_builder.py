@@ -2,7 +2,6 @@ import json
 import os
 import logging
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 class PatternBuilder:
@@ -664,6 +663,8 @@ class PatternBuilder:
                 "keywords": ["所有关键词"],
                 "pattern": "使用符号替代、谐音字或拼写变形来表达敏感内容",
                 "example": "使用特殊符号替代敏感词汇，如'h@ck'代替'hack'",
+                # 关键词以拼音、首字母或同音字形式出现时计为该模式的证据
+                "variant_evidence": True,
                 "detection_rules": {
                     "character_substitution": ["特殊符号替换", "数字代替字母", "符号混合文字"],
                     "phonetic_variants": ["谐音字", "发音相似词", "故意拼写错误", "分词断句"]
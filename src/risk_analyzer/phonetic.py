@@ -0,0 +1,203 @@
+import functools
+import logging
+
+from .pinyin_data import COMMON_BIGRAMS, HOMOPHONE_WORDS, PINYIN_READINGS
+
+logger = logging.getLogger(__name__)
+
+# 每个位置替换的同音字数量上限
+DEFAULT_HOMOPHONES = 3
+# 生成首字母缩写的最短关键词字数，过短的缩写（如"zd"）容易与普通英文缩写混淆
+DEFAULT_INITIALISM_MIN_LENGTH = 4
+# 生成全拼变体的最短拼音字母数
+PINYIN_MIN_LETTERS = 4
+
+
+@functools.lru_cache(maxsize=1)
+def _readings():
+    """解析拼音表，返回 ({汉字: 带声调音节}, {带声调音节: [常用汉字，按字频排列]})"""
+    syllables = {}
+    common = {}
+    for line in PINYIN_READINGS.splitlines():
+        syllable, chars = line.split(" ", 1)
+        common[syllable] = [char for char in chars if _is_common(char)]
+        for char in chars:
+            syllables.setdefault(char, syllable)
+    return syllables, common
+
+
+@functools.lru_cache(maxsize=1)
+def _homophone_words():
+    """换一个同音字后仍是常用词的词，不作为同音字变体"""
+    return frozenset(HOMOPHONE_WORDS.split())
+
+
+@functools.lru_cache(maxsize=1)
+def _common_bigrams():
+    """常用双字词"""
+    chars = COMMON_BIGRAMS.replace("\n", "")
+    return frozenset(chars[i:i + 2] for i in range(0, len(chars), 2))
+
+
+def joins_word(left, right):
+    """
+    两个字是否组成常用双字词
+
+    Args:
+        left (str): 前一个字
+        right (str): 后一个字
+
+    Returns:
+        bool: 是否为常用双字词
+    """
+    return left + right in _common_bigrams()
+
+
+def substituted_edge(term, variant):
+    """
+    同音字变体替换的是否为关键词的首字或尾字
+
+    替换首尾字的变体可能只是原文中两个词的相邻部分（"严重事故"中的"重事"），命中时需要检查相邻的字。
+
+    Args:
+        term (str): 关键词
+        variant (str): 变体
+
+    Returns:
+        int: 0表示替换了首字，-1表示替换了尾字，不是同音字变体或替换的是中间的字时返回None
+    """
+    if len(term) != len(variant):
+        return None
+    positions = [i for i, (a, b) in enumerate(zip(term, variant)) if a != b]
+    if len(positions) != 1:
+        return None
+    if positions[0] == len(term) - 1:
+        return -1
+    return 0 if positions[0] == 0 else None
+
+
+def _is_common(char):
+    """GB2312 一级汉字（3755个常用字）"""
+    return char.encode("gb2312") < b"\xd8"
+
+
+def char_pinyin(char):
+    """
+    汉字的不带声调拼音
+
+    Args:
+        char (str): 单个汉字（简体）
+
+    Returns:
+        str: 拼音（ü 写作 v），不在拼音表中时返回None
+    """
+    syllable = _readings()[0].get(char)
+    return syllable[:-1] if syllable else None
+
+
+def homophones(char, limit=DEFAULT_HOMOPHONES):
+    """
+    与汉字读音（含声调）相同的常用字
+
+    Args:
+        char (str): 单个汉字（简体）
+        limit (int): 返回数量上限
+
+    Returns:
+        list: 同音字，按字频从高到低排列，不含该字本身
+    """
+    syllables, common = _readings()
+    syllable = syllables.get(char)
+    if syllable is None:
+        return []
+    return [other for other in common[syllable] if other != char][:limit]
+
+
+class VariantExpander:
+    """
+    关键词读音变体生成
+
+    文化规避类表达常把敏感词写成拼音、拼音首字母或同音字（"zhadan"、"炸dan"、"炸蛋"），
+    规则集编译时把每个中文关键词展开为这些变体，与原关键词编入同一个自动机并映射到原关键词编号，
+    检测时不需要逐条请求展开。读音来自随包发布的拼音表（见 pinyin_data）。
+
+    可在 domains.json 的 text_matching 中配置，"keyword_variants": false 时不生成变体:
+    {"keyword_variants": {"pinyin": true, "initialism_min_length": 4, "homophones": 3}}
+    """
+
+    __slots__ = ("pinyin", "initialism_min_length", "homophones")
+
+    def __init__(self, pinyin=True, initialism_min_length=DEFAULT_INITIALISM_MIN_LENGTH,
+                 homophones=DEFAULT_HOMOPHONES):
+        """
+        初始化变体生成
+
+        Args:
+            pinyin (bool): 是否生成全拼和单字拼音替换变体
+            initialism_min_length (int): 生成拼音首字母缩写的最短关键词字数，0表示不生成
+            homophones (int): 每个位置替换的同音字数量上限，0表示不生成
+        """
+        self.pinyin = pinyin
+        self.initialism_min_length = initialism_min_length
+        self.homophones = homophones
+
+    @classmethod
+    def from_config(cls, options):
+        """
+        从配置创建变体生成
+
+        Args:
+            options (dict): text_matching 配置
+
+        Returns:
+            VariantExpander: 变体生成，配置 "keyword_variants": false 时返回None
+        """
+        variants = (options or {}).get("keyword_variants", {})
+        if variants is False:
+            return None
+        variants = variants if isinstance(variants, dict) else {}
+        return cls(variants.get("pinyin", True),
+                   variants.get("initialism_min_length", DEFAULT_INITIALISM_MIN_LENGTH),
+                   variants.get("homophones", DEFAULT_HOMOPHONES))
+
+    def expand(self, term):
+        """
+        生成关键词的读音变体
+
+        只展开至少两个字且每个字都在拼音表中的中文关键词，单字的变体误报太多。
+        同音字变体排除常用词（见 pinyin_data.HOMOPHONE_WORDS）。
+
+        Args:
+            term (str): 归一化后的关键词
+
+        Returns:
+            list: 变体（不含原关键词），按生成顺序去重
+        """
+        if len(term) < 2:
+            return []
+        syllables = [char_pinyin(char) for char in term]
+        if None in syllables:
+            return []
+
+        variants = []
+        if self.pinyin:
+            full = "".join(syllables)
+            if len(full) >= PINYIN_MIN_LETTERS:
+                variants.append(full)
+            # 单个字写成拼音，如"炸dan"
+            variants.extend(term[:i] + syllable + term[i + 1:] for i, syllable in enumerate(syllables))
+        if self.initialism_min_length and len(term) >= self.initialism_min_length:
+            variants.append("".join(syllable[0] for syllable in syllables))
+        if self.homophones:
+            # 本身是常用词的同音替换（如"散布"换成"散步"）不是规避写法，不生成
+            words = _homophone_words()
+            for i, char in enumerate(term):
+                for other in homophones(char, self.homophones):
+                    variant = term[:i] + other + term[i + 1:]
+                    if variant not in words:
+                        variants.append(variant)
+        return list(dict.fromkeys(variants))
+
+    def __repr__(self):
+        return (f"VariantExpander(pinyin={self.pinyin!r}, initialism_min_length={self.initialism_min_length!r}, "
+                f"homophones={self.homophones!r})")
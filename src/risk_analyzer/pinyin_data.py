@@ -0,0 +1,1842 @@
+"""
+汉字拼音表
+
+GB2312 字符集中 6763 个汉字的常用读音，每行一个带声调的音节（数字标调，5为轻声，ü 写作 v），
+后接该读音的全部汉字，按字频从高到低排列。读音取自 pypinyin 0.55 的单字拼音数据，
+字频取自 jieba 0.42 的词典（二者均为 MIT 许可），离线生成后随包发布，运行时不依赖这两个库。
+
+HOMOPHONE_WORDS 为 jieba 词典中词频不低于5、且把某个字换成前5个同音常用字后仍是词典词的二至四字词，
+生成同音字变体时排除这些词（如"散布"不展开为"散步"）。
+
+COMMON_BIGRAMS 为 jieba 词典中词频不低于200的双字词，首尾相接排列（每两个字一个词），
+同音字变体命中时，被替换的首字或尾字与原文相邻的字组成常用词则不计为命中（如"严重事故"中的"重事"）。
+"""
+
+PINYIN_READINGS = """\
+a1 阿锕
+a2 嗄
+a5 啊
+ai1 埃哀挨唉哎嗳锿
+ai2 癌捱皑
+ai3 矮蔼霭
+ai4 爱碍艾隘暧瑷嗌砹嫒
+an1 安氨庵鞍谙鹌桉
+an3 俺铵揞埯
+an4 案按暗岸胺黯犴
+ang1 肮
+ang2 昂
+ang4 盎
+ao1 凹
+ao2 熬鳌敖嗷翱螯鏖遨獒聱廒
+ao3 拗袄媪
+ao4 奥澳傲懊坳鏊骜岙
+ba1 八巴粑扒叭芭疤笆捌岜
+ba2 拔跋魃菝茇
+ba3 把靶钯
+ba4 罢爸坝霸灞耙鲅
+ba5 吧
+bai1 掰擘
+bai2 白
+bai3 百摆柏捭佰
+bai4 败拜稗
+ban1 般班颁搬斑扳瘢癍
+ban3 板版阪坂钣舨
+ban4 半办伴扮拌瓣绊
+bang1 邦帮浜梆
+bang3 榜膀绑
+bang4 棒镑傍磅蚌谤蒡
+bao1 包胞孢苞煲褒龅勹
+bao2 薄雹
+bao3 保宝堡饱鸨葆褓
+bao4 报抱爆暴豹鲍趵
+bei1 杯悲碑卑陂鹎
+bei3 北
+bei4 被备背辈贝倍狈悖惫钡焙孛鞴蓓鐾碚邶褙
+bei5 呗
+ben1 奔锛贲
+ben3 本苯畚
+ben4 笨坌
+beng1 崩绷嘣
+beng2 甭
+beng4 泵蹦迸甏
+bi1 逼
+bi2 鼻荸
+bi3 比笔彼鄙匕俾吡秕妣舭
+bi4 必毕币闭避壁臂碧陛弊蔽璧婢毙弼庇敝痹裨濞跸嬖蓖铋愎毖篦薜髀哔筚荜畀萆襞箅狴庳滗
+bian1 边编鞭蝙鳊砭笾煸
+bian3 扁匾贬褊窆碥
+bian4 变便遍辩辨卞辫汴弁苄缏忭
+biao1 标彪镖飚飙杓骠镳膘髟飑灬瘭
+biao3 表婊裱
+biao4 鳔
+bie1 憋鳖
+bie2 别蹩
+bie3 瘪
+bin1 宾滨斌彬濒槟缤镔傧豳玢
+bin4 殡鬓摈膑髌
+bing1 兵冰冫
+bing3 秉柄禀饼丙炳摒邴
+bing4 并病
+bo1 波播拨剥玻钵菠饽啵
+bo2 伯博勃脖搏舶驳膊渤箔帛铂礴亳钹鹁踣
+bo3 簸跛
+bo4 檗
+bo5 卜
+bu1 逋晡钸
+bu2 醭
+bu3 补捕哺卟
+bu4 不部布步怖簿埠钚瓿
+ca1 擦嚓
+ca3 礤
+cai1 猜
+cai2 才财材裁
+cai3 采彩踩睬
+cai4 菜蔡
+can1 参餐骖
+can2 残蚕惭
+can3 惨黪
+can4 灿掺粲璨孱
+cang1 仓舱苍沧伧
+cang2 藏
+cao1 操糙
+cao2 曹槽漕嘈艚螬
+cao3 草艹
+ce4 策测侧册厕恻
+cen2 涔岑
+ceng1 噌
+ceng2 曾层
+ceng4 蹭
+cha1 插叉杈锸馇
+cha2 察查茶茬槎搽碴檫猹
+cha3 衩镲
+cha4 差诧岔姹汊
+chai1 拆钗
+chai2 柴豺侪
+chai4 虿瘥
+chan1 搀觇
+chan2 缠澶禅蝉蟾馋谗潺婵廛躔镡
+chan3 产阐铲谄骣冁蒇
+chan4 颤忏羼
+chang1 昌猖娼阊菖鲳伥
+chang2 常肠偿尝嫦苌徜
+chang3 场厂敞氅昶惝
+chang4 唱畅倡怅鬯
+chao1 超抄钞焯怊
+chao2 朝潮巢嘲晁
+chao3 炒吵
+chao4 耖
+che1 车砗
+che3 扯
+che4 撤彻澈掣坼屮
+chen1 琛嗔郴抻
+chen2 陈沉臣尘晨宸辰谌忱
+chen3 碜
+chen4 趁衬谶龀榇
+cheng1 称撑瞠蛏柽
+cheng2 成城程承乘呈诚惩丞澄橙铖晟裎埕枨塍酲
+cheng3 逞骋
+cheng4 秤
+chi1 吃痴嗤哧螭鸱笞魑蚩媸眵
+chi2 持池迟驰弛墀篪踟坻茌
+chi3 尺齿耻侈褫
+chi4 赤斥翅敕炽叱饬啻瘛彳傺
+chong1 冲充忡舂憧艟茺
+chong2 崇虫
+chong3 宠
+chong4 铳
+chou1 抽瘳
+chou2 仇筹愁酬畴绸稠踌惆雠俦帱
+chou3 丑瞅
+chou4 臭
+chu1 出初樗
+chu2 除厨橱躇雏锄刍蜍滁蹰
+chu3 楚础储褚杵楮
+chu4 处触畜矗黜绌搐怵亍憷
+chuai1 揣搋
+chuai4 踹啜嘬膪
+chuan1 穿川氚巛
+chuan2 传船椽遄舡
+chuan3 喘舛
+chuan4 串钏
+chuang1 窗疮
+chuang2 床幢
+chuang3 闯
+chuang4 创怆
+chui1 吹炊
+chui2 垂椎锤捶棰槌陲
+chun1 春椿蝽
+chun2 纯唇醇淳莼鹑
+chun3 蠢
+chuo1 戳踔
+chuo4 绰辍龊辶
+ci1 疵呲
+ci2 词磁辞慈瓷雌茨祠糍鹚茈
+ci3 此
+ci4 次刺赐伺
+cong1 匆聪葱璁囱骢苁枞
+cong2 从丛淙琮
+cou4 凑辏腠
+cu1 粗
+cu2 徂殂
+cu4 促醋簇蹙猝蹴酢蔟
+cuan1 蹿撺汆镩
+cuan4 窜篡爨
+cui1 催摧崔榱
+cui3 璀
+cui4 翠脆粹萃悴淬啐瘁毳
+cun1 村皴
+cun2 存
+cun3 忖
+cun4 寸
+cuo1 撮磋搓蹉
+cuo2 嵯痤鹾矬
+cuo3 脞
+cuo4 错措挫锉厝
+da1 搭瘩嗒耷褡
+da2 达答鞑沓靼哒怛笪妲
+da3 打
+da4 大
+dai1 呆呔
+dai3 逮歹傣
+dai4 代带待戴袋贷岱怠黛绐殆玳迨甙埭骀
+dan1 单担丹耽郸眈殚儋箪聃瘅
+dan3 胆掸疸赕
+dan4 但弹蛋淡旦诞氮惮澹啖萏
+dang1 当裆铛
+dang3 党挡谠
+dang4 荡档宕菪砀凼
+dao1 刀叨刂氘忉
+dao3 导岛蹈捣祷
+dao4 到道倒盗稻悼焘纛
+de2 得德锝
+de5 的
+deng1 登灯蹬噔簦
+deng3 等戥
+deng4 邓瞪凳磴镫嶝
+di1 低滴堤氐羝镝
+di2 敌迪笛狄涤嫡嘀荻翟籴觌
+di3 底抵砥邸诋骶柢
+di4 地第帝弟递棣蒂缔谛娣碲睇
+dian1 颠甸滇癫巅掂
+dian3 点典碘踮
+dian4 电殿店奠垫淀佃靛惦玷钿癜簟坫阽
+diao1 雕貂刁凋碉叼鲷
+diao4 调掉吊钓铫铞
+die1 爹跌嗲
+die2 叠迭蝶碟牒谍喋堞鲽耋蹀揲垤瓞
+ding1 丁钉盯叮仃玎酊疔耵
+ding3 顶鼎
+ding4 定订锭啶铤碇腚
+diu1 丢铥
+dong1 东冬咚氡鸫岽
+dong3 董懂
+dong4 动洞冻栋侗峒恫硐胴胨垌
+dou1 都兜篼蔸
+dou3 抖陡蚪
+dou4 斗豆窦逗痘
+du1 督嘟
+du2 独读毒渎牍犊椟黩碡髑
+du3 赌堵睹笃
+du4 度渡杜肚妒镀蠹芏
+duan1 端
+duan3 短
+duan4 段断锻缎椴煅簖
+dui1 堆
+dui4 对队兑怼镦碓憝
+dun1 吨敦墩蹲礅
+dun3 盹趸
+dun4 顿盾炖钝遁沌囤砘
+duo1 多咄哆掇裰
+duo2 夺踱铎
+duo3 躲朵垛哚缍
+duo4 舵堕跺剁惰柁
+e1 婀屙
+e2 额俄鹅娥峨蛾讹锇莪
+e4 鄂恶饿厄遏萼愕鳄扼噩垩颚鹗轭呃腭谔锷阏苊
+ei2 诶
+en1 恩蒽
+en4 摁
+er2 而儿鸸鲕
+er3 尔耳饵迩洱珥铒
+er4 二贰佴
+fa1 发
+fa2 罚乏伐阀筏砝垡
+fa3 法
+fa4 珐
+fan1 翻番帆藩蕃幡
+fan2 繁凡烦樊矾钒蘩燔蹯
+fan3 反返
+fan4 范饭犯泛贩梵畈
+fang1 方芳坊枋匚钫邡
+fang2 防房妨肪鲂
+fang3 访纺仿舫
+fang4 放
+fei1 非飞菲妃啡扉绯霏蜚鲱
+fei2 肥腓淝
+fei3 匪斐翡诽榧悱篚
+fei4 费废肺沸吠芾狒痱镄
+fen1 分纷氛芬吩酚
+fen2 坟焚汾鼢棼
+fen3 粉
+fen4 份奋愤粪瀵忿鲼偾
+feng1 风封丰峰锋疯蜂枫烽葑沣酆砜
+feng2 冯逢
+feng3 讽唪
+feng4 奉凤缝俸
+fou3 否缶
+fu1 夫肤敷孵呋跗麸趺稃
+fu2 服福佛幅伏符浮扶俘辐芙弗拂袱氟蝠孚茯苻涪匐绋绂凫蚨怫砩罘蜉菔幞祓桴黻莩郛艴
+fu3 府腐辅抚甫俯斧釜腑黼拊滏
+fu4 复副富负父妇附付腹赴赋傅覆咐缚阜驸馥蝮讣鲋阝赙鳆
+ga1 伽嘎呷旮
+ga2 噶钆尜
+ga3 尕
+ga4 尬
+gai1 该垓赅陔
+gai3 改
+gai4 概盖丐钙溉戤
+gan1 甘杆肝尴柑竿苷酐矸坩疳泔
+gan3 感敢赶橄秆擀澉
+gan4 干赣绀淦旰
+gang1 刚钢冈纲缸杠肛罡
+gang3 港岗
+gang4 戆筻
+gao1 高糕膏皋睾羔篙槔
+gao3 搞稿镐缟槁杲藁
+gao4 告诰锆郜
+ge1 哥歌割戈搁胳鸽咯疙圪仡纥袼
+ge2 革格阁隔葛骼镉嗝膈搿鬲塥
+ge3 舸哿
+ge4 个各铬虼硌
+gei3 给
+gen1 根跟
+gen2 哏
+gen3 艮
+gen4 亘茛
+geng1 耕羹庚赓
+geng3 耿梗哽绠埂鲠
+geng4 更
+gong1 工公功宫供攻恭弓躬龚蚣觥肱
+gong3 拱巩汞珙廾
+gong4 共贡
+gou1 沟勾钩佝篝鞲缑
+gou3 狗苟枸岣笱
+gou4 构够购垢媾彀诟觏遘
+gu1 姑孤估咕辜菇沽鸪箍呱蛄觚菰轱酤
+gu3 古股骨谷鼓钴鹘鹄蛊毂汩牯诂瞽嘏罟臌
+gu4 故顾固雇锢崮梏痼鲴牿
+gua1 瓜刮聒胍鸹栝
+gua3 寡剐
+gua4 挂卦褂诖
+guai1 乖掴
+guai3 拐
+guai4 怪
+guan1 关官观冠棺倌鳏
+guan3 管馆莞
+guan4 贯惯灌罐掼鹳盥涫
+guang1 光胱咣桄
+guang3 广犷
+guang4 逛
+gui1 规归硅龟圭瑰闺傀皈妫鲑
+gui3 鬼轨诡癸庋匦晷宄簋
+gui4 贵桂跪柜鳜桧炔刽刿
+gun3 滚衮绲鲧辊丨磙
+gun4 棍
+guo1 郭锅埚蝈崞呙
+guo2 国虢帼馘
+guo3 果裹椁猓蜾
+guo4 过
+ha1 哈铪
+ha2 蛤
+hai1 嗨
+hai2 还孩骸
+hai3 海醢胲
+hai4 害亥骇氦
+han1 酣憨鼾蚶顸
+han2 含韩寒函涵邯晗邗焓
+han3 喊罕阚
+han4 汉汗旱翰憾悍撼焊捍瀚颔菡撖
+hang1 夯
+hang2 航杭绗珩颃
+hang4 沆
+hao1 蒿薅嚆
+hao2 毫豪壕嚎濠嗥貉蚝
+hao3 好郝
+hao4 号耗浩灏皓昊颢
+he1 喝呵诃嗬
+he2 和合河何核荷盒禾劾颌菏阖涸阂曷翮盍蚵
+he4 赫贺鹤褐壑
+hei1 黑嘿
+hen2 痕
+hen3 很狠
+hen4 恨
+heng1 哼亨
+heng2 横衡恒桁蘅
+hong1 轰烘訇薨
+hong2 红洪宏鸿虹弘闳泓蕻黉荭
+hong3 哄
+hong4 讧
+hou2 侯猴喉骺篌糇瘊
+hou3 吼
+hou4 后候厚後逅鲎堠
+hu1 乎呼忽惚唿滹烀轷虍
+hu2 湖胡狐糊壶弧瑚葫蝴斛猢煳囫觳槲鹕醐
+hu3 虎唬浒琥
+hu4 护户互沪扈祜笏瓠怙岵鹱戽冱
+hua1 花哗
+hua2 华滑猾骅铧
+hua4 化话划画桦
+huai2 怀淮槐徊踝
+huai4 坏
+huan1 欢獾
+huan2 环寰桓鬟圜洹锾萑郇缳
+huan3 缓
+huan4 换患唤幻浣焕宦痪涣鲩豢奂逭擐漶
+huang1 荒慌肓
+huang2 黄皇煌凰惶簧蝗磺鳇潢徨湟璜隍遑蟥篁癀
+huang3 晃恍谎幌
+hui1 挥灰恢辉徽晖麾诙珲隳咴虺
+hui2 回蛔洄茴
+hui3 毁悔
+hui4 会汇绘惠慧贿讳诲晦烩秽卉彗喙荟恚蕙哕缋蟪浍
+hun1 婚昏荤阍
+hun2 魂浑馄
+hun4 混诨溷
+huo1 豁锪攉耠劐
+huo2 活
+huo3 火伙夥钬
+huo4 或获货霍祸惑镬蠖藿砉嚯
+ji1 机基积击激鸡肌饥圾稽矶缉羁畸唧讥姬叽箕跻畿赍玑乩咭芨犄屐齑笄嵇墼丌剞
+ji2 级及集即极急辑吉疾籍脊棘藉嫉汲诘亟笈瘠岌楫蒺戢佶殛蕺
+ji3 己几挤戟麂嵴虮掎
+ji4 计济技记际纪继既季迹剂绩祭忌寄稷寂冀妓暨蓟伎悸髻芰骥偈鲫觊霁荠鲚哜跽洎彐
+jia1 家加嘉佳夹迦茄珈枷浃袈镓痂葭笳跏
+jia2 颊戛荚袷郏蛱铗恝
+jia3 假甲贾钾岬胛瘕
+jia4 价架驾嫁稼
+jian1 间监坚兼尖肩奸艰煎歼笺缄鞯犍缣菅鲣鹣湔蒹搛戋
+jian3 检简减碱剪蹇柬捡俭拣茧锏睑硷謇翦笕裥趼枧戬谫囝
+jian4 建见件剑渐健舰箭键践鉴荐僭贱谏溅涧饯腱楗毽踺牮
+jiang1 将江疆浆姜僵缰豇礓茳
+jiang3 讲奖蒋桨耩
+jiang4 降匠酱绛犟糨洚
+jiao1 交焦胶郊椒娇骄礁浇蕉蛟跤姣鲛鹪艽茭僬
+jiao3 角脚剿缴搅绞矫狡侥饺皎佼铰湫挢敫徼
+jiao4 教叫较轿窖酵醮峤噍
+jie1 接阶街皆揭嗟秸疖喈
+jie2 结节截杰捷洁劫竭睫羯颉桀拮婕碣孑讦鲒卩
+jie3 解姐
+jie4 界介届借戒芥诫蚧骱疥
+jin1 金今津斤筋巾襟矜衿钅
+jin3 仅尽紧锦谨瑾馑槿堇卺廑
+jin4 进近禁劲晋浸缙觐妗烬噤荩靳赆
+jing1 经京精惊荆睛晶茎兢鲸旌泾粳腈菁
+jing3 景警井颈阱憬儆肼刭
+jing4 境竟静径竞敬镜净靖痉迳胫靓婧獍弪
+jiong1 扃冂
+jiong3 炯迥窘炅
+jiu1 究纠揪鸠阄啾赳鬏
+jiu3 九酒久灸韭玖
+jiu4 就救旧舅柩咎疚臼桕鹫厩僦
+ju1 居拘驹鞠狙琚疽掬趄鞫裾苴雎锔菹椐
+ju2 局菊橘桔
+ju3 举矩咀沮榘龃莒榉踽
+ju4 据具句剧巨距聚拒俱惧炬锯踞飓遽讵倨苣钜窭屦醵犋
+juan1 涓捐鹃娟镌蠲
+juan3 卷锩
+juan4 眷倦绢隽鄄狷桊
+jue1 撅噘
+jue2 决觉绝掘爵诀厥嚼崛抉倔獗蕨攫蹶谲镢矍橛噱桷珏孓劂爝觖
+jun1 军均君菌钧麇皲
+jun4 郡俊峻浚竣骏捃
+ka1 喀咖咔
+ka3 卡胩佧
+kai1 开揩锎
+kai3 凯慨楷恺铠锴剀垲蒈
+kai4 忾
+kan1 刊堪勘龛戡
+kan3 砍坎槛侃莰
+kan4 看瞰
+kang1 康慷糠闶
+kang2 扛
+kang4 抗炕亢钪伉
+kao1 尻
+kao3 考烤拷栲
+kao4 靠铐犒
+ke1 科颗柯磕棵珂苛蝌瞌颏窠稞髁嗑轲疴钶
+ke2 壳咳
+ke3 可渴坷岢
+ke4 克客刻课恪缂氪锞溘骒
+ken3 肯恳垦啃龈
+ken4 裉
+keng1 坑吭铿
+kong1 空崆倥箜
+kong3 孔恐
+kong4 控
+kou1 抠芤眍
+kou3 口
+kou4 扣叩寇蔻筘
+ku1 哭枯窟骷刳堀
+ku3 苦
+ku4 库酷裤绔喾
+kua1 夸
+kua3 垮侉
+kua4 跨挎胯
+kuai3 蒯
+kuai4 快块筷脍狯侩哙郐
+kuan1 宽髋
+kuan3 款
+kuang1 框匡筐诓哐
+kuang2 狂诳
+kuang3 夼
+kuang4 况矿旷眶邝圹纩贶
+kui1 亏盔窥悝岿
+kui2 魁逵奎葵夔隗睽喹馗揆蝰暌
+kui3 跬
+kui4 溃愧馈匮喟聩篑愦蒉
+kun1 昆坤醌锟髡鲲琨
+kun3 捆阃悃
+kun4 困
+kuo4 括扩阔廓蛞
+la1 拉垃邋
+la2 剌旯砬
+la3 喇
+la4 腊辣蜡瘌
+la5 啦
+lai2 来莱涞崃徕铼
+lai4 赖睐籁癞濑赉
+lan2 兰蓝拦篮栏澜岚婪斓阑褴镧谰
+lan3 览懒揽缆榄罱漤
+lan4 烂滥
+lang1 啷
+lang2 郎廊狼琅螂榔阆锒稂
+lang3 朗
+lang4 浪莨蒗
+lao1 捞
+lao2 劳牢唠崂痨醪铹
+lao3 老姥佬潦铑栳
+lao4 涝烙酪耢
+le1 肋
+le4 乐叻鳓泐仂
+le5 了
+lei1 勒
+lei2 雷擂嫘镭缧羸檑
+lei3 垒蕾儡磊诔耒
+lei4 类累泪酹
+lei5 嘞
+leng2 棱楞塄
+leng3 冷
+leng4 愣
+li1 哩
+li2 离黎厘璃梨犁蠡漓狸篱藜骊缡罹鲡黧鹂嫠蜊喱蓠
+li3 里理李礼鲤娌澧锂醴俚逦鳢
+li4 力立利历例丽隶厉粒励吏栗莉砾沥栎荔雳俐笠痢砺戾莅俪詈蛎傈溧唳粝郦猁呖苈疠枥疬跞篥坜轹
+lia3 俩
+lian2 联连莲怜廉帘濂鲢涟镰奁臁蠊裢
+lian3 脸敛琏裣蔹
+lian4 练炼链恋楝殓潋
+liang2 良粮梁凉粱踉椋墚
+liang3 两魉
+liang4 量亮辆谅晾
+liao1 撩
+liao2 疗辽聊僚寮寥缭燎獠嘹鹩
+liao3 蓼钌
+liao4 料廖撂镣尥
+lie3 咧
+lie4 列烈裂猎劣冽洌鬣趔埒捩躐
+lin1 拎
+lin2 林临邻磷淋霖鳞琳麟嶙遴啉粼辚瞵
+lin3 凛廪懔檩
+lin4 赁躏吝蔺膦
+ling2 陵灵零龄凌菱铃玲伶羚棂苓绫聆翎蛉泠囹瓴鲮酃柃
+ling3 领岭
+ling4 令另呤
+liu1 溜熘
+liu2 流留刘瘤硫琉浏榴馏镏遛鎏旒骝
+liu3 柳绺锍
+liu4 六鹨
+long2 龙隆笼胧聋珑咙窿砻茏栊泷癃
+long3 垄拢陇垅
+lou2 楼喽娄髅偻蝼耧蒌
+lou3 搂篓嵝
+lou4 漏陋镂瘘
+lu1 噜撸
+lu2 卢炉芦庐胪颅泸鲈鸬舻轳栌垆
+lu3 鲁虏卤掳橹镥
+lu4 路陆录露鹿禄麓碌赂戮璐漉潞辘辂鹭渌逯簏
+lu5 氇
+luan2 鸾挛峦滦銮娈孪栾脔
+luan3 卵
+luan4 乱
+lun1 抡
+lun2 轮伦仑沦纶囵
+lun4 论
+luo2 罗逻螺萝锣骡椤箩猡脶镙
+luo3 裸瘰倮蠃
+luo4 落络洛珞骆雒摞漯荦泺
+lv2 驴榈闾
+lv3 旅吕履屡铝缕侣捋膂褛稆
+lv4 律率绿虑氯滤
+lve4 略掠锊
+ma1 妈嬷
+ma2 麻蟆
+ma3 马码玛蚂
+ma4 骂杩犸唛
+ma5 吗嘛
+mai2 埋霾
+mai3 买荬
+mai4 卖脉麦迈劢
+man1 颟
+man2 蛮瞒馒谩鳗鞔
+man3 满螨
+man4 慢曼漫蔓幔缦熳墁镘
+mang2 忙茫芒盲氓邙硭
+mang3 莽蟒漭
+mao1 猫
+mao2 毛矛茅髦锚牦旄蟊茆蝥
+mao3 卯峁铆昴泖
+mao4 贸冒貌帽茂瑁懋耄袤瞀
+me5 么
+mei2 没梅媒煤眉枚霉酶嵋玫楣湄莓镅鹛猸
+mei3 美每浼镁
+mei4 妹媚魅昧寐袂
+men2 门扪钔
+men4 闷焖懑
+men5 们
+meng2 蒙盟萌朦檬虻艨甍礞瞢
+meng3 猛锰懵蠓勐艋蜢
+meng4 梦孟
+mi1 眯咪
+mi2 迷弥麋谜靡醚縻糜猕祢蘼
+mi3 米弭芈敉脒
+mi4 密秘泌蜜觅幂谧宓嘧汨糸冖
+mian2 棉绵眠宀
+mian3 免沔勉缅冕娩腼湎渑眄
+mian4 面
+miao1 喵
+miao2 苗描瞄鹋
+miao3 秒渺缈藐淼邈眇杪
+miao4 庙妙
+mie1 乜咩
+mie4 灭蔑篾蠛
+min2 民岷缗珉苠
+min3 敏闽闵悯抿皿泯黾愍鳘
+ming2 明名鸣铭冥茗瞑螟溟暝
+ming3 酩
+ming4 命
+miu4 谬
+mo1 摸
+mo2 模摩磨魔膜摹蘑谟馍麽嫫
+mo3 抹
+mo4 末莫默墨漠沫陌蓦寞茉秣殁镆貘貊瘼耱
+mou1 哞
+mou2 谋牟缪眸鍪蛑侔
+mou3 某
+mu2 毪
+mu3 母亩姆牡拇坶
+mu4 目木墓幕牧慕穆募暮沐睦钼苜仫
+n2 嗯
+na2 拿镎
+na3 哪
+na4 那纳娜钠呐捺衲肭
+nai3 奶乃氖艿
+nai4 耐奈鼐萘柰
+nan1 囡
+nan2 南难男喃楠
+nan3 赧腩蝻
+nang1 囔
+nang2 囊馕
+nang3 攮曩
+nao1 孬
+nao2 挠呶铙蛲猱硇
+nao3 脑恼瑙垴
+nao4 闹淖
+ne4 讷疒
+ne5 呢
+nei3 馁
+nei4 内
+nen4 嫩恁
+neng2 能
+ni1 妮
+ni2 尼泥倪霓鲵怩铌猊坭
+ni3 你拟旎
+ni4 逆腻匿溺昵睨伲
+nian1 拈蔫
+nian2 年黏鲇鲶
+nian3 碾捻辇辗撵
+nian4 念廿埝
+niang2 娘
+niang4 酿
+niao3 鸟袅嬲茑
+niao4 尿脲
+nie1 捏
+nie4 涅聂孽镍蹑啮嗫蘖颞镊臬陧
+nin2 您
+ning2 宁凝拧甯柠狞咛聍
+ning4 佞泞
+niu1 妞
+niu2 牛
+niu3 纽扭钮忸狃
+nong2 农浓脓哝侬
+nong4 弄
+nou4 耨
+nu2 奴驽孥
+nu3 努弩胬
+nu4 怒
+nuan3 暖
+nuo2 挪傩
+nuo4 诺糯懦喏搦锘
+nv3 女钕
+nv4 衄恧
+nve4 虐疟
+o1 噢喔
+o2 哦
+ou1 欧殴鸥瓯讴沤
+ou3 偶藕呕耦
+ou4 怄
+pa1 啪趴葩
+pa2 爬琶杷筢
+pa4 怕帕
+pai1 拍
+pai2 排牌徘俳
+pai4 派湃哌蒎
+pan1 攀潘
+pan2 盘蟠磐蹒爿
+pan4 判叛盼畔拚袢襻泮
+pang1 乓滂
+pang2 旁庞彷螃逄
+pang3 耪
+pang4 胖
+pao1 抛脬
+pao2 袍刨咆庖狍匏
+pao3 跑
+pao4 炮泡疱
+pei1 胚呸醅
+pei2 培陪赔裴锫
+pei4 配佩沛辔霈旆帔
+pen1 喷
+pen2 盆湓
+peng1 烹砰怦澎抨嘭
+peng2 朋彭蓬鹏棚膨篷硼堋蟛
+peng3 捧
+peng4 碰
+pi1 批披劈丕霹坯纰噼砒邳铍
+pi2 皮疲脾啤毗琵枇蚍鼙郫罴蜱芘貔陴埤
+pi3 匹癖痞庀疋圮擗仳
+pi4 辟屁僻譬媲淠甓睥
+pian1 偏篇翩犏
+pian2 谝骈胼蹁
+pian4 片骗
+piao1 飘漂缥剽螵
+piao2 瓢嫖
+piao3 瞟殍
+piao4 票嘌
+pie1 撇瞥氕
+pie3 苤丿
+pin1 拼姘
+pin2 频贫嫔颦
+pin3 品榀
+pin4 聘牝
+ping1 乒娉俜
+ping2 平评凭瓶屏苹萍坪枰鲆
+po1 坡泊泼钋
+po2 婆鄱皤
+po3 颇叵笸钷
+po4 破迫魄珀粕
+pou1 剖
+pou2 裒掊
+pu1 扑仆噗攵攴
+pu2 葡蒲菩濮脯璞莆匍镤
+pu3 普谱朴浦埔圃溥蹼氆镨
+pu4 铺瀑曝
+qi1 期七妻欺漆栖戚凄蹊沏嘁槭桤萋柒
+qi2 其奇齐旗骑棋鳍琦歧蕲祁祈祺圻琪耆崎淇麒俟岐脐芪畦蛴亓颀萁綦骐蜞
+qi3 起企启岂乞绮杞芑屺綮
+qi4 气器汽弃契砌泣迄葺憩讫碛汔
+qia1 掐葜
+qia4 恰洽髂
+qian1 千签迁牵谦铅褰骞搴佥阡扦芊愆钎悭仟岍
+qian2 前钱潜乾黔虔钳钤掮箝
+qian3 浅遣谴缱肷凵
+qian4 欠嵌歉堑倩茜慊芡椠
+qiang1 枪腔羌呛跄锵戗戕锖蜣镪
+qiang2 强墙蔷樯嫱丬
+qiang3 抢羟襁
+qiang4 炝
+qiao1 悄敲跷锹橇硗劁缲
+qiao2 桥瞧乔侨憔樵荞谯鞒
+qiao3 巧愀
+qiao4 鞘窍峭翘俏撬诮
+qie3 且
+qie4 切窃怯妾惬挈锲箧郄
+qin1 亲侵钦衾
+qin2 秦勤琴擒禽芹噙嗪芩檎螓溱
+qin3 寝锓
+qin4 沁揿吣
+qing1 清青轻倾卿氢蜻鲭圊
+qing2 情晴擎氰黥檠
+qing3 请顷苘謦
+qing4 庆箐罄磬
+qiong1 芎
+qiong2 穷琼穹邛蛩跫筇銎茕
+qiu1 秋丘邱蚯鳅楸
+qiu2 求球裘囚酋俅虬遒逑泅巯犰蝤赇鼽
+qiu3 糗
+qu1 区曲趋屈驱躯祛岖蛆蛐诎黢麴
+qu2 渠衢瞿劬朐蠼癯蕖鸲磲氍璩蘧
+qu3 取娶龋
+qu4 去趣觑阒
+quan1 圈悛
+quan2 全权泉拳醛痊荃诠蜷颧铨鬈筌辁
+quan3 犬绻畎犭
+quan4 券劝
+que1 缺阙
+que2 瘸
+que4 却确雀鹊榷阕悫
+qun1 逡
+qun2 群裙
+ran2 然燃髯蚺
+ran3 染冉苒
+rang2 瓤禳穰
+rang3 壤嚷攘
+rang4 让
+rao2 饶娆桡荛
+rao3 扰
+rao4 绕
+re3 惹
+re4 热
+ren2 人仁壬亻
+ren3 忍稔荏
+ren4 任认刃韧妊仞饪纫衽轫葚
+reng1 扔
+reng2 仍
+ri4 日
+rong1 茸
+rong2 容荣融溶蓉熔绒戎榕嵘蝾肜狨
+rong3 冗
+rou2 柔揉蹂鞣糅
+rou4 肉
+ru2 如儒濡蠕孺茹嚅铷薷襦颥
+ru3 乳辱汝
+ru4 入褥缛洳溽蓐
+ruan3 软阮朊
+rui2 蕤
+rui3 蕊
+rui4 瑞锐睿芮蚋枘
+run4 润闰
+ruo4 若弱偌箬
+sa1 撒仨挲
+sa3 洒
+sa4 萨卅飒脎
+sai1 塞腮鳃噻
+sai4 赛
+san1 三叁毵
+san3 伞糁馓
+san4 散
+sang1 桑
+sang3 嗓搡颡磉
+sang4 丧
+sao1 骚搔臊缫鳋
+sao3 扫嫂
+sao4 埽瘙
+se4 色瑟涩啬穑铯
+sen1 森
+seng1 僧
+sha1 杀沙砂纱刹莎煞鲨裟铩痧
+sha2 啥
+sha3 傻
+sha4 厦霎歃唼
+shai1 筛酾
+shai4 晒
+shan1 山珊衫杉删煽姗苫膻跚芟舢潸钐埏彡
+shan3 闪陕
+shan4 善扇擅膳缮汕鳝讪赡蟮鄯嬗疝剡骟
+shang1 商伤熵墒觞殇
+shang3 赏晌垧
+shang4 上尚绱
+shang5 裳
+shao1 烧稍梢捎艄蛸筲
+shao2 苕勺韶芍
+shao3 少
+shao4 绍哨邵劭潲
+she1 奢畲赊猞
+she2 蛇舌佘
+she3 舍
+she4 设社射涉摄赦慑麝厍歙滠
+shen1 身深伸申绅呻娠砷诜莘
+shen2 什神
+shen3 审沈婶哂渖谂矧
+shen4 甚肾慎渗椹蜃胂
+sheng1 生声升牲笙甥
+sheng2 绳
+sheng3 省眚
+sheng4 胜盛圣剩嵊
+shi1 师施失诗尸湿狮虱蓍鲺
+shi2 时实十石食识拾蚀鲥饣莳埘炻
+shi3 使史始驶矢屎豕
+shi4 是市事世式士示势视试似适室释侍氏饰誓逝仕嗜恃柿噬拭谥轼舐弑螫筮豉铈礻贳
+shi5 匙
+shou1 收
+shou3 手首守艏
+shou4 受授售寿兽瘦狩绶
+shou5 扌
+shu1 书输殊叔疏舒枢蔬淑梳抒姝倏纾菽殳毹摅
+shu2 熟赎孰塾秫
+shu3 属署鼠蜀暑薯曙黍
+shu4 数术树述束竖恕庶戍墅漱腧沭澍
+shua1 刷唰
+shua3 耍
+shuai1 衰摔
+shuai3 甩
+shuai4 帅蟀
+shuan1 拴栓闩
+shuan4 涮
+shuang1 双霜孀
+shuang3 爽
+shui2 谁
+shui3 水
+shui4 睡税
+shui5 氵
+shun3 吮
+shun4 顺瞬舜
+shuo1 说
+shuo4 硕烁朔蒴搠铄槊妁
+si1 司斯思私丝厮撕嘶咝缌锶蛳鸶厶澌纟
+si3 死
+si4 四寺祀肆饲嗣驷泗巳汜耜姒笥兕
+song1 松嵩淞崧凇忪菘
+song3 耸怂悚竦
+song4 送宋讼颂诵
+sou1 搜艘嗖飕馊溲锼螋
+sou3 擞叟薮嗾瞍
+sou4 嗽
+su1 苏酥稣
+su2 俗
+su4 速素诉肃宿塑粟溯簌夙涑谡僳愫嗉蔌觫
+suan1 酸狻
+suan4 算蒜
+sui1 虽睢濉荽眭
+sui2 随隋绥
+sui3 髓
+sui4 岁碎遂隧穗祟邃燧谇
+sun1 孙荪狲飧
+sun3 损笋隼榫
+suo1 缩梭娑唆羧蓑嗍睃桫
+suo3 所索锁琐唢
+suo5 嗦
+ta1 他她它塌趿铊溻
+ta3 塔獭鳎
+ta4 踏榻蹋挞遢闼
+tai1 胎
+tai2 台抬苔邰薹跆鲐炱
+tai4 太态泰汰钛肽酞
+tan1 滩贪摊瘫坍
+tan2 谈坛潭谭痰檀昙覃郯锬
+tan3 坦毯袒忐钽
+tan4 探叹碳炭
+tang1 汤镗羰铴耥
+tang2 堂唐糖塘膛棠搪螳瑭饧醣樘溏螗
+tang3 倘躺淌傥帑
+tang4 趟烫
+tao1 涛掏滔韬绦饕
+tao2 桃逃陶萄淘洮啕鼗
+tao3 讨
+tao4 套
+te4 特忒忑慝铽
+teng2 腾疼藤滕誊
+ti1 梯踢剔锑
+ti2 提题蹄啼缇绨鹈醍荑
+ti3 体
+ti4 替惕剃涕屉嚏倜悌裼逖
+tian1 天添
+tian2 田甜填恬阗畋
+tian3 舔腆忝殄
+tian4 掭
+tiao1 挑祧佻
+tiao2 条迢笤龆髫蜩鲦
+tiao3 窕
+tiao4 跳眺粜
+tie1 贴帖萜
+tie3 铁
+tie4 餮
+ting1 听厅烃汀町
+ting2 停庭廷亭婷霆蜓莛葶
+ting3 艇挺梃
+tong1 通嗵
+tong2 同童铜桐酮潼佟彤瞳僮仝茼砼
+tong3 统筒桶捅
+tong4 痛恸
+tou1 偷
+tou2 头投骰亠
+tou3 钭
+tou4 透
+tu1 突凸秃
+tu2 图途徒涂屠荼菟酴
+tu3 土吐钍
+tu4 兔堍
+tuan1 湍
+tuan2 团抟
+tuan3 疃
+tuan4 彖
+tui1 推
+tui2 颓
+tui3 腿
+tui4 退褪蜕煺
+tun1 吞暾
+tun2 屯豚臀饨
+tun3 氽
+tuo1 托脱拖乇
+tuo2 陀驼驮沱鸵坨橐佗鼍跎砣酡沲
+tuo3 妥椭庹
+tuo4 拓唾箨柝
+wa1 挖洼蛙娲
+wa2 娃
+wa3 瓦佤
+wa4 袜腽
+wa5 哇
+wai1 歪
+wai3 崴
+wai4 外
+wan1 湾弯蜿豌剜
+wan2 完玩顽丸烷纨芄
+wan3 晚碗宛挽皖婉绾惋畹脘菀琬
+wan4 万腕
+wang1 汪
+wang2 王亡
+wang3 往网枉惘罔魍辋
+wang4 望忘旺妄
+wei1 微威危巍薇煨萎偎逶葳隈
+wei2 维围韦唯违惟帷桅圩潍闱嵬涠帏沩囗
+wei3 委尾伟纬伪苇玮娓诿猥痿韪炜艉鲔洧
+wei4 为位未卫味谓魏慰胃畏尉喂渭蔚猬軎
+wen1 温瘟
+wen2 文闻纹蚊雯阌玟
+wen3 稳吻紊刎
+wen4 问璺汶
+weng1 翁嗡
+weng3 蓊
+weng4 瓮蕹
+wo1 窝涡倭挝蜗莴
+wo3 我
+wo4 握卧沃斡渥龌幄硪肟
+wu1 屋乌污呜巫诬钨邬圬
+wu2 无吴吾芜梧毋蜈唔浯鼯
+wu3 武五午舞伍侮捂庑鹉妩忤呒仵牾怃
+wu4 物务误雾悟兀勿晤坞戊婺寤鋈鹜骛焐杌芴迕痦阢
+xi1 西息希吸析稀悉惜熙锡溪浠夕牺昔嘻膝晰羲烯熄兮犀熹嬉螅奚汐蜥曦蟋硒淅唏皙醯僖翕穸舾鼷粞欷樨菥郗
+xi2 席习袭媳檄隰觋
+xi3 喜洗禧徙玺铣屣葸蓰
+xi4 系细戏隙饩阋矽舄禊
+xia1 瞎虾
+xia2 辖峡侠狭霞暇匣瑕遐黠狎硖柙
+xia4 下夏吓罅
+xian1 先鲜仙纤掀酰暹锨祆籼氙跹莶
+xian2 闲贤咸弦衔嫌娴涎舷痫鹇
+xian3 显险藓蚬跣冼燹筅猃
+xian4 现县线限献宪陷腺羡馅岘苋霰
+xiang1 相乡香襄湘箱厢镶缃骧芗葙
+xiang2 祥详翔庠
+xiang3 想响享饷飨鲞
+xiang4 向像象项巷橡蟓
+xiao1 消销萧硝潇宵逍嚣霄枭箫哮骁绡魈哓枵
+xiao2 淆崤
+xiao3 小晓筱
+xiao4 笑校效孝肖啸
+xie1 些歇蝎楔
+xie2 协斜胁鞋携邪谐挟偕缬勰撷
+xie3 写
+xie4 谢械泄卸蟹屑泻懈榭亵绁邂獬燮廨瀣渫薤榍躞
+xin1 心新辛薪欣芯锌馨昕歆鑫忻
+xin4 信衅囟
+xin5 忄
+xing1 兴星腥惺猩
+xing2 行形型刑邢荥硎陉
+xing3 醒擤
+xing4 性姓幸杏悻荇
+xiong1 兄胸凶匈汹
+xiong2 雄熊
+xiu1 修休羞馐咻庥鸺髹貅
+xiu3 朽
+xiu4 秀袖绣嗅锈溴岫
+xu1 需须虚吁墟胥嘘戌顼盱
+xu2 徐
+xu3 许栩诩醑糈
+xu4 续序绪叙蓄旭絮婿恤煦酗勖溆洫
+xu5 蓿
+xuan1 宣轩喧萱煊暄谖揎儇
+xuan2 旋悬玄璇漩痃
+xuan3 选癣
+xuan4 眩炫绚渲铉楦镟泫碹
+xue1 削薛靴
+xue2 学穴踅泶
+xue3 雪鳕
+xue4 血谑
+xun1 勋熏埙薰醺窨獯曛
+xun2 寻询巡循旬鲟荀峋浔荨洵恂
+xun4 训迅讯逊驯汛殉徇巽蕈
+ya1 压押鸭丫鸦桠垭吖
+ya2 牙衙崖涯芽蚜琊伢睚岈
+ya3 雅哑痖
+ya4 亚讶轧娅氩砑迓揠
+ya5 呀
+yan1 烟嫣焉淹腌阉胭湮鄢恹菸崦
+yan2 言研严沿岩延盐颜炎檐阎蜒筵闫妍芫讠
+yan3 眼演掩衍奄偃俨兖魇郾厣鼹罨琰
+yan4 验堰燕宴艳咽厌雁焰彦砚晏谚唁赝焱餍谳酽滟
+yang1 央鸯秧殃鞅泱
+yang2 阳杨洋扬羊疡佯炀烊徉蛘
+yang3 养氧仰痒
+yang4 样漾恙怏
+yao1 腰邀妖幺吆夭
+yao2 摇遥瑶姚肴窑谣尧徭爻繇鳐轺珧
+yao3 咬舀杳窈崾
+yao4 要药耀钥鹞曜
+ye1 椰掖噎
+ye2 爷耶揶铘
+ye3 也野冶
+ye4 业夜叶页液腋谒曳邺晔靥烨
+yi1 一依医衣伊揖漪咿噫壹铱猗黟欹衤
+yi2 宜遗移疑仪夷姨怡彝颐咦胰贻沂迤饴诒眙嶷痍圯
+yi3 以已乙椅矣倚蚁苡旖钇舣酏
+yi4 意义议易艺亿益异役亦译翼忆抑疫毅谊逸溢驿裔翊奕邑懿翌诣熠绎佚轶肄弈缢弋臆屹刈蜴呓翳薏镒羿挹峄劓悒癔怿瘗佾镱殪埸
+yin1 因音阴殷姻荫茵氤喑铟堙洇
+yin2 银吟淫寅垠夤鄞狺霪
+yin3 引隐饮尹瘾蚓吲廴
+yin4 印胤茚
+ying1 应英鹰婴樱瑛莺膺缨鹦嘤罂撄璎
+ying2 营迎盈赢瀛蝇莹荧萤楹萦嬴茔蓥滢潆
+ying3 影颖郢颍瘿
+ying4 硬映媵
+yo1 哟唷
+yong1 拥庸佣雍鳙饔痈臃壅慵邕墉镛
+yong2 喁
+yong3 永勇涌泳咏甬俑踊蛹恿
+yong4 用
+you1 优忧悠幽攸呦
+you2 由游油尤犹邮铀鱿猷疣蚰莸蝣莜尢
+you3 有友黝酉卣莠牖铕
+you4 又右幼诱佑釉宥柚鼬蚴囿侑
+yu1 淤迂瘀纡
+yu2 于鱼余渔舆瑜俞愚娱愉渝隅逾虞榆禺於盂谀臾觎欤馀妤腴竽窬揄萸嵛蝓雩狳舁
+yu3 与语雨予宇羽屿禹俣龉庾圉圄窳伛瘐
+yu4 育域玉预遇御欲誉愈豫狱郁裕喻寓浴谕芋毓峪驭钰阈煜昱鬻聿鹬饫妪鹆蜮燠蓣肀
+yuan1 冤渊鸳箢鸢眢
+yuan2 员原元源园圆袁缘援垣猿沅辕塬鼋爰螈橼
+yuan3 远
+yuan4 院愿怨垸苑媛瑗掾
+yue1 约曰
+yue4 月越岳跃阅悦瀹粤钺刖樾龠
+yun1 晕氲
+yun2 云郧匀芸纭耘筠昀
+yun3 允陨殒狁
+yun4 运孕韵蕴酝郓熨愠韫恽
+za1 匝咂拶
+za2 杂砸
+za3 咋
+zai1 灾栽哉甾
+zai3 仔宰崽
+zai4 在再载
+zan1 簪糌
+zan2 咱
+zan3 攒趱昝
+zan4 赞暂瓒錾
+zang1 赃臧
+zang3 驵
+zang4 葬脏奘
+zao1 遭糟
+zao2 凿
+zao3 早藻枣澡蚤
+zao4 造燥灶躁噪皂唣
+ze2 则责泽择啧帻笮赜舴迮箦
+ze4 仄昃
+zei2 贼
+zen3 怎
+zen4 谮
+zeng1 增憎缯罾
+zeng4 赠甑锃
+zha1 扎渣楂喳吒哳揸齄
+zha2 闸札铡
+zha3 眨砟
+zha4 炸诈榨乍栅柞蚱咤痄
+zhai1 斋摘
+zhai2 宅
+zhai3 窄
+zhai4 寨债砦瘵
+zhan1 粘瞻沾詹毡旃谵
+zhan3 展斩盏崭搌
+zhan4 战站占湛绽栈蘸
+zhang1 张章璋彰漳樟獐鄣蟑嫜
+zhang3 长掌涨仉
+zhang4 障丈仗帐杖胀账瘴嶂幛
+zhao1 招昭钊啁
+zhao3 找爪沼
+zhao4 照召赵诏兆罩肇棹笊
+zhe1 遮蜇
+zhe2 折哲辙辄摺蛰谪磔
+zhe3 者褶锗赭
+zhe4 这浙蔗鹧柘
+zhe5 着
+zhen1 真针珍侦祯贞斟甄臻帧榛桢砧箴胗浈蓁
+zhen3 诊枕疹缜稹轸畛
+zhen4 镇阵震振圳朕赈鸩
+zheng1 争征蒸挣睁怔铮筝狰徵峥钲
+zheng3 整拯
+zheng4 政正证症郑诤
+zhi1 之知支织枝脂肢汁芝吱蜘祗卮栀胝
+zhi2 直职值执植殖侄跖踯摭埴絷
+zhi3 只指止纸址旨芷趾酯咫枳祉夂黹轵
+zhi4 制治至质志置致智秩掷滞帜稚峙挚窒炙郅雉蛭痔痣栉帙彘觯鸷陟桎贽骘豸轾踬忮膣
+zhong1 中终钟忠衷锺盅舯螽
+zhong3 种肿冢踵
+zhong4 重众仲
+zhou1 州周洲舟粥诌
+zhou2 轴妯
+zhou3 肘帚
+zhou4 宙皱骤昼咒绉胄纣籀酎荮
+zhu1 朱诸珠猪株诛蛛铢侏茱潴洙邾槠橥
+zhu2 逐竹烛竺舳躅瘃
+zhu3 主煮嘱瞩渚拄丶麈
+zhu4 住注助著筑驻柱祝铸贮蛀炷苎伫箸杼翥疰
+zhua1 抓
+zhuai1 拽
+zhuan1 专砖颛
+zhuan3 转
+zhuan4 撰赚篆馔啭
+zhuang1 装庄妆桩
+zhuang4 状壮撞
+zhui1 追锥骓隹
+zhui4 坠缀赘惴缒
+zhun1 谆肫窀
+zhun3 准
+zhuo1 桌捉拙涿倬
+zhuo2 卓灼浊酌啄镯擢斫茁濯浞诼禚
+zi1 资滋咨姿兹缁孜淄孳辎龇赀髭谘锱鲻嵫粢訾觜趑
+zi3 紫姊梓秭籽滓笫耔
+zi4 自字渍恣眦
+zi5 子
+zong1 宗综踪棕鬃腙
+zong3 总偬
+zong4 纵粽
+zou1 邹诹陬鄹驺鲰
+zou3 走
+zou4 奏揍楱
+zu1 租
+zu2 族足卒镞
+zu3 组祖阻诅俎
+zuan1 钻躜
+zuan3 纂缵
+zuan4 攥
+zui3 嘴
+zui4 最罪醉蕞
+zun1 尊遵樽鳟
+zun3 撙
+zuo2 昨琢
+zuo3 左佐
+zuo4 作做坐座祚唑胙怍阼
+"""
+
+HOMOPHONE_WORDS = """\
+阿坝 阿爸 阿非 阿飞 阿伦 阿仑 阿蒙 阿盟 唉叹 哀叹 哀痛 艾伦 爱伦 爱玛 爱马 鞍部 鞍山 氨化 安布 安部 安达 安化 安利 安立 安那 安娜 安山 安西 安息 安祥 安详 安新 安心
+安义 按语 暗淡 暗合 暗河 暗滩 暗线 暗香 暗箱 暗语 岸基 岸滩 岸线 胺基 奥德 奥得 扒开 扒拉 扒手 八辈 八倍 八步 八部 八达 八代 八袋 八斗 八番 八极 八级 八戒 八届 八开
+八里 八米 八手 八首 八味 八位 八元 八员 八章 八张 八中 巴达 巴拉 巴厘 巴黎 巴里 巴米 巴西 巴辛 巴新 巴中 靶子 把手 把守 把子 耙子 坝子 白吃 白痴 白圭 白话 白莲 白茅
+白毛 白沙 白石 白食 白薯 白鼠 白杨 白羊 白洋 白阳 白纸 柏科 百步 百部 百佳 百家 百件 百科 百起 百盛 百胜 百世 百事 百味 百位 百页 百业 百叶 百夜 百艺 百亿 摆件 摆起
+拜佛 拜服 斑痕 班机 班级 搬动 扳动 扳机 板块 板面 板式 版块 版面 版式 扮成 伴生 伴音 半步 半部 半城 半成 半程 半价 半架 半件 半剑 半截 半节 半露 半路 半声 半生 半下
+半夏 半页 半叶 半夜 半音 办成 帮子 梆子 苞谷 胞兄 胞衣 包工 包公 包谷 包含 包涵 包兄 包衣 包子 保安 保藏 保和 保价 保驾 保洁 保暖 保山 饱和 饱暖 宝安 宝藏 宝剑 宝洁
+宝山 抱病 抱头 抱怨 抱住 报酬 报仇 报出 报到 报道 报头 报怨 暴病 暴发 暴利 暴力 爆出 爆发 悲痛 北峰 北风 北江 北疆 北路 北陆 北区 北曲 北塘 北堂 北西 北原 北源 辈份
+辈数 辈子 背包 倍感 倍受 倍数 备份 备感 备受 被包 被服 被子 本部 本场 本厂 本事 本市 本息 本相 本乡 本意 本义 本原 本园 本源 本周 本州 逼供 逼宫 比画 比划 比及 比利
+比例 比林 比邻 比试 比数 比特 比做 比作 鄙意 笔画 笔划 笔记 笔路 笔录 笔试 笔数 笔意 彼特 毕命 毕生 毕升 痹症 痹证 闭经 闭幕 闭目 闭式 闭市 闭眼 必经 必需 必须 壁式
+边裁 边材 编成 编程 编集 贬义 贬职 贬值 便士 便是 变换 变幻 变体 变为 变味 变位 变现 变线 变型 变形 变易 辨明 辨证 辩明 辩士 辩证 遍体 标杆 标竿 标志 彬县 濒海 滨海
+滨州 滨洲 宾县 宾州 兵火 兵库 兵员 兵源 冰冻 冰洞 冰封 冰峰 冰壶 冰湖 冰火 冰库 冰芯 冰心 冰原 丙子 秉承 秉赋 秉性 饼子 病历 病例 病原 病员 病源 病重 并立 并力 并重
+玻尔 播弄 播音 拨动 拨拉 拨弄 波动 波尔 波拉 波兰 波澜 波利 波力 波音 博采 博彩 博格 博乐 博士 博世 博兴 勃兴 伯格 伯乐 哺养 补丁 补钉 补记 补休 补修 补养 不安 不便
+不变 不丹 不单 不法 不符 不服 不复 不负 不会 不济 不计 不仅 不尽 不赖 不利 不力 不料 不满 不是 不息 不下 不祥 不详 不孝 不肖 不行 不一 不依 不易 不意 不予 不语 不再
+不在 不支 不知 布带 布袋 布道 布赖 布里 布利 布料 布满 布市 布头 布下 布依 布衣 步长 步道 步法 步行 步子 簿子 部长 部里 部署 部属 部头 部下 裁剪 裁减 才力 财力 财物
+财务 采蛋 采光 采石 采食 采信 彩旦 彩蛋 彩光 彩石 彩信 菜圃 菜谱 参合 参事 灿然 舱位 仓促 仓皇 仓惶 仓位 草率 草绿 草塘 草堂 草乌 草屋 侧向 测向 插手 叉手 茶场 茶厂
+茶点 茶房 茶精 茶香 茶乡 茶业 茶叶 查查 查察 查点 查房 查访 查看 查询 查寻 察访 察看 差异 诧异 柴河 铲子 产子 场部 场长 场里 场区 场址 场主 场子 常理 常礼 常时 常识
+常住 常驻 长班 长鞭 长编 长城 长成 长法 长丰 长风 长鼓 长骨 长谷 长留 长流 长毛 长矛 长门 长明 长鸣 长山 长衫 长上 长勺 长石 长实 长势 长项 长巷 长啸 长效 长嘴 厂部
+厂长 厂里 厂区 厂址 厂主 厂子 超声 超生 超收 抄收 朝内 朝气 朝阳 潮气 潮阳 巢内 车城 车程 车价 车架 车驾 车型 车行 撤销 撤消 辰光 辰星 尘雾 晨光 晨雾 晨星 沉香 沉箱
+沉毅 陈毅 称为 称谓 称做 称作 城建 城乡 城子 成安 成报 成材 成才 成城 成法 成方 成风 成家 成见 成交 成例 成立 成龙 成陆 成仁 成人 成色 成数 成文 成心 成型 成形 成行
+成鱼 成员 呈报 呈交 呈文 呈现 呈献 乘法 乘方 乘风 乘机 乘积 乘龙 乘数 乘员 程家 程陆 程文 承安 承办 承建 迟缓 弛缓 赤城 赤子 翅子 斥骂 斥责 冲掉 冲吊 冲击 冲积 冲激
+冲喜 冲洗 冲销 丑化 丑话 初版 初具 初期 初七 初任 初赛 初生 初十 初时 初识 初叶 初夜 初战 初诊 初中 初衷 出版 出场 出厂 出点 出典 出格 出阁 出工 出价 出嫁 出界 出借
+出井 出警 出境 出具 出列 出猎 出任 出赛 出生 出世 出事 出现 出线 出战 出诊 锄草 雏型 雏形 除草 除息 处士 处世 处事 处置 处治 传到 传道 传家 传票 传颂 传送 传诵 传艺
+传主 船家 船票 船务 船型 船形 船主 串联 串连 疮口 窗口 闯进 闯劲 创见 创建 创利 创立 创意 创议 锤头 垂体 垂头 春意 春义 醇厚 唇音 淳厚 淳化 淳朴 纯化 纯朴 纯音 蠢材
+蠢才 磁盘 磁片 磁瓶 磁器 磁条 磁头 磁芯 磁心 磁性 磁砖 雌性 辞典 辞句 辞令 辞源 辞藻 辞章 慈心 瓷盘 瓷片 瓷瓶 瓷器 瓷砖 词典 词句 词令 词条 词头 词性 词源 词藻 词章
+赐予 赐与 次声 次生 从容 从中 从重 从众 丛中 凑和 凑合 粗沙 粗纱 篡改 窜改 措辞 措词 错划 错话 达官 达观 答理 答礼 打鼓 打谷 打结 打鱼 打渔 大板 大半 大办 大堡 大宝
+大步 大部 大厂 大城 大成 大乘 大道 大盗 大地 大帝 大肚 大度 大丰 大风 大佛 大幅 大福 大工 大功 大公 大宫 大姑 大鼓 大谷 大关 大官 大观 大旱 大汉 大化 大话 大伙 大火
+大集 大计 大家 大加 大将 大江 大节 大捷 大军 大君 大理 大里 大礼 大历 大利 大力 大路 大陆 大明 大名 大幕 大木 大棚 大鹏 大平 大器 大气 大丘 大邱 大区 大曲 大权 大泉
+大全 大赦 大社 大声 大生 大胜 大圣 大士 大事 大市 大树 大数 大顺 大舜 大肆 大寺 大四 大塘 大堂 大唐 大桶 大统 大碗 大宛 大为 大位 大卫 大武 大午 大雾 大悟 大西 大系
+大戏 大项 大象 大校 大笑 大刑 大型 大幸 大姓 大岩 大洋 大阳 大野 大冶 大意 大义 大英 大鹰 大于 大余 大鱼 大雨 大宇 大员 大圆 大源 大枣 大早 大战 大站 大樟 大张 大正
+大政 大志 大治 大中 大钟 大种 大足 大族 戴尔 戴孝 带领 带露 带路 带脉 带入 带孝 带笑 带子 代尔 代发 代工 代公 代考 代领 代脉 代入 代售 代为 代位 代用 代宗 袋子 待发
+待考 待售 待用 耽搁 耽心 耽忧 耽于 担搁 担心 担忧 担子 丹井 丹心 单非 单飞 单缸 单杠 单击 单机 单极 单级 单件 单井 单据 单句 单县 单线 单项 单向 单一 单衣 单于 单子
+掸子 胆子 淡化 淡黄 弹壳 蛋黄 蛋壳 当做 当作 挡风 党风 党际 党纪 刀具 倒闭 倒底 倒卖 倒手 倒头 倒运 到岸 到案 到场 到底 到手 到头 稻场 稻子 道场 道子 盗卖 盗运 德利
+德州 得到 得道 得利 得力 得意 得州 灯市 灯台 灯盏 灯展 登基 登机 登录 登陆 登台 低落 滴答 滴落 抵销 抵消 底板 底版 底布 底部 底限 底线 地保 地堡 地极 地级 地理 地里
+地利 地力 地契 地气 地市 地王 地位 地学 地穴 地域 地志 地质 帝力 帝王 帝位 帝子 弟子 颠狂 点播 点拨 点画 点化 点明 点名 点中 点钟 垫子 电场 电厂 电磁 电瓷 电化 电话
+电击 电机 电门 电平 电瓶 电器 电气 电业 电液 电子 甸子 店门 店堂 店子 殿堂 掉包 掉换 掉价 掉头 掉转 吊车 吊钩 吊篮 吊兰 钓钩 调包 调车 调和 调合 调换 调价 调式 调头
+调相 调香 调职 调值 调制 调质 调治 调转 丁当 丁零 盯住 叮当 钉住 顶峰 顶风 顶极 顶级 顶棚 顶真 顶针 鼎立 鼎力 锭子 定边 定编 定单 定购 定婚 定货 定价 定金 定睛 定惊
+定例 定力 定式 定为 定位 定西 定息 定县 定线 定型 定形 定约 定责 定则 定制 定子 定做 定座 订单 订购 订婚 订货 订价 订金 订约 订制 订做 东丹 东单 东峰 东风 东宫 东瓜
+东胡 东湖 东京 东经 东莱 东来 东丽 东力 东林 东临 东路 东欧 东盛 东胜 东西 东星 东兴 东洋 东阳 东夷 东移 东营 东园 东源 东至 东周 东州 冬宫 冬瓜 冬至 董事 懂事 动土
+冻土 斗式 斗士 斗志 督查 督察 督抚 督府 毒霸 毒计 毒砂 毒杀 毒雾 毒物 犊子 独霸 独脚 独角 独立 独力 独幕 独木 独子 读物 肚量 度过 度假 度量 渡过 渡假 短见 短剑 短句
+短剧 段子 断面 缎面 缎子 兑付 兑换 队歌 队内 对付 对歌 对攻 对公 对换 对内 对仗 对症 对证 对质 多变 多遍 多步 多部 多封 多峰 多佛 多幅 多服 多福 多副 多极 多集 多级
+多价 多架 多具 多里 多礼 多利 多例 多轮 多伦 多模 多摩 多亩 多姆 多斯 多丝 多态 多味 多位 多页 多夜 多亿 多义 多于 多余 多址 多指 多只 蛾眉 峨眉 娥眉 恶鬼 恶梦 厄运
+扼死 扼制 遏制 饿鬼 饿死 恩师 恩施 二步 二部 二成 二程 二代 二袋 二黄 二簧 二集 二级 二价 二架 二驾 二期 二七 二手 二首 二武 二五 二心 二亿 二意 二元 二员 二枝 二支
+贰心 发奋 发愤 发际 发夹 发家 发掘 发觉 发梢 发烧 发声 发生 发式 发型 发行 发言 法例 法力 法轮 法伦 法螺 法罗 法式 法事 法物 法务 法医 法衣 法意 法制 法治 帆板 帆船
+番茄 翻板 翻版 翻船 翻番 翻翻 翻然 翻越 翻阅 繁难 繁琐 繁杂 凡人 凡世 凡事 凡是 凡心 烦难 烦人 烦琐 烦心 烦杂 烦躁 烦燥 反式 反是 反照 反正 反证 返照 范文 范志 范质
+贩黄 饭钱 饭前 饭时 饭食 泛黄 方城 方成 方程 方济 方巾 方今 方式 方士 方塘 方糖 方型 方形 方正 方证 房地 房钱 房前 房事 房市 房水 防暴 防爆 防地 防水 仿古 访古 放声
+放生 非人 非行 飞宏 飞红 飞人 飞行 飞鱼 飞越 飞跃 肥力 废气 废弃 废水 废止 废纸 沸水 酚类 分辨 分辩 分布 分步 分部 分场 分厂 分管 分馆 分洪 分红 分划 分化 分类 分立
+分力 分列 分裂 分流 分社 分设 分署 分属 分型 分形 分行 分页 分业 分争 分枝 分支 纷争 忿恨 忿怒 愤恨 愤怒 丰采 丰度 丰林 丰水 丰韵 丰姿 封顶 封关 封官 封火 封口 封门
+封面 封山 封土 峰顶 峰林 峰山 锋面 风采 风动 风洞 风度 风火 风口 风帽 风貌 风门 风水 风土 风箱 风烟 风韵 风姿 疯长 疯涨 佛尔 佛法 佛号 佛拉 佛山 佛手 夫子 幅面 符兵
+符号 伏安 伏兵 伏地 伏法 伏侍 伏特 伏罪 服法 服气 服式 服侍 服罪 浮尘 浮沉 浮华 浮滑 浮图 浮屠 浮油 浮游 福安 福地 福尔 福气 福山 福斯 福特 福星 福兴 抚河 辅币 府河
+副本 副刊 副业 副职 复本 复出 复国 复核 复合 复华 复会 复刊 复式 复述 复数 复现 复线 复星 复兴 复性 复姓 复业 复叶 复议 复印 复元 复原 复员 复职 父本 父女 父业 父子
+负极 负面 负数 负翁 负心 负有 负于 负载 负值 富国 富华 富丽 富平 富人 富水 富泰 富态 富翁 富阳 富有 富于 富余 富足 妇女 妇人 该是 该市 该县 该线 改成 改乘 改掉 改调
+改型 改行 干犯 干饭 干姜 干将 干流 干路 干禄 干湿 干尸 干式 干事 干校 干笑 干枝 干支 杆儿 杆子 柑桔 柑子 竿子 肝儿 赶到 感到 感官 感观 感情 敢情 刚体 钢管 钢领 钢制
+钢质 缸体 缸子 纲领 岗区 岗台 港区 港台 杠子 高背 高倍 高城 高成 高程 高点 高胡 高湖 高价 高架 高抗 高亢 高丽 高利 高梁 高粱 高龄 高陵 高卢 高炉 高庙 高妙 高墙 高强
+高声 高升 高堂 高唐 高尾 高纬 高校 高效 高薪 高新 高扬 高洋 高阳 膏粱 糕点 搞头 镐头 告戒 哥德 哥儿 歌德 歌儿 歌子 格儿 格利 格力 隔世 个别 个个 个人 个位 各别 各个
+各人 各式 各市 各位 各型 各行 给予 给与 耿直 工办 工本 工布 工部 工场 工厂 工尺 工读 工房 工分 工夫 工会 工价 工架 工交 工课 工矿 工况 工力 工人 工伤 工商 工事 工体
+工务 工效 工学 工业 工用 工质 工种 工装 攻读 攻关 攻掠 攻略 攻心 功德 功法 功夫 功架 功课 功利 功力 功效 功业 功用 供称 供词 供方 供认 供体 供者 供职 供种 公办 公布
+公称 公尺 公德 公法 公方 公房 公分 公府 公关 公贿 公会 公积 公鸡 公交 公爵 公决 公理 公里 公历 公例 公立 公路 公鹿 公门 公人 公认 公社 公设 公生 公升 公式 公事 公室
+公私 公司 公物 公务 公心 公学 公意 公义 公议 公用 公育 公元 公园 公正 公证 公职 公主 公子 宫本 宫城 宫词 宫府 宫里 宫门 宫人 宫室 宫体 宫廷 宫庭 宫者 宫主 宫装 巩县
+贡生 共济 共计 共生 钩子 勾通 勾子 沟通 构件 构建 购建 够呛 孤立 孤力 孤子 姑子 鼓板 鼓风 鼓浪 鼓楼 鼓膜 鼓气 鼓曲 鼓式 鼓书 鼓掌 鼓涨 古板 古本 古城 古董 古风 古画
+古话 古浪 古力 古龙 古隆 古楼 古录 古陆 古曲 古诗 古尸 古式 古士 古书 古物 古学 古意 古义 骨板 骨董 骨力 骨膜 骨器 骨气 骨学 骨子 谷城 谷物 谷子 股本 股长 股利 股掌
+股子 故城 故技 顾主 固城 雇主 刮片 瓜片 挂钩 挂勾 关爱 关隘 关长 关吏 关联 关连 关念 关山 关心 关员 关照 关子 官长 官倒 官道 官军 官吏 官路 官禄 官名 官山 官园 官员
+官子 冠军 冠名 冠子 观念 观山 观心 观照 管长 管带 管待 管见 管件 管内 管式 管事 管员 管制 管治 管子 馆长 馆内 馆员 馆子 罐装 灌注 灌装 贯注 光采 光彩 光华 光滑 光器
+光气 光鲜 光纤 光艳 广灵 广陵 广元 广源 广运 广韵 规程 规范 规约 归程 归功 归公 归依 归约 鬼怪 鬼计 诡怪 诡计 桂山 桂阳 桂鱼 柜子 贵山 贵阳 贵子 国父 国富 国军 国君
+国利 国立 国力 国商 国士 国事 国文 国闻 果枝 裹胁 过度 过渡 过虑 过滤 哈勃 哈伯 海报 海豹 海布 海部 海道 海盗 海丰 海峰 海风 海虹 海红 海警 海景 海路 海陆 海轮 海伦
+海南 海难 海事 海市 海塘 海棠 海图 海涂 海岩 海燕 海宴 海洋 海阳 海药 海原 海员 害怕 骇怕 酣睡 含意 含义 涵义 寒喧 寒意 寒症 寒证 翰海 汗水 汉水 嚎叫 好事 好像 好象
+耗子 号子 浩渺 呵斥 喝采 喝彩 喝斥 荷马 荷塘 荷叶 核计 核算 核子 和龙 和式 和易 和义 和议 和约 何力 何为 何谓 何意 何用 合川 合计 合力 合流 合龙 合面 合山 合身 合式
+合水 合算 合为 合眼 合演 合阳 合页 合叶 合意 合议 合用 合约 合著 合住 合子 河川 河流 河马 河面 河山 河身 河水 河塘 河阳 河子 黑河 黑话 黑幕 黑木 黑啤 黑皮 黑沙 黑纱
+黑桃 黑陶 横梁 横批 横披 横山 横生 横水 横县 横线 衡量 衡山 衡水 恒量 恒山 恒生 虹口 虹桥 虹影 鸿基 鸿图 洪大 洪河 洪口 洪量 洪亮 洪山 宏大 宏道 宏基 宏亮 宏图 弘道
+弘图 红筹 红绸 红河 红桥 红砂 红纱 红杉 红山 红衫 红影 红藻 红枣 红装 红妆 喉头 猴头 猴子 厚生 后辈 后背 后备 后记 后金 后进 后晋 后劲 后期 后妻 后秦 后勤 后生 后世
+后事 后市 后堂 后唐 后卫 后园 后坐 后座 呼哨 忽哨 壶口 胡蝶 胡风 胡佛 胡服 胡佳 胡家 胡涂 糊口 糊涂 湖光 湖口 湖面 弧光 弧面 护照 护罩 互联 互连 互市 沪市 花会 花剑
+花径 花枪 花腔 花式 花市 花树 花束 花香 花乡 花序 花园 华辰 华晨 华工 华宫 华联 华融 华容 华润 华陀 华县 华星 华兴 华原 华源 华州 滑联 滑润 滑县 滑州 画传 画船 画幅
+画符 画工 画名 画片 画作 划船 划片 划入 划子 化儿 化费 化工 化机 化名 化入 化石 化食 化装 化妆 化子 化做 化作 话儿 话费 话机 淮扬 淮阳 坏帐 欢畅 欢唱 欢欣 欢心 欢跃
+欢悦 环岛 环球 环县 环线 环型 环形 环行 环宇 缓刑 缓行 换成 换乘 换发 换房 换防 换上 患上 患者 焕发 宦者 荒乱 慌乱 黄帝 黄褐 黄鹤 黄家 黄巾 黄金 黄历 黄陵 黄马 黄埔
+黄浦 黄旗 黄权 黄泉 黄砂 黄沙 黄水 黄杨 黄羊 黄页 黄叶 黄鱼 皇帝 皇家 皇历 皇陵 皇马 皇权 恍忽 灰褐 灰鹤 辉县 徽县 恢宏 恢弘 回拨 回波 回城 回程 回历 回力 回龙 回笼
+回声 回生 回升 回手 回首 回想 回响 回游 慧心 惠东 贿款 会东 会合 会集 会聚 会面 会通 会务 会心 会演 会意 会议 会元 会员 汇合 汇集 汇聚 汇款 汇通 汇演 浑圆 浑源 混帐
+火暴 火爆 火工 火攻 火井 火警 火具 火器 火气 惑乱 霍乱 货价 货架 货殖 货值 祸乱 击剑 击节 基德 基辅 基极 基利 基民 基切 基石 基数 基体 基因 基音 基座 机变 机场 机动
+机井 机警 机理 机灵 机身 机数 机体 机头 机芯 机心 机制 机座 稽查 稽察 积德 积愤 积极 积石 积血 激变 激辩 激动 激奋 激愤 激灵 激切 鸡场 鸡头 鸡心 鸡血 吉他 吉它 极化
+极难 极其 极权 极为 极性 极至 集安 集流 集权 集束 集数 集为 及其 及时 及至 急剧 急流 急难 急性 即期 即日 即时 即食 级数 挤出 几辈 几倍 几比 几笔 几步 几部 几出 几代
+几袋 几队 几对 几方 几幅 几服 几何 几具 几句 几棵 几颗 几例 几任 几十 几时 几手 几首 几味 几位 几页 几夜 几元 几员 几章 几张 几枝 几支 己方 己任 己子 技工 济南 济宁
+济州 寄予 寄语 计成 计程 计发 计分 计量 计入 计生 计时 计数 计委 记得 记分 记工 记功 记恨 记录 记名 记念 记入 记时 记实 记事 记述 记数 记住 纪程 纪录 纪念 纪时 纪实
+纪事 纪委 嘉宾 嘉里 夹道 夹紧 夹具 夹克 夹住 夹注 夹子 佳宾 佳境 佳人 家长 家道 家法 家境 家具 家里 家人 家世 家事 家鼠 家属 家数 家燕 家宴 家住 家装 家子 加长 加法
+加官 加冠 加紧 加进 加劲 加勒 加里 加利 加力 加数 加锁 加筑 加注 加装 甲地 甲第 架车 架式 驾车 监管 监牢 监利 监事 监守 坚牢 坚守 尖利 尖头 尖细 兼管 肩头 奸猾 奸滑
+检查 检察 柬帖 碱化 简报 简短 简化 简捷 简洁 简慢 简朴 简谱 简帖 简易 简约 剪报 剪除 剪短 剪子 减除 减慢 减震 减振 见长 见外 见笑 见效 见于 见证 健康 健旺 健忘 剑桥
+剑鞘 渐进 渐近 建工 建功 建湖 建康 建桥 建外 建行 建言 建于 建元 建园 姜汁 将门 浆水 浆汁 江门 江水 江原 江源 江州 江洲 讲席 讲习 酱色 降幅 降伏 降服 焦点 焦木 焦心
+焦易 焦躁 焦燥 胶管 胶合 胶结 胶卷 胶木 胶水 交代 交待 交到 交道 交点 交管 交好 交合 交河 交会 交汇 交结 交卷 交心 交易 交由 交游 交予 交与 交子 郊游 浇筑 浇注 娇子
+脚步 脚部 脚架 脚力 脚门 脚色 角力 角门 角色 角形 角质 角子 绞架 绞杀 剿杀 教法 教化 教会 教母 教义 教育 教子 酵母 轿子 叫法 叫化 叫做 叫作 叫座 揭发 接办 接发 接口
+接上 接头 接种 街办 街口 街上 街头 街子 截留 截流 截杀 截肢 节点 节后 节减 节流 节余 节育 节支 节肢 桔红 桔黄 桔子 杰出 杰克 捷克 结疤 结巴 结出 结点 结队 结对 结核
+结合 结石 结实 结识 结余 结帐 解毒 解读 解秘 解密 戒条 芥末 芥子 界面 界石 界限 界线 借词 借代 借贷 借入 借条 借助 借住 介词 介面 介入 介石 介子 筋斗 筋节 斤斗 金币
+金城 金成 金店 金殿 金丰 金风 金刚 金钢 金鼓 金谷 金节 金桔 金陵 金门 金秋 金文 金乌 金屋 金像 金象 金元 金源 金志 金质 今秋 今文 津城 津门 锦兴 进城 进呈 进程 进出
+进攻 进宫 进见 进京 进军 进来 进路 进取 进入 进食 进水 进用 进占 进站 进制 晋城 晋代 晋见 晋京 晋书 禁城 禁地 禁军 禁食 禁书 禁卫 禁用 禁制 近程 近代 近地 近交 近郊
+近来 近路 近世 近卫 浸出 浸取 浸入 浸水 尽兴 荆东 荆门 荆南 荆山 京东 京华 京门 京南 京山 惊魂 惊觉 惊心 精编 精采 精彩 精粹 精典 精度 精干 精河 精华 精魂 精简 精减
+精炼 精练 精米 精心 精血 精研 精义 精英 精油 精制 经编 经典 经度 经济 经纪 经纶 经委 经纬 经心 经血 警世 警务 警悟 景元 景园 静安 静立 静力 静室 静水 境域 境遇 径赛
+径自 竟自 竞赛 韭菜 久保 久间 九代 九袋 九顶 九鼎 九歌 九家 九间 九件 九剑 九具 九句 九类 九曲 九泉 九章 九张 九州 九洲 酒保 酒菜 酒钢 酒缸 酒歌 酒家 酒具 酒类 酒器
+酒气 酒曲 酒泉 酒涡 酒窝 救国 救人 救物 旧国 旧历 旧例 旧人 旧时 旧识 旧式 旧事 旧物 旧学 旧业 旧有 旧友 就是 就学 就业 拘留 拘于 居留 居于 局子 据点 巨变 巨龙 巨然
+巨头 巨星 巨型 巨子 巨作 具备 具结 句点 句型 句子 剧变 剧中 剧终 剧作 掘取 觉世 决不 决非 决口 决然 决无 决意 决议 绝不 绝非 绝技 绝口 绝然 绝世 绝无 绝域 绝育 菌种
+军工 军功 军棋 军旗 军权 军山 军士 军事 军医 军衣 军种 君权 君山 峻工 竣工 浚县 郡县 喀嚓 卡玛 卡马 卡文 开场 开敞 开城 开成 开动 开冻 开工 开合 开河 开伙 开火 开价
+开架 开奖 开讲 开金 开进 开禁 开列 开裂 开颅 开炉 开罗 开锣 开平 开屏 开起 开启 开枪 开腔 开式 开市 开眼 开演 开洋 开阳 开元 开原 开源 凯地 凯蒂 凯斯 凯丝 勘查 勘察
+砍价 看轻 看清 看做 看作 抗暴 抗爆 考查 考察 考问 拷问 烤制 柯达 柯文 柯西 科达 科文 科西 可比 可鄙 可变 可辨 可不 可怖 可是 可望 渴望 克星 克制 刻本 刻画 刻划 刻石
+刻制 客官 客观 客堂 客星 客栈 客站 课本 课堂 空城 空乘 空房 空防 空化 空话 空廓 空阔 空权 空拳 空投 空头 空文 空闻 空中 空钟 口服 口福 口器 口气 口型 口形 扣击 扣压
+扣押 苦工 苦功 苦练 苦刑 苦行 库伦 库仑 裤带 裤袋 跨境 跨径 宽带 宽贷 宽待 筐子 狂生 狂升 狂啸 狂笑 框子 矿工 矿物 矿务 旷工 扩大 阔大 拉钩 拉沟 拉克 拉客 拉链 拉练
+拉斯 拉丝 拉索 拉锁 拉西 拉稀 蜡黄 腊黄 腊味 辣味 来世 来源 赖帐 蓝花 蓝山 栏板 拦截 篮板 兰花 兰山 兰西 揽胜 览胜 榔头 狼嚎 狼毫 狼头 郎中 老城 老成 老父 老妇 老化
+老话 老九 老酒 老路 老陆 老太 老态 老挝 老窝 老相 老乡 老鸦 老鸭 老爷 老丈 姥爷 乐艺 乐意 雷射 镭射 累人 类人 泪人 冷锋 冷风 冷酷 冷库 梨山 梨园 梨子 离子 理科 理县
+李德 李氏 李斯 李子 里德 里氏 里数 里斯 里子 鲤科 礼佛 礼服 礼帽 礼貌 礼泉 礼数 礼俗 礼县 礼制 礼治 丽莎 历城 历程 历法 历时 历世 历书 历阳 历元 利国 利害 利剑 利鹿
+利禄 利马 利莎 利士 利市 利文 利于 例文 例行 例子 立场 立德 立得 立法 立国 立克 立刻 立马 立时 立式 立项 立像 立于 立元 立志 力场 力度 力克 力士 力行 联播 联唱 联城
+联成 联程 联动 联队 联和 联合 联接 联结 联络 联片 联手 联锁 联体 联通 联同 联网 联线 联营 联用 联缀 联袂 莲子 连播 连唱 连城 连成 连动 连队 连合 连江 连接 连结 连络
+连片 连声 连生 连升 连手 连锁 连体 连通 连同 连网 连线 连营 连赢 连用 连缀 连作 连坐 连袂 廉江 廉正 廉政 帘子 敛衽 脸型 脸形 炼就 练就 粮田 粮栈 粮站 凉城 凉山 凉药
+凉州 梁城 梁家 梁山 梁州 良材 良才 良家 良田 良药 良友 两岸 两案 两辈 两倍 两步 两部 两侧 两册 两城 两成 两程 两幢 两床 两代 两袋 两队 两对 两封 两峰 两幅 两服 两河
+两极 两级 两记 两具 两句 两棵 两颗 两例 两立 两幕 两目 两期 两栖 两全 两拳 两手 两首 两束 两数 两委 两尾 两味 两位 两页 两叶 两夜 两元 两员 两章 两张 两枝 两支 量度
+量化 亮度 亮化 列日 列为 列位 烈马 烈日 烈性 劣马 劣性 猎狗 林产 林场 林海 林火 林家 林里 林县 磷火 霖雨 临产 临场 临海 临近 临县 临刑 临行 临震 临阵 邻家 邻近 邻里
+邻县 淋雨 菱花 零花 零活 零乱 零时 零食 零星 凌迟 凌乱 凌州 灵川 灵活 灵器 灵气 灵寿 灵兽 灵州 陵迟 陵川 岭地 岭头 岭子 领到 领道 领地 领头 领子 令爱 硫黄 硫基 留出
+留芳 留连 留下 留言 留住 留驻 刘基 流程 流出 流弹 流芳 流河 流金 流连 流露 流路 流时 流食 流式 流下 流形 流行 流言 流域 柳城 六步 六部 六处 六代 六袋 六具 六句 六期
+六七 六味 六位 六畜 六艺 六亿 六元 六员 六章 六张 六枝 六支 龙岗 龙港 龙亭 龙庭 龙头 龙岩 龙洋 龙阳 龙舟 龙州 龙子 聋子 笼头 笼子 芦笛 卤菜 卤莽 鲁菜 鲁莽 露地 露面
+露台 露西 露相 路程 路风 路基 路军 路矿 路况 路面 路桥 路上 路西 鹿城 禄丰 录像 录象 陆程 陆地 陆丰 陆风 陆基 陆机 陆军 陆路 陆陆 陆桥 陆上 陆台 陆相 铝业 铝制 铝质
+旅行 旅业 履行 氯化 律师 律诗 滤波 绿波 绿地 绿蒂 绿化 绿山 绿衫 掠过 略过 轮次 伦次 论集 论及 螺山 螺丝 螺纹 罗家 罗加 罗马 罗那 罗纳 罗莎 罗刹 罗山 罗文 罗纹 骡马
+落地 落第 落基 落石 落实 落水 落子 洛河 洛基 洛水 络子 麻利 码头 码子 蚂蜂 马鞭 马边 马场 马厂 马岛 马导 马蜂 马脚 马角 马蓝 马兰 马路 马鹿 马陆 马荣 马融 马司 马头
+马系 马戏 马子 买嘱 买主 麦地 麦克 卖出 卖地 迈出 迈克 满园 满员 满足 满族 蔓延 慢步 漫步 漫画 漫话 漫延 茅盾 毛头 矛盾 矛头 茂名 冒顶 冒名 帽顶 梅山 梅县 梅雨 梅州
+煤场 煤厂 煤气 煤山 煤质 没法 眉尖 眉间 眉山 眉县 媒质 每餐 每章 每张 美餐 美丽 美利 美式 美事 美玉 美育 美元 美圆 门封 门风 门槛 门坎 门联 门帘 门式 门市 蒙授 蒙受
+蒙胧 靡费 糜费 迷漫 迷雾 迷误 弥漫 米亚 米制 米质 秘事 秘室 秘书 蜜语 密集 密级 密室 密书 密语 棉纸 绵羊 绵阳 绵纸 勉力 面巾 面筋 面世 面市 妙诀 妙绝 民房 民防 民丰
+民风 民声 民生 民窑 民谣 明方 明教 明理 明里 明目 明器 明仁 明人 明山 明式 明堂 明文 明心 明星 明言 明治 明子 鸣叫 鸣琴 鸣禽 鸣声 铭牌 铭文 铭心 名刺 名次 名方 名教
+名叫 名句 名剧 名木 名目 名牌 名琴 名人 名山 名声 名师 名诗 名堂 名为 名位 名星 名言 名子 摹仿 摹拟 摹写 模板 模版 模仿 模具 模拟 模式 模写 模子 膜式 磨擦 磨机 磨具
+磨炼 磨练 磨石 磨头 磨子 摩擦 魔头 魔杖 魔障 抹杀 末儿 末路 末子 莫顿 莫里 莫西 莫希 墨子 默顿 默里 默然 沫儿 沫子 漠然 谋利 谋取 谋士 谋事 牟利 牟取 某事 某市 拇指
+牡牛 母机 母鸡 母牛 母珠 母株 母猪 墓场 墓地 墓区 墓群 墓石 木板 木版 木荷 木合 木僵 木浆 木栏 木兰 木马 木排 木牌 木石 木下 木香 木箱 木业 木叶 木鱼 木制 木质 目地
+目下 目鱼 牧场 牧地 牧马 牧区 牧群 牧业 纳粮 纳凉 耐特 奈特 南方 南丰 南峰 南风 南岗 南港 南关 南和 南河 南江 南疆 南凉 南梁 南路 南木 南平 南桥 南侨 南区 南曲 南塘
+南唐 南投 南头 南希 南县 南线 南襄 南湘 南巡 南洋 南阳 南园 南苑 南院 南越 南岳 南召 南竹 男方 男声 男生 男式 男士 男友 难倒 难道 难关 难友 闹事 闹市 内地 内蒂 内弟
+内耳 内尔 内含 内涵 内核 内河 内画 内化 内径 内伊 内衣 内源 能溶 能容 拟定 拟订 拟提 拟题 逆水 溺水 年青 年轻 碾碎 碾子 捻碎 捻子 鸟龙 鸟笼 凝立 凝力 凝炼 凝练 凝住
+凝注 牛筋 牛金 牛津 钮扣 纽扣 农副 农妇 怒斥 女声 女生 女式 女士 女真 女贞 暖锋 暖风 懦夫 诺夫 诺斯 诺思 欧式 偶合 拍岸 拍案 排比 排笔 排名 排位 牌名 牌位 盘鼓 盘古
+盘据 盘龙 盘石 磐石 刨子 炮制 袍子 泡制 配戴 配带 配电 配殿 配饰 配系 配戏 配置 配制 佩戴 佩带 佩饰 蓬松 膨松 鹏城 鹏程 批阅 披阅 劈啪 皮带 皮袋 皮革 皮格 皮相 皮箱
+皮制 皮质 偏师 偏失 片段 片断 片石 片时 片子 骗子 飘泊 飘浮 飘流 飘渺 飘移 漂泊 漂浮 漂流 漂移 频道 贫道 品名 品味 品位 苹果 平板 平版 平城 平成 平定 平分 平伏 平服
+平果 平化 平话 平价 平金 平津 平空 平山 平身 平声 平生 平时 平实 平水 平西 平息 平乡 平信 平易 平装 凭空 凭信 瓶身 瓶装 评定 评分 评话 评价 屏气 屏弃 屏山 屏息 破击
+迫击 扑通 扑哧 蒲州 朴子 普度 普渡 普尔 普洱 普及 谱仪 谱子 期数 期中 期终 七步 七部 七代 七袋 七美 七数 七叶 七夜 七元 七员 七章 七张 七枝 七支 其次 其后 其时 其实
+其他 其它 其子 棋后 棋手 棋子 奇兵 奇技 奇绝 奇门 奇人 奇士 奇事 奇文 奇闻 奇异 歧义 齐次 齐鸣 齐名 齐射 齐州 旗人 旗手 旗子 骑兵 骑射 骑士 骑手 起程 起动 起航 起价
+起驾 起锚 起毛 起事 起用 起运 起止 岂止 乞求 企求 启程 启动 启航 启锚 启事 启用 启运 契机 砌体 器量 器物 器宇 气儿 气缸 气化 气话 气机 气绝 气量 气体 气息 气血 气宇
+气运 气韵 气质 弃儿 弃绝 弃物 汽缸 汽化 汽机 牵头 牵张 铅块 铅山 铅字 千步 千部 千幅 千伏 千斤 千金 千钧 千军 千块 千名 千山 千手 千首 千条 千头 千元 千员 千张 签定
+签订 签名 签条 签子 签字 黔江 黔南 黔阳 钱款 前江 前款 前南 前期 前妻 前山 前贤 前嫌 前行 前言 前沿 潜江 潜山 潜行 潜阳 欠帐 枪枝 枪支 墙脚 墙角 墙子 强度 强渡 强子
+切记 茄克 茄子 侵掠 侵略 秦王 琴鸟 勤王 禽鸟 青白 青茶 青城 青峰 青锋 青风 青工 青河 青口 青联 青莲 青木 青山 青衫 青史 青松 青桐 青铜 青溪 青杨 青羊 青阳 青州 轻兵
+轻点 轻风 轻工 轻灵 轻木 轻声 轻生 轻水 轻松 轻闲 轻扬 轻油 氢化 倾城 倾谈 倾泄 倾心 清白 清兵 清茶 清查 清城 清醇 清纯 清点 清芬 清分 清丰 清风 清河 清化 清缴 清剿
+清静 清口 清灵 清史 清水 清谈 清溪 清闲 清香 清乡 清新 清心 清扬 清议 清油 清原 清源 清运 清韵 清州 擎天 晴天 情节 情结 情事 情思 情丝 情意 情义 情志 庆元 庆源 琼海
+秋播 秋波 秋粮 秋凉 秋叶 秋夜 球型 球形 球衣 囚衣 区直 曲风 曲径 曲律 曲率 曲曲 曲洋 曲阳 曲艺 曲意 曲直 屈曲 驱虫 驱除 驱风 驱邪 渠县 取悦 取阅 取自 取字 去世 权利
+权力 权能 权属 权术 权责 泉城 泉州 全班 全般 全场 全厂 全城 全程 全力 全能 全盛 全胜 全师 全属 全套 全县 全线 全形 全行 全园 全员 全责 全州 全洲 拳师 拳术 拳套 劝戒
+缺刻 缺课 缺如 鹊山 确山 壬子 仁人 仁寿 仁心 仁学 仁意 仁义 人材 人才 人际 人人 人声 人生 人士 人世 人事 人寿 人为 人味 人心 人形 人行 人学 人艺 人意 人员 人质 人治
+人子 韧性 任命 任性 认命 日斑 日班 日工 日公 日见 日渐 日均 日军 日历 日立 日食 日星 日兴 日元 日圆 蓉城 荣光 荣县 融和 融合 融化 融会 融汇 融解 融融 融入 融于 熔合
+熔化 熔剂 熔解 熔融 熔岩 溶合 溶化 溶剂 溶解 溶入 溶岩 溶于 容光 容县 揉合 儒林 如林 乳业 乳液 入骨 入股 入世 入市 入围 入住 入驻 软膜 软磨 瑞丽 瑞利 瑞气 锐利 锐器
+锐气 弱质 萨菲 萨非 塞上 塞尚 三保 三宝 三辈 三倍 三步 三部 三城 三成 三代 三袋 三顶 三鼎 三锭 三定 三栋 三洞 三丰 三封 三峰 三幅 三伏 三服 三公 三宫 三官 三观 三合
+三河 三极 三集 三级 三记 三价 三架 三脚 三角 三节 三杰 三界 三届 三斤 三金 三进 三晋 三具 三句 三棵 三颗 三科 三例 三菱 三陵 三路 三鹿 三氯 三滤 三明 三名 三木 三目
+三期 三七 三枪 三腔 三泉 三拳 三声 三生 三牲 三十 三实 三世 三手 三首 三束 三数 三围 三维 三味 三位 三卫 三贤 三弦 三相 三湘 三性 三姓 三洋 三阳 三页 三叶 三夜 三亿
+三义 三元 三原 三员 三愿 三院 三章 三张 三镇 三阵 三枝 三支 三株 散布 散步 散记 散见 散件 莎车 莎拉 砂锅 砂金 砂砾 砂粒 砂石 砂田 砂土 砂岩 砂子 杀场 杀伐 杀气 杀头
+刹车 刹住 沙场 沙伐 沙锅 沙金 沙拉 沙砾 沙粒 沙石 沙田 沙头 沙土 沙陀 沙岩 沙鱼 沙州 沙洲 沙子 山峰 山风 山岗 山港 山尖 山间 山路 山西 山杨 山羊 山阳 山越 山岳 删除
+擅于 善变 善辩 善于 墒情 伤号 伤科 伤情 伤人 商号 商科 商情 商人 商战 商站 商周 商州 上步 上部 上菜 上蔡 上策 上册 上城 上成 上乘 上传 上船 上地 上帝 上吊 上调 上峰
+上风 上工 上攻 上供 上古 上谷 上好 上河 上集 上级 上佳 上家 上将 上浆 上江 上焦 上交 上进 上劲 上声 上升 上士 上市 上手 上首 上书 上述 上数 上思 上司 上诉 上位 上限
+上线 上刑 上行 上犹 上游 上元 上原 上庄 上装 上妆 尚好 尚书 梢公 稍候 稍后 烧麦 烧卖 勺子 蛇头 蛇形 蛇行 舌头 舍监 舍间 摄入 摄影 射猎 射入 射影 涉猎 涉县 社区 设区
+申斥 申达 申遗 申仪 申冤 伸长 伸手 伸冤 身长 身处 身手 身受 身陷 深长 深处 深达 深受 深陷 神甫 神府 神功 神宫 神化 神话 神京 神经 神庙 神妙 神器 神气 神物 神志 神舟
+神州 沈度 审查 审察 审定 审订 审度 声光 声级 声明 声名 声母 声气 声色 声势 声威 声息 声学 声压 生光 生克 生客 生利 生力 生母 生平 生气 生色 生涩 生水 生威 生息 生肖
+生效 生员 生源 升级 升平 升势 升水 升息 升学 升压 升职 升值 省级 省立 省力 省事 省市 盛饭 盛景 盛世 盛事 剩饭 胜地 胜迹 胜景 胜境 胜者 圣地 圣哥 圣歌 圣迹 圣境 圣者
+师传 师恩 师法 师范 师父 师事 师训 师友 师职 失传 失地 失掉 失调 失范 失礼 失身 失事 失手 失守 失笑 失效 失学 失意 失职 失主 施恩 施法 施礼 施行 施训 施予 施与 施主
+湿地 湿法 诗化 诗话 诗句 诗剧 诗体 诗行 诗学 诗艺 诗意 诗友 尸身 尸体 十本 十步 十部 十场 十处 十代 十刀 十道 十点 十段 十队 十对 十方 十分 十盒 十级 十记 十佳 十家
+十间 十节 十杰 十具 十句 十块 十门 十名 十全 十拳 十日 十首 十数 十堂 十头 十文 十下 十行 十一 十元 十员 十则 十章 十张 十招 十指 十只 十字 十足 石板 石版 石场 石弹
+石刀 石坊 石方 石核 石河 石湖 石基 石鸡 石级 石家 石刻 石块 石料 石门 石南 石砌 石器 石人 石首 石头 石峡 石像 石向 石盐 石油 石制 石质 石筑 时代 时点 时段 时分 时价
+时间 时节 时刻 时人 时日 时时 时事 时数 时文 时务 时下 时效 时装 什物 食道 食盒 食具 食料 食堂 食糖 食物 食盐 食言 食用 食油 食指 实处 实弹 实际 实价 实利 实例 实力
+实名 实时 实事 实数 实物 实务 实现 实线 实像 实效 实行 实用 实则 实招 实质 实装 实足 识记 识字 史臣 史官 史观 史记 史料 史志 矢志 使臣 使出 使得 驶出 驶进 驶近 始得
+始料 式样 式子 士兵 士民 士人 士子 士卒 士族 世兵 世博 世伯 世道 世故 世界 世面 世情 世人 世实 世事 世俗 世态 世外 世卫 世务 世行 世业 世子 世族 事故 事件 事例 事情
+事实 事事 事态 事物 事务 事业 事宜 势利 势力 是从 市场 市长 市道 市地 市集 市级 市口 市立 市面 市民 市名 市内 市情 市俗 市外 市直 市值 市制 收伏 收服 收复 收市 收住
+手部 手段 手法 手记 手轮 手势 手套 手下 手相 手指 手纸 首部 首段 首辅 首府 首富 首节 首例 首轮 首套 首下 首相 首信 首义 首则 首战 首站 守城 守成 守法 守节 守势 守信
+守业 守夜 守义 守则 寿礼 寿面 寿命 寿县 寿限 授粉 授奖 授精 授命 授权 授业 授艺 授意 授予 授与 售予 受粉 受惠 受贿 受奖 受惊 受精 受理 受礼 受命 受权 受限 受业 受重
+受众 兽面 输导 输运 舒城 舒卷 舒展 疏导 疏忽 疏理 疏于 疏运 书城 书价 书架 书卷 书立 书声 书生 书市 书童 书香 书箱 书写 书页 书业 书展 熟食 熟识 薯类 蜀地 蜀国 鼠类
+属地 属国 术家 树根 树立 树起 树人 树身 树荫 树阴 树枝 树脂 树种 束身 竖立 竖起 竖条 数出 数根 数集 数级 数计 数记 数家 数据 数句 数口 数理 数里 数例 数辆 数量 数起
+数术 数数 数条 数章 数张 数种 数珠 数株 摔交 霜叶 双缸 双杠 双钩 双沟 双黄 双簧 双脚 双角 双全 双拳 双声 双生 双树 双数 双叶 水城 水程 水稻 水道 水电 水殿 水合 水河
+水基 水机 水精 水井 水警 水景 水利 水力 水路 水鹿 水陆 水幕 水木 水炮 水泡 水平 水瓶 水气 水汽 水声 水生 水师 水塔 水獭 水文 水纹 水雾 水务 水西 水箱 水乡 水烟 水淹
+水域 水原 水源 水藻 水蚤 水质 睡相 睡乡 税负 顺帝 顺式 顺意 顺义 舜帝 说辞 说词 硕果 斯密 斯人 撕下 思辨 思辩 思路 思南 思念 思惟 思维 思议 私法 私利 私立 私密 私念
+私人 私下 私议 司长 司法 司南 司掌 丝路 丝棉 丝绵 死记 死节 死结 肆行 寺里 四步 四部 四代 四袋 四幅 四伏 四合 四河 四胡 四湖 四极 四集 四级 四记 四件 四具 四句 四棵
+四颗 四里 四明 四名 四期 四七 四十 四时 四手 四首 四围 四维 四味 四位 四行 四叶 四夜 四元 四员 四岳 四月 四章 四张 四枝 四支 四周 四洲 松弛 松驰 松山 颂词 颂诗 宋慈
+宋词 宋诗 苏菲 苏非 苏式 俗物 俗务 素食 素性 素志 素质 速食 塑性 宿夜 宿愿 宿怨 诉愿 算式 算是 算术 算数 碎末 碎石 岁末 梭标 索求 所求 所为 所谓 他家 他俩 他们 它们
+她家 她俩 她们 泰安 泰和 泰宁 泰山 泰顺 太安 太古 太谷 太和 太合 太庙 太妙 太宁 太山 太顺 太元 太原 谈到 谈道 坦承 碳化 碳素 碳源 探查 探察 探询 探寻 探源 叹息 炭化
+炭素 唐人 糖人 糖元 糖原 桃园 桃源 特急 特级 特利 特例 特力 特区 特曲 特赦 特设 特意 特制 特质 腾越 腾跃 提款 提名 题辞 题词 题款 题名 蹄声 啼声 体例 体力 体量 体谅
+体诗 体味 体位 体型 体形 体制 体质 天保 天宝 天城 天成 天地 天帝 天蛾 天鹅 天父 天富 天工 天公 天宫 天合 天河 天虹 天宏 天基 天机 天梁 天良 天路 天禄 天幕 天目 天蓬
+天棚 天盛 天圣 天师 天显 天险 天星 天兴 天幸 天性 天崖 天涯 天眼 天演 天意 天义 天元 天原 天园 天圆 天竹 天资 天姿 填制 田猎 田头 田制 甜美 甜头 恬美 条文 条纹 贴子
+铁幕 铁木 铁杉 铁山 铁术 铁树 铁索 铁锁 铁芯 铁心 铁业 铁叶 铁制 铁质 帖子 听政 听证 亭长 庭长 通关 通观 通化 通话 通利 通例 通力 通联 通连 通量 通亮 通神 通什 通义
+桐城 桐乡 桐子 瞳仁 瞳人 同理 同里 同门 同年 同仁 同人 同声 同事 同乡 同心 同形 同行 同性 同姓 同业 同意 同义 同音 同志 同质 同治 铜板 铜版 铜城 铜陵 铜门 铜排 铜牌
+铜仁 铜山 铜业 铜制 铜质 铜子 童年 童仆 童山 童声 童生 童心 童音 童真 童贞 童子 筒裙 统和 统合 统裙 统制 统治 痛哭 投合 投河 投球 投生 投宿 投诉 投胎 头关 头冠 头球
+头生 头式 头胎 头子 凸出 凸起 凸显 凸现 突出 突起 突显 突现 图板 图版 图集 图件 图片 图式 图文 图纹 图像 图象 涂片 土风 土气 土温 土制 土质 吐番 吐气 吐温 团员 团圆
+推托 推脱 推委 蜕化 褪去 褪色 退朝 退潮 退化 退伙 退火 退去 退色 吞食 拖靶 拖把 拖拉 拖运 托辞 托词 托拉 托运 脱靶 陀螺 陀罗 驮子 驼子 妥贴 妥帖 瓦利 外部 外带 外代
+外敷 外功 外公 外界 外借 外露 外路 外貌 外贸 外伤 外商 外县 外线 外相 外乡 外型 外形 外行 外因 外阴 外域 外遇 外源 弯子 湾子 玩艺 玩意 完毕 碗装 晚装 皖西 宛西 宛转
+婉转 万磅 万镑 万部 万成 万乘 万代 万袋 万担 万丹 万幅 万福 万古 万股 万斤 万金 万颗 万科 万历 万例 万盛 万圣 万世 万事 万手 万首 万县 万线 万向 万象 万重 万众 腕部
+王菲 王公 王宫 王国 王者 亡国 亡者 枉顾 枉然 威风 威克 威利 威力 巍山 微臣 微尘 微辞 微词 微风 微黄 微机 微克 微利 微山 微缩 微言 危机 危及 危急 危岩 危言 韦达 韦拉
+韦利 违心 围场 围堤 围护 围子 唯独 唯恐 唯心 唯一 唯有 惟独 惟恐 惟一 惟有 为官 为了 为名 为难 为生 为数 维达 维护 维拉 维利 维西 维希 萎黄 萎缩 委曲 委屈 委琐 委托
+伪书 伪托 伪证 纬书 未了 未名 未能 位能 位数 卫城 卫国 卫生 瘟病 温病 文采 文彩 文峰 文风 文具 文句 文理 文明 文名 文人 文身 文饰 文殊 文书 文献 文县 文言 文艺 文意
+文义 文章 闻风 闻名 闻人 闻言 纹理 纹身 纹饰 纹章 问明 问名 蜗轮 涡轮 窝轮 卧式 巫山 巫溪 乌里 乌利 乌力 乌山 乌溪 污蔑 诬蔑 屋里 无常 无偿 无措 无错 无机 无极 无级
+无理 无礼 无明 无名 无宁 无期 无欺 无人 无为 无味 无谓 无物 无误 无息 无限 无线 无需 无须 无遗 无疑 无意 无庸 无用 无余 吾人 吴用 毋宁 毋庸 武部 武场 武城 武大 武斗
+武关 武官 武会 武家 武经 武口 武林 武陵 武岭 武坛 武系 武戏 武乡 武行 武学 武穴 武阳 武艺 武义 武者 五步 五部 五场 五城 五成 五大 五代 五袋 五刀 五斗 五队 五对 五封
+五峰 五服 五福 五古 五谷 五股 五官 五河 五家 五加 五间 五件 五建 五戒 五届 五斤 五金 五经 五具 五句 五口 五联 五莲 五林 五陵 五岭 五龙 五轮 五伦 五门 五期 五七 五台
+五味 五位 五香 五乡 五刑 五行 五羊 五洋 五叶 五夜 五元 五原 五员 五岳 五月 五枝 五支 五指 五只 五株 午间 午门 午夜 舞步 舞场 舞刀 舞会 舞龙 舞台 舞坛 舞阳 舞者 雾化
+物化 物事 物像 物象 物性 务工 务虚 务须 悟性 误工 误事 析取 西奥 西澳 西边 西伯 西部 西川 西德 西尔 西丰 西峰 西风 西沟 西谷 西和 西河 西华 西画 西化 西京 西经 西口
+西拉 西兰 西林 西临 西陵 西流 西路 西罗 西盟 西纳 西宁 西欧 西平 西山 西式 西市 西斯 西特 西头 西乡 西亚 西洋 西阳 西原 西园 西源 西苑 西院 西周 西州 西洲 西装 吸纳
+吸取 吸水 锡伯 稀罕 稀奇 稀世 稀有 希德 希尔 希罕 希克 希拉 希罗 希奇 希斯 希特 希瓦 希亚 希有 檄文 袭用 习文 习用 洗炼 洗练 洗印 系辞 系词 戏说 细布 细部 细菌 细君
+细砂 细沙 细纱 细说 细辛 细心 细雨 细语 瞎子 虾子 峡谷 侠义 狭谷 狭义 下策 下册 下臣 下沉 下关 下官 下河 下集 下级 下界 下届 下令 下人 下士 下世 下手 下首 下限 下线
+下泄 下装 夏历 夏利 夏令 夏装 吓人 先父 先富 先见 先觉 先决 先人 先声 先生 先师 先世 先是 先手 先于 仙草 仙花 仙器 仙气 仙人 仙师 鲜草 鲜花 鲜见 鲜于 鲜鱼 纤手 咸水
+贤慧 贤惠 贤人 贤淑 闲人 闲事 闲雅 显威 显微 显要 显耀 险要 现丑 现出 现价 现金 现今 现身 现时 现实 现形 现行 现职 现值 现状 献丑 献出 献辞 献词 献技 献计 献上 献身
+献县 县城 县立 县令 县上 县县 县政 宪政 宪制 限价 限令 限时 限于 限值 限制 线型 线形 线状 相成 相乘 相承 相干 相护 相互 相会 相间 相敬 相竞 相联 相连 相邻 相片 相亲
+相融 相容 相声 相生 相殊 相书 相思 相像 相向 相象 相移 相宜 相中 相助 香包 香菜 香干 香会 香江 香精 香庐 香炉 香浓 香农 香片 香熏 箱包 襄城 襄助 湘菜 湘江 湘莲 湘帘
+湘乡 湘中 乡间 乡邻 乡农 乡亲 乡思 乡乡 翔实 详实 想起 想像 想象 响起 项背 巷子 橡子 像是 像素 向背 象是 象素 硝化 硝烟 销魂 销烟 消化 消魂 消融 消溶 消声 消受 消瘦
+消业 消夜 宵夜 晓市 小报 小豹 小辈 小贝 小便 小城 小乘 小传 小船 小负 小工 小宫 小伙 小火 小记 小件 小建 小脚 小角 小节 小结 小解 小姐 小井 小景 小径 小利 小路 小鹿
+小器 小气 小桥 小瞧 小区 小曲 小声 小生 小石 小时 小食 小事 小市 小暑 小鼠 小树 小数 小西 小项 小巷 小艺 小义 小于 小鱼 孝服 校服 校刊 校勘 校验 啸声 笑声 效验 楔子
+蝎子 鞋带 鞋垫 鞋店 鞋面 协调 协和 协同 携带 邪路 斜井 斜颈 斜路 斜面 卸下 卸装 卸妆 薪火 芯片 芯子 欣然 辛店 辛集 辛然 辛酸 新安 新潮 新堤 新低 新店 新法 新房 新丰
+新风 新富 新妇 新机 新集 新江 新疆 新立 新力 新路 新片 新声 新生 新式 新市 新田 新县 新线 新星 新兴 新型 新行 新洋 新阳 新意 新语 新元 新园 新源 新正 新政 新郑 新枝
+新知 新舟 新州 新洲 新庄 新装 心安 心潮 心法 心房 心服 心甘 心肝 心火 心机 心计 心静 心境 心口 心理 心里 心力 心路 心律 心率 心木 心目 心脾 心皮 心声 心生 心事 心酸
+心田 心系 心细 心阳 心意 心语 心苑 心愿 心志 心子 信贷 信袋 信封 信风 信佛 信符 信服 信史 信使 信手 信守 星型 星形 腥味 惺松 兴城 兴味 刑房 刑期 刑事 刑政 型号 型式
+型台 型态 形迹 形式 形态 形状 邢台 行房 行号 行贿 行会 行迹 行李 行礼 行期 行使 行驶 行事 行市 行政 行状 醒木 醒目 幸事 杏子 性器 性气 性事 性子 凶器 凶气 凶杀 雄蜂
+雄风 雄师 熊蜂 休学 休养 休整 修城 修成 修定 修订 修炼 修练 修明 修学 修养 修整 羞明 需要 虚发 虚症 虚证 须发 须要 序论 序幕 序目 畜生 畜牲 绪论 悬臂 悬乎 悬想 旋臂
+旋涡 玄乎 玄想 选集 选区 选曲 眩目 学步 学部 学工 学宫 学时 学识 学位 学园 学员 学苑 学院 穴位 雪暴 雪豹 血战 血站 循声 询问 寻回 寻声 寻问 巡查 巡察 巡回 训戒 迅急
+迅即 压片 押运 押韵 鸦片 丫环 牙关 牙冠 牙子 雅丽 雅利 雅普 雅浦 雅士 雅事 亚那 亚娜 亚纳 亚泰 亚太 亚型 亚行 烟管 烟馆 淹没 严辞 严词 严复 严父 严家 严加 严紧 严谨
+严明 严霜 严重 岩山 岩体 岩土 岩性 延边 延河 延性 延至 言辞 言词 言官 言极 言及 言路 言明 言重 沿边 沿河 沿湖 沿路 眼生 衍变 衍化 衍生 演变 演化 演艺 演义 艳服 艳福
+艳装 艳妆 堰口 燕北 燕子 杨浦 杨桃 扬场 扬琴 扬声 扬升 扬中 扬子 羊场 羊城 羊山 羊油 洋河 洋面 洋浦 洋气 洋枪 洋腔 洋琴 洋文 洋油 洋中 洋庄 洋装 阳城 阳河 阳面 阳气
+阳山 阳桃 阳文 阳子 氧气 养气 妖雾 妖物 瑶家 姚家 药害 药价 药业 药液 药枕 药疹 要犯 要饭 要害 要价 要子 耶酥 页面 业大 业力 业态 叶面 叶体 叶芽 叶状 腋芽 夜大 夜光
+夜市 夜鹰 液力 液面 液态 液体 液状 一斑 一班 一般 一磅 一镑 一辈 一倍 一壁 一步 一部 一侧 一册 一成 一程 一川 一幢 一床 一次 一大 一带 一代 一袋 一道 一锭 一定 一动
+一栋 一兜 一堵 一睹 一队 一对 一顿 一盾 一方 一封 一峰 一夫 一幅 一服 一罐 一贯 一集 一级 一记 一家 一架 一驾 一件 一剑 一脚 一角 一具 一句 一棵 一颗 一克 一刻 一例
+一力 一律 一幕 一目 一片 一撇 一瞥 一期 一七 一气 一汽 一枪 一腔 一声 一生 一师 一十 一时 一世 一事 一手 一首 一束 一数 一通 一桶 一统 一万 一味 一位 一箱 一乡 一项
+一向 一新 一心 一药 一页 一业 一叶 一夜 一元 一员 一载 一再 一战 一站 一章 一张 一针 一枝 一支 一只 一纸 一着 医大 医道 医德 医方 医家 医生 医师 医托 医药 依次 依兰
+依律 依托 伊壁 伊川 伊德 伊顿 伊方 伊夫 伊兰 伊通 伊万 衣袋 衣兜 衣服 衣架 衣角 衣片 衣箱 衣着 遗害 遗民 遗容 遗文 遗闻 遗族 移居 移民 移情 仪表 仪容 仪文 宜居 宜山
+已往 乙方 以方 以后 以往 以至 艺德 艺名 艺能 艺文 艺业 艺员 易爆 易传 易地 易发 易名 易趣 易事 易位 易物 易县 易学 易于 易州 亿发 逸士 逸事 意会 意见 意气 意趣 意图
+意味 意谓 意想 意向 意象 意兴 意义 意旨 义夫 义马 义气 义士 义县 义兴 义学 义勇 议会 议价 议事 议员 译著 译注 异味 异位 异相 异香 异乡 异型 异形 异性 异姓 翼型 翼形
+荫凉 因素 因缘 殷天 音符 音素 音速 音义 阴符 阴功 阴宫 阴凉 阴私 阴司 阴天 姻缘 银核 银河 银灰 银辉 银瓶 银屏 银杉 银山 银元 银圆 银制 银质 饮水 饮用 饮子 引见 引水
+引退 引用 引语 引子 隐避 隐退 隐语 印记 印泥 印尼 英磅 英镑 英明 英名 英式 英士 英王 英制 英资 英姿 英子 鹰式 鹰王 鹰扬 鹰洋 应城 应承 应明 应制 缨子 营火 营利 营门
+营州 营子 蝇头 蝇子 迎面 迎头 赢利 赢面 盈利 盈门 影像 影象 硬功 硬式 硬是 映像 映象 拥塞 佣人 庸人 泳道 永和 永合 永济 永记 永历 永利 用工 用功 用做 用作 幽愤 幽静
+幽径 幽美 幽明 幽然 幽闲 幽雅 幽咽 幽燕 幽远 优美 优闲 优雅 优游 优遇 悠然 悠闲 悠游 悠远 忧愤 邮船 邮路 邮轮 邮品 邮箱 邮资 油船 油矿 油路 油轮 油品 油水 油香 油箱
+油性 油榨 油炸 油子 游船 游轮 游水 游性 游艺 游泳 游勇 游鱼 游资 游子 有轨 有鬼 有利 有力 有情 有人 有声 有生 有限 有线 有幸 有性 有意 有源 友情 友人 右面 釉面 幼帝
+幼弟 幼鼠 幼子 余次 余辉 余家 余利 余例 余力 余辆 余量 余钱 余生 余台 余味 余位 余者 余种 鱼叉 鱼生 鱼台 鱼网 鱼汛 鱼种 渔叉 渔家 渔利 渔民 渔人 渔网 渔汛 雨林 雨淋
+雨声 雨丝 雨衣 宇文 语声 语丝 语素 语速 语文 语意 语义 羽衣 玉成 玉佛 玉林 玉瓶 玉屏 玉液 玉衣 玉玺 遇见 御览 御史 御使 御制 御玺 育成 育林 育英 育婴 预定 预订 预见
+预览 预热 预示 预研 预言 预支 预知 预置 预制 元件 元军 元配 元曲 元山 元始 元氏 元素 元通 元阳 元月 元子 原地 原点 原故 原件 原木 原配 原人 原始 原水 原素 原田 原味
+原位 原型 原形 原岩 原阳 原意 原义 原由 原油 原著 原注 原状 原子 园地 园田 园子 员外 圆点 圆木 圆山 圆通 圆头 圆形 圆月 圆状 圆子 源地 源氏 源头 源于 源自 远扬 远洋
+远源 约束 约数 越儿 越飞 越过 越剧 越南 越西 越州 跃过 跃入 岳飞 岳南 岳州 月儿 月桂 月历 月入 月食 月相 月香 阅历 云杉 云山 云县 云阳 郧县 郧阳 运城 运程 蕴含 蕴涵
+砸碎 杂技 杂记 杂碎 杂物 杂务 杂志 杂质 载有 再世 再有 在岸 在案 在世 糟蹋 糟踏 枣茶 早茶 早市 澡塘 澡堂 造化 造型 造形 皂化 增殖 增值 赠予 赠与 榨取 炸死 诈取 诈死
+债主 寨主 栈房 占地 占位 战场 战地 战技 战例 战力 战区 战士 战事 战意 站场 站房 站区 站位 章子 掌班 掌法 掌骨 掌门 掌上 掌勺 掌嘴 涨势 帐册 帐房 帐号 帐户 帐面 帐幕
+帐目 帐蓬 招工 招供 招来 招术 招数 找茬 找碴 照见 照面 罩面 召见 折叠 折中 折衷 蛰居 珍品 珍奇 珍珠 真品 真奇 真言 真珠 贞节 贞洁 针眼 侦查 侦察 震颤 震荡 震动 震幅
+震害 震骇 震憾 震级 震惊 震区 震源 震灾 振颤 振荡 振动 振幅 振型 振源 振子 镇级 镇惊 镇内 镇区 镇痛 镇子 阵内 阵式 阵痛 阵型 阵形 阵子 蒸气 蒸汽 挣得 征得 征购 征战
+征兆 征召 争得 争购 争气 争战 整副 整复 整件 整建 整式 整束 整数 整页 整夜 整枝 整支 正变 正电 正殿 正法 正副 正负 正教 正经 正论 正史 正始 正式 正事 正是 正书 正体
+正像 正向 正沿 正要 正元 正源 正职 正直 正值 正坐 正座 政变 政法 政和 政见 政教 政经 政论 政史 政事 政体 政要 政者 政制 政治 郑和 证法 证见 证件 证书 证者 枝江 枝丫
+枝子 支流 支前 支取 知取 脂类 之江 之类 之流 之前 职教 职守 职业 职掌 直白 直播 直拨 直到 直道 直截 直捷 直立 直行 执白 执教 执勤 执刑 执行 执业 执掌 值勤 值守 指骨
+指甲 指明 指名 指事 指头 指正 指证 纸带 纸袋 纸头 纸页 纸业 纸制 纸质 志哀 志军 志气 志学 志业 志远 至爱 至诚 至死 至于 致辞 致词 置备 置地 置业 置疑 置于 制备 制裁
+制材 制定 制订 制法 制伏 制服 制冷 制取 制热 制做 制作 智利 智力 质保 质地 质朴 质谱 质疑 质子 治保 治病 治法 治军 治学 中表 中策 中册 中层 中场 中城 中成 中程 中稻
+中道 中点 中段 中断 中非 中峰 中锋 中风 中伏 中服 中富 中关 中观 中号 中浩 中和 中河 中慧 中汇 中集 中级 中技 中计 中坚 中间 中将 中江 中京 中经 中南 中年 中盘 中日
+中山 中时 中实 中式 中士 中世 中体 中天 中统 中卫 中心 中星 中兴 中型 中行 中野 中冶 中易 中意 中义 中油 中游 中元 中原 中曾 中职 中直 中指 中止 中州 中洲 中子 盅子
+忠实 忠心 忠义 忠于 钟表 钟点 钟情 钟山 钟体 钟行 衷情 衷心 终场 终成 终点 终非 终将 终南 终年 终盘 终日 终天 终统 终于 终止 种树 种数 重点 重典 重迭 重叠 重复 重负
+重荷 重合 重击 重机 重见 重剑 重建 重利 重力 重生 重新 重心 重信 重刑 重型 重言 重洋 重阳 重振 重镇 仲家 众家 众生 众心 众信 周长 周旋 州长 珠子 朱色 朱子 猪仔 诸色
+诸子 逐条 竹排 竹牌 竹条 竹影 烛影 主父 主妇 主攻 主公 主官 主观 主教 主叫 主客 主课 主粮 主梁 主时 主食 主页 主业 主意 主义 主因 主音 著文 助词 助手 筑波 筑城 筑成
+筑造 住地 住手 注文 祝辞 祝词 驻波 驻地 专场 专程 专集 专署 专属 专项 专向 专著 专注 砖场 砖厂 转授 转售 转为 转位 转型 转行 转意 转义 撰文 篆文 装扮 装甲 装假 装饰
+装做 装作 妆扮 妆饰 撞击 撞机 壮语 状语 椎体 追击 追缴 追剿 追诉 卓见 灼见 咨讯 资材 资财 资历 资力 资讯 姿式 滋生 紫荆 紫杉 紫衫 子力 子叶 子夜 自救 自咎 自觉 自决
+自绝 自立 自力 自留 自流 自然 自燃 自体 自卫 自叙 自序 自制 自治 字幅 字符 字据 字句 字体 字型 字形 字原 字源 鬃毛 棕毛 总场 总厂 总工 总攻 总会 总汇 总责 总则 总支
+总之 纵身 纵深 走进 走近 租界 租借 足已 足以 祖训 组件 组建 组训 钻进 钻劲 醉人 罪人 尊奉 尊荣 尊容 遵奉 左权 左拳 左手 左首 做伴 做成 做出 做到 做东 做法 做工 做功
+做鬼 做好 做客 做派 做人 做为 做主 做做 做作 作伴 作成 作出 作到 作东 作法 作工 作鬼 作好 作客 作派 作人 作为 作主 坐标 坐舱 坐次 坐垫 坐功 坐客 坐落 坐式 坐位 坐席
+坐椅 座标 座舱 座次 座垫 座落 座位 座席 座椅 亟需 亟须 夙愿 夙怨 缥渺 穹窿 穹隆 貂蝉 阿德雷 阿得雷 阿尔特 阿奎那 阿奎纳 阿姆河 阿母河 艾默生 艾滋病 爱丽思 爱丽丝 爱默生
+爱滋病 安德列 安德烈 百余步 百余部 暴发性 爆发性 北双雄 北双熊 边境县 边境线 玻璃钢 玻璃缸 波塞东 波塞冬 博纳乌 伯纳乌 不莱梅 不来梅 不至于 布莱梅 布政史 布政使 曹文轩 曹文宣
+朝阳市 潮阳市 仇士华 仇世华 邓李宝 邓里宝 地面战 地面站 第二步 第二部 第二集 第二级 第二例 第二手 第二首 第二章 第二张 第二枝 第二支 第六步 第六部 第三步 第三部 第三集 第三章
+第三张 第三枝 第三支 第四步 第四部 第五步 第五部 第一步 第一部 第一封 第一峰 第一集 第一级 第一例 第一幕 第一目 第一手 第一首 第一页 第一夜 第一章 第一张 第一枝 第一支 独脚戏
+独角戏 杜光廷 杜光庭 段誉伸 段誉身 峨眉山 二十步 二十部 二十元 二十员 发电场 发电厂 发声器 发生器 法尔斯 法尔思 法制化 法治化 方孝儒 方孝孺 菲利普 菲利浦 非营利 非盈利 飞利浦
+冯师父 佛兰德 佛朗哥 符腾堡 腐植酸 腐殖酸 副作用 负作用 高材生 高才生 哥达德 戈达德 工夫茶 功夫茶 公孙述 公孙树 关老爷 官老爷 广播式 郭靖奇 郭靖骑 郭靖伸 郭靖身 郭靖越 郭靖跃
+郭靖知 郭靖之 哈韦尔 哈维尔 和事老 和事佬 合成器 合成气 河东军 河东君 赫歇耳 赫歇尔 横山县 衡山县 呼吸机 胡为民 胡卫民 胡斐伸 胡斐身 黄培生 黄培升 黄埔区 黄浦区 黄蓉伏 黄蓉教
+黄蓉叫 黄蓉伸 黄蓉身 黄蓉知 黄蓉之 会合处 会合点 汇合处 汇合点 活性碳 活性炭 集安市 几十步 几十部 几十具 几十句 几十棵 几十颗 记录片 纪录片 检查官 检查员 检察官 检察员 减震器
+减振器 交会处 交会点 交汇处 交汇点 脚指头 桔红色 桔黄色 金香玉 金之俊 金之竣 京山县 京山线 径流量 卡罗林 柯尔特 柯林斯 科尔特 科林斯 克劳迪 克劳狄 克丽奥 克利奥 老黄历 老皇历
+雷吉娜 雷吉纳 李健华 李建华 李斯特 李特尔 李伟峰 李希光 李晓明 李晓霞 李小明 李小霞 里斯特 里特尔 历三世 利三世 联接件 连接件 连柯夫 连科夫 凌岩寺 灵岩寺 刘光第 刘光弟 刘晓东
+刘小东 刘云非 刘云飞 芦沟桥 卢沟桥 卢西亚 卢希亚 鲁滨孙 鲁滨逊 鲁宾孙 鲁宾逊 陆征祥 铝矾土 铝钒土 罗德岛 罗德斯 罗得岛 罗得斯 洛伦兹 洛仑兹 玛丽亚 玛利亚 玛索林 玛祖卡 马耳他
+马尔他 马克斯 马克思 马利克 马利亚 马立克 马其诺 马奇诺 马萨革 马萨格 马索林 马祖卡 麦克尔 迈克尔 明斯克 明思克 莫西芬 木姊姊 穆尔西 穆尔希 纳木措 纳木错 年青人 年轻人 聂斯托
+聂斯脱 聂思脱 欧米加 欧米茄 帕尔玛 帕尔马 帕尔莫 帕尔默 潘季驯 潘季训 盘龙镇 赔笑脸 陪笑脸 贫困县 贫困线 普利斯 普利司 七八具 七八句 起动器 启动器 亲和力 亲合力 秦相公 秦襄公
+青河县 清河县 丘处机 丘吉尔 邱处机 邱吉尔 人士处 人事处 日耳曼 日尔曼 熔解热 溶解热 萨伏依 萨伏伊 三岔河 三脚架 三角架 三角型 三角形 杀风景 上半叶 上半夜 神经元 神经原 施耐德
+施奈德 十八棵 十八颗 十二棵 十二颗 十二元 十二员 十二章 十二张 十二枝 十二支 十几步 十几部 十几棵 十几颗 十几枝 十几支 十余步 十余部 时效性 实效性 受惠者 受贿者 数十步 数十部
+数十枝 数十支 水利学 水力学 水蒸气 水蒸汽 斯罗普 斯韦尔 斯韦特 斯维尔 斯维特 思罗普 司马义 四不像 四不象 宋江教 宋江叫 苏黎士 苏黎世 孙为民 孙卫民 索菲亚 索非亚 索尼亚 塔玛拉
+塔马拉 泰利斯 泰利思 碳酸岩 桃花园 桃花源 桃园县 桃源县 田宏遇 田弘遇 田际云 田纪云 屠宰场 屠宰厂 托玛斯 托马斯 玩艺儿 玩意儿 顽意儿 万佳乐 万家乐 王家屏 王剑英 王建英 韦德曼
+韦尔纳 韦尔斯 韦塞尔 韦斯特 维德曼 维尔纳 维尔斯 维娜斯 维纳斯 维塞尔 维斯特 文征明 沃尔福 沃尔玛 沃尔马 沃斯堡 沃思堡 乌斯藏 乌思藏 吴用见 西尔斯 西克斯 希伯莱 希伯来 希尔斯
+希克斯 下半叶 下半夜 下工夫 下功夫 下三烂 下三滥 现政府 县政府 想像力 想象力 新文学 新闻学 信息员 信息源 徐宏祖 徐弘祖 徐士昌 徐世昌 堰塞湖 燕塞湖 杨夫人 杨过伏 杨过服 杨过见
+杨过剑 杨过越 杨过跃 杨过知 杨过之 杨明山 杨士奇 阳夫人 阳明山 叶荣顺 叶容顺 一古脑 一股脑 一两步 一两部 伊文斯 伊文思 印地安 印第安 营利性 赢利性 盈利性 于光远 俞光远 苑维伟
+越剧团 章公公 章宗祥 张公公 张海丽 张海利 张义潮 张议潮 张玉林 张育林 张宗祥 帐户卡 侦查员 侦察员 质量关 质量观 中国画 中国化 钟南山 终南山 重点县 重点线 周期律 周期率 朱常询
+朱丽叶 朱利亚 朱利叶 朱力亚 朱熔基 朱容基 朱子之 诸子之 祝酒辞 祝酒词 坐山雕 座山雕 伽玛刀 伽马刀 阿斯匹林 阿斯塔那 阿斯塔纳 阿司匹林 暗淡无光 暗度陈仓 暗渡陈仓 拜耳公司 拜尔公司
+兵荒马乱 兵慌马乱 不可胜计 不可胜记 察言观色 撑杆跳高 撑竿跳高 触目惊心 辞不达意 词不达意 大做文章 大作文章 当家做主 当家作主 德克萨斯 得克萨斯 栋梁之材 栋梁之才 多姿多采 多姿多彩
+发奋图强 发愤图强 翻来复去 菲利普斯 菲利浦斯 非营利性 非盈利性 飞砂走石 飞沙走石 丰富多采 丰富多彩 丰姿绰约 风姿绰约 敢做敢为 敢作敢为 哥德巴赫 歌德巴赫 隔三岔五 隔三差五 各行其事
+各行其是 攻城掠地 攻城略地 钩心斗角 勾心斗角 故步自封 故技重演 固步自封 归根结底 鬼计多端 诡计多端 海德拉巴 海得拉巴 含糊其辞 含糊其词 回光反照 回光返照 活血化淤 凯撒大帝 慷慨陈辞
+慷慨陈词 夸大其辞 夸大其词 宽洪大量 宽宏大量 老奸巨猾 老奸巨滑 联成一气 连成一气 两相情愿 令狐冲见 令狐冲剑 令狐冲伸 令狐冲身 留连忘返 流连忘返 毛骨耸然 没精打采 没精打彩 迷天大罪
+弥天大罪 明查暗访 明察暗访 明火执杖 明火执仗 磨拳擦掌 摩拳擦掌 莫明其妙 莫名其妙 欧几里德 欧几里得 劈里啪啦 飘洋过海 漂洋过海 器宇轩昂 气宇轩昂 清静无为 情深意重 情深义重 秋后算帐
+群情激奋 群情激愤 惹事生非 惹是生非 融会贯通 融汇贯通 柔情蜜意 柔情密意 山青水秀 山清水秀 闪烁其辞 闪烁其词 深情厚意 圣玛丽亚 圣玛利亚 塔尔博特 塔尔伯特 桃之夭夭 逃之夭夭 同等学历
+同等学力 唯利是图 唯命是从 唯我独尊 惟利是图 惟命是从 惟我独尊 乌兹别克 乌孜别克 无动于中 无动于衷 无精打采 无精打彩 无坐力炮 无座力炮 稀奇古怪 希伯莱语 希伯来语 希奇古怪 喜玛拉雅
+喜马拉雅 小题大做 小题大作 亚德里亚 亚得里亚 烟波浩渺 一刀两段 一刀两断 一古脑儿 一股脑儿 一面之辞 一面之词 一塌胡涂 一塌糊涂 一相情愿 义无反顾 义无返顾 义正辞严 义正词严 溢美之辞
+溢美之词 印第安那 印第安纳 优哉游哉 悠哉游哉 张皇失措 张惶失措 振振有辞 振振有词 正言厉色 知书达理 知书达礼 指手画脚 指手划脚 众口一辞 众口一词 自行其事 自行其是 自做主张 自作主张
+做贼心虚 作贼心虚 桀傲不驯
+"""
+
+COMMON_BIGRAMS = """\
+啊哟阿哥阿拉阿里阿曼阿姨埃及挨打挨着哎呀哎哟哀求癌症矮胖矮小矮子爱国爱好爱护爱情爱惜爱心氨化氨基安定安顿安放安抚安徽安静安陆安娜安南安内安宁安排安庆安全安危安慰安稳安息安乡安歇安心安阳安葬安置安装俺们
+按摩按时按说按照按住按着暗暗暗藏暗淡暗道暗器暗杀暗示暗算暗想暗中暗自岸边岸上案件案例案情案子肮脏昂贵傲慢奥秘奥妙奥运懊悔澳门澳洲芭蕾八宝八成八大八个八角八戒八届八名八年八七八旗八五八一八月八中八字八卦
+巴东巴结巴黎巴蜀巴西巴掌拔出拔剑拔牙把持把手把守把头把握霸道霸权霸王霸主罢工罢官罢了罢免罢市罢休爸爸白白白布白菜白痴白带白发白宫白骨白果白家白酒白莲白领白马白嫩白旗白人白色白石白天白雪白洋白夜白衣白银
+白云白纸白昼白族柏林柏树百般百倍百度百官百花百货百科百里百年百头百万百姓摆摆摆布摆动摆放摆设摆手摆脱摆在败坏败仗拜访拜见拜年拜谢斑斑斑点斑竹班长班级班子搬出搬家搬迁搬运般的般地般若颁布颁发颁奖颁行板凳
+板块板栗版本版权版图扮演伴侣伴生伴随伴有伴奏半边半步半部半岛半点半分半个半截半斤半径半句半空半路半年半球半日半晌半数半天半头半夜半月办法办公办好办理办事办学帮帮帮忙帮手帮主帮助榜眼榜样膀胱傍晚包袱包裹
+包含包机包金包括包围包银包扎包装剥夺剥落剥蚀剥削薄膜薄弱保安保持保存保定保管保护保荐保健保康保留保罗保密保姆保全保守保卫保险保养保佑保障保证保重保住堡垒饱和饱满饱受宝宝宝贝宝藏宝刀宝贵宝海宝剑宝库宝马
+宝石宝塔宝物宝业宝玉宝座抱负抱歉抱拳抱怨抱住报表报酬报仇报答报道报复报告报国报价报警报刊报考报名报上报社报销报业报应报知报纸暴动暴力暴露暴徒暴行暴雨暴躁豹子爆发爆破爆炸杯子碑亭悲哀悲惨悲愤悲观悲剧悲伤
+悲痛悲壮卑鄙卑职北岸北边北部北侧北城北大北斗北端北段北伐北方北非北风北海北湖北极北郊北京北流北麓北路北美北门北面北欧北平北坡北齐北山北上北宋北纬北魏北向北洋北约北周辈出辈子背包背部背负背后背脊背景背面
+背叛背上背诵背心背影背鳍贝尔贝壳贝勒贝类贝母备案备降备考备受备用备有备战被捕被动被俘被告被叫被评被迫被褥被窝被子奔波奔驰奔赴奔跑奔腾奔走本版本报本部本场本次本地本分本该本国本级本届本科本来本领本轮本能
+本期本钱本区本人本色本身本省本事本市本书本体本土本文本校本性本意本月本章本质本周本着本子崩溃逼近逼迫逼人逼真鼻孔鼻梁鼻涕鼻子比达比尔比方比分比划比较比例比率比拟比起比如比赛比试比武比喻比重比作鄙薄鄙视
+鄙夷笔法笔记笔架笔墨笔试笔者笔直彼此彼得碧绿毕竟毕生毕升毕业毙命庇护闭合闭会闭幕闭目闭塞弊端必备必定必读必将必然必胜必需必须必要辟邪壁画壁上避风避寒避开避免避难避暑避孕陛下鞭炮鞭子边防边际边疆边界边境
+边区边上边沿边缘边远边陲编成编程编导编队编号编辑编剧编码编排编入编写编修编译编印编造编织编制编钟编组编纂贬值扁平便当便捷便利便秘便士便是便衣便宜便于变成变得变动变法变革变更变故变化变换变幻变量变迁变色
+变态变为变相变形变异变质辨别辨认辨证辩护辩解辩论辩证辫子遍布遍地遍及标本标的标记标明标签标识标题标语标志标准表层表达表哥表决表妹表面表明表皮表情表示表述表态表现表演表扬表彰表征别处别的别国别名别扭别人
+别墅别说濒临滨海宾馆宾客兵部兵丁兵法兵火兵力兵马兵器兵权兵刃兵士兵书兵团兵制冰川冰岛冰块冰冷冰凉冰期冰山冰箱冰雪饼干病变病床病毒病房病理病例病情病人病逝病死病因并称并存并非并购并肩并列并且并入并未并行
+并用玻璃菠萝播出播放播种拨打拨开拨款波长波动波段波及波兰波浪波罗波斯波涛波音博得博客博士博雅搏斗伯伯伯父伯爵伯母脖子渤海泊位捕获捕捞捕食捕鱼捕捉补偿补充补给补救补贴补选补血补助不安不败不必不便不变不成
+不吃不错不大不单不但不当不到不得不等不定不断不对不二不乏不法不凡不妨不服不负不该不甘不敢不公不够不顾不管不光不过不好不合不会不及不济不计不见不解不仅不禁不尽不久不觉不均不堪不可不肯不快不愧不理不利不力
+不良不了不料不留不论不满不免不妙不明不难不能不怕不配不平不期不屈不然不让不忍不容不如不善不少不胜不失不时不是不适不顺不俗不算不停不通不同不妥不畏不问不无不惜不下不祥不详不想不消不小不懈不屑不行不幸不休
+不朽不须不许不要不一不宜不已不易不用不由不予不语不远不悦不再不在不曾不正不知不止不致不中不住不准不足布袋布尔布局布朗布雷布满布什布置步兵步步步伐步枪步入步行步骤步子部长部队部分部件部将部类部落部门部署
+部属部委部位部下部族猜测猜想猜疑裁定裁缝裁减裁决裁军裁判裁员材料才华才能财产财富财经财力财年财税财团财物财务财政财主采茶采访采购采花采集采矿采纳采取采用采摘彩电彩虹彩画彩绘彩票彩色彩陶彩印彩云菜汤菜系
+菜肴餐馆餐厅餐饮餐桌参差参观参加参见参军参考参谋参赛参数参与参预参赞参展参战参照参政蚕豆残暴残存残废残疾残酷残留残破残忍残余惭愧惨案惨白惨败惨叫惨烈惨遭惨重灿烂苍白苍老苍天苍蝇舱内仓皇仓库沧海沧桑沧州
+藏身藏书藏有藏族操场操持操练操心操纵操作曹操曹丕曹禺草案草本草场草丛草地草甸草木草坪草原厕所策动策划策略侧耳侧面侧身侧重册封册立测定测绘测量测评测试测算测验层层层次层面插口插入插手插图插嘴茶杯茶馆茶壶
+茶几茶楼茶树茶水茶碗茶叶茶园茶庄查出查处查看查理查明查询查阅查找察觉察看差别差错差点差额差距差遣差役差异诧异拆除拆解拆开拆迁柴禾柴油搀扶缠绵缠绕缠住产出产地产妇产量产卵产能产品产区产权产生产物产业产于
+产值阐明阐释阐述颤动颤抖猖獗场地场合场景场面场上场所尝尝尝试常常常德常规常见常绿常年常青常人常任常设常识常数常委常务常用常有常州常住常驻长安长辈长长长城长成长处长春长大长堤长度长短长发长官长河长虹长假
+长剑长江长久长廊长老长乐长满长矛长年长袍长篇长期长沙长山长衫长生长诗长寿长叹长途长相长阳长于长远长征长子长足偿还肠道肠子厂长厂房厂家厂里厂商敞开畅达畅通畅销唱歌唱名唱片唱戏倡导倡议超标超出超导超额超过
+超级超前超群超声超市超越抄家钞票朝臣朝代朝服朝廷朝霞朝鲜朝阳朝野朝政朝着嘲讽嘲笑潮流潮湿潮水潮汐吵架吵闹炒菜炒锅炒米炒面炒制炒作车长车城车程车队车夫车间车辆车轮车牌车票车上车身车体车厢车站车子撤出撤回
+撤军撤离撤退撤销撤职撤走彻底臣民臣子尘埃尘土晨报沉沉沉船沉淀沉积沉寂沉降沉浸沉井沉静沉没沉默沉思沉稳沉香沉吟沉重沉着陈旧陈列陈设陈述陈毅陈云趁机趁着衬衫衬衣称道称帝称号称呼称颂称王称为称谓称赞称作城邦
+城堡城北城池城东城郊城里城楼城门城南城内城墙城区城市城头城外城西城下城乡城垣城镇城址城中成败成本成长成虫成都成方成分成功成果成化成婚成绩成交成就成立成名成年成排成品成亲成群成人成色成书成熟成天成为成文
+成像成效成型成形成行成因成员呈现乘车乘机乘客乘马乘势乘员乘着乘坐程度程序程志惩办惩处惩罚惩治澄清诚恳诚然诚实诚心诚信诚意承办承包承担承接承诺承认承受承袭承载吃掉吃法吃饭吃喝吃惊吃酒吃苦吃亏吃药持刀持股
+持久持续持有池河池塘迟迟迟到迟钝迟缓迟疑迟早驰名耻辱齿轮尺寸尺度赤壁赤道赤字翅膀斥责充斥充当充电充分充军充满充沛充任充实充裕充足冲出冲刺冲动冲锋冲击冲积冲开冲破冲入冲散冲杀冲天冲突冲洗冲虚冲撞冲着崇拜
+崇高崇敬崇尚崇祯宠爱宠物抽查抽出抽搐抽调抽签抽屉抽象抽烟踌躇稠密筹备筹措筹划筹集筹建仇恨仇人绸缎丑恶丑陋初步初次初冬初级初年初期初三初时初始初一初中初衷出版出兵出差出产出场出动出发出访出国出过出海出汗
+出乎出击出家出嫁出境出具出口出来出栏出力出炉出路出马出卖出没出门出面出名出品出奇出钱出去出缺出任出入出色出山出身出生出师出使出示出世出事出手出售出台出题出头出土出外出息出席出现出新出行出血出言出游出于
+出狱出征出资出自出租厨房厨师除掉除非除了除去除外楚国楚王储备储存储量储蓄矗立触动触发触犯触及触角触怒处长处处处罚处方处分处境处理处死处以处于处在处置揣摩穿戴穿过穿梭穿透穿行穿越传遍传播传承传出传达传导
+传到传递传动传给传呼传记传教传来传令传媒传奇传球传染传人传入传世传授传输传说传送传统传闻传销传言传真船舶船舱船长船队船上船体船头船只喘气喘息串珠窗户窗口窗帘窗前窗外窗子床边床单床上床头闯进闯入闯王创办
+创汇创建创刊创立创伤创设创维创下创新创业创意创造创制创作吹灯垂体垂危垂直春风春季春节春秋春天春义春游醇厚纯白纯粹纯碱纯洁纯净纯熟纯属纯正绰号磁场磁带磁化磁矩磁性雌性雌雄辞去辞职慈悲慈善慈禧瓷器词典词汇
+词条词语此案此处此次此地此法此后此话此间此举此刻此类此前此人此时此事此书此外此物此项此行此言此种刺刀刺激刺客刺杀刺伤刺史刺绣赐予次年次日次生次数次序次要次之次子聪明匆匆匆忙从不从此从而从今从军从来从没
+从前从容从事从属从头从未从小从严从业从政从中丛林丛生丛书丛中凑合凑近凑巧粗暴粗糙粗大粗细粗壮簇拥促成促进促使促销摧残摧毁催促催化脆弱村长村里村落村民村庄村子存储存放存款存亡存心存有存在磋商措施挫败挫折
+错觉错落错误搭建搭配搭载达标达成达到达赖达摩达西答案答道答复答话答题答问答应打败打扮打成打出打倒打动打断打发打法打分打工打鼓打击打架打井打开打捞打量打猎打乱打破打扰打人打入打扫打伤打死打算打探打听打通
+打下打响打印打赢打造打仗打中打着大坝大败大半大便大兵大病大伯大步大部大潮大臣大城大成大乘大厨大船大大大胆大刀大岛大道大德大堤大抵大地大帝大典大殿大豆大都大堆大队大多大发大法大方大风大夫大幅大概大纲大哥
+大功大公大官大观大国大海大喊大汉大好大河大红大湖大户大会大伙大火大祸大家大件大将大江大奖大叫大街大捷大姐大局大举大军大哭大块大乐大理大礼大力大连大量大楼大路大陆大乱大妈大麦大门大米大明大名大漠大脑大内
+大娘大牌大盘大炮大批大片大旗大气大桥大清大庆大权大人大赛大嫂大山大声大胜大圣大师大石大使大事大寿大叔大树大帅大顺大肆大堂大唐大体大厅大同大头大腿大湾大碗大王大为大喜大侠大厦大象大小大笑大型大修大选大学
+大雪大洋大爷大冶大业大衣大意大营大于大雨大院大约大增大寨大战大振大致大中大众大洲大专大字大宗大作大阪大鲵呆子傣族戴尔带兵带到带电带动带给带回带宽带来带领带上带头带有带状带走殆尽代表代号代价代理代码代数
+代替代为代谢贷款待定待人待遇逮捕怠慢耽搁耽误担保担当担负担架担任担心担忧担子丹麦丹青丹田丹阳单板单薄单兵单纯单词单打单单单刀单调单独单个单果单人单身单体单位单项单向单行单一单于单元胆大胆敢胆量胆怯胆小
+胆子但凡但是但愿淡淡淡化淡水诞辰诞生弹道弹簧弹壳弹射弹头弹匣弹性弹药弹劾蛋白蛋糕蛋壳当兵当场当成当初当代当地当儿当官当即当家当今当局当面当年当前当然当日当时当天当头当晚当下当先当选当阳当夜当真当中当众
+当着当做当作挡住党风党籍党内党派党人党委党员党章党政党组荡漾档案档次刀法刀工刀剑刀枪刀子捣毁捣乱倒闭倒地倒好倒霉倒塌倒腾倒退倒下倒像倒转岛国岛内岛上岛屿岛主导出导弹导电导管导航导师导体导线导向导演导引
+导游导致到处到达到底到来到期到手到位稻谷稻米稻田悼念道场道长道德道姑道光道家道教道具道理道路道歉道人道士道特道谢道义盗版盗墓盗窃盗贼德安德国德化德军德里德行德语德育得逞得出得当得到得分得来得力得名得胜
+得失得手得体得以得意得知得罪的话的确灯光灯火灯笼登场登基登极登记登录登陆登山登上登时登台等待等到等等等候等级等价等于凳子邓肯堤垸低潮低沉低调低估低级低价低空低廉低落低声低头低洼低微低温低下低压低于滴定
+敌对敌方敌国敌后敌机敌军敌人敌手敌我敌意抵触抵达抵挡抵抗抵押抵御抵制底部底层底面底盘底下底线底座地板地被地表地步地层地产地处地带地道地底地点地段地方地宫地基地壳地雷地理地里地貌地面地名地盘地球地区地上
+地势地坛地毯地铁地图地委地位地下地形地域地狱地震地址地质地主地租第八第二第九第六第七第三第十第四第五第一帝国帝王帝位帝制弟弟弟兄弟子递给递减递交递增缔结缔造颠倒颠覆颠簸点滴点点点儿点火点击点亮点评点燃
+点头点心点穴点中点缀点着点子典范典籍典礼典型典雅典章电报电场电厂电池电磁电灯电动电工电荷电话电机电极电解电缆电离电力电流电路电脑电能电器电气电视电台电梯电网电信电讯电压电影电源电站电子电阻店里店铺店主
+惦记奠定淀粉殿内殿试殿堂殿下雕刻雕栏雕塑雕像掉头吊舱吊桥钓鱼调查调动调度调和调集调剂调节调解调控调来调配调皮调遣调味调蓄调研调用调整调制跌倒跌落爹爹爹娘叠加丁卯盯住叮嘱钉子顶部顶点顶端顶多顶峰顶级顶上
+顶住鼎立鼎盛定点定都定额定价定居定理定量定律定论定名定期定然定时定为定位定下定向定型定性定义定于定制订单订购订货订立丢掉丢失丢下东岸东北东边东部东侧东城东道东方东非东风东宫东海东汉东湖东家东晋东京东经
+东路东门东盟东面东南东欧东坡东升东吴东西东亚东岳东征东至东州东莞冬瓜冬季冬天冬至董家董事懂得懂事动词动弹动荡动工动画动机动静动力动量动乱动脉动能动人动身动手动态动武动物动向动摇动用动员动作动辄侗族冻结
+冻土洞开洞口洞窟洞庭洞穴抖动斗拱斗争斗志陡壁陡峭陡然豆腐豆类逗留都城都督都市都统督查督察督促毒辣毒品毒气毒蛇毒手毒素毒物毒性毒药独裁独到独家独具独立独特独有独自读书读完读物读者堵截堵塞堵住赌博赌场赌气
+杜甫杜鹃杜绝杜仲肚里肚皮肚子度过度假度量渡过渡河渡江渡口端的端门端倪端详端正端庄端坐短促短刀短短短剑短命短期短缺短线短小短信短暂锻炼断层断代断定断绝断裂断然断言堆积兑换兑现队长队里队伍队友队员对岸对比
+对策对称对此对答对待对敌对方对付对华对话对抗对口对立对联对了对面对内对手对外对象对应对于对照对阵对峙对准墩台蹲下敦促敦煌顿时顿足哆嗦多半多边多变多长多出多处多次多达多多多方多个多家多久多亏多么多米多名
+多年多期多日多少多数多岁多所多胎多天多条多万多位多项多谢多样多用多于多余多元多月多种多重多子多座夺得夺冠夺回夺目夺取夺去垛口躲避躲过躲开躲闪跺脚舵主堕落峨嵋俄共俄国俄军额头额外恶斗恶毒恶鬼恶化恶劣恶人
+恶心恶性恶意恶贼遏制鄂东鄂南鄂皖鄂西鄂州饿死恩人恩师恩施而后而今而立而论而且而是而言而已儿女儿童儿媳儿子耳边耳朵耳光耳机耳目尔后二百二次二道二分二哥二号二环二级二来二老二龙二楼二路二氯二门二年二品二期
+二七二千二人二十二世二位二爷二元二月二则二战二者二中二柱发表发兵发病发布发财发愁发出发达发电发动发抖发放发疯发给发光发挥发酵发掘发觉发亮发明发难发怒发票发起发热发烧发射发生发誓发送发现发泄发信发行发言
+发扬发音发育发源发展发自发作罚款乏力法案法宝法典法定法度法官法规法国法令法律法门法名法人法师法庭法王法学法语法院法则法制法治法子帆船翻滚翻过翻开翻身翻腾翻修翻译翻阅繁多繁复繁华繁忙繁茂繁荣繁盛繁琐繁衍
+繁殖繁重凡事凡是烦恼烦躁反驳反常反弹反倒反导反帝反动反对反而反复反感反攻反共反击反抗反恐反馈反面反叛反潜反射反省反手反思反响反应反映反贼反正反之返回范畴范围范蠡贩卖犯规犯人犯罪饭菜饭店饭馆饭后饭铺饭碗
+饭桌泛滥芳香方案方便方才方城方程方法方可方略方面方始方式方位方向方形方言方圆方丈方针房产房基房价房间房里房门房舍房屋房县房中房子防备防范防腐防洪防护防火防空防守防水防卫防务防线防汛防御防止防治妨碍仿佛
+仿效仿照仿真仿制访华访谈访问纺纱纺织放出放大放到放电放过放火放进放开放宽放疗放流放慢放牧放屁放弃放入放射放声放手放肆放松放下放心放行放眼放养放映放在放置放逐放纵非常非但非得非典非法非凡非洲飞奔飞船飞刀
+飞过飞机飞架飞快飞来飞马飞去飞身飞升飞速飞往飞舞飞翔飞行飞扬飞跃肥大肥力肥料肥胖肥沃肥皂肺癌肺炎废除废话废弃废水废物废墟沸点沸腾费力费时费用芬兰吩咐氛围分辨分别分布分部分成分出分担分队分封分付分割分隔
+分给分工分管分红分化分会分解分局分开分类分离分立分量分列分裂分流分泌分娩分明分派分配分批分期分歧分区分散分身分神分手分属分数分头分团分外分为分析分享分校分行分院分枝分支分治分钟分子纷纷纷争坟墓焚毁焚烧
+粉红粉末粉碎粉蒸奋斗奋力奋起奋勇奋战份额愤恨愤慨愤怒粪便丰产丰富丰厚丰满丰盛丰收封闭封存封冻封建封爵封口封面封锁蜂蜜峰峰锋利风暴风波风采风度风格风光风化风景风浪风力风流风貌风气风情风沙风尚风声风水风俗
+风速风味风险风向风雪风雨风云风韵风筝疯狂疯子缝隙讽刺奉承奉命奉天奉献奉行奉旨凤凰凤山凤阳佛法佛教佛经佛门佛山佛塔佛像佛祖否定否决否认否则夫妇夫妻夫人敷衍肤色孵化扶持扶贫扶植拂尘辐射幅度符号符合伏兵俘获
+俘虏服从服侍服饰服务服药服役服用服装浮雕浮动浮现浮肿福建福晋福利福临福气福星福银福州抚摸抚慰抚养辅导辅政辅助辅佐俯冲俯身府上腐败腐烂腐蚀腐朽副官副将副职副总覆盖覆灭赋税赋役赋予复辟复查复仇复出复旦复发
+复合复活复明复试复苏复习复线复兴复原复杂复制付出付给付款父母父女父亲父子腹部腹地腹面腹痛腹泻腹中负担负荷负面负伤负有负责负债负重富贵富含富豪富户富集富农富强富饶富人富水富翁富有富于富裕附带附和附加附件
+附近附属附有附中附着妇科妇联妇女妇人妇孺该车该处该当该党该国该机该科该是该市该书该项该校该行该院改编改变改称改成改动改革改观改建改进改良改名改善改为改写改型改用改由改元改造改正改制改装改组概况概括概览
+概率概论概貌概念概述盖茨盖德盖子干贝干部干脆干旱干活干净干粮干流干吗干面干扰干涉干尸干事干系干线干预干燥干重甘泉甘薯甘肃甘心甘愿甘蔗杆菌杆子柑橘肝炎肝脏赶到赶回赶紧赶快赶来赶路赶忙赶上赶往赶着赶走感到
+感动感激感觉感慨感冒感情感染感人感受感叹感悟感谢感性感应感知敢于刚才刚刚刚果刚好刚体刚毅钢板钢材钢厂钢刀钢管钢筋钢琴钢铁肛门纲领纲要岗哨岗位港澳港口港湾港元杠杆高昂高层高产高超高潮高程高出高处高大高档
+高等高低高地高度高端高额高法高分高峰高高高官高贵高喊高呼高级高家高价高检高举高亢高考高空高丽高粱高龄高陵高明高能高炮高频高坡高三高僧高山高尚高声高手高耸高速高台高铁高位高温高校高效高薪高新高兴高悬高压
+高雅高一高于高原高涨高职高中搞好搞笑稿子告别告辞告诫告示告诉告知告终告状哥哥歌唱歌词歌剧歌曲歌声歌手歌颂歌舞歌谣戈壁鸽子胳膊疙瘩割断割据割裂革命革新格调格斗格局格式格外蛤蟆阁楼阁下隔壁隔绝隔开隔离个别
+个儿个个个股个人个数个体个头个性个子各别各部各处各地各方各个各国各级各家各界各类各路各门各派各人各色各省各式各市各条各位各县各项各校各型各异各种各州各自各族给出给予根本根基根据根系根源跟进跟前跟上跟随
+跟着跟踪耕地耕田耕耘耕种耕作更迭更改更好更换更加更具更名更深更是更替更为更新工兵工部工场工厂工程工党工地工夫工会工件工匠工具工贸工农工钱工人工商工事工序工业工艺工资工作攻打攻读攻关攻击攻坚攻克攻略攻破
+攻取攻入攻势攻守攻下攻陷攻占功臣功德功夫功过功绩功课功劳功力功率功名功能功效功勋功业恭候恭敬恭喜供电供奉供给供求供水供养供应供职躬身公安公案公办公报公布公差公道公告公公公共公关公馆公国公鸡公家公交公斤
+公爵公开公款公理公里公立公路公民公牛公平公顷公然公人公认公社公使公式公事公私公司公孙公凸公文公务公益公用公有公寓公元公园公约公正公证公职公众公主公子宫城宫灯宫殿宫颈宫里宫门宫内宫女宫墙宫廷宫中宫阙弓箭
+巩固拱手拱形贡茶贡品贡士贡献共存共和共计共建共鸣共生共识共同共享共用共有勾当勾结沟渠沟通构成构件构建构思构图构想构造构筑购房购买购物购置辜负咕咕估计估价估算孤单孤独孤儿孤立姑姑姑妈姑娘姑且姑苏鼓吹鼓动
+鼓乐鼓励鼓声鼓舞鼓掌古巴古称古城古代古典古董古都古怪古迹古籍古今古老古墓古朴古人古山古诗古尸古时古田古玩古文古物古月古镇骨干骨灰骨架骨肉骨髓骨头骨折骨质骨骼谷城谷底谷地谷物谷主谷子股本股东股份股价股票
+股权股市股数股指股子故城故道故宫故居故里故人故事故乡故意故障顾及顾忌顾客顾虑顾问顾源固城固定固然固守固体固有固执雇佣雇用雇员雇主瓜分瓜子寡妇寡头挂钩挂念挂牌乖乖拐杖怪人怪物怪异棺材棺木棺椁关爱关闭关岛
+关东关公关怀关键关节关口关联关门关内关切关山关上关税关头关外关系关心关押关于关羽关照关中关注官兵官场官儿官方官府官话官家官军官吏官僚官人官山官绅官署官司官位官员官职官制冠军冠以观测观察观点观光观看观摩
+观念观赏观望观音观众管道管家管教管理管事管辖管线管制管子馆长罐头罐子惯例惯性灌丛灌溉灌木贯彻贯穿贯通光波光彩光电光度光复光谷光顾光华光滑光辉光景光缆光亮光临光芒光明光年光盘光谱光荣光是光束光速光纤光线
+光绪光学光源光泽光照光子广播广布广场广大广东广度广泛广告广阔广为广西广义广州规程规定规范规格规划规矩规律规模规则规章硅谷归附归公归国归还归结归来归纳归侨归入归属归宿归于归州龟兹闺女轨道轨迹鬼魂鬼神鬼子
+诡计诡异桂花桂林桂鱼柜台柜子跪拜跪倒跪下贵宾贵人贵阳贵重贵州贵族贵妃滚动滚滚棍棒棍子锅巴锅炉国安国宝国宾国产国道国防国共国号国徽国会国籍国际国家国界国境国军国库国立国力国美国门国民国名国内国旗国企国情
+国人国师国事国势国土国外国王国务国营国有国语国贼国债国政果断果品果然果实果蔬果树果园果真果子过长过程过错过度过渡过儿过分过关过河过后过节过境过来过量过滤过敏过目过年过去过人过上过剩过失过时过往过问过夜
+过硬过于过早过招哈哈哈里哈密孩儿孩子海岸海拔海报海豹海边海滨海参海产海岛海盗海底海地海尔海防海港海沟海关海河海军海口海浪海里海面海南海宁海盆海区海瑞海上海水海滩海外海湾海峡海洋海域海运海藻海战害虫害怕
+害人害死害羞骇然邯郸韩国韩信含糊含泪含量含笑含蓄含意含义含有涵盖寒风寒光寒冷寒气寒意寒暄函数喊道喊叫喊声罕见翰林捍卫焊接汗水汉堡汉朝汉城汉川汉代汉奸汉江汉口汉人汉书汉水汉唐汉王汉文汉阳汉英汉语汉中汉子
+汉字汉族杭汉杭州航班航程航道航海航空航母航速航天航线航向航行航运豪华豪杰豪迈豪强毫不毫克毫米毫升毫无好办好比好吃好处好歹好多好感好汉好好好喝好坏好几好久好看好评好奇好人好生好事好手好似好听好像好象好些
+好友好转耗费耗尽耗资耗子号称号角号令号码号召浩劫喝采喝彩喝茶喝道喝酒喝水喝问喝醉荷花荷兰荷马荷叶菏泽核查核弹核电核能核实核试核算核桃核心核准和丰和解和平和尚和谈和田和县和谐和约何必何不何尝何处何等何方
+何故何苦何况何人何如何时何事何以何用何在何者何种合并合唱合称合成合法合肥合格合乎合伙合计合金合理合力合十合适合同合兴合一合营合影合葬合资合作盒子河岸河北河边河床河道河东河段河沟河谷河湖河间河口河里河流
+河南河内河畔河势河水河滩河套河头河湾河网河西河蟹河鱼河源河子赫然褐色鹤峰嘿嘿黑暗黑白黑点黑洞黑豆黑海黑客黑人黑色黑陶黑夜黑衣黑影黑鱼痕迹很大很多很快很少很小很早狠毒狠狠狠心哼哼亨利亨特横穿横幅横沟横贯
+横跨横扫横向横行横亘衡量衡山恒定恒河恒山恒星轰动轰击轰然轰炸烘烤洪湖洪涝洪亮洪流洪山洪水洪武宏达宏大宏观宏伟弘扬弘治红安红绸红光红海红花红火红军红利红莲红楼红旗红墙红色红烧红薯红糖红土红外红眼红晕红肿
+喉咙喉头猴儿猴头猴王猴子吼声厚度厚重候补后背后备后边后部后场后代后方后宫后果后河后湖后悔后金后劲后来后门后面后期后勤后人后任后山后生后世后市后台后堂后唐后天后头后退后魏后卫后续后裔后院后者后主后妃呼喊
+呼喝呼呼呼唤呼叫呼救呼声呼吸呼啸呼延呼应呼吁忽地忽而忽略忽然忽视忽悠葫芦胡风胡佳胡椒胡乱胡闹胡人胡适胡说胡同胡涂胡须胡子蝴蝶狐狸糊涂湖北湖边湖泊湖广湖面湖南湖畔湖区湖水湖西湖中湖州弧形虎口虎门虎山护法
+护理护士护送护卫护照互补互不互动互利互通互为互相互助户部户籍户口户外花白花瓣花草花灯花朵花儿花费花粉花菇花卉花木花鸟花钱花色花山花生花坛花厅花纹花样花园华北华表华东华丽华美华南华侨华人华容华瑞华沙华山
+华为华夏华中滑稽滑雪画家画廊画面画派画像划出划定划分划归划一化成化肥化工化解化军化疗化身化石化为化纤化学化验化妆话费话剧话题话筒话音话语槐树怀抱怀里怀念怀疑怀有怀孕怀中怀着淮河淮南坏人坏事坏死欢呼欢快
+欢乐欢庆欢喜欢迎环保环岛环顾环节环境环流环球环绕环形还给还好还击还是还要还有还原缓步缓存缓和缓缓缓解缓慢换成换届换来换取换上换装患病患难患有患者唤起唤醒宦官幻觉幻想荒地荒凉荒谬荒漠荒山荒唐荒芜荒原慌乱
+慌忙慌张黄安黄道黄帝黄豆黄冈黄瓜黄海黄河黄花黄昏黄家黄金黄连黄陵黄龙黄牛黄牌黄色黄沙黄山黄石黄土黄原黄纸黄州黄陂黄骅黄鳝皇朝皇城皇帝皇岗皇宫皇后皇家皇陵皇马皇权皇上皇室皇位皇爷皇子皇族惶恐晃动恍然恍惚
+谎言灰尘灰色灰陶挥动挥发挥手挥舞辉煌辉映徽州恢复回报回避回答回到回复回顾回归回锅回国回过回合回击回家回扣回来回廊回落回去回身回声回升回事回收回首回头回乡回想回旋回忆回应回游回转回族回鹘毁掉毁坏毁灭晦气
+贿赂会餐会场会长会儿会馆会合会后会计会见会面会上会审会师会试会谈会同会晤会意会议会员会战会址汇报汇编汇成汇兑汇合汇集汇聚汇率汇票汇入绘画绘制昏暗昏迷婚后婚礼婚事婚姻婚育浑厚浑身混蛋混合混乱混入混淆混杂
+混战混沌活动活儿活佛活活活力活泼活人活塞活性活跃活捉活着伙伴伙计火把火爆火柴火车火堆火光火锅火候火花火箭火炬火控火力火龙火炮火器火枪火热火山火烧火速火星火焰火药火灾获得获奖获利获取获胜获悉获准或是或许
+或者霍地货币货物货运祸害击败击毙击沉击溃击落击退击中基本基部基层基础基地基督基辅基金基数基团基岩基因基于基准基座机场机车机床机电机动机构机关机会机理机灵机密机能机票机器机枪机上机身机体机械机型机翼机遇
+机缘机载机制机智机主机组畸形积分积极积聚积累积水积温积蓄积雪肌肤肌肉饥饿饥民迹象激昂激荡激动激发激光激化激活激进激励激烈激流激怒激起激情激素激战鸡蛋鸡汤绩效吉利吉米吉祥吉象极大极地极点极度极端极富极好
+极力极了极目极其极少极为极限极小极致棘手集成集合集会集结集群集散集市集体集团集训集镇集中集资及其及时及早及至急促急救急剧急流急忙急切急速急性急需急于急躁疾病疾驰疾患疾苦汲取即便即将即可即刻即令即日即时
+即使即位嫉妒级别级差级数挤出挤满挤压几百几杯几遍几步几层几处几次几代几道几点几分几个几根几何几乎几家几件几经几句几口几块几率几名几年几千几日几声几十几时几岁几天几条几万几位几下几项几眼几张几招几只几种
+脊背脊髓己方技法技改技工技能技巧技术技艺季度季风季节季梁祭司祭天祭祖祭祀剂量济南寄生寄托寄养寄主寂静寂寞计策计划计较计量计算计委计议记得记号记录记述记忆记载记者记住既定既然既有忌惮忌讳妓女妓院继承继而
+继任继位继续纪录纪律纪年纪念纪事纪委纪要嘉宾嘉靖嘉庆嘉兴夹攻夹击夹杂佳肴家产家长家当家电家丁家伙家家家教家境家具家里家门家庙家禽家人家属家庭家务家乡家畜家业家园家中家主家族加班加倍加大加工加固加害加紧
+加剧加快加盟加纳加蓬加强加热加入加上加深加速加息加薪加以加油加之加重加州加筑加装甲板甲基甲级甲醚甲醛甲烷甲鱼假定假话假冒假期假日假如假若假设假使假说假装价格价钱价位价值架构架起架桥架上架设架子驾车驾驶
+驾驭歼敌歼灭监测监察监督监管监护监禁监控监利监事监视监狱坚持坚定坚固坚决坚强坚韧坚实坚守坚信坚硬尖刀尖端尖椒尖叫尖锐间谍间断间隔间接间隙煎熬兼备兼并兼顾兼任兼容兼用兼有兼职肩膀肩负肩上肩头艰巨艰苦艰难
+艰辛奸臣奸细奸淫奸贼检测检查检察检举检索检讨检验检疫检阅碱性简便简称简单简短简化简洁简介简历简陋简略简明简史简易简直俭朴剪刀减产减肥减免减轻减去减弱减少减退减小鉴别鉴定鉴于践踏贱人见长见到见得见方见见
+见解见面见识见闻见于见证键盘健康健美健全健身健壮舰船舰队舰炮舰艇舰载剑法剑桥剑术渐渐渐近建安建材建成建都建工建国建华建交建康建立建平建起建桥建设建树建行建议建有建于建造建制建筑僵持僵化僵局僵尸僵硬将近
+将军将来将领将令将士将要江北江边江城江道江底江东江段江海江汉江河江湖江淮江陵江流江面江南江青江山江水江苏江西江夏江阴江浙江中江猪江豚疆域奖惩奖金奖励奖项奖章讲话讲解讲究讲课讲求讲授讲述讲习讲学讲演讲义
+讲座酱油降到降低降价降临降落降水降温降雨焦点焦耳焦黄焦急焦虑焦躁胶体交叉交出交错交代交待交锋交付交给交互交还交换交汇交货交际交接交界交警交流交纳交配交情交涉交手交谈交替交通交往交易交战交织郊区郊外浇注
+骄傲搅拌侥幸脚本脚步脚跟脚踏脚下狡猾角度角落角色角质角逐饺子缴获缴纳剿灭教材教导教法教官教皇教会教诲教练教派教师教士教室教授教书教堂教头教徒教委教务教学教训教养教义教育教员教众教主轿车轿子较差较大较量
+较为较之叫喊叫好叫化叫唤叫卖叫嚷叫声叫做叫作揭发揭开揭露揭示揭晓接触接待接到接管接轨接过接见接近接口接连接纳接壤接任接入接上接收接受接替接通接应接种接着街道街坊街上街市街头街巷阶层阶段阶级阶梯截断截止
+截至截住节点节目节能节日节省节约节制节奏杰出杰作捷径捷克睫毛竭力洁白洁净结成结构结果结核结合结婚结交结晶结局结论结盟结实结识结束结算结为结尾解除解答解毒解读解放解救解决解开解剖解散解释解说解题解体解脱
+解围解析姐夫姐姐姐妹戒备戒律戒严戒指界定界岭界面界限界线借贷借给借机借鉴借口借款借钱借以借用借助借着介入介绍介意介于介质届时筋斗筋骨金箔金代金殿金额金刚金冠金光金花金华金黄金利金莲金陵金轮金锣金牌金平
+金钱金融金色金山金蛇金石金属金丝金台金星金牙金银金庸金元金针金子金嫣今儿今后今年今日今天今晚今夜津南津贴紧闭紧急紧紧紧密紧迫紧缺紧缩紧张锦旗锦州仅仅谨慎进兵进步进城进程进出进度进而进发进犯进攻进宫进化
+进京进军进口进来进门进球进取进去进入进山进深进食进士进退进屋进行进修进展进驻晋代晋级晋升禁捕禁地禁毒禁忌禁军禁令禁区禁止近处近代近海近乎近郊近况近来近年近期近前近日近似浸泡浸透尽管尽快尽力尽量尽情尽数
+尽头尽心尽早劲敌劲儿劲风劲力荆东荆府荆江荆门荆沙荆州晶石晶体晶莹京城京都京广京汉京剧京山京师京西京族惊诧惊呆惊动惊骇惊呼惊慌惊惶惊叫惊惧惊恐惊奇惊人惊叹惊喜惊吓惊醒惊讶惊疑惊异精兵精彩精度精光精华精魂
+精简精绝精力精良精美精密精妙精明精品精巧精确精锐精神精通精细精心精选精英精于精湛精致精制精子粳稻经常经典经费经管经过经济经理经历经略经络经脉经贸经商经受经书经文经验经营经由井口警报警备警察警方警告警官
+警戒警觉警示警惕警卫景点景观景区景色景山景物景象景致颈部静电静静静脉静默静态静止境地境界境况境内境外敬酒敬佩敬畏敬仰敬业敬意敬重镜头镜子径流径直径自痉挛竟敢竟陵竟然竟是竞技竞赛竞相竞选竞争净化究竟纠缠
+纠纷纠葛纠正久久久美久远九尺九大九个九间九江九龙九年九品九卿九曲九十九天九五九线九阳九月九章九州酒吧酒保酒杯酒店酒壶酒家酒精酒楼酒泉酒席救出救国救护救济救命救人救援救灾救治救助旧城旧闻旧址旧制舅舅就此
+就读就近就让就任就是就算就要就业就医就诊就职拘留居多居留居民居然居士居于居中居住菊花局部局长局面局势局限咀嚼矩形矩阵举办举报举出举措举动举例举起举人举手举行举止举子沮丧聚合聚会聚集聚焦聚居聚众拒绝据称
+据此据点据说据悉巨大巨额巨幅巨人巨石巨头巨响巨型具备具体具有距离锯齿俱全句子惧怕剧本剧场剧毒剧烈剧目剧情剧社剧痛剧团剧院剧照剧中剧种剧作捐款捐献捐赠眷属卷起卷入卷烟卷宗攫取抉择倔强爵士爵位觉察觉得觉悟
+觉醒觉着决不决策决定决断决非决计决赛决无决心决意决议决战绝不绝顶绝对绝非绝技绝境绝灭绝情绝望绝无绝缘绝招均衡均匀军备军部军长军队军阀军方军费军港军工军官军火军机军纪军舰军警军力军令军马军民军情军区军人
+军容军师军士军事军售军团军委军务军衔军校军械军心军需军训军营军用军政军中军种军装军饷君臣君权君王君主君子竣工郡王郡县郡主骏马喀什咖啡卡车卡拉卡特开办开辟开采开场开车开出开除开创开端开发开放开封开赴开工
+开关开国开花开会开进开局开垦开口开阔开来开朗开罗开门开明开幕开平开启开枪开去开设开时开始开水开通开头开拓开挖开往开胃开心开学开业开元开凿开展开战开支楷书凯旋刊登刊物堪称勘测勘探坎坷看病看成看出看待看到
+看法看过看好看见看看看来看清看守看书看似看望看中看重看准看着看作康德康复康熙慷慨抗病抗敌抗衡抗洪抗击抗拒抗日抗体抗议抗原抗战抗争考查考察考场考点考古考官考核考究考卷考虑考前考取考入考上考生考试考题考研
+考验考证烤鸡烤鱼靠近靠拢靠山靠着苛刻柯达磕头颗粒科比科长科技科教科举科隆科目科普科学科研咳嗽可爱可比可不可怖可恶可否可观可贵可好可见可靠可可可口可怜可能可逆可怕可取可是可望可谓可惜可喜可笑可信可行可言
+可疑可以可用可知渴望克服克拉克里克隆克制刻本刻画刻苦刻意刻有客场客车客店客房客观客户客机客流客气客人客商客体客厅客运客栈课本课程课目课堂课题肯定恳求坑道坑洞吭声空白空地空调空洞空间空降空姐空军空旷空气
+空前空缺空手空投空袭空隙空虚空运空战空中恐怖恐慌恐惧恐龙恐怕孔道孔明孔雀孔子控告控股控诉控制口岸口袋口服口号口径口诀口里口气口腔口头口味口吻口音口语口中口子扣除扣押哭泣哭声窟窿苦苦苦练苦闷苦难苦恼苦涩
+苦头苦笑苦心苦于苦战库存裤子夸大夸奖夸特夸张跨度跨国跨过跨越筷子快步快船快点快活快捷快快快乐快速快要快照宽敞宽大宽带宽度宽广宽阔宽容宽恕宽松款待款项狂奔狂风狂欢狂热狂妄框架矿藏矿产矿床矿工矿井矿区矿山
+矿石矿物矿冶矿业旷野况且亏损盔甲葵花魁梧傀儡溃败溃疡昆虫昆仑昆明捆绑困惑困境困难困扰扩充扩大扩建扩散扩展扩张垃圾拉扯拉动拉古拉开拉拢拉美拉萨喇叭喇嘛蜡烛腊肉腊月辣椒辣味莱茵来到来得来访来华来回来讲来京
+来看来历来临来时来势来说来往来信来源来自赖以蓝色蓝天蓝图栏杆栏目拦截拦住拦阻篮板篮球篮子兰湖兰花兰州懒得滥用狼狈狼群郎君郎中朗诵浪潮浪费浪漫劳动劳工劳累劳力劳务劳役劳作牢房牢固牢记牢牢老爸老板老伴老兵
+老伯老大老道老弟老爹老二老夫老妇老高老哥老公老汉老虎老化老家老将老李老龄老马老母老年老娘老婆老区老人老山老师老实老式老鼠老太老头老外老挝老乡老兄老爷老营老张老者老子老总老衲姥姥勒马乐队乐府乐观乐器乐曲
+乐趣乐团乐舞乐意乐于乐园雷达雷电雷锋雷击雷声雷霆累积累计擂鼓擂台肋骨类别类似类型泪花泪水泪珠棱形冷淡冷汗冷静冷酷冷落冷门冷漠冷气冷却冷水冷笑冷战厘米犁头黎明黎族篱笆离别离婚离开离去离散离职离子理财理睬
+理工理会理解理科理论理念理事理想理性理学理应理由理智李白李家李俊李娜李鹏李珊李子李逵里昂里边里程里海里面里头鲤鱼礼拜礼部礼法礼服礼节礼乐礼貌礼品礼堂礼物礼仪荔枝吏部丽江厉害厉声历程历次历代历法历届历经
+历来历年历任历时历史利害利率利器利刃利润利税利息利亚利益利用利于例如例外例行例子立案立场立法立方立功立国立即立刻立马立时立体立下立宪立项立于立志立足粒子沥青隶属力道力度力量力气力求力图力学力争力主联邦
+联苯联队联合联接联结联军联络联盟联名联赛联手联通联网联系联想联谊联姻莲花莲蓬莲肉莲子连长连带连队连环连接连结连累连连连忙连年连任连日连声连锁连同连续连夜廉价廉洁廉政怜悯怜惜帘子脸蛋脸红脸颊脸孔脸面脸庞
+脸皮脸色脸上链接恋爱恋人炼丹炼油炼制练兵练功练武练习粮草粮食凉拌凉爽凉州梁山良好良机良久良心良性良药良知两岸两把两半两倍两边两步两部两侧两层两场两处两次两代两道两地两点两端两段两队两对两方两份两幅两个
+两根两广两河两湖两会两极两级两家两架两间两件两届两晋两句两颗两口两块两类两列两路两枚两门两米两面两名两年两派两旁两匹两片两栖两千两日两声两手两艘两天两条两头两碗两万两位两下两项两行两性两眼两样两翼两用
+两院两张两者两支两只两种两周两组两座量子亮点亮度亮丽亮相谅解聊聊聊天疗法疗效辽东辽河辽阔辽宁辽西了得了结了解料到料理料想列表列车列出列传列举列宁列强列入列为列位列席裂变裂缝裂开裂纹烈火烈士劣势猎人猎头
+猎物林彪林冲林肯林立林木林区林业林中林子磷肥磷矿磷酸临安临床临界临近临时临死临头临终临走邻邦邻国邻近邻居鳞片淋巴凛然玲珑菱湖菱花菱形零点零件零食零售零星铃声羚羊凌晨凌空凌厉凌辱灵感灵魂灵活灵敏灵柩陵墓
+陵区岭南岭子领导领到领地领队领海领会领教领略领取领事领头领土领悟领先领衔领袖领域领主另外另行令狐令人令尊琉璃榴弹硫酸留出留给留恋留情留神留守留下留心留学留意留有留在留住刘邦刘备刘家刘翔流产流畅流程流出
+流传流动流芳流放流经流浪流泪流利流量流露流落流氓流派流入流失流水流速流淌流体流通流亡流下流向流星流行流血流言流域流贼柳树六部六朝六大六个六合六级六角六届六路六年六期六十六位六月六中龙船龙大龙宫龙骨龙井
+龙门龙袍龙泉龙山龙亭龙头龙王龙舟笼络笼罩隆冬隆隆隆起隆庆隆中隆重垄断楼顶楼房楼阁楼上楼梯楼下漏洞芦花芦苇卢布庐江庐山炉火炉子掳掠卤鸡鲁莽鲁迅露出露面露天路边路程路灯路过路径路口路面路旁路桥路上路途路线
+路子鹿角录取录像录音录用陆地陆军陆路陆上陆续陆游陆羽驴子吕布旅店旅馆旅客旅途旅行旅游履带履行屡次屡屡律师率领率先率众绿豆绿化绿林绿色绿洲绿萼卵巢乱打乱砍乱石掠夺掠过略带略微略有轮船轮番轮换轮回轮廓轮流
+轮式轮胎轮子伦比伦敦伦理沦为沦陷论点论断论述论坛论题论文论语论战论证论著萝卜螺旋罗汉罗家罗马罗刹罗斯罗田逻辑锣鼓骡马骡子裸露裸体落差落成落到落得落地落后落户落入落实落下落叶洛桑洛阳骆驼妈妈麻痹麻布麻城
+麻袋麻烦麻将麻木麻雀麻糖麻醉玛瑙码头蚂蚁马鞍马背马鞭马场马车马刺马刀马道马丁马夫马克马口马来马里马力马良马路马匹马赛马上马蹄马头骂人埋藏埋伏埋头埋怨埋葬买办买方买房买来买卖买入买下买者麦加麦子卖出卖掉
+卖国迈出迈进脉搏脉冲馒头满地满腹满怀满口满脸满面满腔满清满身满头满文满心满意满载满洲满足满族蔓延曼谷曼联慢慢慢性漫步漫长漫画漫天漫游茫茫茫然盲目盲人忙活忙碌忙于茅屋毛笔毛病毛发毛尖毛巾毛皮矛盾矛头茂密
+冒充冒犯冒险冒烟帽子贸然贸易玫瑰梅花梅林梅子煤矿煤气煤炭煤田没底没法没事没收没用没有眉毛眉目眉头媒介媒体每次每当每逢每个每股每家每块每每每秒每年每人每日每天每月每周美德美的美方美分美观美国美好美景美军
+美丽美貌美妙美女美容美食美术美味美学美誉美元美洲妹儿妹妹妹子媚外门板门边门窗门洞门阀门户门槛门将门口门类门楼门路门内门派门票门前门人门上门生门外门下门诊门扉萌发萌芽蒙古盟国盟军盟友盟主猛地猛攻猛虎猛烈
+猛扑猛禽猛然梦鸽梦幻梦见梦境梦想孟子迷宫迷糊迷惑迷恋迷茫迷人迷失迷信弥补弥漫米饭米粉米格米兰米业米芾秘诀秘鲁秘密秘书觅食蜜蜂蜜枣密布密度密封密集密林密码密谋密切密室棉袄棉布棉纺棉花棉纱棉衣绵延绵羊免除
+免得免费免去免疫免于勉强缅甸缅怀面板面包面部面对面粉面积面颊面具面孔面临面貌面目面皮面前面容面色面上面试面条面团面向面子苗族描绘描述描写瞄准藐视秒钟渺茫庙街庙里庙宇妙计蔑视灭火灭绝灭亡民办民兵民法民歌
+民工民国民航民间民建民警民盟民权民生民事民俗民心民意民营民用民政民众民主民族敏感敏捷敏锐闽西明白明朝明代明儿明教明朗明亮明明明末明年明器明清明确明日明史明天明文明显明星明月明知明智明珠鸣叫铭文名茶名称
+名城名词名次名单名额名贵名家名将名叫名利名列名录名目名牌名片名气名人名山名声名胜名师名士名堂名头名望名为名位名校名言名义名优名誉名曰名著名字命令命脉命名命题命运命中谬误摸摸摸索蘑菇模范模仿模糊模块模拟
+模式模特模型模样磨损磨制摩擦摩尔魔鬼魔教魔头魔王末端末年末期莫不莫大莫非莫名墨镜墨鱼默默默契默然默认漠北陌生谋反谋划谋略谋求谋杀谋生谋士某个某某某人某些某种拇指牡丹母本母女母亲母体母子墓碑墓道墓地墓室
+墓穴墓葬暮色幕府幕后幕僚募集募捐募款慕名慕容木板木棒木材木雕木工木棍木盒木匠木牌木头木星木业木制木质木柱目标目的目睹目光目录目前牧草牧场牧民牧区牧师牧业拿出拿到拿来拿下哪儿哪个哪里哪怕哪些呐喊那般那边
+那场那次那大那段那儿那个那根那里那马那么那末那年那日那时那双那天那条那位那些那样那种纳粹纳闷纳米纳入纳什纳税乃是乃至奶粉奶奶耐心奈何南岸南北南边南部南侧南昌南朝南端南方南非南港南海南航南湖南极南疆南郊
+南京南口南麓南路南美南门南面南宁南平南山南宋南唐南通南纬南下南县南襄南湘南亚南洋南阳南移南岳南漳男儿男孩男女男人男生男士男性男友男子难保难当难道难得难点难度难怪难关难过难堪难看难免难民难忍难受难逃难题
+难忘难以难于脑袋脑海脑筋脑门脑子恼火恼怒闹事内部内参内侧内城内存内地内阁内功内涵内河内科内里内力内陆内乱内膜内容内设内侍内外内务内心内在内脏内战内政内讧能否能够能级能力能量能耐能源泥沙泥土泥鳅尼姑拟定
+你好你家你老你们逆转拈阄年产年长年初年代年底年度年份年后年级年纪年间年均年老年龄年满年末年内年前年轻年头年限年薪年幼碾子念道念书念头念珠娘家娘娘娘子酿成酿酒鸟儿鸟类鸟瞰尿道凝固凝结凝聚凝神凝视凝望凝重
+宁波宁静宁可宁夏宁远宁愿牛车牛顿牛筋牛马牛奶牛皮牛肉牛市扭曲扭头扭转纽带纽约浓度浓厚浓烈浓缩浓烟浓郁浓重农场农村农夫农耕农户农家农具农历农民农牧农奴农田农行农药农业农用弄清弄堂奴才奴家奴隶奴仆奴役奴婢
+努力怒吼怒火怒气女兵女队女儿女方女工女孩女郎女排女人女神女生女尸女士女童女王女性女婿女友女真女子暖和暖流虐待挪威糯米诺言欧拉欧盟欧亚欧阳欧元欧洲呕吐偶尔偶然偶像趴在爬行怕人拍打拍马拍卖拍拍拍摄拍手拍照
+排长排成排斥排出排除排队排放排灌排挤排练排列排名排球排水排外排泄排行排序牌坊牌楼牌位牌照牌子徘徊派别派兵派出派遣派系攀升盘算盘旋盘中盘子盼望判处判定判断判官判决判刑叛变叛军叛乱叛逆叛徒庞大旁边旁观旁人
+旁听胖子抛弃咆哮炮兵炮弹炮轰炮火炮击炮声炮塔炮台袍子跑道泡沫胚胎胚珠培训培养培育培植赔偿赔款陪伴陪同配备配殿配方配合配件配偶配色配套配位配有配置配制配子佩戴佩服喷出喷发喷气喷射盆地抨击烹调烹制烹饪彭真
+蓬勃棚里膨胀朋友碰到碰见碰上碰撞霹雳批次批发批复批量批判批评批示批准披挂披甲披露披上琵琶毗邻啤酒脾气脾胃疲惫疲倦疲劳疲软皮层皮肤皮革皮毛皮球皮肉皮下皮鞋皮质皮子匹配屁股譬如篇幅篇章偏差偏见偏将偏离偏南
+偏僻偏偏偏向偏要偏重片刻片面片名骗人骗子漂浮漂亮漂流票价票据撇开拼搏拼命拼死拼音频道频繁频率频频贫道贫乏贫富贫寒贫苦贫困贫民贫穷贫僧贫血品尝品德品格品级品牌品味品位品行品质品种聘请聘为聘用苹果平安平板
+平常平淡平等平底平地平定平儿平凡平反平方平和平衡平缓平津平静平均平米平面平民平平平壤平日平生平时平素平台平坦平稳平息平行平遥平庸平原平整凭借凭证凭着瓶颈瓶子评定评估评级评价评论评判评审评说评为评选评议
+屏风屏幕屏障坡度颇具婆娘婆婆婆子破败破产破坏破解破旧破烂破裂破门破灭破碎破损破译破绽迫害迫切迫使迫于剖析扑灭扑通铺设铺筑仆人葡萄菩萨蒲圻朴实朴素普遍普查普法普及普通浦东曝光瀑布期待期货期间期刊期满期盼
+期望期限欺负欺凌欺骗欺侮欺诈栖息妻子七八七个七届七年七日七十七天七月七座凄凉凄然漆黑漆器漆树其次其二其父其后其间其内其时其实其他其它其一其余其中其子棋盘棋手棋子奇才奇怪奇观奇迹奇妙奇特奇异奇珍歧视崎岖
+齐国齐名齐全齐声旗杆旗号旗舰旗袍旗下旗帜旗子祈祷祈求骑兵骑马骑士起兵起步起草起初起床起到起点起飞起伏起火起降起居起来起码起身起始起诉起先起义起因起用起源岂非岂可岂能乞丐企盼企图企业启程启德启动启发启蒙
+启示启用启奏契丹契机契约器材器官器件器具器皿器物器械气氛气愤气概气管气候气节气孔气力气流气囊气恼气派气魄气球气势气死气体气味气温气息气象气旋气血气压气质迄今弃权汽车汽配汽水汽油恰当恰好恰恰牵扯牵动牵挂
+牵连牵涉牵头牵引牵制铅笔千步千尺千古千户千斤千金千卡千克千里千米千亩千年千秋千瓦千万千元千张迁都迁居迁入迁移迁徙签订签名签署签约签证签字谦虚谦逊乾坤乾隆钱币钱财前辈前边前部前场前朝前程前导前殿前端前方
+前锋前后前进前景前来前列前门前面前年前期前秦前去前人前任前日前哨前身前台前提前天前头前途前往前夕前线前行前胸前沿前者潜伏潜江潜力潜能潜入潜水潜艇潜心潜在遣使浅层浅海浅色浅水谴责欠缺欠身枪弹枪法枪口枪炮
+枪杀枪声枪响枪支羌族墙壁墙角墙上强暴强大强盗强敌强调强度强国强悍强化强加强奸强劲强力强烈强迫强忍强弱强盛强势强行强硬强占强者强制强壮抢夺抢劫抢救抢先抢险抢占敲门悄悄悄然悄声桥墩桥梁桥面桥身桥下瞧见瞧瞧
+乔红乔木乔治侨眷巧合巧妙巧遇撬棍峭壁窍门切除切断切割切合切块切实茄汁且慢且说钦差钦定钦佩侵犯侵害侵华侵略侵权侵入侵蚀侵袭侵占亲爱亲笔亲兵亲家亲近亲口亲临亲率亲密亲戚亲切亲情亲热亲人亲身亲生亲事亲手亲属
+亲王亲信亲眼亲友亲征亲政亲自秦安秦国秦汉秦岭秦腔秦王秦桧琴台勤奋勤劳勤务擒拿禽兽寝宫寝室青藏青草青城青春青葱青岛青海青木青年青青青色青石青铜青蛙青衣青州青竹青睐轻薄轻度轻纺轻工轻蔑轻轻轻声轻视轻松轻微
+轻型轻易轻盈轻重轻装氢气倾覆倾诉倾听倾向倾斜倾心清白清兵清查清朝清澈清晨清初清除清楚清脆清代清单清风清宫清华清江清洁清静清净清军清理清凉清亮清明清末清热清人清史清水清算清廷清晰清洗清香清新清醒清秀清早
+清蒸清炖晴天晴雯情报情操情调情感情怀情节情结情景情况情趣情人情势情形情绪情意情谊情由情欲情愿情状顷刻请安请假请教请客请来请求请示请问请愿庆典庆贺庆幸庆祝琼斯穷人秋季秋审秋水秋天丘陵球场球队球门球迷球星
+球形球员求得求和求见求解求救求情求学求知求职求助囚犯囚禁酋长趋势趋向趋于区别区长区分区划区内区区区委区域区政曲调曲酒曲面曲目曲线曲艺曲折曲子躯干躯体屈服屈辱屈原驱除驱动驱赶驱使驱逐渠道取材取出取代取得
+取缔取经取决取名取暖取舍取胜取食取向取消取笑趣味去除去处去掉去过去路去年去取去世去向圈套圈子权贵权衡权利权力权势权威权限权益泉水泉州全邦全部全场全长全称全城全程全村全党全岛全都全队全国全会全集全家全歼
+全景全境全局全军全力全面全民全能全年全盘全球全区全权全然全身全省全市全书全体全天全文全县全线全校全新全真全州痊愈拳法拳击拳脚拳头券门券商劝告劝说劝阻缺点缺乏缺口缺少缺失缺席缺陷缺氧却是却说确保确定确立
+确切确认确实确信确有确诊裙子群臣群岛群落群山群体群雄群众然而然后燃料燃起燃气燃烧燃油冉冉染发染料染色嚷嚷让步让给扰乱绕城绕道绕过热爱热潮热忱热带热点热泪热量热烈热门热闹热能热气热情热水热线热心热血热衷
+仁慈仁兄仁义人才人参人称人次人丛人大人格人工人迹人际人家人间人均人口人类人力人流人马人们人民人命人品人气人情人权人群人人人身人声人生人士人世人事人氏人手人数人体人头人为人文人物人心人形人行人性人选人学
+人影人员人造人质人种忍耐忍受忍心韧性任何任教任免任命任凭任期任务任性任意任用任由任职认出认错认得认定认购认可认清认识认输认同认为认真认证认知妊娠扔掉扔下仍旧仍然日报日本日常日程日出日方日光日后日记日渐
+日军日寇日历日落日期日前日趋日日日夜日益日用日语日元日月日照日志日子戎装荣获荣禄荣耀荣誉融合融化融洽融入融资熔点熔岩熔铸溶剂溶解溶液溶于容积容量容貌容纳容器容忍容许容易绒毛柔和柔情柔软肉鸡肉类肉丝肉体
+肉眼肉质蠕动儒家儒生儒学如此如果如何如今如来如林如期如其如若如实如是如同如下如意如愿乳房乳头乳腺乳汁入川入党入阁入关入海入境入口入库入门入侵入市入手入睡入土入伍入选入学入狱入主软件软弱瑞典瑞士锐减锐利
+锐气若非若干弱点弱势弱者撒谎撒手赛场赛后赛季赛前赛事三百三杯三步三藏三层三叉三尺三次三代三道三等三点三端三分三个三国三合三户三级三家三甲三间三件三角三节三局三军三类三路三枚三门三面三名三年三品三千三日
+三声三十三世三岁三天三条三通三万三王三维三位三峡三下三鲜三项三星三元三院三月三丈三招三者三只三中三种三重三子三座伞兵散布散步散发散货散开散乱散落散射散水散文嗓门嗓音嗓子丧命丧生丧失丧事骚动骚乱骚扰扫除
+扫荡扫地扫雷扫描扫帚嫂嫂嫂子色彩色酚色情色素色泽森工森林森严僧道僧侣僧人砂土砂岩杀出杀敌杀掉杀毒杀害杀戮杀气杀人杀入杀伤杀手杀死杀头沙包沙俄沙发沙河沙湖沙皇沙咀沙口沙漠沙丘沙僧沙市沙滩沙特沙土沙湾沙鱼
+沙洲沙子傻蛋傻瓜傻子筛选珊瑚杉木山川山道山地山顶山东山洞山峰山沟山谷山河山后山间山口山里山林山岭山麓山路山脉山门山南山坡山前山墙山丘山区山上山石山势山水山体山头山西山下山羊山野山影山寨山珍山镇山中山庄
+删除煽动闪避闪电闪动闪光闪过闪亮闪闪闪身闪烁陕北陕甘陕西擅长擅自膳食善恶善良善人善行善意善于汕头扇形扇子伤感伤害伤寒伤痕伤口伤人伤势伤痛伤亡伤心伤员商标商场商朝商城商船商代商店商定商会商家商贾商量商旅
+商贸商品商丘商人商讨商务商业商议商用商周赏赐赏识赏心上岸上班上报上边上部上层上场上朝上车上乘上船上床上次上当上帝上吊上调上方上房上访上风上岗上古上海上级上将上交上街上课上空上来上篮上楼上路上马上门上面
+上年上爬上皮上品上铺上前上去上任上山上身上升上市上书上述上司上台上天上万上网上午上下上限上线上校上行上学上旬上演上扬上衣上映上游上院上月上涨上阵上周尚可尚且尚书尚未尚无尚有稍稍稍微烧饼烧成烧毁烧烤烧杀
+烧死烧香烧制少儿少妇少见少将少量少林少年少女少数少爷少有少于哨兵绍兴奢侈奢华舌头舍得舍命舍弃舍人摄取摄入摄氏摄影摄政射程射电射击射箭射门射手射速射线涉及涉外涉嫌涉足社长社会社交社论社区社团社员社稷设备
+设定设法设计设立设施设想设宴设有设在设置申报申花申请申诉呻吟伸长伸出伸手伸缩伸展身边身材身长身处身穿身法身分身份身高身后身价身旁身披身躯身上身世身手身受身体身亡身为身心身形身影身着身子深层深沉深处深度
+深感深谷深海深厚深化深刻深切深情深入深山深深深受深水深思深陷深信深夜深渊深远深造深知深重深圳深邃绅士神道神父神功神话神经神灵神龙神秘神庙神明神农神奇神气神情神色神圣神态神通神往神位神仙神像神学神医神韵
+神智神州沈思沈阳审查审定审核审计审理审美审判审批审视审问审讯审议婶子甚么甚为甚至肾脏慎重渗出渗入渗透声波声称声道声调声乐声明声名声势声望声息声响声学声音声誉声援生病生产生长生成生出生存生动生父生化生活
+生机生计生来生理生命生母生怕生平生气生前生日生死生态生物生息生效生性生涯生意生于生育生源生殖生猪牲口牲畜升高升华升级升降升空升旗升起升迁升任升腾升温升职升值升至绳索绳子省长省城省得省份省会省籍省级省里
+省内省区省市省外省委省悟省直盛产盛大盛会盛京盛开盛名盛世盛行剩下剩余胜败胜地胜负胜过胜迹胜利胜任胜仗圣地圣火圣经圣母圣人圣上圣水圣贤圣旨师长师大师弟师范师傅师父师哥师妹师门师母师娘师生师师师徒师团师兄
+师爷师资失败失常失传失地失调失衡失利失落失眠失去失声失手失守失望失误失陷失效失学失业失踪狮子施工施加施琅施礼施行施展施政施主湿地湿度湿热湿润诗词诗歌诗集诗经诗句诗篇诗人诗文诗意诗作尸骨尸身尸首尸体十八
+十倍十次十大十道十二十分十个十几十九十里十六十名十年十七十日十三十四十岁十天十万十五十堰十一十余十月十足石安石板石碑石壁石雕石膏石湖石化石灰石匠石阶石刻石窟石块石料石林石龙石门石棉石墨石器石桥石狮石室
+石首石兽石头石英石油石柱石子拾荒时报时常时辰时代时而时分时隔时光时候时会时机时间时节时刻时空时期时人时任时日时尚时时时数时说时速时装时髦什么食品食堂食物食性食盐食用食欲食指实德实地实话实惠实际实践实例
+实力实录实情实权实施实时实事实属实数实体实为实物实务实习实现实效实行实验实业实用实在实则实战实质识别识字史册史方史籍史记史料史前史诗史实史书史学使臣使出使得使馆使唤使节使劲使命使用使者始建始于始终始祖
+式样示范示威示意士兵士官士气士卒士族世代世纪世家世间世界世人世上世事世俗世袭事变事儿事故事关事后事迹事件事例事前事情事实事事事态事物事务事先事项事业事宜誓死誓言逝世势必势力势头是从是非是否适才适当适度
+适合适量适龄适时适宜适应适用适于适中仕途侍从侍候侍郎侍女侍卫释放饰演氏族市场市长市级市郊市里市民市内市区市容市委市县市镇市政室内室外视察视角视觉视力视频视为视线视野试点试飞试管试剂试卷试射试试试探试题
+试图试行试验试用试制收藏收到收费收复收购收回收获收集收敛收留收录收买收盘收起收取收入收拾收缩收下收益收支手臂手表手册手持手段手法手稿手工手机手脚手里手帕手枪手上手势手书手术手套手提手头手腕手下手心手续
+手艺手掌手指手中手足首长首创首次首都首发首辅首府首个首级首届首领首轮首脑首批首饰首位首席首先首相首选首要首页首座守备守城守恒守护守军守卫守御寿命授课授权授予售价受到受罚受过受贿受苦受理受命受热受伤受损
+受体受刑受益受用受众受阻瘦子蔬菜枢纽梳理殊荣殊死抒发抒情输出输电输给输入输送输血叔父叔惠叔叔舒畅舒服舒适舒展疏忽疏散疏松疏通疏远书包书本书城书店书法书房书画书籍书记书架书面书目书上书生书写书信书影书院
+书桌熟练熟人熟悉熟知暑假曙光署名鼠标属实属下属性属于术后术语述说树丛树干树立树林树木树皮树上树叶树枝树脂树种束缚竖立竖起庶民数百数步数次数额数据数理数里数量数码数目数年数千数日数十数万数学数月数丈数招
+数值数字数组恕罪刷刷刷新摔倒摔跤衰变衰竭衰老衰落衰弱衰退衰亡甩开双臂双边双层双打双刀双儿双方双湖双脚双目双桥双亲双手双双双腿双喜双向双星双眼双拥双重爽口爽快谁家谁知水泵水草水产水稻水道水底水电水洞水分
+水果水壶水解水晶水军水库水雷水利水力水量水流水路水陆水面水能水泥水泡水平水上水深水声水生水师水手水体水土水位水温水文水系水下水乡水性水银水域水源水运水质水中水肿水准水族睡觉睡梦睡眠睡着税率税收税务瞬间
+顺便顺从顺利顺势顺手顺序顺应顺治顺着说出说错说道说法说服说好说话说谎说来说明说起说完硕士斯密斯文撕下嘶哑思潮思考思科思量思路思虑思念思索思维思想思绪私家私利私人私事私下私心私信私营私有私自司长司法司机
+司空司令司马司徒丝绸丝毫死活死囚死去死伤死尸死守死亡死刑死者肆意寺里寺庙寺院四壁四尺四处四川四次四大四方四分四个四海四级四季四家四角四库四门四面四名四年四品四圈四散四十四条四维四位四五四下四项四爷四月
+四肢四只四中四种四周四纵伺候似的似地似乎饲料饲养松弛松花松江松开松林松软松散松山松手松树松滋耸立颂扬送达送到送给送回送来送礼送入送往送行送走宋朝宋代宋江搜捕搜查搜狗搜狐搜集搜索搜寻苏北苏打苏丹苏军苏联
+苏木苏宁苏区苏州苏轼俗称俗名素材素来素养素有素质速度速率塑料塑像塑性塑造宿舍宿主诉说诉讼肃立肃穆肃清酸麻酸软酸性算法算计算了算命算盘算是算术算作虽然虽说隋朝隋唐随便随从随后随机随即随军随口随身随时随手
+随同随行随意随之随州随着碎片碎屑岁月遂行隧道孙女孙权孙子损害损耗损坏损伤损失唆使缩短缩回缩减缩小缩写索尼索取索性索引锁定所部所长所得所属所说所为所谓所学所以所用所有所在所知所指所致他家他俩他们他人他杀
+他用它们她家她们踏进踏上踏实胎儿胎盘抬高抬起抬手抬头台北台大台地台独台风台海台基台阶台前台上台湾台下台站泰国泰来泰山泰州太保太公太和太后太湖太极太监太康太空太郎太庙太平太师太史太守太太太尉太小太行太阳
+太医太原太重太子太宗太祖态度态势摊开摊子贪官贪婪贪图贪污瘫痪谭家谈到谈话谈论谈判谈起谈谈坦白坦诚坦克坦率坦然坦言探测探春探花探究探明探亲探索探讨探听探头探望探险叹气叹息炭火塘沽堂上堂堂堂屋唐朝唐代唐僧
+唐诗唐宋糖果糖色倘或倘若倘使掏出滔滔桃花桃园桃源逃避逃出逃离逃命逃难逃跑逃生逃脱逃亡逃往逃走淘汰陶瓷陶器陶醉讨伐讨好讨论讨厌套餐特别特产特长特此特大特地特点特定特级特技特困特区特权特色特赦特使特殊特委
+特务特性特意特异特有特约特征特制特种疼痛梯度梯子提案提拔提包提倡提出提到提督提防提高提供提及提交提炼提名提起提前提请提取提升提示提问提携提醒提议题材题词题目题为题写题型蹄声蹄子啼哭体表体裁体操体长体格
+体会体积体检体力体面体内体能体弱体贴体外体温体系体现体型体形体虚体验体液体育体制体质体重替补替代替换天安天宝天边天才天池天大天地天鹅天府天赋天宫天河天黑天花天皇天监天津天井天空天亮天龙天麻天门天明天命
+天棚天气天堑天桥天然天色天山天上天神天生天使天顺天坛天堂天体天天天王天文天下天仙天线天象天星天性天鹰天宇天真天子天竺添加填报填补填充填写田地田间田径田野田园甜菜甜酒甜蜜挑起挑剔挑衅挑选挑战条件条款条例
+条文条约条子眺望跳板跳槽跳出跳动跳进跳伞跳水跳投跳舞跳跃贴金贴近贴身贴现贴着铁棒铁钉铁锅铁甲铁匠铁矿铁链铁路铁门铁骑铁器铁青铁丝铁掌铁证铁戟帖子厅长厅堂听罢听从听到听懂听候听话听见听觉听力听取听说听听
+听众廷杖停泊停步停产停车停当停顿停放停靠停留停牌停下停战停止停滞亭子庭长庭院挺进通报通常通车通称通城通达通道通风通高通告通过通航通红通话通货通缉通商通史通俗通天通往通向通宵通信通行通讯通用通知通州通衢
+瞳孔同伴同胞同比同步同等同级同居同类同僚同门同盟同名同年同期同情同日同声同时同事同心同行同学同样同一同意同志同治铜镜铜矿铜牌铜器铜钱童话童年童装童子统称统筹统计统考统领统率统帅统统统辖统一统制统治痛楚
+痛恨痛哭痛苦痛快痛心偷偷偷袭投奔投产投放投机投降投靠投篮投票投入投射投身投诉投向投影投掷投资头部头等头顶头儿头发头骨头号头巾头颈头盔头领头颅头目头脑头皮头球头上头疼头痛头陀头衔头绪头晕头子透出透过透镜
+透露透明透视凸出突变突出突发突击突破突起突然突围突袭突厥图案图表图册图丹图画图库图谋图片图书图腾图像图形图纸徒步徒弟徒手途径途中涂料涂抹屠刀屠杀土层土城土地土豆土匪土改土家土坑土块土木土丘土壤土司土著
+土族吐露吐蕃兔子团长团城团队团结团体团团团员团子推测推迟推崇推出推辞推倒推动推断推翻推广推荐推进推举推开推理推力推论推拿推送推算推向推销推行推选推演推移退兵退出退后退化退还退回退路退去退却退让退缩退位
+退休退役吞并吞噬屯兵屯田屯子臀部拖欠拖延托福托管托人脱离脱落脱身脱手脱水脱险陀螺椭圆妥当妥善妥协拓跋拓宽拓展唾沫挖出挖掘哇哇洼地娃娃瓦工瓦罐瓦解瓦屋袜子外边外表外部外侧外层外长外出外传外地外电外公外观
+外国外号外汇外籍外加外交外界外科外壳外来外力外流外貌外贸外面外皮外婆外戚外企外人外商外甥外事外头外围外文外校外形外衣外语外援外债外资豌豆弯曲弯腰玩儿玩家玩具玩弄玩耍玩笑玩意顽固顽皮顽强顽童完备完毕完成
+完蛋完工完好完婚完美完全完善完整挽回挽救晚报晚辈晚餐晚饭晚会晚间晚年晚期晚清晚上惋惜宛如婉转万镑万吨万多万方万分万个万股万户万家万斤万里万历万辆万民万名万亩万年万世万事万岁万台万头万万万尾万物万线万向
+万一万余万元汪洋王八王朝王道王府王公王宫王国王侯王后王家王莽王明王平王权王室王位王爷王者王子王妃亡国网吧网点网队网具网络网民网球网上网页网友网站网址往常往返往后往回往来往年往前往日往事往往旺盛望见望去
+望望忘掉忘记忘却妄图妄想威风威力威廉威名威慑威望威武威胁威信威严巍峨微波微臣微分微观微光微粒微量微米微妙微软微弱微微微小微笑微型危害危机危及危急危难危品危亡危险违背违法违反违规违纪违抗违者围城围攻围观
+围剿围困围棋围墙围绕围住围着唯独唯恐唯一唯有惟恐惟一惟有为此为官为害为何为了为民为名为难为期为啥为生为首为数为政为止为重为主为准为着维持维和维护维系维新维修苇席萎缩委派委屈委任委实委托委婉委员伟大伪军
+伪造伪装尾巴尾部尾声尾翼尾鳍纬度未必未尝未定未婚未及未经未来未了未免未能未有未曾未知味道味儿畏惧胃肠胃口魏晋魏巍位居位移位于位置位子慰问卫兵卫队卫国卫冕卫生卫士卫铁卫校卫星瘟疫温饱温差温带温度温和温暖
+温泉温热温柔温室温州温馨蚊子文本文昌文臣文帝文峰文革文官文华文化文汇文集文件文教文科文库文联文盲文明文凭文人文史文书文坛文体文武文物文献文选文学文艺文章文职文中文字闻到闻名闻讯纹饰吻合稳步稳定稳固稳健
+稳妥稳重稳住紊乱问道问候问话问及问起问世问题问问嗡嗡涡轮我辈我国我会我家我军我们我省我市我校我心我行卧室握手握住巫山呜咽乌龟乌黑乌鸦乌鱼乌云乌桕污染污水诬陷屋顶屋脊屋里屋内屋外屋子屋檐无比无边无不无常
+无偿无尘无耻无处无从无敌无法无非无辜无关无机无尽无可无赖无理无礼无力无量无聊无论无名无奈无能无情无穷无权无人无色无声无数无私无望无为无畏无锡无暇无限无线无效无心无形无需无须无言无疑无以无意无益无异无用
+无忧无缘无知无罪芜湖吴楚吴县吴仪毋宁武备武昌武大武当武功武官武汉武将武警武力武林武陵武麻武器武士武术武松武艺武职武装五百五保五彩五尺五次五大五代五道五分五峰五个五更五谷五官五横五间五届五里五门五名五年
+五千五十五世五四五天五万五位五县五项五星五行五一五岳五月五丈五指五中五种五座捂住午餐午饭午后午门午夜舞蹈舞动舞剧舞美舞台侮辱雾气物产物价物件物理物力物流物品物事物体物业物质物种物资务必务实误差误会误解
+误区昔日西安西岸西北西边西部西藏西侧西城西单西德西方西非西风西瓜西汉西湖西华西江西晋西口西陵西路西门西面西南西宁西欧西沙西山西天西夏西学西亚西洋西域西周西装吸毒吸附吸纳吸取吸入吸收吸烟吸引牺牲稀饭稀罕
+稀少稀释稀疏稀有希腊希望悉尼膝盖夕阳熄灭溪流溪水袭击席卷席位习惯习俗习性媳妇喜爱喜好喜欢喜剧喜庆喜事喜讯喜悦洗劫洗净洗礼洗脸洗手洗衣洗澡系列系数系统戏称戏剧戏曲戏台细胞细长细节细菌细看细嫩细腻细微细细
+细小细心细致细作瞎说瞎子虾子匣子辖区峡谷侠客侠义狭隘狭长狭小狭义狭窄下巴下班下边下部下层下场下车下沉下垂下次下达下地下调下跌下发下方下放下岗下官下锅下过下滑下级下降下来下列下令下楼下落下马下面下棋下去
+下山下设下手下属下述下水下文下午下辖下乡下旬下游下雨下院下载下颌厦门夏季夏日夏天吓倒吓唬吓坏吓人掀开掀起先帝先锋先后先进先例先烈先令先期先前先秦先驱先人先生先师先是先天先行先于仙女仙人仙桃鲜卑鲜红鲜花
+鲜美鲜明鲜嫩鲜品鲜血鲜艳鲜有纤夫纤维咸蛋咸丰咸宁咸阳贤弟贤良衔接闲话闲谈闲暇闲置闲着嫌疑显出显得显赫显见显露显然显示显现显著险恶险峻险些险要现场现成现出现存现代现金现今现任现身现时现实现象现行现已现役
+现有现在现状献策献出献帝献给献身县长县城县府县级县境县里县令县市县委县域腺瘤羡慕宪兵宪法宪章宪政宪宗陷害陷落陷入陷于陷阱限定限度限额限期限于限制线路线索线条线性相伴相比相差相称相持相处相传相待相当相等
+相对相反相逢相符相干相隔相公相关相互相会相机相继相间相见相交相接相近相救相聚相距相连相邻相貌相容相识相似相通相同相望相信相宜相异相应相遇相助厢房镶嵌香港香火香蕉香精香辣香料香炉香气香山香水香味香烟箱子
+襄樊襄阳襄州湘北湘鄂湘军湘西湘云乡长乡村乡里乡亲乡试乡下乡镇祥和详见详尽详情详细想必想到想法想见想来想念想起想想想像想象想要想着响彻响动响亮响起响声响应享受享用享有项目项羽橡胶橡树像是向导向东向来向量
+向前向上向往向下向阳向着象山象是象牙象征萧条硝酸硝烟削减削弱哮喘销毁销量销售消除消毒消防消费消耗消化消极消灭消遣消失消瘦消亡消息晓得小贝小便小肠小车小城小吃小船小村小岛小弟小店小队小儿小贩小腹小鬼小孩
+小河小将小姐小看小康小可小孔小林小龙小路小马小麦小妹小米小牛小女小品小区小人小山小声小时小史小事小手小说小摊小屋小小小心小型小学小于小鱼小雨小张小镇小子小字小组小厮小觑孝感孝敬孝顺孝子校长校名校区校外
+校园肖像笑话笑脸笑容笑声笑笑笑意效果效力效率效能效益效应效用效忠歇息歇歇鞋子协调协定协会协商协同协议协助协作携带携手邪恶斜坡斜眼胁迫写成写出写道写给写下写信写作泄漏泄露谢恩谢家谢谢薪酬薪金薪水薪资芯片
+欣然欣赏欣慰欣喜辛苦辛勤新版新编新兵新城新春新村新堤新房新风新港新高新河新华新婚新建新江新疆新教新近新旧新军新郎新浪新路新年新娘新奇新桥新人新任新沙新生新式新闻新鲜新兴新型新颜新药新颖新月新增新政新洲
+新字心爱心肠心得心底心地心动心腹心怀心肌心惊心境心理心里心灵心目心念心情心上心神心声心事心思心态心疼心跳心头心想心绪心血心眼心意心愿心脏心中信贷信道信封信奉信号信件信赖信念信任信徒信托信息信心信仰信用
+信誉星光星火星级星际星期星球星宿星团星系星星星夜星云星座兴办兴奋兴国兴建兴隆兴起兴趣兴山兴盛兴衰兴旺兴修兴致刑部刑场刑罚刑法刑事型号型谱型式形成形容形式形势形似形态形体形象形制形状邢台行长行车行程行刺
+行当行动行宫行贿行家行进行径行军行李行礼行列行路行情行人行省行使行驶行事行署行为行星行刑行业行医行辕行者行政行至行踪行走醒来醒目醒悟幸而幸福幸好幸亏幸运性别性病性感性格性急性命性能性情性欲性质性状性子
+姓名姓氏兄长兄弟兄妹凶恶凶狠凶猛凶手凶险胸部胸脯胸怀胸襟胸口胸前胸膛胸中匈奴汹涌雄厚雄蕊雄伟雄性雄壮雄姿熊猫熊掌休假休克休息休闲休养修补修订修复修改修建修理修炼修缮修习修行修养修正修筑修葺羞愧羞辱羞涩
+嗅觉秀才秀丽袖子绣花需求需要虚构虚假虚名虚拟虚弱虚实虚伪须知须臾徐海徐家徐徐徐州许昌许多许家许久许可许诺叙事叙述序列序幕畜牧畜禽畜生喧哗喧嚣宣布宣称宣传宣德宣读宣告宣誓宣统宣武宣言宣扬宣战悬浮悬挂悬念
+悬殊悬挑悬崖旋风旋律旋涡旋转玄武选拔选出选定选购选集选举选料选民选派选票选区选取选任选手选项选用选择选中眩晕绚丽学到学费学分学风学府学海学会学家学界学科学历学联学派学期学生学识学士学术学说学堂学徒学位
+学问学习学校学业学艺学员学苑学院学者学制学子穴道穴位雪白雪地雪花雪山血泊血管血迹血浆血泪血流血清血色血糖血统血腥血型血性血压血液血缘勋章熏陶循环询问寻常寻访寻觅寻求寻思寻找驯鹿巡捕巡抚巡航巡逻巡视殉国
+汛期训斥训练讯息迅捷迅猛迅速压倒压低压力压迫压强压缩压抑压制鸦片鸭子丫环丫头丫鬟牙齿牙膏牙口衙门衙署衙役雅典雅虎雅克哑巴亚军亚科亚麻亚平亚洲焉耆咽喉阉党烟草烟囱烟火烟台烟雾烟叶淹没淹死盐度盐酸严惩严格
+严寒严加严谨严禁严峻严酷严厉严密严明严守严肃严刑严整严正严重研发研究研讨研习研制岩层岩洞岩浆岩石岩盐延安延长延缓延津延期延庆延伸延误延续言辞言论言行言语颜料颜面颜色阎王炎帝炎热炎症沿岸沿革沿海沿河沿江
+沿途沿袭沿线沿用沿着掩盖掩护掩埋掩饰眼光眼见眼角眼界眼睛眼镜眼看眼眶眼泪眼里眼皮眼前眼球眼圈眼色眼神眼下眼中眼珠衍射衍生演变演唱演出演化演讲演练演示演说演习演戏演绎演员演奏艳丽堰口堰桥燕京燕山燕子厌恶
+厌烦厌倦雁湖宴会宴请谚语验收验证央视央行杨柳杨维扬起扬言扬州羊毛羊皮羊肉洋人洋务洋行洋溢洋芋阳府阳光阳台阳新阳性氧吧氧化氧气仰慕仰天仰望养成养分养活养老养牛养生养殖养猪样本样品样式样样样子邀请腰带腰间
+妖怪妖精妖魔瑶族摇动摇晃摇篮摇手摇头遥感遥控遥望遥远窑洞谣言咬牙药材药店药方药房药库药品药膳药师药丸药物药业药用要冲要道要点要犯要害要紧要领要么要命要钱要求要塞要是要说要死要素要旨耀眼椰子耶稣爷爷野菜
+野蛮野人野生野兽野外野味野心野战野猪冶金冶炼也罢也好也门也许业绩业界业内业务业已业余业主叶片叶子夜间夜景夜空夜里夜幕夜色夜晚液化液晶液态液体液压一八一把一百一班一般一半一帮一包一杯一倍一本一笔一边一遍
+一并一步一部一侧一层一场一尺一出一处一串一幢一次一村一寸一大一带一代一旦一刀一道一灯一等一滴一点一叠一顶一定一动一度一端一段一堆一队一对一顿一朵一二一发一番一方一分一份一封一幅一副一概一个一根一共一股
+一贯一号一晃一回一会一伙一级一记一家一架一间一件一剑一脚一角一节一届一斤一经一举一具一句一卷一开一棵一颗一刻一口一块一款一来一类一例一粒一连一脸一两一辆一流一路一缕一律一轮一枚一门一米一面一名一抹一幕
+一目一年一排一派一盘一旁一盆一批一匹一篇一片一瞥一品一瓶一期一齐一起一千一枪一切一曲一圈一拳一群一日一如一扇一身一声一生一时一世一事一手一首一束一双一瞬一丝一艘一所一台一趟一套一体一天一条一通一同一统
+一头一团一碗一万一味一位一文一席一下一线一响一项一向一小一些一新一心一行一眼一样一页一夜一一一应一隅一员一月一再一遭一早一则一盏一战一站一章一张一丈一招一阵一枝一支一直一只一纸一致一中一种一周一株一桩
+一桌一着一组一尊一座医保医疗医生医师医务医学医药医院医治依次依法依附依旧依据依靠依赖依恋依然依托依稀依照伊尔伊朗伊犁伊利伊万衣服衣冠衣襟衣衫衣裳衣食衣物衣袖衣着夷陵遗产遗传遗存遗憾遗迹遗留遗漏遗弃遗书
+遗体遗忘遗物遗址遗嘱移动移交移居移民移植仪表仪器仪式仪仗疑惑疑虑疑难疑问疑心宜昌宜城宜都宜黄宜人宜兴姨妈彝族椅子已成已经已然已有已知乙醇乙肝乙醚乙烯以北以备以便以此以东以防以后以及以来以免以南以内以前
+以求以上以示以外以往以为以西以下以至以致艺人艺术抑或抑郁抑制易经易于亿吨亿年亿万亿元亿株疫苗疫情亦可意见意境意料意识意思意图意外意味意向意杨意义意欲意愿意在意旨意志毅力毅然义父义军义气义务议案议长议程
+议定议和议会议论议事议题议员议政译本译成译文异常异同异性异样异议翌年因此因而因故因果因素因为因子殷勤音调音节音乐音响音像音译阴暗阴沉阴道阴毒阴茎阴谋阴阳阴影银川银海银河银奖银两银牌银票银行银杏银鱼银元
+银针银子饮酒饮料饮食饮宴饮用饮誉引爆引出引导引得引发引见引进引来引力引领引路引起引桥引入引水引向引信引用引诱引着隐蔽隐藏隐患隐居隐瞒隐秘隐身隐私隐形隐隐隐约印度印记印尼印刷印象印章印证英镑英才英超英尺
+英寸英国英军英俊英美英明英亩英山英文英雄英勇英语樱桃婴儿应变应城应酬应当应得应付应该应急应届应考应力应聘应声应试应为应选应邀应用应有萤石营长营地营建营救营生营销营养营业营运营造营寨荧光迎宾迎春迎风迎合
+迎接迎来迎面迎娶迎战赢得赢利盈利盈盈影壁影片影射影视影响影像影子硬度硬化硬件硬盘硬是映照拥抱拥戴拥护拥挤拥入拥有佣工庸俗雍正踊跃涌出涌入涌现永安永不永福永固永和永恒永久永乐永新永远勇敢勇猛勇气勇士勇于
+用兵用布用到用地用电用功用户用具用来用力用品用人用水用途用心用药用以用意用油用于用语用作幽灵幽默幽深幽幽幽州优待优点优化优惠优良优劣优美优孟优胜优势优先优秀优雅优异优于优越优质悠久悠闲悠悠忧愁忧虑忧伤
+忧郁尤其尤为由此由于由衷邮编邮电邮件邮票邮政犹如犹太犹豫油菜油茶油灯油画油价油料油漆油气油砂油饰油田油桐油榨油脂游荡游动游击游记游街游客游览游离游历游牧游人游玩游戏游行游泳游子有别有待有点有毒有功有关
+有害有机有加有理有利有力有名有钱有趣有权有人有如有色有伤有生有失有时有事有数有所有望有无有误有限有效有些有心有幸有序有意有益有用有余有着有罪友爱友好友情友人友谊右臂右边右侧右脚右派右倾右手右腿右翼右掌
+诱导诱发诱惑诱人又称又名幼虫幼儿幼年幼时幼小幼稚迂回淤积淤泥于今于是愚蠢愚昧舆论余部余处余地余额余家余脉余米余亩余年余万余下余种鱼池鱼翅鱼肚鱼花鱼雷鱼类鱼苗鱼松鱼头鱼尾鱼汛鱼原鱼种愉快愉悦渔场渔船渔民
+渔人渔网渔业予以娱乐雨季雨量雨水与非与否与会与其宇宙语调语法语句语气语文语系语言语音语种语族羽毛玉带玉兰玉米玉女玉器玉山玉石玉音域名郁闷遇到遇见遇难遇上遇事御道御驾御史愈发愈合愈加欲望狱中育才育种誉为
+寓言寓意预案预报预备预测预定预订预防预付预感预计预见预警预料预期预示预算预先预言鸳鸯渊源冤枉元宝元朝元代元旦元件元老元年元气元首元帅元素袁绍原本原产原创原地原定原告原籍原件原来原理原谅原料原名原始原委
+原文原先原型原野原意原因原油原有原则原址原种原子援军援引援助园林园内园区园中园子员工圆满圆圈圆形圆圆圆柱源泉源头源于源自缘故缘由远安远程远处远东远方远古远近远离远去远眺远销远洋远远远征愿望愿意怨恨院长
+院里院落院门院内院士院校院中院子约旦约定约翰约会约莫约束越冬越发越国越南越是越野跃出跃起跃入跃上钥匙岳飞岳父岳家岳母月初月底月份月光月湖月季月经月均月刊月亮月球月色月薪阅读阅卷阅历云朵云集云母云南云盘
+云梯云雾郧县郧阳陨石允许运到运动运河运力运气运输运送运算运往运行运营运用运载运转运作蕴藏蕴含酝酿晕倒韵律孕妇孕育杂草杂技杂交杂剧杂志杂质杂种栽培灾害灾民灾难灾区宰相载荷载人载入载体载有载重再创再次再度
+再见再三再生再说再现再行再也再有在场在乎在家在建在内在手在外在位在线在校在意在于在职在座咱家咱俩咱们暂且暂时暂停暂行赞成赞美赞赏赞叹赞同赞扬赞誉赞助脏腑脏器葬礼遭到遭逢遭受遭遇糟糕糟蹋藻井藻类枣阳早餐
+早晨早点早饭早就早年早期早日早上早晚早些早已早早早知噪声噪音造成造船造反造福造化造价造就造林造像造型造诣造纸灶台责备责成责怪责令责难责任择业择优贼人怎地怎么怎样增补增产增长增大增多增发增幅增高增加增减
+增进增量增强增设增生增收增速增添增援增殖增值增至憎恨曾经赠送扎实扎营闸门榨菜榨油炸弹炸毁炸药诈骗摘要斋戒宅子债权债券债务寨主瞻仰粘膜粘土粘性粘液斩断斩首辗转崭新展出展开展览展示展望展现占卜占地占据占领
+占用占有战败战备战场战车战船战斗战法战犯战俘战功战国战果战后战火战机战绩战舰战局战乱战略战马战前战区战胜战士战事战术战死战线战役战友战争站长站点站立站台站稳站住章程漳州张大张飞张家张开张口张罗张宁张贴
+张望张扬张嘴掌法掌管掌柜掌门掌上掌声掌握掌心掌印涨幅涨价涨停丈夫丈量帐篷账户账目障碍招安招办招标招待招呼招架招来招募招牌招聘招商招生招式招收招手招数招致昭君找出找到找寻沼泽赵家赵云照顾照旧照看照例照亮
+照料照明照片照射照相照样照耀照应召唤召回召集召见召开遮掩遮住折叠折断折合折回折扣折磨折扇折射折腾折子哲理哲学蔗糖这般这帮这本这笔这边这部这场这次这点这儿这份这个这话这回这伙这家这件这块这里这么这时这天
+这位这项这些这样这种浙东浙江珍宝珍藏珍贵珍品珍稀珍惜珍珠斟酌真诚真的真个真话真假真经真菌真空真理真切真情真人真实真是真味真相真心真正真挚真主贞观针刺针对针灸侦查侦察枕头诊断诊治震颤震荡震动震撼震惊震天
+振臂振荡振动振奋振兴镇长镇定镇江镇静镇上镇守镇压阵地阵法阵前阵容阵势阵亡阵线阵营阵阵蒸发蒸馏蒸笼蒸气蒸汽挣钱挣脱挣扎征伐征服征集征求征收征税征讨征战征兆争辩争吵争斗争端争夺争论争气争取争相争议争执整车
+整顿整风整个整合整洁整理整齐整日整数整体整天整修整整整治拯救正版正比正常正当正德正殿正副正规正好正经正门正面正南正派正气正桥正确正色正式正是正视正说正统正文正午正向正要正义正月正在正直正值正中正宗政变
+政策政党政法政府政工政绩政局政客政区政权政事政体政委政务政协政制政治症状郑和郑家郑克郑重郑州证见证件证据证明证券证人证实证书芝麻枝江枝叶支部支撑支持支出支队支付支架支流支配支书支线支行支援支柱蜘蛛知道
+知府知己知觉知名知青知情知识知县知晓知音知足肢体脂肪之二之后之际之间之江之类之内之前之上之外之下之一之用之中织布织物织造职称职高职工职官职能职权职司职位职务职业职员职责直奔直播直达直到直观直管直接直径
+直觉直立直隶直流直属直通直系直辖直线直言直指直至植被植树植物植株殖民执法执教执事执行执意执掌执政执着值班值得值钱侄儿侄女指标指出指导指点指定指挥指甲指教指控指令指路指明指南指使指示指数指头指望指向指引
+指责指针指指指着止血止住只当只得只顾只管只好只见只能只怕只求只是只要只用只有旨意旨在纸币纸坊纸条纸烟纸张志军志愿至此至极至今至少至于至正至尊致癌致病致电致富致敬致力致密致命致使致死致远置身置于制备制裁
+制成制导制定制订制度制服制剂制品制取制式制糖制药制约制造制止制作智慧智利智力智能智商秩序质地质点质感质量质朴质问质询质疑质子滞后治安治病治国治理治疗治权治所治愈窒息中部中层中场中常中程中大中道中等中东
+中毒中段中断中队中方中纺中共中国中和中华中级中间中建中将中介中军中立中路中南中能中年中欧中期中人中日中山中式中枢中堂中统中途中土中外中文中午中西中线中小中心中信中星中兴中型中行中性中学中旬中亚中央中阳
+中药中叶中医中用中游中原中曾中指中止中洲中专中子忠臣忠诚忠实忠心忠义忠于钟声钟头钟祥衷心终点终端终极终结终究终年终日终身终生终于终止种类种群种属种姓种植种质种种种子种族肿瘤肿胀重兵重病重臣重创重大重担
+重点重叠重返重复重建重力重量重庆重任重伤重申重视重围重现重新重心重型重修重演重阳重要重用重镇重重重组重檐仲裁众多众将众人舟曲周边周长周代周到周二周家周刊周礼周六周密周末周年周期周全周日周三周身周四周岁
+周围周五周旋周一周转周瑜州长州府轴瓦咒骂皱眉皱纹宙斯昼夜骤然珠宝珠海珠江珠子朱笔朱德朱红朱漆朱砂朱熹猪肉诸般诸多诸国诸侯诸如诸事诸位诸州逐步逐出逐渐逐年逐一竹竿竹林竹山竹溪竹乡竹园竹子烛光瞩目嘱咐主办
+主编主场主持主导主动主队主峰主干主攻主公主观主管主机主将主角主教主力主料主流主权主人主任主食主帅主题主体主席主演主要主意主义主宰主战主张主政主旨主治主子著称著录著名著述著作柱洞柱头柱子助长助攻助理助手
+助学贮藏贮存铸币铸成铸铁铸造筑城筑成住处住房住宿住所住院住宅注册注定注明注目注入注射注释注视注意注重祝福祝贺祝愿驻地驻华驻军驻守驻外驻扎驻足抓好抓紧抓起抓住爪哇专场专程专电专管专家专科专栏专利专卖专门
+专区专权专人专任专题专线专项专心专业专用专员专政专职专制专著专注砖石砖头砖瓦转变转达转动转而转发转过转化转换转机转念转让转入转身转速转头转弯转为转向转型转眼转移转运转载转增转战转折转正撰文撰写赚钱庄家
+庄稼庄客庄上庄严庄园庄重庄周庄子装扮装备装甲装配装饰装束装填装卸装修装药装有装载装置装作撞击撞见壮大壮观壮丽壮烈壮士壮族状况状态状元追兵追赶追击追加追究追求追杀追溯追随追问追寻追逐追踪准备准确准时准许
+准则捉拿捉住卓越卓著桌面桌前桌上桌椅桌子琢磨着地着急着力着陆着实着手着想着眼着重咨询资本资财资产资费资格资金资历资料资深资讯资源资质资助姿势姿态滋润滋生滋味紫色仔细子弹子弟子房子宫子口子女子孙子叶自称
+自成自此自从自带自动自发自负自个自给自古自豪自己自家自尽自居自觉自考自来自立自律自强自然自如自杀自身自私自卫自我自小自信自行自旋自学自已自由自有自幼自愿自知自制自治自主自助自转自尊自刎字典字儿字符字号
+字画字迹字母字数字体字头字型字形字眼字样棕色踪迹踪影宗法宗教宗庙宗派宗室宗旨宗族综合总兵总部总裁总长总称总成总得总督总队总额总分总共总管总和总会总计总监总结总局总理总量总能总是总数总算总体总统总之总值
+纵队纵贯纵横纵然纵容纵身纵深纵向走出走动走访走狗走过走进走近走开走来走廊走路走入走上走势走兽走私走向走走奏疏奏章奏折租地租界租金租赁足够足迹足见足球足下足协足以足足族长族人祖坟祖父祖国祖籍祖母祖上祖师
+祖先祖宗诅咒阻碍阻挡阻隔阻拦阻力阻挠阻塞阻止组长组成组分组合组建组织组装钻进钻入钻石钻研嘴巴嘴边嘴唇嘴角嘴里最长最初最大最低最高最好最后最佳最近最快最强最少最深最为最先最小最新最早最终最重罪恶罪犯罪过
+罪名罪人罪行尊贵尊号尊敬尊严尊重遵从遵守遵循遵照昨儿昨日昨天昨晚昨夜左岸左臂左边左侧左传左脚左派左手左腿左翼左右做成做出做到做法做饭做工做官做好做客做梦做起做人做事做为作弊作出作对作法作坊作风作好作家
+作品作曲作为作文作物作响作业作用作战作者作证坐标坐定坐落坐骑坐下坐在坐镇座舱座谈座位兀自丐帮丞相噩梦匕首睾丸厮杀匮乏匾额攸县俨然俸禄偌大倏地倭寇禀报禀告诏令诏书谕旨郢州圪节芙琳芙蓉茯苓莼菜蓦地蒽醌蕲春
+尴尬拚命叩头吆喝咚咚哽咽唧唧喃喃喽罗嘈杂嘀咕帷幕崆峒崛起嵩山徭役狩猎饴糖庵堂忏悔怦怦怡悦恪守悖论惬意愕然愣住憔悴憧憬沐浴沔阳汶川浏览浠水淙淙渲染溥仪潇洒潇湘漕运潼关逍遥彗星妩媚姊夫姊妹娴熟婊子媲美嫔妃
+嫦娥嫘祖孢子驸马驿站缰绳珞狮珞珈杞县枸杞梓树楠木楠竹殡葬牦牛胭脂腓力朦胧飓风旌旗炫耀熠熠祠堂禅师禅杖畲族羁縻镖局秭归皈依甬道鸱吻鹧鸪褶皱虔诚蚯蚓蜈蚣蜿蜒蝌蚪蝙蝠蟋蟀蟠龙筵席袈裟羟基粽子糍粑翡翠醴陵跻身
+踉跄蹂躏蹊跷霎时鱿鱼鲇鱼鲟鱼鲥鱼鲨鱼鲶鱼鳇鱼鳊鱼鳜鱼鞑靼骰子骷髅魅力麾下麋鹿黯然
+"""
@@ -0,0 +1,420 @@
+import bisect
+import logging
+import re
+import threading
+
+from .normalization import normalize_text
+from .tokenizer import CJK_RANGES
+
+logger = logging.getLogger(__name__)
+
+
+class KeywordAutomaton:
+    """
+    多关键词匹配自动机（Aho-Corasick）
+
+    所有关键词构建为一棵带失败指针的字典树，对文本只扫描一遍即可判断是否包含任一关键词，
+    或列出全部命中位置，耗时与关键词数量无关。匹配按归一化（见 normalize_text）后的子串进行，不检查单词边界，
+    命中结果是各检测阶段实际匹配结果的超集。
+    """
+
+    __slots__ = ("keywords", "filler", "_lengths", "_goto", "_fail", "_output", "_matches")
+
+    def __init__(self, keywords, filler=None):
+        """
+        构建自动机
+
+        Args:
+            keywords (iterable): 关键词
+            filler (FillerTable, optional): 填充字符表，提供时匹配跳过文本和关键词中的填充字符，
+                "炸 弹"、"炸*弹" 都可以命中"炸弹"
+        """
+        # 状态0为根节点，_goto[状态] = {字符: 下一状态}，_output[状态] 为以该状态结尾的关键词，
+        # _matches[状态] 为以该状态结尾的全部关键词编号（含失败链上的较短关键词）
+        goto = [{}]
+        output = [None]
+        matches = [()]
+        self.keywords = []
+        self.filler = filler
+        # 各关键词参与匹配的字符数（去掉填充字符后）
+        self._lengths = []
+        for keyword in keywords:
+            if not isinstance(keyword, str):
+                continue
+            normalized = normalize_text(keyword)
+            chars = filler.remove(normalized) if filler is not None else normalized
+            if not chars.strip():
+                continue
+            state = 0
+            for char in chars:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][char] = next_state
+                    goto.append({})
+                    output.append(None)
+                    matches.append(())
+                state = next_state
+            if output[state] is None:
+                output[state] = keyword
+                matches[state] = (len(self.keywords),)
+                self.keywords.append(normalized)
+                self._lengths.append(len(chars))
+
+        # 按层次遍历计算失败指针，并把失败链上的输出合并到当前状态
+        fail = [0] * len(goto)
+        queue = list(goto[0].values())
+        for state in queue:
+            state_fail = fail[state]
+            for char, next_state in goto[state].items():
+                queue.append(next_state)
+                fallback = state_fail
+                while fallback and char not in goto[fallback]:
+                    fallback = fail[fallback]
+                target = fail[next_state] = goto[fallback].get(char, 0)
+                if target:
+                    if output[next_state] is None:
+                        output[next_state] = output[target]
+                    if matches[target]:
+                        matches[next_state] = matches[next_state] + matches[target]
+
+        self._goto = goto
+        self._fail = fail
+        self._output = output
+        self._matches = matches
+
+    @property
+    def size(self):
+        """关键词数量"""
+        return len(self.keywords)
+
+    def find_first(self, text):
+        """
+        查找文本中最先出现的关键词
+
+        Args:
+            text (str): 文本
+
+        Returns:
+            str: 命中的关键词，没有命中时返回None
+        """
+        return self.find_first_normalized(normalize_text(text))
+
+    def find_first_normalized(self, text):
+        """
+        在已归一化的文本中查找最先出现的关键词
+
+        Args:
+            text (str): 归一化后的文本
+
+        Returns:
+            str: 命中的关键词，没有命中时返回None
+        """
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        if self.filler is not None:
+            text = self.filler.remove(text)
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state] is not None:
+                return output[state]
+        return None
+
+    def iter_matches(self, text):
+        """
+        列出文本中的全部命中
+
+        Args:
+            text (str): 文本
+
+        Yields:
+            tuple: (起始位置, 结束位置, 关键词编号)，位置对应原文（归一化不改变文本长度，跳过的填充字符也换算回原文），
+                关键词为 keywords[编号]
+        """
+        return self.iter_normalized_matches(normalize_text(text))
+
+    def iter_normalized_matches(self, lowered):
+        """
+        列出已归一化文本中的全部命中
+
+        Args:
+            lowered (str): 归一化后的文本，归一化不改变长度，命中位置同样对应原文
+
+        Yields:
+            tuple: (起始位置, 结束位置, 关键词编号)
+        """
+        lengths = self._lengths
+        text = self.filler.remove(lowered) if self.filler is not None else lowered
+        if len(text) == len(lowered):
+            for end, keyword_id in self._iter_ends(lowered):
+                yield end - lengths[keyword_id], end, keyword_id
+            return
+
+        # 匹配在去掉填充字符的文本上进行，命中位置按各段填充字符换算回原文，只在有命中时计算
+        gaps = None
+        for end, keyword_id in self._iter_ends(text):
+            if gaps is None:
+                # gaps[i] 为第i段填充字符之后第一个字符在去掉填充字符的文本中的位置，removed[i] 为截至该段删除的字符数
+                gaps, removed = self.filler.offsets(lowered)
+            start = end - lengths[keyword_id]
+            index = bisect.bisect_right(gaps, start) - 1
+            original_start = start + (removed[index] if index >= 0 else 0)
+            index = bisect.bisect_right(gaps, end - 1) - 1
+            original_end = end + (removed[index] if index >= 0 else 0)
+            yield original_start, original_end, keyword_id
+
+    def _iter_ends(self, text):
+        """按结束位置列出归一化文本中的全部命中 (结束位置, 关键词编号)"""
+        goto = self._goto
+        fail = self._fail
+        matches = self._matches
+        state = 0
+        for end, char in enumerate(text, 1):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for keyword_id in matches[state]:
+                yield end, keyword_id
+
+
+# 按文字划分的子索引：zh 为全部关键词（中文回合中常夹有英文单词、数字和拼音），en 为不含CJK字符的关键词
+ROUTE_ZH = "zh"
+ROUTE_EN = "en"
+ROUTES = (ROUTE_ZH, ROUTE_EN)
+
+_CJK_RE = re.compile(f"[{CJK_RANGES}]")
+
+
+def text_route(lowered):
+    """
+    判断回合文本使用的子索引
+
+    只检查文本中是否出现CJK字符，一次正则搜索，不做完整的语言识别：
+    不含CJK字符的文本不可能命中含CJK字符的关键词，只需 en 子索引。
+
+    Args:
+        lowered (str): 归一化后的文本
+
+    Returns:
+        str: 子索引名
+    """
+    return ROUTE_ZH if _CJK_RE.search(lowered) else ROUTE_EN
+
+
+class RoutedKeywordAutomaton:
+    """
+    按文字路由的多关键词匹配
+
+    关键词分为 zh、en 两个子自动机，各自在第一次遇到需要它的回合时才构建：
+    只处理英文的部署不会构建中文关键词及其读音变体的自动机，只处理中文的部署不会构建 en 子自动机。
+    每个回合只扫描一遍，zh 子自动机构建后不含CJK字符的回合也直接使用它，en 子自动机随之释放。
+    接口与 KeywordAutomaton 相同，关键词按全局编号，与不分路由时的编号一致。
+    """
+
+    __slots__ = ("keywords", "filler", "_en_keywords", "_en_ids", "_automata")
+
+    def __init__(self, keywords, filler=None):
+        """
+        划分关键词，子自动机在首次使用时构建
+
+        Args:
+            keywords (iterable): 关键词
+            filler (FillerTable, optional): 填充字符表，与 KeywordAutomaton 相同
+        """
+        self.keywords = []
+        self.filler = filler
+        # en 子索引的归一化关键词和对应的全局编号
+        self._en_keywords = []
+        self._en_ids = []
+        self._automata = {}
+        seen = set()
+        for keyword in keywords:
+            if not isinstance(keyword, str):
+                continue
+            # 与 KeywordAutomaton 相同的去重规则，保证全局编号一致
+            normalized = normalize_text(keyword)
+            chars = filler.remove(normalized) if filler is not None else normalized
+            if not chars.strip() or chars in seen:
+                continue
+            seen.add(chars)
+            if not _CJK_RE.search(chars):
+                self._en_keywords.append(normalized)
+                self._en_ids.append(len(self.keywords))
+            self.keywords.append(normalized)
+
+    @property
+    def size(self):
+        """关键词数量"""
+        return len(self.keywords)
+
+    @property
+    def loaded_routes(self):
+        """已构建的子索引"""
+        return tuple(route for route in ROUTES if route in self._automata)
+
+    def automaton(self, route):
+        """
+        子索引的自动机，首次使用时构建
+
+        Args:
+            route (str): 子索引名
+
+        Returns:
+            KeywordAutomaton: 自动机
+        """
+        automaton = self._automata.get(route)
+        if automaton is None:
+            keywords = self.keywords if route == ROUTE_ZH else self._en_keywords
+            automaton = self._automata[route] = KeywordAutomaton(keywords, self.filler)
+            if route == ROUTE_ZH:
+                # zh 子索引包含全部关键词，之后不再需要 en 子索引
+                self._automata.pop(ROUTE_EN, None)
+            logger.debug(f"已构建 {route} 子索引，{automaton.size} 个关键词")
+        return automaton
+
+    def _route(self, lowered):
+        if ROUTE_ZH in self._automata:
+            return ROUTE_ZH
+        return text_route(lowered)
+
+    def find_first(self, text):
+        """
+        查找文本中最先出现的关键词
+
+        Args:
+            text (str): 文本
+
+        Returns:
+            str: 命中的关键词，没有命中时返回None
+        """
+        lowered = normalize_text(text)
+        return self.automaton(self._route(lowered)).find_first_normalized(lowered)
+
+    def iter_matches(self, text):
+        """
+        列出文本中的全部命中
+
+        Args:
+            text (str): 文本
+
+        Returns:
+            iterator: (起始位置, 结束位置, 关键词编号)，编号为全局编号，关键词为 keywords[编号]
+        """
+        return self.iter_normalized_matches(normalize_text(text))
+
+    def iter_normalized_matches(self, lowered):
+        """
+        列出已归一化文本中的全部命中
+
+        Args:
+            lowered (str): 归一化后的文本
+
+        Returns:
+            iterator: (起始位置, 结束位置, 关键词编号)，编号为全局编号
+        """
+        route = self._route(lowered)
+        matches = self.automaton(route).iter_normalized_matches(lowered)
+        if route == ROUTE_ZH:
+            return matches
+        ids = self._en_ids
+        return ((start, end, ids[keyword_id]) for start, end, keyword_id in matches)
+
+
+class ConversationPrefilter:
+    """
+    会话预筛选
+
+    第一级快速检查：会话内容不包含规则集中的任何词汇，且没有出现 roles.json 角色规则中的角色时，
+    后续各检测阶段都不会有命中，可以直接返回无风险结果。
+    """
+
+    __slots__ = ("automaton", "roles")
+
+    def __init__(self, keywords, roles=(), filler=None):
+        """
+        初始化预筛选
+
+        Args:
+            keywords (iterable): 规则集中的全部词汇
+            roles (iterable): 需要完整分析的角色名
+            filler (FillerTable, optional): 填充字符表，与各检测阶段的匹配方式一致
+        """
+        self.automaton = RoutedKeywordAutomaton(keywords, filler)
+        self.roles = frozenset(roles)
+
+    def first_hit(self, conversation):
+        """
+        查找会话中第一个命中的词汇或角色
+
+        Args:
+            conversation (list): 会话列表，格式为 [{"role": "...", "content": "..."}, ...]
+
+        Returns:
+            str: 命中的词汇或角色名，没有命中时返回None
+        """
+        for turn in conversation:
+            if not isinstance(turn, dict):
+                continue
+            if turn.get("role") in self.roles:
+                return turn["role"]
+            content = turn.get("content")
+            if isinstance(content, str) and content:
+                hit = self.automaton.find_first(content)
+                if hit is not None:
+                    return hit
+        return None
+
+    def should_analyze(self, conversation):
+        """会话是否需要进入完整检测流程"""
+        return self.first_hit(conversation) is not None
+
+
+class PrefilterStats:
+    """预筛选计数，用于统计实际的放行比例"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checked = 0
+        self.passed = 0
+
+    def record(self, passed):
+        """
+        记录一次预筛选结果
+
+        Args:
+            passed (bool): 会话是否进入完整检测流程
+        """
+        with self._lock:
+            self.checked += 1
+            if passed:
+                self.passed += 1
+
+    @property
+    def skipped(self):
+        """直接返回无风险结果的会话数"""
+        return self.checked - self.passed
+
+    @property
+    def pass_through_rate(self):
+        """进入完整检测流程的会话比例，尚未检查任何会话时为0"""
+        return self.passed / self.checked if self.checked else 0.0
+
+    def as_dict(self):
+        with self._lock:
+            checked, passed = self.checked, self.passed
+        return {
+            "checked": checked,
+            "passed": passed,
+            "skipped": checked - passed,
+            "pass_through_rate": round(passed / checked, 4) if checked else 0.0,
+        }
+
+    def reset(self):
+        """清空计数"""
+        with self._lock:
+            self.checked = 0
+            self.passed = 0
@@ -0,0 +1,214 @@
+from collections.abc import Mapping
+
+
+class PatternHit:
+    """
+    单条风险模式命中记录
+
+    只保存回合索引和会话引用，内容在访问或序列化时才从会话中读取，
+    不会为每条命中复制回合文本。兼容原有详情字典的 get/[] 访问方式。
+    """
+
+    __slots__ = ("pattern_id", "turn_index", "role", "category", "name", "_conversation")
+
+    FIELDS = ("turn", "role", "content", "category", "name")
+
+    def __init__(self, pattern_id, turn_index, role, category, name, conversation):
+        """
+        初始化模式命中记录
+
+        Args:
+            pattern_id (str): 模式ID
+            turn_index (int): 回合索引（从0开始）
+            role (str): 回合角色
+            category (str): 模式大类
+            name (str): 模式名称
+            conversation (list): 命中所在的会话
+        """
+        self.pattern_id = pattern_id
+        self.turn_index = turn_index
+        self.role = role
+        self.category = category
+        self.name = name
+        self._conversation = conversation
+
+    @property
+    def turn(self):
+        """回合编号（从1开始），与原详情字典的turn字段一致"""
+        return self.turn_index + 1
+
+    @property
+    def content(self):
+        """命中回合的内容，按需从会话中读取"""
+        turn = self._conversation[self.turn_index]
+        return turn.get("content", "").strip() if isinstance(turn, dict) else ""
+
+    def __getitem__(self, key):
+        if key not in self.FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key, default=None):
+        """按字段名读取，兼容字典访问"""
+        if key not in self.FIELDS:
+            return default
+        return getattr(self, key)
+
+    def to_dict(self):
+        """序列化为原有的详情字典格式"""
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+    def __repr__(self):
+        return f"PatternHit({self.pattern_id!r}, turn={self.turn}, role={self.role!r})"
+
+
+class DetectionResult(Mapping):
+    """
+    会话风险检测结果
+
+    以只读映射的形式提供与原结果字典相同的键，内部保存命中记录对象，
+    ruleset_version 等附加信息只作为属性提供，不出现在映射和序列化结果中。
+    detailed_patterns 等嵌套结构在访问或调用 to_dict() 时才转换为字典。
+    风险摘要在第一次访问时才生成，只需要分数和模式ID的调用方不承担字符串格式化开销。
+    """
+
+    __slots__ = ("detected", "risk_categories", "risk_patterns", "pattern_hits",
+                 "semantic_risks", "multi_role_risks", "ruleset_version", "metrics", "similar_patterns",
+                 "_risk_summary", "_summary_renderer")
+
+    KEYS = ("detected", "risk_categories", "risk_patterns", "detailed_patterns",
+            "risk_summary", "semantic_risks", "multi_role_risks")
+
+    def __init__(self, detected, risk_categories, risk_patterns, pattern_hits,
+                 semantic_risks, multi_role_risks, risk_summary=None, summary_renderer=None,
+                 ruleset_version=None, metrics=None, similar_patterns=None):
+        """
+        初始化检测结果
+
+        Args:
+            detected (bool): 是否检测到风险
+            risk_categories (list): 风险类别列表
+            risk_patterns (list): 风险模式ID列表
+            pattern_hits (dict): {模式ID: [PatternHit]}
+            semantic_risks (dict): 语义网络风险分析结果
+            multi_role_risks (dict): 多角色风险分析结果
+            risk_summary (str, optional): 已生成的风险摘要
+            summary_renderer (callable, optional): 生成风险摘要的无参函数，首次访问摘要时调用
+            ruleset_version (int, optional): 检测使用的规则集版本
+            metrics (dict, optional): 阶段计时开启时为 {"timings": {...}, "counters": {...}}
+            similar_patterns (list, optional): 模式相似度检索开启时为与各回合最相似的风险模式
+        """
+        self.detected = detected
+        self.risk_categories = risk_categories
+        self.risk_patterns = risk_patterns
+        self.pattern_hits = pattern_hits
+        self.semantic_risks = semantic_risks
+        self.multi_role_risks = multi_role_risks
+        self.ruleset_version = ruleset_version
+        self.metrics = metrics
+        self.similar_patterns = similar_patterns
+        self._risk_summary = risk_summary
+        self._summary_renderer = summary_renderer
+
+    @property
+    def risk_summary(self):
+        """风险摘要，首次访问时生成并缓存"""
+        if self._risk_summary is None and self._summary_renderer is not None:
+            self._risk_summary = self._summary_renderer()
+            # 释放生成摘要所需的引用
+            self._summary_renderer = None
+        return self._risk_summary
+
+    @property
+    def summary_rendered(self):
+        """风险摘要是否已经生成"""
+        return self._summary_renderer is None
+
+    @property
+    def detailed_patterns(self):
+        """细粒度风险模式详情 {模式ID: [PatternHit]}"""
+        return self.pattern_hits
+
+    @property
+    def _keys(self):
+        """结果包含的键，模式相似度检索开启时另有 similar_patterns"""
+        return self.KEYS if self.similar_patterns is None else self.KEYS + ("similar_patterns",)
+
+    def __getitem__(self, key):
+        if key not in self._keys:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def to_dict(self):
+        """序列化为原有的结果字典格式"""
+        result = {key: getattr(self, key) for key in self._keys}
+        result["detailed_patterns"] = {
+            pattern_id: [hit.to_dict() for hit in hits]
+            for pattern_id, hits in self.pattern_hits.items()
+        }
+        return result
+
+    def __repr__(self):
+        return (f"DetectionResult(detected={self.detected}, "
+                f"risk_categories={self.risk_categories!r}, risk_patterns={self.risk_patterns!r})")
+
+
+class Verdict:
+    """
+    快速判定结果
+
+    只回答会话是否达到拦截阈值；stages 记录实际运行过的检测阶段，
+    complete 为 False 表示提前结束，risk_score 是已运行阶段给出的分数下界。
+    完整分析结果通过 details 属性在首次访问时生成。
+    """
+
+    __slots__ = ("blocked", "risk_score", "block_threshold", "stages", "complete",
+                 "_details", "_details_loader")
+
+    def __init__(self, blocked, risk_score, block_threshold, stages, complete, details_loader=None):
+        """
+        初始化判定结果
+
+        Args:
+            blocked (bool): 是否达到拦截阈值
+            risk_score (int): 风险分数，提前结束时为分数下界
+            block_threshold (int): 拦截阈值
+            stages (list): 已运行的检测阶段
+            complete (bool): 是否运行了全部阶段
+            details_loader (callable, optional): 生成完整分析结果的无参函数
+        """
+        self.blocked = blocked
+        self.risk_score = risk_score
+        self.block_threshold = block_threshold
+        self.stages = stages
+        self.complete = complete
+        self._details = None
+        self._details_loader = details_loader
+
+    @property
+    def details(self):
+        """完整分析结果，首次访问时生成并缓存"""
+        if self._details is None and self._details_loader is not None:
+            self._details = self._details_loader()
+            self._details_loader = None
+        return self._details
+
+    def to_dict(self):
+        """序列化为字典（不包含完整分析结果）"""
+        return {
+            "blocked": self.blocked,
+            "risk_score": self.risk_score,
+            "block_threshold": self.block_threshold,
+            "stages": self.stages,
+            "complete": self.complete,
+        }
+
+    def __repr__(self):
+        return (f"Verdict(blocked={self.blocked}, risk_score={self.risk_score}, "
+                f"stages={self.stages!r}, complete={self.complete})")
@@ -1,43 +1,53 @@
 import os
-import json
-import re  # 添加re模块导入
 import logging
+import functools
 from collections import defaultdict
 from ..utils.config import ConfigLoader
-from .semantic_analyzer import SemanticNetworkAnalyzer
-from .multi_role_detector import MultiRolePatternDetector
+from .ruleset import RulesetManager
+from .results import PatternHit, DetectionResult
+from .instrumentation import MetricsRegistry, NULL_TIMER
+from .prefilter import PrefilterStats
+from .term_index import turn_contents
+from ..utils.logging_utils import SampledLogger, ConversationDiagnostics
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
+# 逐条命中日志只在DEBUG级别按采样输出
+hit_logger = SampledLogger(logger)
 
 class RiskDetector:
     """风险检测器，用于检测文本中的风险内容"""
     
-    def __init__(self, patterns_file=None, vocabulary_file=None):
+    def __init__(self, patterns_file=None, vocabulary_file=None, config_loader=None, metrics=None,
+                 prefilter=False, similarity=False):
         """
         初始化风险检测器
         
         Args:
             patterns_file (str, optional): 风险模式定义文件路径
             vocabulary_file (str, optional): 词汇库文件路径
+            config_loader (ConfigLoader, optional): 配置加载器，默认使用项目config目录
+            metrics (MetricsRegistry, optional): 指标汇总，设置后记录各检测阶段耗时
+            prefilter (bool): 是否开启预筛选，不包含任何规则词汇的会话直接返回无风险结果
+            similarity (bool): 是否检索与各回合最相似的风险模式（按模式名称、描述和示例）
         """
         # 创建配置加载器
-        self.config_loader = ConfigLoader()
-        
-        # 基本初始化
-        self.patterns = {}
-        self.pattern_to_category = {}  # 模式ID到大类的映射
-        self.pattern_to_name = {}      # 模式ID到名称的映射 
-        self.pattern_to_desc = {}      # 模式ID到描述的映射
-        self.vocabulary = {}           # 词汇库
+        self.config_loader = config_loader or ConfigLoader()
+
+        # 阶段计时，默认关闭
+        self.metrics = metrics
+
+        # 预筛选，默认关闭；prefilter_stats 统计进入完整检测流程的比例
+        self.prefilter_enabled = prefilter
+        self.prefilter_stats = PrefilterStats()
+
+        # 模式相似度检索，默认关闭
+        self.similarity_enabled = similarity
         
         # 设置数据目录
         self.data_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
         self.data_dir = os.path.join(self.data_dir, "data")
         os.makedirs(self.data_dir, exist_ok=True)
 
-        # 从配置文件加载风险类别
-        risk_categories = self.config_loader.load_config("risk_categories.json")
         self.risk_categories_mapping = {
             "ERC": "显性风险组合类",
             "MCP": "隐喻协作类",
@@ -46,48 +56,129 @@ class RiskDetector:
             "REP": "角色特性利用类",
             "CEP": "文化规避类"
         }
-        self.risk_categories = risk_categories
         
-        # 确保风险类别关键词配置文件存在
-        risk_keywords = self.config_loader.load_config("risk_categories_keywords.json")
-        if not risk_keywords:
-            # 默认风险类别关键词配置将在_detect_risk_categories方法中处理
-            pass
+        # 加载规则集（模式库、词汇库和配置文件），支持热加载
+        self.ruleset_manager = RulesetManager(
+            patterns_file=patterns_file if patterns_file and os.path.exists(patterns_file) else None,
+            vocabulary_file=vocabulary_file if vocabulary_file and os.path.exists(vocabulary_file) else None,
+            config_loader=self.config_loader
+        )
+        self.risk_categories = self.ruleset.risk_categories
     
         # 载入风险类别到文件(如果不存在)
         risk_categories_file = self.config_loader.get_default_config_path("risk_categories.json")
         if not os.path.exists(risk_categories_file):
             self.config_loader.save_config(self.risk_categories, "risk_categories.json")
         
-        # 加载风险模式定义
-        if patterns_file and os.path.exists(patterns_file):
-            try:
-                with open(patterns_file, 'r', encoding='utf-8') as f:
-                    self.patterns = json.load(f)
-                logger.info(f"已加载风险模式定义，包含 {len(self.patterns)} 个大类")
-                
-                # 构建模式ID到大类的映射
-                for category, patterns in self.patterns.items():
-                    for pattern in patterns:
-                        if "id" in pattern:
-                            self.pattern_to_category[pattern["id"]] = category
-                            self.pattern_to_name[pattern["id"]] = pattern.get("name", pattern["id"])
-                            self.pattern_to_desc[pattern["id"]] = pattern.get("description", "")
-            except Exception as e:
-                logger.error(f"加载风险模式定义失败: {e}")
-                self.patterns = {}
-        
-        # 加载词汇库
-        if vocabulary_file and os.path.exists(vocabulary_file):
-            try:
-                with open(vocabulary_file, 'r', encoding='utf-8') as f:
-                    vocabulary_data = json.load(f)
-                    self.vocabulary = vocabulary_data.get('vocabulary', {})
-                logger.info(f"已加载词汇库，包含 {len(self.vocabulary)} 个类别")
-            except Exception as e:
-                logger.error(f"加载词汇库失败: {e}")
-                self.vocabulary = {}
-    
+        if self.ruleset.patterns:
+            logger.info(f"已加载风险模式定义，包含 {len(self.ruleset.patterns)} 个大类")
+        if self.ruleset.vocabulary:
+            logger.info(f"已加载词汇库，包含 {len(self.ruleset.vocabulary)} 个类别")
+
+    @property
+    def ruleset(self):
+        """当前规则集快照"""
+        return self.ruleset_manager.current
+
+    @property
+    def patterns(self):
+        """风险模式定义"""
+        return self.ruleset.patterns
+
+    @property
+    def pattern_to_category(self):
+        """模式ID到大类的映射"""
+        return self.ruleset.pattern_to_category
+
+    @property
+    def pattern_to_name(self):
+        """模式ID到名称的映射"""
+        return self.ruleset.pattern_to_name
+
+    @property
+    def pattern_to_desc(self):
+        """模式ID到描述的映射"""
+        return self.ruleset.pattern_to_desc
+
+    @property
+    def vocabulary(self):
+        """词汇库"""
+        return self.ruleset.vocabulary
+
+    def enable_hot_reload(self, poll_interval=None):
+        """
+        启动规则集热加载，模式库或配置文件变化时在后台重新构建
+        
+        Args:
+            poll_interval (float, optional): 轮询间隔（秒）
+        """
+        self.ruleset_manager.start(poll_interval)
+
+    def disable_hot_reload(self):
+        """停止规则集热加载"""
+        self.ruleset_manager.stop()
+
+    def enable_metrics(self, metrics=None):
+        """
+        开启阶段计时，检测结果的 metrics 属性包含本次请求的各阶段耗时和计数
+        
+        Args:
+            metrics (MetricsRegistry, optional): 指标汇总，默认新建
+        
+        Returns:
+            MetricsRegistry: 使用的指标汇总
+        """
+        self.metrics = metrics or MetricsRegistry()
+        return self.metrics
+
+    def disable_metrics(self):
+        """关闭阶段计时"""
+        self.metrics = None
+
+    def enable_prefilter(self):
+        """
+        开启预筛选，会话内容不包含规则集中的任何词汇、也没有出现 roles.json 角色规则中的角色时，
+        跳过语义网络和多角色分析，直接返回无风险结果
+
+        只依赖角色交互顺序或话题转移、不含任何规则词汇的多角色风险会被跳过。
+
+        Returns:
+            PrefilterStats: 预筛选计数
+        """
+        self.prefilter_enabled = True
+        return self.prefilter_stats
+
+    def disable_prefilter(self):
+        """关闭预筛选"""
+        self.prefilter_enabled = False
+
+    def enable_similarity(self):
+        """
+        开启模式相似度检索，检测结果的 similar_patterns 列出与各回合最相似的风险模式
+
+        相似度按字符 n 元组 TF-IDF 计算，只作为参考证据，不影响是否检测到风险和风险分数。
+        返回数量和相似度下限可在 semantic.json 的 pattern_similarity 中配置:
+        {"top_k": 3, "min_score": 0.05, "ngram_sizes": [2, 3], "hash_bits": 20}
+        配置 "example_index"（build-index 命令生成的目录）后，同时近似检索标注的风险示例库，
+        "probes" 为查询时探查的倒排列表数。
+        """
+        self.similarity_enabled = True
+
+    def disable_similarity(self):
+        """关闭模式相似度检索"""
+        self.similarity_enabled = False
+
+    def create_temporal_tracker(self):
+        """
+        创建时序规则状态机，用于实时会话逐轮检测时序依赖类模式
+
+        状态机绑定创建时的规则集快照，热加载后需要重新创建。
+
+        Returns:
+            TemporalTracker: 时序规则状态机，逐轮调用 add_turn(role, content)
+        """
+        return self.ruleset.rule_engine.create_temporal_tracker()
+
     # def detect_conversation_risks(self, conversation):
     #     """
     #     检测会话中的风险，包括风险类别和风险模式
@@ -128,88 +219,66 @@ class RiskDetector:
     #         "risk_summary": risk_summary
     #     }
 
-    def _detect_risk_categories(self, texts):
+    def _detect_risk_categories(self, texts, ruleset=None, diagnostics=None, hits=None):
         """
         检测文本中的风险类别 - 增强版本，支持所有wiki_scraper.py中的风险类别
         使用更丰富的口语化、书面语词汇，涵盖各种词性
         
+        每个类别的关键词预先转换为全局词汇表上的位集，与会话命中位集做一次位与即可判断。
+        
         Args:
             texts (list): 文本列表
+            ruleset (Ruleset, optional): 使用的规则集，默认为当前规则集
+            diagnostics (ConversationDiagnostics, optional): 会话诊断信息，累加命中计数
+            hits (HitIndex, optional): 已建立的会话命中索引，未提供时扫描texts
             
         Returns:
-            list: 检测到的风险类别列表
+            list: 检测到的风险类别列表，按配置顺序
         """
-        # 使用集合存储检测结果，避免重复
-        detected_categories = set()
-        
-        # 从配置文件加载风险类别关键词
-        risk_categories_keywords = self.config_loader.load_config("risk_categories_keywords.json")
+        ruleset = ruleset or self.ruleset
         
         # 如果配置文件不存在或为空，使用默认关键词并保存到配置文件
-        if not risk_categories_keywords:
+        if not ruleset.risk_category_keywords:
             logger.info("风险类别关键词配置不存在，使用默认配置并保存")
             exit(0)
         
-        # 遍历所有文本，检测风险类别
-        for text in texts:
-            text = text.strip()
-            if not text:
-                continue
-            
-            # 遍历所有风险类别及其关键词
-            for category, keywords in risk_categories_keywords.items():
-                # 如果已经检测到该类别，则跳过
-                if category in detected_categories:
-                    continue
-                
-                # 检测关键词匹配（支持词语拆分和重组）
-                for keyword in keywords:
-                    # 使用正则表达式检测关键词，支持中英文混合匹配
-                    pattern = re.compile(r"\b" + re.escape(keyword) + r"\b", re.IGNORECASE)
-                    if pattern.search(text):
-                        detected_categories.add(category)
-                        logger.info(f"检测到风险类别: {category} (文本: {text})")
-                        break  # 跳出关键词循环，继续检测下一个文本
-        
-        return list(detected_categories)
+        # 扫描一遍文本得到命中位集：中文按子串匹配，拉丁字母关键词检查单词边界
+        term_index = ruleset.term_index
+        if hits is None:
+            hits = term_index.scan([text if text.strip() else None for text in texts])
+        union = hits.union
+        
+        detected_categories = []
+        for category, mask in ruleset.category_masks:
+            matched = union & mask
+            if matched:
+                detected_categories.append(category)
+                if diagnostics is not None:
+                    diagnostics.add("category_hits")
+                hit_logger.debug("risk_category_hit", category=category, keyword=term_index.first_term(matched))
+        
+        return detected_categories
     
     def _load_risk_patterns(self):
         """
         加载风险模式库
         """
-        try:
-            patterns_path = os.path.join(self.data_dir, "risk_patterns.json")
-            if os.path.exists(patterns_path):
-                with open(patterns_path, 'r', encoding='utf-8') as f:
-                    self.patterns = json.load(f)
-                    
-                # 构建模式ID到大类和名称的映射
-                self.pattern_to_category = {}
-                self.pattern_to_name = {}
-                self.pattern_to_desc = {}
-                
-                for category, patterns_list in self.patterns.items():
-                    if isinstance(patterns_list, list):
-                        for pattern in patterns_list:
-                            if isinstance(pattern, dict) and "id" in pattern:
-                                pattern_id = pattern["id"]
-                                self.pattern_to_category[pattern_id] = category
-                                self.pattern_to_name[pattern_id] = pattern.get("name", pattern_id)
-                                self.pattern_to_desc[pattern_id] = pattern.get("description", "")
-                
-                logger.info(f"成功加载风险模式库，共 {len(self.patterns)} 个大类，"
-                          f"{sum(len(patterns_list) if isinstance(patterns_list, list) else 0 for patterns_list in self.patterns.values())} 个模式")
-                return True
-            else:
-                logger.warning(f"风险模式库文件不存在: {patterns_path}")
-                self.patterns = {}
-                return False
-        except Exception as e:
-            logger.error(f"加载风险模式库失败: {str(e)}")
-            self.patterns = {}
+        patterns_path = os.path.join(self.data_dir, "risk_patterns.json")
+        if not os.path.exists(patterns_path):
+            logger.warning(f"风险模式库文件不存在: {patterns_path}")
+            return False
+        
+        self.ruleset_manager.set_sources(patterns_file=patterns_path)
+        if not self.patterns:
+            logger.error(f"加载风险模式库失败: {patterns_path}")
             return False
+        
+        logger.info(f"成功加载风险模式库，共 {len(self.patterns)} 个大类，"
+                  f"{self.ruleset.pattern_count} 个模式")
+        return True
 
-    def _detect_risk_patterns_with_details(self, conversation, risk_categories):
+    def _detect_risk_patterns_with_details(self, conversation, risk_categories, ruleset=None, diagnostics=None,
+                                           hits=None):
         """
         检测会话中的风险模式，并提供细粒度风险模式详情
         支持多角色会话场景
@@ -217,34 +286,54 @@ class RiskDetector:
         Args:
             conversation (list): 会话列表，格式为 [{"role": "...", "content": "..."}, ...]
             risk_categories (list): 风险类别列表
+            ruleset (Ruleset, optional): 使用的规则集，默认为当前规则集
+            diagnostics (ConversationDiagnostics, optional): 会话诊断信息，累加命中计数
+            hits (HitIndex, optional): 已建立的会话命中索引，未提供时扫描会话
             
         Returns:
             tuple: (风险模式列表, 细粒度风险模式详情字典)
         """
-        logger.info("开始检测风险模式...")
+        ruleset = ruleset or self.ruleset
         
         detected_patterns = []
         detailed_patterns = defaultdict(list)
         
         # 检查patterns是否为空
-        if not self.patterns:
+        if not ruleset.patterns:
             logger.warning("风险模式库为空，跳过风险模式检测")
             return detected_patterns, detailed_patterns
         
         # 提取所有会话角色
         conversation_roles = set(turn.get("role", "") for turn in conversation 
                            if isinstance(turn, dict) and "role" in turn)
-        logger.info(f"检测到会话中的角色: {', '.join(conversation_roles)}")
+        if diagnostics is not None:
+            diagnostics.set("roles", len(conversation_roles))
+
+        # 扫描一遍会话得到各回合的命中位集，模式关键词、detection_rules 共现规则和时序规则都在位集上求值
+        term_index = ruleset.term_index
+        rule_engine = ruleset.rule_engine
+        if hits is None:
+            hits = term_index.scan(turn_contents(conversation), token_positions=rule_engine.needs_tokens)
+        rule_matches = rule_engine.evaluate(
+            hits, [turn.get("role", "") if isinstance(turn, dict) else "" for turn in conversation]
+        )
+        pattern_masks = ruleset.pattern_masks
+        detected_ids = set()
+
+        # 允许任何角色，不限于user和assistant，但没有角色的回合不参与模式检测
+        role_turns = [i for i, turn in enumerate(conversation) if isinstance(turn, dict) and turn.get("role", "")]
+        if len(role_turns) == len(conversation):
+            role_turns = None
         
         # 遍历所有风险模式大类
-        for pattern_category, pattern_list in self.patterns.items():
+        for pattern_category, pattern_list in ruleset.patterns.items():
             # 确保pattern_list是列表
             if not isinstance(pattern_list, list):
                 logger.warning(f"风险模式类别 {pattern_category} 格式错误，应为列表而非 {type(pattern_list)}")
                 continue
             
             # 遍历该大类下的所有风险模式
-            for pattern_item in pattern_list:
+            for pattern_item, mask in zip(pattern_list, pattern_masks[pattern_category]):
                 # 确保pattern_item是字典
                 if not isinstance(pattern_item, dict):
                     logger.warning(f"风险模式项格式错误，应为字典而非 {type(pattern_item)}")
@@ -252,49 +341,40 @@ class RiskDetector:
                 
                 pattern_id = pattern_item.get("id")
                 pattern_name = pattern_item.get("name", pattern_id)
-                pattern_keywords = pattern_item.get("keywords", [])
-                
-                if not pattern_id or not pattern_keywords:
-                    continue
                 
                 # 检查该模式是否已被检测到
-                if pattern_id in detected_patterns:
+                if not pattern_id or pattern_id in detected_ids:
                     continue
             
-                # 遍历会话中的每个回合
-                for i, turn in enumerate(conversation):
-                    # 确保turn是字典
-                    if not isinstance(turn, dict):
-                        continue
-                        
-                    role = turn.get("role", "")
-                    content = turn.get("content", "").strip()
-                    
-                    if not content or not role:  # 允许任何角色，不限于user和assistant
+                # 模式关键词命中的最早回合，关键词未命中时检查共现规则，
+                # 标记 variant_evidence 的模式（如文化规避类的谐音、拼音表达）再检查读音变体命中，
+                # 只计入模式自身关键词和风险类别关键词的变体，普通词汇的变体不是规避写法
+                turn_index = hits.first_turn(mask, role_turns) if mask else None
+                if turn_index is not None:
+                    counter, event = "pattern_hits", "risk_pattern_hit"
+                    keyword = term_index.first_term(hits.turn_masks[turn_index] & mask)
+                elif pattern_id in rule_matches:
+                    turn_index = rule_matches[pattern_id]
+                    counter, event, keyword = "rule_hits", "risk_rule_hit", None
+                else:
+                    variant_hit = hits.first_variant(role_turns, mask | ruleset.risk_term_mask) \
+                        if pattern_item.get("variant_evidence") else None
+                    if variant_hit is None:
                         continue
-                    
-                    # 检测模式关键词
-                    detected = False
-                    for keyword in pattern_keywords:
-                        if not isinstance(keyword, str):
-                            continue
-                            
-                        if keyword.lower() in content.lower():
-                            detected_patterns.append(pattern_id)
-                            detailed_patterns[pattern_id].append({
-                                "turn": i + 1,
-                                "role": role,
-                                "content": content,
-                                "category": pattern_category,  # 记录大类信息
-                                "name": pattern_name  # 记录模式名称
-                            })
-                            logger.info(f"检测到风险模式: {pattern_id} ({pattern_name}) - 大类: {pattern_category} "
-                                      f"(回合 {i+1}, 角色: {role})")
-                            detected = True
-                            break
-                
-                    if detected:
-                        break  # 如果已经检测到该模式，则跳出回合循环
+                    turn_index, _, keyword = variant_hit
+                    counter, event = "variant_hits", "risk_variant_hit"
+
+                role = conversation[turn_index].get("role", "")
+                detected_patterns.append(pattern_id)
+                detected_ids.add(pattern_id)
+                # 只记录回合索引，内容在需要时从会话中读取
+                detailed_patterns[pattern_id].append(PatternHit(
+                    pattern_id, turn_index, role, pattern_category, pattern_name, conversation
+                ))
+                if diagnostics is not None:
+                    diagnostics.add(counter)
+                hit_logger.debug(event, pattern=pattern_id, category=pattern_category,
+                                 turn=turn_index + 1, role=role, keyword=keyword)
     
         return detected_patterns, detailed_patterns
 
@@ -515,9 +595,14 @@ class RiskDetector:
             conversation (list): 会话列表，格式为 [{"role": "...", "content": "..."}, ...]
         
         Returns:
-            dict: 风险检测结果
+            DetectionResult: 风险检测结果，可按字典方式访问，to_dict()得到完整字典
         """
-        logger.info("开始检测会话风险...")
+        # 阶段计时关闭时使用空计时器，不读取时钟
+        metrics = self.metrics
+        timer = metrics.new_timer() if metrics is not None else NULL_TIMER
+        
+        # 取得规则集快照，整个请求使用同一版本，热加载不影响进行中的检测
+        ruleset = self.ruleset
 
         # 提取所有文本内容
         texts = []
@@ -527,17 +612,51 @@ class RiskDetector:
                 if content:
                     texts.append(content)
 
+        timer.count("turns", len(conversation))
+        timer.count("texts", len(texts))
+        timer.lap("prepare")
+
+        diagnostics = ConversationDiagnostics()
+
+        # 预筛选：没有命中任何词汇的会话不进入后续检测
+        if self.prefilter_enabled:
+            passed = ruleset.prefilter.should_analyze(conversation)
+            self.prefilter_stats.record(passed)
+            timer.count("prefilter_checked")
+            timer.count("prefilter_passed", int(passed))
+            timer.lap("prefilter")
+            if not passed:
+                return self._prefiltered_result(conversation, ruleset, timer, diagnostics)
+
+        # 扫描一遍会话建立关键词命中索引，风险类别和风险模式阶段共用
+        hits = ruleset.term_index.scan(turn_contents(conversation),
+                                       token_positions=ruleset.rule_engine.needs_tokens)
+        timer.count("term_hits", len(hits))
+        timer.lap("scan")
+
         # 检测风险类别
-        risk_categories = self._detect_risk_categories(texts)
+        risk_categories = self._detect_risk_categories(texts, ruleset, diagnostics, hits)
+        timer.lap("categories")
 
         # 检测风险模式
-        risk_patterns, detailed_patterns = self._detect_risk_patterns_with_details(conversation, risk_categories)
+        risk_patterns, detailed_patterns = self._detect_risk_patterns_with_details(
+            conversation, risk_categories, ruleset, diagnostics, hits)
+        timer.lap("patterns")
+
+        # 检索与各回合最相似的风险模式
+        similar_patterns = None
+        if self.similarity_enabled:
+            similar_patterns = self._detect_similar_patterns(conversation, ruleset)
+            timer.count("similar_patterns", len(similar_patterns))
+            timer.lap("similarity")
 
         # 检测分散式风险内容（新增）
-        semantic_risks = self._detect_semantic_risks(conversation)
+        semantic_risks = self._detect_semantic_risks(conversation, ruleset)
+        timer.lap("semantic")
         
         # 检测多角色风险模式（新增）
-        multi_role_risks = self._detect_multi_role_risks(conversation)
+        multi_role_risks = self._detect_multi_role_risks(conversation, ruleset, timer)
+        timer.lap("multi_role")
 
         # 合并风险检测结果
         detected = (
@@ -555,8 +674,9 @@ class RiskDetector:
                 if pattern_id not in combined_risk_patterns:
                     combined_risk_patterns.append(pattern_id)
         
-        # 生成风险摘要（包含多角色和分散式风险）
-        risk_summary = self._generate_enhanced_risk_summary(
+        # 风险摘要（包含多角色和分散式风险）在首次访问时才生成
+        summary_renderer = functools.partial(
+            self._generate_enhanced_risk_summary,
             risk_categories, 
             combined_risk_patterns, 
             detailed_patterns,
@@ -564,23 +684,135 @@ class RiskDetector:
             multi_role_risks
         )
 
-        return {
-            "detected": detected,
-            "risk_categories": risk_categories,
-            "risk_patterns": combined_risk_patterns,
-            "detailed_patterns": detailed_patterns,
-            "risk_summary": risk_summary,
-            "semantic_risks": semantic_risks,
-            "multi_role_risks": multi_role_risks
+        timer.count("risk_categories", len(risk_categories))
+        timer.count("risk_patterns", len(combined_risk_patterns))
+        timer.lap("merge")
+        if metrics is not None:
+            metrics.observe(timer)
+
+        # 每个会话输出一条汇总日志，代替逐条命中日志
+        diagnostics.set("turns", len(conversation))
+        diagnostics.set("categories", len(risk_categories))
+        diagnostics.set("patterns", len(combined_risk_patterns))
+        diagnostics.set("semantic_detected", bool(semantic_risks.get("detected", False)))
+        diagnostics.set("multi_role_score", multi_role_risks.get("risk_score", 0))
+        diagnostics.set("ruleset_version", ruleset.version)
+        diagnostics.emit(logger, "conversation_risk_detected" if detected else "conversation_clean")
+
+        return DetectionResult(
+            detected=detected,
+            risk_categories=risk_categories,
+            risk_patterns=combined_risk_patterns,
+            pattern_hits=detailed_patterns,
+            semantic_risks=semantic_risks,
+            multi_role_risks=multi_role_risks,
+            summary_renderer=summary_renderer,
+            ruleset_version=ruleset.version,
+            metrics=timer.as_dict(),
+            similar_patterns=similar_patterns
+        )
+
+    def _prefiltered_result(self, conversation, ruleset, timer, diagnostics):
+        """生成预筛选未命中时的无风险结果"""
+        semantic_risks = {
+            "detected": False,
+            "overall_risk_score": 0.0,
+            "risk_level": "none",
+            "dangerous_combinations": [],
+            "information_flow_risks": [],
+            "role_based_risks": {}
+        }
+        multi_role_risks = {
+            "multi_role_risk_detected": False,
+            "risk_score": 0,
+            "risk_patterns": [],
+            "details": "预筛选未命中任何风险词汇，跳过多角色分析"
         }
+        summary_renderer = functools.partial(
+            self._generate_enhanced_risk_summary, [], [], {}, semantic_risks, multi_role_risks)
 
-    def _detect_semantic_risks(self, conversation):
+        if self.metrics is not None:
+            self.metrics.observe(timer)
+
+        diagnostics.set("turns", len(conversation))
+        diagnostics.set("prefiltered", True)
+        diagnostics.set("ruleset_version", ruleset.version)
+        diagnostics.emit(logger, "conversation_clean")
+
+        return DetectionResult(
+            detected=False,
+            risk_categories=[],
+            risk_patterns=[],
+            pattern_hits={},
+            semantic_risks=semantic_risks,
+            multi_role_risks=multi_role_risks,
+            summary_renderer=summary_renderer,
+            ruleset_version=ruleset.version,
+            metrics=timer.as_dict(),
+            similar_patterns=[] if self.similarity_enabled else None
+        )
+
+    def _detect_similar_patterns(self, conversation, ruleset=None):
+        """
+        检索与各回合最相似的风险模式
+
+        Args:
+            conversation (list): 会话列表
+            ruleset (Ruleset, optional): 规则集快照
+
+        Returns:
+            list: [{"turn", "role", "pattern_id", "name", "score"}]，按回合顺序，同一回合按相似度从高到低
+        """
+        from .similarity import DEFAULT_MIN_SCORE, DEFAULT_TOP_K
+
+        ruleset = ruleset or self.ruleset
+        index = ruleset.pattern_similarity
+        options = ruleset.similarity_options
+        top_k = options.get("top_k", DEFAULT_TOP_K)
+        min_score = options.get("min_score", DEFAULT_MIN_SCORE)
+        contents = turn_contents(conversation)
+        matches = index.query(contents, top_k, min_score)
+
+        # 配置了标注示例索引时，合并近似检索到的示例：同一模式取最高相似度，再按相似度重新取前 top_k 个
+        example_index = ruleset.example_index
+        if example_index is not None:
+            from .ann_index import DEFAULT_PROBES
+            labels = example_index.labels
+            # 同一模式的多条示例可能同时命中，多取一些候选
+            example_matches = example_index.search(contents, top_k * 4, options.get("probes", DEFAULT_PROBES))
+            merged = []
+            for turn_matches, turn_examples in zip(matches, example_matches):
+                best = dict(turn_matches)
+                for example, score in turn_examples:
+                    pattern_id = labels[example]
+                    if score >= min_score and score > best.get(pattern_id, 0):
+                        best[pattern_id] = score
+                merged.append(sorted(best.items(), key=lambda item: -item[1])[:top_k])
+            matches = merged
+
+        similar = []
+        for turn_index, turn_matches in enumerate(matches):
+            turn = conversation[turn_index]
+            role = turn.get("role", "unknown") if isinstance(turn, dict) else "unknown"
+            for pattern_id, score in turn_matches:
+                similar.append({
+                    "turn": turn_index + 1,
+                    "role": role,
+                    "pattern_id": pattern_id,
+                    "name": ruleset.pattern_to_name.get(pattern_id, pattern_id),
+                    "score": score
+                })
+        return similar
+
+    def _detect_semantic_risks(self, conversation, ruleset=None):
         """检测语义网络风险模式"""
         try:
             from .semantic_analyzer import SemanticNetworkAnalyzer
             
+            ruleset = ruleset or self.ruleset
+            
             # 创建语义网络分析器实例
-            analyzer = SemanticNetworkAnalyzer(risk_vocabulary=self.vocabulary)
+            analyzer = SemanticNetworkAnalyzer(risk_vocabulary=ruleset.vocabulary, ruleset=ruleset)
             
             # 构建语义网络
             semantic_graph = analyzer.build_semantic_network(conversation)
@@ -596,16 +828,16 @@ class RiskDetector:
             traceback.print_exc()
             return {"detected": False, "error": str(e)}
 
-    def _detect_multi_role_risks(self, conversation):
+    def _detect_multi_role_risks(self, conversation, ruleset=None, timer=NULL_TIMER):
         """检测多角色互动风险模式"""
         try:
             from .multi_role_detector import MultiRolePatternDetector
             
             # 创建多角色风险检测器实例
-            detector = MultiRolePatternDetector(risk_detector=self)
+            detector = MultiRolePatternDetector(risk_detector=self, ruleset=ruleset or self.ruleset)
             
-            # 检测多角色风险
-            multi_role_risks = detector.detect_multi_role_risks(conversation)
+            # 检测多角色风险，子阶段耗时记录为 multi_role.<阶段>
+            multi_role_risks = detector.detect_multi_role_risks(conversation, timer=timer.child("multi_role"))
             
             return multi_role_risks
             
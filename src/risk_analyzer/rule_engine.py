@@ -0,0 +1,236 @@
+import logging
+
+from .temporal_rules import TemporalRule, TemporalTracker, temporal_rule_steps
+from .term_index import TermIndex, turn_contents
+
+logger = logging.getLogger(__name__)
+
+# 未在模式中配置 rule_window 时的共现窗口：命中需落在连续3个回合内
+DEFAULT_RULE_WINDOW = {"unit": "turn", "size": 3}
+RULE_WINDOW_UNITS = ("turn", "token")
+
+
+def rule_keywords(patterns):
+    """
+    收集模式 detection_rules 和 temporal_rule 中的全部关键词
+
+    Args:
+        patterns (dict): 风险模式定义 {大类: [模式]}
+
+    Returns:
+        list: 关键词，按出现顺序
+    """
+    keywords = []
+    for patterns_list in patterns.values():
+        if not isinstance(patterns_list, list):
+            continue
+        for pattern in patterns_list:
+            if not isinstance(pattern, dict):
+                continue
+            for group in (pattern.get("detection_rules") or {}).values():
+                if isinstance(group, list):
+                    keywords.extend(k for k in group if isinstance(k, str))
+            temporal_rule = pattern.get("temporal_rule")
+            if isinstance(temporal_rule, dict):
+                for step in temporal_rule.get("steps", []):
+                    if isinstance(step, dict) and isinstance(step.get("keywords"), list):
+                        keywords.extend(k for k in step["keywords"] if isinstance(k, str))
+    return keywords
+
+
+class PatternRule:
+    """
+    模式的共现规则
+
+    detection_rules 中的每个关键词组都至少命中一个关键词，且所有命中落在同一窗口内时规则成立。
+    """
+
+    __slots__ = ("pattern_id", "category", "name", "groups", "masks", "unit", "size")
+
+    def __init__(self, pattern_id, category, name, groups, unit, size):
+        """
+        初始化规则
+
+        Args:
+            pattern_id (str): 模式ID
+            category (str): 模式大类
+            name (str): 模式名称
+            groups (list): 各关键词组的关键词编号集合
+            unit (str): 窗口单位，"turn" 按回合，"token" 按词
+            size (int): 窗口大小
+        """
+        self.pattern_id = pattern_id
+        self.category = category
+        self.name = name
+        self.groups = groups
+        # 各关键词组的位集，任一组在会话中没有命中时规则不可能成立
+        self.masks = [sum(1 << keyword_id for keyword_id in group) for group in groups]
+        self.unit = unit
+        self.size = size
+
+    def __repr__(self):
+        return f"PatternRule({self.pattern_id!r}, groups={len(self.groups)}, {self.unit}={self.size})"
+
+
+class RuleEngine:
+    """
+    模式共现规则引擎
+
+    模式 detection_rules 中的关键词编入全局词汇表，每个会话只扫描一遍文本建立命中索引，
+    规则再在索引上按窗口求值，规则数量和关键词组数量增加不会增加对文本的扫描次数。
+
+    模式可以通过 rule_window 配置窗口，例如 {"unit": "token", "size": 30}。
+    有时序规则的模式（时序依赖类或配置了 temporal_rule，见 temporal_rule_steps）不按共现窗口求值，
+    而是按步骤顺序在回合流上单遍求值。
+    """
+
+    def __init__(self, patterns, term_index, default_window=None):
+        """
+        初始化规则引擎
+
+        Args:
+            patterns (dict): 风险模式定义 {大类: [模式]}
+            term_index (TermIndex|Tokenizer): 全局词汇表，需包含规则关键词（见 rule_keywords）；
+                传入分词器时只用规则关键词新建词汇表
+            default_window (dict, optional): 默认窗口 {"unit", "size"}
+        """
+        if not isinstance(term_index, TermIndex):
+            term_index = TermIndex(rule_keywords(patterns), term_index)
+        self.term_index = term_index
+        default_window = default_window or DEFAULT_RULE_WINDOW
+
+        rule_specs = []
+        self.temporal_rules = []
+        for category, patterns_list in patterns.items():
+            if not isinstance(patterns_list, list):
+                continue
+            for pattern in patterns_list:
+                if not isinstance(pattern, dict) or not pattern.get("id"):
+                    continue
+                steps = temporal_rule_steps(pattern, category)
+                if steps:
+                    self.temporal_rules.append(TemporalRule(
+                        pattern["id"], category, pattern.get("name", pattern["id"]),
+                        [(term_index.mask(keywords), within, role) for keywords, within, role in steps]
+                    ))
+                    continue
+                groups = []
+                for keywords in (pattern.get("detection_rules") or {}).values():
+                    if not isinstance(keywords, list):
+                        continue
+                    group = set()
+                    for keyword in keywords:
+                        keyword_id = term_index.term_id(keyword)
+                        if keyword_id is not None:
+                            group.add(keyword_id)
+                    if group:
+                        groups.append(group)
+                if not groups:
+                    continue
+                window = pattern.get("rule_window") or default_window
+                unit = window.get("unit", DEFAULT_RULE_WINDOW["unit"])
+                if unit not in RULE_WINDOW_UNITS:
+                    logger.warning(f"模式 {pattern['id']} 的窗口单位 {unit} 无效，使用按回合计算")
+                    unit = "turn"
+                rule_specs.append((pattern["id"], category, pattern.get("name", pattern["id"]),
+                                   groups, unit, int(window.get("size", DEFAULT_RULE_WINDOW["size"]))))
+
+        self.rules = [PatternRule(*spec) for spec in rule_specs]
+        # 有按词计算窗口的规则时，扫描需要计算词位置
+        self.needs_tokens = any(rule.unit == "token" for rule in self.rules)
+
+    def build_index(self, conversation):
+        """
+        扫描会话建立命中索引
+
+        Args:
+            conversation (list): 会话列表，格式为 [{"role": "...", "content": "..."}, ...]
+
+        Returns:
+            HitIndex: 命中索引
+        """
+        return self.term_index.scan(turn_contents(conversation), token_positions=self.needs_tokens)
+
+    def create_temporal_tracker(self):
+        """
+        创建时序规则状态机，用于实时会话逐轮检测
+
+        Returns:
+            TemporalTracker: 时序规则状态机
+        """
+        return TemporalTracker(self.temporal_rules, self.term_index)
+
+    def evaluate(self, index, roles=None):
+        """
+        在命中索引上求值全部规则
+
+        Args:
+            index (HitIndex): 命中索引
+            roles (list, optional): 各回合角色，与索引回合一一对应；不提供时不求值时序规则
+
+        Returns:
+            dict: {模式ID: 回合下标}，共现规则为满足规则的最早窗口中最后一个命中所在的回合，
+                时序规则为最后一步命中的回合
+        """
+        matched = {}
+        positions = index.positions
+        union = index.union
+        if not union:
+            return matched
+
+        if roles is not None and self.temporal_rules:
+            tracker = self.create_temporal_tracker()
+            for turn, mask in enumerate(index.turn_masks):
+                if mask:
+                    tracker.feed(mask, roles[turn], turn)
+            matched.update(tracker.matches)
+
+        for rule in self.rules:
+            # 位集检查：任一关键词组在整个会话中都没有命中时跳过
+            if not all(union & mask for mask in rule.masks):
+                continue
+            events = [(hit, group_index)
+                      for group_index, group in enumerate(rule.groups)
+                      for keyword_id in group
+                      for hit in positions.get(keyword_id, ())]
+            turn = self._first_window(events, len(rule.groups), rule.unit, rule.size)
+            if turn is not None:
+                matched[rule.pattern_id] = turn
+        return matched
+
+    @staticmethod
+    def _first_window(events, group_count, unit, size):
+        """
+        查找覆盖全部关键词组的最早窗口
+
+        Args:
+            events (list): [((回合, 词位置), 组下标)]
+            group_count (int): 关键词组数量
+            unit (str): 窗口单位
+            size (int): 窗口大小
+
+        Returns:
+            int: 窗口中最后一个命中所在的回合，不存在时返回None
+        """
+        axis = 0 if unit == "turn" else 1
+        # 按回合计算时 size 个连续回合的跨度为 size-1
+        span = size - 1 if unit == "turn" else size
+        events.sort(key=lambda event: event[0][axis])
+
+        counts = [0] * group_count
+        covered = 0
+        left = 0
+        for hit, group_index in events:
+            if counts[group_index] == 0:
+                covered += 1
+            counts[group_index] += 1
+            # 收缩左边界，保证窗口跨度不超过限制
+            while hit[axis] - events[left][0][axis] > span:
+                left_group = events[left][1]
+                counts[left_group] -= 1
+                if counts[left_group] == 0:
+                    covered -= 1
+                left += 1
+            if covered == group_count:
+                return hit[0]
+        return None
@@ -0,0 +1,650 @@
+import os
+import time
+import logging
+import threading
+from ..utils.config import ConfigLoader
+from ..utils import serialization
+from .tokenizer import Tokenizer
+from .prefilter import ConversationPrefilter, RoutedKeywordAutomaton
+from .rule_engine import RuleEngine, rule_keywords
+from .term_index import TermIndex
+from .filler import FillerTable
+from .phonetic import VariantExpander
+from .concept_graph import CombinationIndex, ConceptGraph
+from .normalization import normalize_text
+
+logger = logging.getLogger(__name__)
+
+# 规则集依赖的配置文件
+RULESET_CONFIG_FILES = (
+    "risk_categories.json",
+    "risk_categories_keywords.json",
+    "domains.json",
+    "roles.json",
+    "semantic.json",
+)
+
+
+def parse_role_interaction_risk(roles_config):
+    """
+    解析角色交互风险配置
+
+    配置文件中以字符串键"role1,role2"存储，转换为元组键(role1, role2)
+
+    Args:
+        roles_config (dict): roles.json配置内容
+
+    Returns:
+        dict: {(role1, role2): 风险值}
+    """
+    role_interaction_risk = {}
+    for key_str, value in roles_config.get("role_interaction_risk", {}).items():
+        roles = key_str.split(",")
+        if len(roles) == 2:
+            role_interaction_risk[(roles[0], roles[1])] = value
+    return role_interaction_risk
+
+
+def normalize_keyword_lists(keyword_lists):
+    """
+    预先归一化按主题分组的关键词，逐回合匹配时不再重复归一化
+
+    Args:
+        keyword_lists (dict): {主题: [关键词]}
+
+    Returns:
+        dict: {主题: [(关键词, 归一化形式)]}，保持配置中的顺序和重复项
+    """
+    return {topic: [(keyword, normalize_text(keyword)) for keyword in keywords]
+            for topic, keywords in keyword_lists.items()}
+
+
+# roles.json 未配置时使用的高风险角色组合和敏感角色
+DEFAULT_HIGH_RISK_COMBINATIONS = [
+    {"roles": ["chemistry_student", "electronics_expert"], "score": 0.8},
+    {"roles": ["chemistry_student", "mechanical_engineer"], "score": 0.7},
+    {"roles": ["mining_engineer", "electronics_expert"], "score": 0.9},
+    {"roles": ["chemistry_teacher", "hobbyist"], "score": 0.6}
+]
+
+DEFAULT_SENSITIVE_ROLES = {
+    "chemistry_student": 0.5,
+    "mining_engineer": 0.6,
+    "hobbyist": 0.4,
+    "anonymous": 0.7
+}
+
+
+class RoleRuleIndex:
+    """
+    角色规则索引
+
+    角色交互风险按角色对建立哈希表，高风险角色组合按组合中的第一个角色建立倒排索引，
+    检测时只查找与会话中出现的角色相关的规则，耗时与规则总数无关。
+    匹配结果按配置文件中的顺序返回。
+    """
+
+    __slots__ = ("interaction_risk", "combinations", "sensitive_roles", "_pair_order", "_combinations_by_role")
+
+    def __init__(self, roles_config):
+        """
+        构建索引
+
+        Args:
+            roles_config (dict): roles.json配置内容
+        """
+        self.interaction_risk = parse_role_interaction_risk(roles_config)
+        self._pair_order = {pair: i for i, pair in enumerate(self.interaction_risk)}
+
+        self.combinations = []
+        self._combinations_by_role = {}
+        for combo in roles_config.get("high_risk_combinations", DEFAULT_HIGH_RISK_COMBINATIONS):
+            roles = combo.get("roles") or []
+            if not roles:
+                continue
+            self._combinations_by_role.setdefault(roles[0], []).append(len(self.combinations))
+            self.combinations.append(combo)
+
+        self.sensitive_roles = dict(roles_config.get("sensitive_roles", DEFAULT_SENSITIVE_ROLES))
+
+    @property
+    def roles(self):
+        """规则中出现的全部角色"""
+        roles = {role for pair in self.interaction_risk for role in pair}
+        for combo in self.combinations:
+            roles.update(combo["roles"])
+        roles.update(self.sensitive_roles)
+        return roles
+
+    def match_interactions(self, edges):
+        """
+        查找有交互的角色对命中的交互风险规则
+
+        Args:
+            edges (iterable): 有交互的 (角色1, 角色2)，方向不限
+
+        Returns:
+            list: [((角色1, 角色2), 风险值)]，按配置顺序
+        """
+        matched = set()
+        for role1, role2 in edges:
+            for pair in ((role1, role2), (role2, role1)):
+                if pair in self._pair_order:
+                    matched.add(pair)
+        return [(pair, self.interaction_risk[pair]) for pair in sorted(matched, key=self._pair_order.get)]
+
+    def match_combinations(self, roles):
+        """
+        查找会话角色完整包含的高风险角色组合
+
+        Args:
+            roles (iterable): 会话中出现的角色
+
+        Returns:
+            list: 组合配置 {"roles": [...], "score": ...}，按配置顺序
+        """
+        roles = set(roles)
+        indexes = []
+        for role in roles:
+            for index in self._combinations_by_role.get(role, ()):
+                if all(r in roles for r in self.combinations[index]["roles"]):
+                    indexes.append(index)
+        return [self.combinations[index] for index in sorted(indexes)]
+
+
+class Ruleset:
+    """
+    规则集快照，包含模式库、词汇库和所有配置文件的内容
+
+    规则集构建完成后不再修改，检测流程在开始时取得当前规则集的引用，
+    整个请求都使用同一个版本，热加载只会替换管理器中的引用。
+    词汇表、规则引擎等编译结构在首次使用时创建，创建过程加锁，并发的首次使用只构建一次；
+    RulesetManager 在替换引用前调用 prepare 预先构建，请求路径上不再有冷启动开销。
+    """
+
+    def __init__(self, version, patterns=None, vocabulary=None, configs=None, sources=None):
+        """
+        初始化规则集
+
+        Args:
+            version (int): 规则集版本号，每次重新构建递增
+            patterns (dict, optional): 风险模式定义 {大类: [模式]}
+            vocabulary (list|dict, optional): 词汇库
+            configs (dict, optional): {配置文件名: 配置内容}
+            sources (dict, optional): {文件路径: 文件指纹}，用于检测文件变化
+        """
+        configs = configs or {}
+        self.version = version
+        self.patterns = patterns or {}
+        self.vocabulary = vocabulary or {}
+        self.sources = sources or {}
+
+        self.risk_categories = configs.get("risk_categories.json", {})
+        self.risk_category_keywords = configs.get("risk_categories_keywords.json", {})
+        self.domains_config = configs.get("domains.json", {})
+        self.roles_config = configs.get("roles.json", {})
+        self.semantic_config = configs.get("semantic.json", {})
+
+        # 预先解析的结构，避免在请求路径上重复处理
+        self.role_rules = RoleRuleIndex(self.roles_config)
+        self.role_interaction_risk = self.role_rules.interaction_risk
+        # 分词器使用规则集中的全部词汇作为词典，各检测阶段共享分词缓存
+        self.tokenizer = Tokenizer(self.dictionary_terms())
+        # 关键词匹配跳过的填充字符（空白、标点、零宽字符等），见 domains.json 的 text_matching
+        self.filler = FillerTable.from_config(self.domains_config.get("text_matching"))
+        # 中文关键词的拼音、首字母和同音字变体，编译词汇表时展开
+        self.variants = VariantExpander.from_config(self.domains_config.get("text_matching"))
+        # 保护延迟创建的结构，可重入：预筛选的构建依赖词汇表
+        self._lock = threading.RLock()
+        self._prefilter = None
+        self._concept_automaton = None
+        self._rule_engine = None
+        self._term_index = None
+        self._category_masks = None
+        self._risk_term_mask = None
+        self._pattern_masks = None
+        self._domain_keyword_lists = None
+        self._pattern_similarity = None
+        self._example_index = None
+        self._example_index_loaded = False
+        self._combination_index = None
+        self._concept_graph = None
+        self._concept_graph_loaded = False
+
+        # 模式ID到大类、名称和描述的映射
+        self.pattern_to_category = {}
+        self.pattern_to_name = {}
+        self.pattern_to_desc = {}
+        for category, patterns_list in self.patterns.items():
+            if not isinstance(patterns_list, list):
+                continue
+            for pattern in patterns_list:
+                if isinstance(pattern, dict) and "id" in pattern:
+                    pattern_id = pattern["id"]
+                    self.pattern_to_category[pattern_id] = category
+                    self.pattern_to_name[pattern_id] = pattern.get("name", pattern_id)
+                    self.pattern_to_desc[pattern_id] = pattern.get("description", "")
+
+    def dictionary_terms(self):
+        """
+        收集规则集中的全部词汇，用作分词词典
+
+        Returns:
+            set: 词汇集合
+        """
+        terms = set()
+        for keywords in self.risk_category_keywords.values():
+            terms.update(keywords)
+        for section in ("domain_keywords", "sensitive_topics"):
+            for keywords in self.domains_config.get(section, {}).values():
+                terms.update(keywords)
+        for keywords in self.roles_config.get("role_specific_contributions", {}).values():
+            terms.update(keywords)
+        terms.update(self.semantic_config.get("technical_terms", []))
+        for combinations in self.semantic_config.get("dangerous_combinations", {}).values():
+            for combination in combinations:
+                terms.update(combination.get("keywords", []))
+        for patterns_list in self.patterns.values():
+            if not isinstance(patterns_list, list):
+                continue
+            for pattern in patterns_list:
+                if isinstance(pattern, dict):
+                    terms.update(k for k in pattern.get("keywords", []) if isinstance(k, str))
+        return terms
+
+    def _lazy(self, attribute, build):
+        """
+        读取延迟创建的结构，尚未创建时加锁构建
+
+        Args:
+            attribute (str): 保存结构的属性名
+            build (callable): 构建函数
+
+        Returns:
+            object: 构建好的结构
+        """
+        value = getattr(self, attribute)
+        if value is None:
+            with self._lock:
+                value = getattr(self, attribute)
+                if value is None:
+                    value = build()
+                    setattr(self, attribute, value)
+        return value
+
+    def _routed_automata(self):
+        """按语言路由的关键词自动机：全局词汇表、预筛选和语义分析技术术语"""
+        return (self.term_index.automaton, self.prefilter.automaton, self.concept_automaton)
+
+    def prepare(self, previous=None):
+        """
+        预先构建检测请求路径上用到的全部编译结构
+
+        按语言路由的子自动机由流量决定是否构建，这里按上一版本已构建的子自动机预先构建相同的部分；
+        相似度索引和示例索引依赖NumPy且默认关闭，仍在首次使用时创建。
+
+        Args:
+            previous (Ruleset, optional): 被替换的上一版本规则集
+
+        Returns:
+            Ruleset: 规则集本身
+        """
+        automata = self._routed_automata()
+        self.rule_engine
+        self.category_masks
+        self.risk_term_mask
+        self.pattern_masks
+        self.domain_keyword_lists
+        self.combination_index
+        self.concept_graph
+        if previous is not None:
+            for automaton, previous_automaton in zip(automata, previous._routed_automata()):
+                for route in previous_automaton.loaded_routes:
+                    automaton.automaton(route)
+        return self
+
+    def _build_prefilter(self):
+        """构建会话预筛选"""
+        terms = self.dictionary_terms()
+        terms.update(self.term_index.automaton.keywords)
+        return ConversationPrefilter(terms, self.role_rules.roles, self.filler)
+
+    @property
+    def prefilter(self):
+        """会话预筛选，由全部词汇（含模式共现规则的关键词及其读音变体）和角色规则中的角色构建，首次使用时创建"""
+        return self._lazy("_prefilter", self._build_prefilter)
+
+    @property
+    def concept_automaton(self):
+        """语义分析技术术语的匹配自动机，首次使用时创建"""
+        return self._lazy("_concept_automaton", lambda: RoutedKeywordAutomaton(
+            self.semantic_config.get("technical_terms", []), self.filler))
+
+    @property
+    def combination_index(self):
+        """语义分析危险组合的查找表，首次使用时创建，概念的命中结果跨会话缓存"""
+        return self._lazy("_combination_index", lambda: CombinationIndex(
+            self.semantic_config.get("dangerous_combinations", {})))
+
+    @property
+    def concept_graph(self):
+        """
+        离线挖掘的概念共现图，首次使用时加载
+
+        由 build-graph 命令从爬取语料构建，路径见 semantic.json 的 concept_graph.path；未配置或加载失败时为 None
+        """
+        if not self._concept_graph_loaded:
+            with self._lock:
+                if not self._concept_graph_loaded:
+                    self._concept_graph = ConceptGraph.from_config(self.semantic_config.get("concept_graph"))
+                    self._concept_graph_loaded = True
+        return self._concept_graph
+
+    @property
+    def rule_engine(self):
+        """模式 detection_rules 的共现规则引擎，首次使用时创建"""
+        return self._lazy("_rule_engine", lambda: RuleEngine(self.patterns, self.term_index))
+
+    def _build_term_index(self):
+        """收集风险关键词并构建全局词汇表"""
+        terms = [keyword for keywords in self.risk_category_keywords.values() for keyword in keywords]
+        for patterns_list in self.patterns.values():
+            if not isinstance(patterns_list, list):
+                continue
+            for pattern in patterns_list:
+                if isinstance(pattern, dict):
+                    terms.extend(pattern.get("keywords", []))
+        terms.extend(rule_keywords(self.patterns))
+        return TermIndex(terms, self.tokenizer, self.filler, self.variants)
+
+    @property
+    def term_index(self):
+        """风险类别关键词、模式关键词和共现规则关键词（含读音变体）的全局词汇表，首次使用时创建"""
+        return self._lazy("_term_index", self._build_term_index)
+
+    @property
+    def category_masks(self):
+        """[(风险类别, 关键词位集)]，按配置顺序"""
+        return self._lazy("_category_masks", lambda: [
+            (category, self.term_index.mask(keywords))
+            for category, keywords in self.risk_category_keywords.items()])
+
+    def _build_risk_term_mask(self):
+        """合并全部风险类别关键词的位集"""
+        mask = 0
+        for _, category_mask in self.category_masks:
+            mask |= category_mask
+        return mask
+
+    @property
+    def risk_term_mask(self):
+        """全部风险类别关键词的位集，读音变体只有属于这些关键词时才作为规避写法的证据"""
+        return self._lazy("_risk_term_mask", self._build_risk_term_mask)
+
+    @property
+    def pattern_masks(self):
+        """{模式大类: [各模式关键词位集]}，与 patterns 中的模式列表一一对应"""
+        return self._lazy("_pattern_masks", lambda: {
+            category: [self.term_index.mask(pattern.get("keywords", [])) if isinstance(pattern, dict) else 0
+                       for pattern in patterns_list]
+            for category, patterns_list in self.patterns.items() if isinstance(patterns_list, list)
+        })
+
+    @property
+    def domain_keyword_lists(self):
+        """{领域: [(关键词, 归一化形式)]}，由 domains.json 的 domain_keywords 预先归一化，供多角色检测逐回合匹配"""
+        return self._lazy("_domain_keyword_lists", lambda: normalize_keyword_lists(
+            self.domains_config.get("domain_keywords", {})))
+
+    @property
+    def similarity_options(self):
+        """模式相似度配置，见 semantic.json 的 pattern_similarity"""
+        return self.semantic_config.get("pattern_similarity", {})
+
+    @property
+    def pattern_similarity(self):
+        """模式名称、描述和示例的字符 n 元组 TF-IDF 相似度索引，首次使用时创建"""
+        return self._lazy("_pattern_similarity", self._build_pattern_similarity)
+
+    def _build_pattern_similarity(self):
+        """构建模式相似度索引"""
+        # 依赖NumPy，只在开启相似度检索时导入
+        from .similarity import NgramHasher, SimilarityIndex, DEFAULT_HASH_BITS, DEFAULT_NGRAM_SIZES
+        options = self.similarity_options
+        hasher = NgramHasher(options.get("ngram_sizes", DEFAULT_NGRAM_SIZES),
+                             options.get("hash_bits", DEFAULT_HASH_BITS), self.filler)
+        return SimilarityIndex.from_patterns(self.patterns, hasher)
+
+    @property
+    def example_index(self):
+        """
+        标注风险示例的近似最近邻索引，首次使用时以内存映射方式打开
+
+        索引目录由 build-index 命令离线构建，路径见 semantic.json 的 pattern_similarity.example_index；
+        未配置或打开失败时为 None，相似度检索只使用模式自身的名称、描述和示例。
+        """
+        if not self._example_index_loaded:
+            with self._lock:
+                if not self._example_index_loaded:
+                    self._example_index = self._load_example_index()
+                    self._example_index_loaded = True
+        return self._example_index
+
+    def _load_example_index(self):
+        """打开配置的示例索引，未配置或打开失败时返回None"""
+        path = self.similarity_options.get("example_index")
+        if not path:
+            return None
+        try:
+            # 依赖NumPy，只在开启相似度检索时导入
+            from .ann_index import ExampleIndex
+            index = ExampleIndex.load(path, self.filler)
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"打开示例索引失败: {path}, 错误: {e}")
+            return None
+        logger.info(f"已打开示例索引: {path}，{index.size} 条示例")
+        return index
+
+    @property
+    def pattern_count(self):
+        """模式总数"""
+        return sum(len(p) for p in self.patterns.values() if isinstance(p, list))
+
+
+def _file_fingerprint(path):
+    """获取文件指纹 (修改时间, 大小)，文件不存在时返回None"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _read_json(path):
+    """读取JSON文件，解析失败时抛出异常"""
+    return serialization.load_file(path)
+
+
+class RulesetManager:
+    """
+    规则集管理器，负责构建规则集并在文件变化时原子替换
+
+    检测请求通过 current 属性获取规则集引用；后台线程轮询文件指纹，
+    发现变化后在请求路径之外重新构建规则集，构建成功后一次性替换引用。
+    正在处理的请求继续使用旧版本，新请求使用新版本。
+    """
+
+    def __init__(self, patterns_file=None, vocabulary_file=None, config_loader=None, poll_interval=2.0):
+        """
+        初始化规则集管理器
+
+        Args:
+            patterns_file (str, optional): 风险模式定义文件路径
+            vocabulary_file (str, optional): 词汇库文件路径
+            config_loader (ConfigLoader, optional): 配置加载器
+            poll_interval (float): 后台轮询文件变化的间隔（秒）
+        """
+        self.patterns_file = patterns_file
+        self.vocabulary_file = vocabulary_file
+        self.config_loader = config_loader or ConfigLoader()
+        self.poll_interval = poll_interval
+
+        self._build_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._listeners = []
+
+        # 初次构建：文件缺失或损坏时使用空配置，与原有加载行为一致
+        self._ruleset = self._build(version=1, strict=False)
+
+    @property
+    def current(self):
+        """当前规则集（引用读取是原子的，无需加锁）"""
+        return self._ruleset
+
+    def _watched_files(self):
+        """返回需要监控的文件路径列表"""
+        paths = [self.config_loader.get_default_config_path(name) for name in RULESET_CONFIG_FILES]
+        for path in (self.patterns_file, self.vocabulary_file):
+            if path:
+                paths.append(path)
+        return paths
+
+    def _snapshot_sources(self):
+        """获取所有监控文件的指纹"""
+        return {path: _file_fingerprint(path) for path in self._watched_files()}
+
+    def _build(self, version, strict=True, previous=None):
+        """
+        从文件构建新的规则集
+
+        Args:
+            version (int): 新规则集的版本号
+            strict (bool): 为True时文件解析失败直接抛出异常，调用方保留旧规则集
+            previous (Ruleset, optional): 将被替换的规则集，新规则集按它已构建的语言子自动机预先构建
+
+        Returns:
+            Ruleset: 新构建的规则集
+        """
+        # 先记录指纹再读取，读取期间文件再次变化时下一轮轮询会重新构建
+        sources = self._snapshot_sources()
+
+        def load(path, default):
+            if not path or sources.get(path) is None:
+                return default
+            try:
+                return _read_json(path)
+            except Exception as e:
+                if strict:
+                    raise
+                logger.error(f"加载规则文件失败: {path}, 错误: {e}")
+                return default
+
+        configs = {}
+        for name in RULESET_CONFIG_FILES:
+            configs[name] = load(self.config_loader.get_default_config_path(name), {})
+
+        patterns = load(self.patterns_file, {})
+
+        vocabulary = {}
+        vocabulary_data = load(self.vocabulary_file, {})
+        if isinstance(vocabulary_data, dict):
+            vocabulary = vocabulary_data.get('vocabulary', {})
+
+        start = time.perf_counter()
+        # 在替换引用之前编译词汇表、规则引擎等结构，新版本的第一个请求不承担构建开销
+        ruleset = Ruleset(version, patterns=patterns, vocabulary=vocabulary,
+                          configs=configs, sources=sources).prepare(previous)
+        logger.info(f"已构建规则集 v{version}，包含 {len(ruleset.patterns)} 个大类，"
+                    f"{ruleset.pattern_count} 个模式，耗时 {time.perf_counter() - start:.2f} 秒")
+        return ruleset
+
+    def has_changes(self):
+        """检查监控的文件自当前规则集构建后是否发生变化"""
+        return self._snapshot_sources() != self._ruleset.sources
+
+    def reload(self, force=False):
+        """
+        文件发生变化时重新构建规则集并原子替换
+
+        Args:
+            force (bool): 为True时即使文件未变化也重新构建
+
+        Returns:
+            bool: 是否替换了规则集
+        """
+        with self._build_lock:
+            if not force and not self.has_changes():
+                return False
+            try:
+                ruleset = self._build(version=self._ruleset.version + 1, previous=self._ruleset)
+            except Exception as e:
+                # 文件可能正在写入，保留旧规则集，等待下一轮轮询
+                logger.warning(f"重新构建规则集失败，继续使用 v{self._ruleset.version}: {e}")
+                return False
+            self._ruleset = ruleset
+
+        for listener in list(self._listeners):
+            try:
+                listener(ruleset)
+            except Exception as e:
+                logger.error(f"规则集更新回调失败: {e}")
+        return True
+
+    def set_sources(self, patterns_file=None, vocabulary_file=None):
+        """
+        切换模式库或词汇库文件并立即重新构建
+
+        Args:
+            patterns_file (str, optional): 新的风险模式定义文件路径
+            vocabulary_file (str, optional): 新的词汇库文件路径
+
+        Returns:
+            bool: 是否替换了规则集
+        """
+        with self._build_lock:
+            if patterns_file is not None:
+                self.patterns_file = patterns_file
+            if vocabulary_file is not None:
+                self.vocabulary_file = vocabulary_file
+        return self.reload(force=True)
+
+    def add_listener(self, callback):
+        """注册规则集更新回调，参数为新的规则集"""
+        self._listeners.append(callback)
+
+    def start(self, poll_interval=None):
+        """
+        启动后台线程，定期检查文件变化
+
+        Args:
+            poll_interval (float, optional): 轮询间隔（秒），默认使用初始化时的值
+        """
+        if poll_interval is not None:
+            self.poll_interval = poll_interval
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._watch, name="ruleset-watcher", daemon=True)
+        self._thread.start()
+        logger.info(f"规则集热加载已启动，轮询间隔 {self.poll_interval} 秒")
+
+    def stop(self):
+        """停止后台轮询线程"""
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    @property
+    def running(self):
+        """后台轮询线程是否正在运行"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def _watch(self):
+        """后台轮询循环"""
+        while not self._stop_event.wait(self.poll_interval):
+            try:
+                self.reload()
+            except Exception as e:
+                logger.error(f"规则集热加载检查失败: {e}")
@@ -1,25 +1,38 @@
 import networkx as nx
-import numpy as np
 import logging
 import os
 from collections import defaultdict
 import re
 from ..utils.config import ConfigLoader
+from .concept_graph import CombinationIndex, ConceptGraph, DEFAULT_MIN_WEIGHT
+from .filler import FillerTable
+from .normalization import normalize_text
+from .prefilter import KeywordAutomaton
 
 logger = logging.getLogger(__name__)
 
 class SemanticNetworkAnalyzer:
     """语义网络分析器，用于检测分散在多轮对话中的风险信息网络"""
     
-    def __init__(self, risk_vocabulary=None):
-        """初始化语义网络分析器"""
+    def __init__(self, risk_vocabulary=None, ruleset=None):
+        """
+        初始化语义网络分析器
+        
+        Args:
+            risk_vocabulary (list|dict, optional): 风险词汇库
+            ruleset (Ruleset, optional): 预先构建的规则集，提供时不再读取配置文件
+        """
         self.risk_vocabulary = risk_vocabulary or {}
         
-        # 创建配置加载器
-        self.config_loader = ConfigLoader()
+        if ruleset is not None:
+            # 直接使用规则集中的语义分析配置
+            self.config_loader = None
+            semantic_config = ruleset.semantic_config
+        else:
+            # 创建配置加载器，从配置文件加载语义分析配置
+            self.config_loader = ConfigLoader()
+            semantic_config = self.config_loader.load_config("semantic.json")
         
-        # 从配置文件加载语义分析配置
-        semantic_config = self.config_loader.load_config("semantic.json")
         self.dangerous_combinations = semantic_config.get("dangerous_combinations", {})
         self.technical_terms = semantic_config.get("technical_terms", [])
         self.risk_levels = semantic_config.get("risk_levels", {
@@ -30,7 +43,26 @@ class SemanticNetworkAnalyzer:
         })
         
         # 将配置保存到默认文件(如果不存在)
-        self._save_default_configs_if_not_exist()
+        if self.config_loader is not None:
+            self._save_default_configs_if_not_exist()
+        
+        # 语料共现图的边权下限，见 semantic.json 的 concept_graph
+        self.min_cooccurrence_weight = semantic_config.get("concept_graph", {}).get("min_weight", DEFAULT_MIN_WEIGHT)
+        
+        # 技术术语只扫描一遍文本匹配，跳过插入的空格、标点和零宽字符；
+        # 危险组合和共现图按概念查表，规则集提供时共享其中预先构建的结构
+        if ruleset is not None:
+            self.concept_automaton = ruleset.concept_automaton
+            self.combination_index = ruleset.combination_index
+            self.concept_graph = ruleset.concept_graph
+        else:
+            self.concept_automaton = KeywordAutomaton(self.technical_terms, FillerTable())
+            self.combination_index = CombinationIndex(self.dangerous_combinations)
+            self.concept_graph = ConceptGraph.from_config(semantic_config.get("concept_graph"))
+        self._concept_names = {}
+        for term in self.technical_terms:
+            if isinstance(term, str):
+                self._concept_names.setdefault(normalize_text(term), term)
         
         # 初始化语义网络
         self.G = nx.DiGraph()
@@ -69,11 +101,10 @@ class SemanticNetworkAnalyzer:
             # 提取该轮次中的关键概念
             concepts = self._extract_key_concepts(content)
             
-            # 添加对话轮次节点
+            # 添加对话轮次节点（只记录回合索引，内容可通过turn_id从会话中获取）
             self.G.add_node(f"turn_{i}", 
                            type="dialogue",
                            role=role, 
-                           content=content,
                            concepts=concepts,
                            turn_id=i)
             
@@ -104,46 +135,53 @@ class SemanticNetworkAnalyzer:
         return self.G
     
     def _extract_key_concepts(self, text):
-        """提取文本中的关键概念 - 使用配置中的技术术语"""
-        concepts = set()
+        """提取文本中的关键概念 - 使用配置中的技术术语，按首次命中位置排列（位置相同时按名称）"""
+        if not text:
+            return []
         
-        # 使用配置中的技术术语进行匹配
-        lower_text = text.lower()
-        for term in self.technical_terms:
-            if term.lower() in lower_text:
-                concepts.add(term)
+        # 使用配置中的技术术语进行匹配，记录每个概念首次命中的位置
+        first_offsets = {}
+        keywords = self.concept_automaton.keywords
+        for start, _, keyword_id in self.concept_automaton.iter_matches(text):
+            keyword = keywords[keyword_id]
+            concept = self._concept_names.get(keyword, keyword)
+            if start < first_offsets.get(concept, start + 1):
+                first_offsets[concept] = start
         
-        return concepts
+        return sorted(first_offsets, key=lambda concept: (first_offsets[concept], concept))
     
     def _build_concept_relations(self):
         """建立概念之间的语义关联"""
         concept_nodes = [n for n, d in self.G.nodes(data=True) if d.get('type') == "concept"]
         
-        # 使用预定义的危险组合模式建立关联
-        for category, combinations in self.dangerous_combinations.items():
-            for combo in combinations:
-                keywords = combo["keywords"]
-                score = combo["score"]
-                
-                # 查找网络中是否有这些关键词
-                found_concepts = []
-                for keyword in keywords:
-                    matching_concepts = [c for c in concept_nodes if keyword.lower() in c.lower()]
-                    found_concepts.extend(matching_concepts)
-                
-                # 如果找到多个关键词，则建立它们之间的关联
-                if len(found_concepts) >= 2:
-                    for i in range(len(found_concepts)):
-                        for j in range(i+1, len(found_concepts)):
-                            # 双向连接
-                            self.G.add_edge(found_concepts[i], found_concepts[j], 
-                                          weight=score, 
-                                          category=category,
-                                          combination_type="dangerous_pattern")
-                            self.G.add_edge(found_concepts[j], found_concepts[i], 
-                                          weight=score, 
-                                          category=category,
-                                          combination_type="dangerous_pattern")
+        # 使用预定义的危险组合模式建立关联，按概念节点查表得到成立的组合
+        for found_concepts, category, score in self.combination_index.relations(concept_nodes):
+            # 建立命中的概念之间的关联
+            for i in range(len(found_concepts)):
+                for j in range(i+1, len(found_concepts)):
+                    # 双向连接
+                    self.G.add_edge(found_concepts[i], found_concepts[j], 
+                                  weight=score, 
+                                  category=category,
+                                  combination_type="dangerous_pattern")
+                    self.G.add_edge(found_concepts[j], found_concepts[i], 
+                                  weight=score, 
+                                  category=category,
+                                  combination_type="dangerous_pattern")
+        
+        # 没有危险组合关联的概念对，按语料共现图的归一化点互信息建立弱关联
+        if self.concept_graph is None:
+            return
+        names = [self.G.nodes[n].get('name') for n in concept_nodes]
+        for i in range(len(concept_nodes)):
+            for j in range(i+1, len(concept_nodes)):
+                u, v = concept_nodes[i], concept_nodes[j]
+                if self.G.has_edge(u, v) or self.G.has_edge(v, u):
+                    continue
+                weight = self.concept_graph.weight(names[i], names[j])
+                if weight > 0 and weight >= self.min_cooccurrence_weight:
+                    self.G.add_edge(u, v, weight=weight, combination_type="corpus_cooccurrence")
+                    self.G.add_edge(v, u, weight=weight, combination_type="corpus_cooccurrence")
     
     def detect_dangerous_knowledge_flow(self):
         """
@@ -181,12 +219,24 @@ class SemanticNetworkAnalyzer:
                     }
                     risk_findings["dangerous_combinations"].append(combo)
         
+        # 配置了语料共现图时，列出会话中共现权重较高的概念对，只作为参考证据，不影响风险分数
+        if self.concept_graph is not None:
+            # 每对概念只列一次，概念按在会话中出现的先后排列；按权重从高到低，权重相同时按概念出现的先后
+            order = {node: i for i, node in enumerate(self.G.nodes)}
+            pairs = sorted(((-data.get('weight', 0.0), order[u], order[v], u, v)
+                            for u, v, data in self.G.edges(data=True)
+                            if data.get('combination_type') == "corpus_cooccurrence" and order[u] < order[v]))
+            risk_findings["concept_associations"] = [
+                {"concepts": [self.G.nodes[u].get('name'), self.G.nodes[v].get('name')], "weight": -weight}
+                for weight, _, _, u, v in pairs
+            ]
+        
         # 检查信息流风险（从不同角色获取关联信息）
         role_nodes = [n for n, d in self.G.nodes(data=True) if d.get('type') == "role"]
         concept_nodes = [n for n, d in self.G.nodes(data=True) if d.get('type') == "concept"]
         
-        # 构建角色到概念的映射
-        role_to_concepts = defaultdict(set)
+        # 构建角色到概念的映射，概念按加入语义网络的先后排列
+        role_to_concepts = defaultdict(dict)
         for role_node in role_nodes:
             role_name = self.G.nodes[role_node].get('name')
             
@@ -198,23 +248,20 @@ class SemanticNetworkAnalyzer:
                         if self.G.nodes[concept_node].get('type') == "concept":
                             concept_name = self.G.nodes[concept_node].get('name')
                             if concept_name:
-                                role_to_concepts[role_name].add(concept_name)
+                                role_to_concepts[role_name].setdefault(concept_name)
         
         # 评估角色分布的风险
         role_count = len(role_to_concepts)
         if role_count >= 3:  # 多个角色参与
             # 检查概念是否分布在不同角色中，但组合起来形成风险
-            all_dangerous_keywords = set()
-            for category, combinations in self.dangerous_combinations.items():
-                for combo in combinations:
-                    all_dangerous_keywords.update(combo["keywords"])
+            all_dangerous_keywords = self.combination_index.keywords
             
             # 检查每个角色贡献的危险关键词
             role_contributions = {}
             for role, concepts in role_to_concepts.items():
-                dangerous_concepts = concepts.intersection(all_dangerous_keywords)
+                dangerous_concepts = [concept for concept in concepts if concept in all_dangerous_keywords]
                 if dangerous_concepts:
-                    role_contributions[role] = list(dangerous_concepts)
+                    role_contributions[role] = dangerous_concepts
             
             # 如果多个角色共同贡献了危险关键词
             if len(role_contributions) >= 2:
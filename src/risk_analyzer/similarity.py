@@ -0,0 +1,286 @@
+import functools
+import logging
+
+import numpy as np
+
+from .normalization import PRECOMPUTED_RANGE, normalize_text
+
+logger = logging.getLogger(__name__)
+
+# 默认参数：字符二元组和三元组，哈希到 2^20 维
+DEFAULT_NGRAM_SIZES = (2, 3)
+DEFAULT_HASH_BITS = 20
+DEFAULT_TOP_K = 3
+DEFAULT_MIN_SCORE = 0.05
+
+# 模式中参与相似度计算的字段
+PATTERN_TEXT_FIELDS = ("name", "description", "example")
+
+_FNV_OFFSET = np.uint64(0xCBF29CE484222325)
+_FNV_PRIME = np.uint64(0x100000001B3)
+# 乘法散列常数，取乘积的高位作为维度编号
+_MIX = np.uint64(0x9E3779B97F4A7C15)
+# 每次计算乘积的命中条目数上限，限制临时数组的内存
+_CHUNK_ENTRIES = 1 << 18
+
+
+class NgramHasher:
+    """
+    字符 n 元组哈希
+
+    整批文本拼接为一个码位数组，按预先计算的码位表做与关键词匹配相同的归一化（见 normalize_text）
+    和填充字符删除，再用 NumPy 向量化计算全部 n 元组的哈希，不需要词表，也不逐文本、逐字符循环。
+    n 元组不跨越文本。
+    """
+
+    __slots__ = ("ngram_sizes", "bits", "filler")
+
+    def __init__(self, ngram_sizes=DEFAULT_NGRAM_SIZES, bits=DEFAULT_HASH_BITS, filler=None):
+        """
+        初始化 n 元组哈希
+
+        Args:
+            ngram_sizes (iterable): n 元组长度
+            bits (int): 哈希空间的位数，维度为 2^bits
+            filler (FillerTable, optional): 填充字符表，提供时删除文本中的填充字符
+        """
+        self.ngram_sizes = tuple(ngram_sizes)
+        self.bits = bits
+        self.filler = filler
+
+    def codes(self, texts):
+        """
+        把一批文本转换为归一化后的码位数组
+
+        Args:
+            texts (list): 文本
+
+        Returns:
+            tuple: (码位, 各码位所属的文本下标)，文本之间以码位0分隔，填充字符已删除
+        """
+        texts = [text if isinstance(text, str) else "" for text in texts]
+        codes = np.frombuffer("\x00".join(texts).encode("utf-32-le", "surrogatepass"), dtype=np.uint32)
+        lengths = np.fromiter(map(len, texts), dtype=np.int64, count=len(texts))
+        rows = np.repeat(np.arange(len(texts), dtype=np.int64), lengths + 1)[:len(codes)]
+
+        # 整批文本按预先计算的码位表归一化，与 normalize_text 逐字符的结果相同
+        table = _folded_codes()
+        astral = codes >= len(table)
+        folded = table[np.where(astral, 0, codes)]
+        if astral.any():
+            for code in np.unique(codes[astral]).tolist():
+                folded[codes == code] = ord(normalize_text(chr(code)))
+        if self.filler is not None:
+            filler = _filler_codes(self.filler.pattern)
+            remove = filler[np.minimum(folded, len(filler) - 1)]
+            for code in np.unique(folded[folded >= len(filler)]).tolist():
+                remove[folded == code] = self.filler[chr(code)]
+            keep = ~remove | (folded == 0)
+            folded, rows = folded[keep], rows[keep]
+        return folded.astype(np.uint64), rows
+
+    def hash(self, texts):
+        """
+        计算一批文本的 n 元组词频
+
+        Args:
+            texts (list): 文本
+
+        Returns:
+            tuple: (文本下标, 维度编号, 出现次数)，三个等长数组，按 (文本下标, 维度编号) 排序且不重复
+        """
+        codes, rows = self.codes(texts)
+        bits = np.uint64(self.bits)
+        keys = []
+        with np.errstate(over="ignore"):
+            for size in self.ngram_sizes:
+                count = len(codes) - size + 1
+                if count <= 0:
+                    continue
+                # FNV-1a，初始值区分 n 元组长度；包含分隔符的 n 元组跨越了文本，丢弃
+                value = np.full(count, _FNV_OFFSET ^ np.uint64(size), dtype=np.uint64)
+                valid = np.ones(count, dtype=bool)
+                for offset in range(size):
+                    window = codes[offset:offset + count]
+                    value = (value ^ window) * _FNV_PRIME
+                    valid &= window != 0
+                columns = ((value * _MIX) >> (np.uint64(64) - bits)).astype(np.int64)
+                keys.append((rows[:count][valid] << self.bits) | columns[valid])
+
+        if not keys:
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, empty, np.zeros(0, dtype=np.float32)
+        keys, counts = np.unique(np.concatenate(keys), return_counts=True)
+        return keys >> self.bits, keys & ((1 << self.bits) - 1), counts.astype(np.float32)
+
+    def __repr__(self):
+        return f"NgramHasher(ngram_sizes={self.ngram_sizes!r}, bits={self.bits!r})"
+
+
+class SimilarityIndex:
+    """
+    基于字符 n 元组 TF-IDF 的文本相似度检索
+
+    文档（如各风险模式的描述和示例）预先转换为 L2 归一化的 TF-IDF 向量，只保留文档中出现过的维度，
+    存为 (维度数 × 文档数) 的稠密矩阵。查询文本按批哈希后只保留这些维度，
+    逐条命中乘以矩阵对应行并按文本累加得到余弦相似度，再用 argpartition 取每条文本的前 k 个文档。
+    完全离线运行，不需要下载模型。
+    """
+
+    __slots__ = ("labels", "hasher", "_positions", "_idf", "_matrix")
+
+    def __init__(self, documents, labels, hasher=None):
+        """
+        构建索引
+
+        Args:
+            documents (list): 文档文本
+            labels (list): 与文档一一对应的标识（如模式ID）
+            hasher (NgramHasher, optional): n 元组哈希，默认使用默认参数
+        """
+        self.labels = list(labels)
+        self.hasher = hasher or NgramHasher()
+        rows, columns, counts = self.hasher.hash(documents)
+        vocabulary, inverse = np.unique(columns, return_inverse=True)
+
+        # 按维度编号直接查表：文档维度在矩阵中的行号（未出现为-1）和平滑的逆文档频率（未出现取最大值）
+        total = len(self.labels)
+        frequencies = np.bincount(inverse, minlength=len(vocabulary))
+        self._positions = np.full(1 << self.hasher.bits, -1, dtype=np.int32)
+        self._positions[vocabulary] = np.arange(len(vocabulary), dtype=np.int32)
+        self._idf = np.full(1 << self.hasher.bits, np.log(1 + total) + 1, dtype=np.float32)
+        self._idf[vocabulary] = np.log((1 + total) / (1 + frequencies)) + 1
+
+        weights = counts * self._idf[columns]
+        weights /= _row_norms(rows, weights, total)[rows]
+        self._matrix = np.zeros((len(vocabulary), total), dtype=np.float32)
+        self._matrix[inverse, rows] = weights
+        logger.debug(f"相似度索引: {total} 个文档，{len(vocabulary)} 个维度")
+
+    @classmethod
+    def from_patterns(cls, patterns, hasher=None):
+        """
+        由风险模式定义构建索引
+
+        Args:
+            patterns (dict): 风险模式定义 {大类: [模式]}
+            hasher (NgramHasher, optional): n 元组哈希
+
+        Returns:
+            SimilarityIndex: 以模式ID为标识、名称、描述和示例为文档的索引
+        """
+        documents = []
+        labels = []
+        for patterns_list in patterns.values():
+            if not isinstance(patterns_list, list):
+                continue
+            for pattern in patterns_list:
+                if isinstance(pattern, dict) and "id" in pattern:
+                    fields = (pattern.get(field) for field in PATTERN_TEXT_FIELDS)
+                    # 字段之间以码位0分隔，n 元组不跨越字段
+                    documents.append("\x00".join(field for field in fields if isinstance(field, str)))
+                    labels.append(pattern["id"])
+        return cls(documents, labels, hasher)
+
+    @property
+    def size(self):
+        """文档数量"""
+        return len(self.labels)
+
+    def transform(self, texts):
+        """
+        把一批文本转换为 L2 归一化的 TF-IDF 向量
+
+        Args:
+            texts (list): 文本
+
+        Returns:
+            tuple: (文本下标, 索引维度下标, 权重)，只包含文档中出现过的维度；
+                权重按文本的全部维度归一化
+        """
+        rows, columns, counts = self.hasher.hash(texts)
+        weights = counts * self._idf[columns]
+        weights /= _row_norms(rows, weights, len(texts))[rows]
+        positions = self._positions[columns]
+        known = positions >= 0
+        return rows[known], positions[known], weights[known]
+
+    def scores(self, texts):
+        """
+        计算一批文本与全部文档的余弦相似度
+
+        Args:
+            texts (list): 文本
+
+        Returns:
+            numpy.ndarray: (文本数 × 文档数) 的相似度矩阵
+        """
+        rows, positions, weights = self.transform(texts)
+        scores = np.zeros((len(texts), self.size), dtype=np.float32)
+        for start in range(0, len(rows), _CHUNK_ENTRIES):
+            end = start + _CHUNK_ENTRIES
+            chunk_rows = rows[start:end]
+            # 条目按文本下标排序，同一文本的条目连续，按段累加
+            starts = np.flatnonzero(np.r_[True, chunk_rows[1:] != chunk_rows[:-1]])
+            products = self._matrix[positions[start:end]] * weights[start:end, None]
+            scores[chunk_rows[starts]] += np.add.reduceat(products, starts, axis=0)
+        return scores
+
+    def query(self, texts, top_k=DEFAULT_TOP_K, min_score=DEFAULT_MIN_SCORE):
+        """
+        检索每条文本最相似的文档
+
+        Args:
+            texts (list): 文本
+            top_k (int): 每条文本返回的文档数上限
+            min_score (float): 相似度下限
+
+        Returns:
+            list: 与输入一一对应，每项为 [(文档标识, 相似度)]，按相似度从高到低排列
+        """
+        top_k = min(top_k, self.size)
+        if top_k <= 0 or not texts:
+            return [[] for _ in texts]
+        scores = self.scores(texts)
+        top = np.argpartition(-scores, top_k - 1, axis=1)[:, :top_k]
+        top_scores = np.take_along_axis(scores, top, axis=1)
+        order = np.argsort(-top_scores, axis=1, kind="stable")
+        top = np.take_along_axis(top, order, axis=1)
+        top_scores = np.take_along_axis(top_scores, order, axis=1)
+
+        labels = self.labels
+        results = []
+        for documents, values in zip(top.tolist(), top_scores.tolist()):
+            results.append([(labels[document], round(value, 4))
+                            for document, value in zip(documents, values) if value > 0 and value >= min_score])
+        return results
+
+    def __repr__(self):
+        return f"SimilarityIndex(size={self.size}, hasher={self.hasher!r})"
+
+
+@functools.lru_cache(maxsize=1)
+def _folded_codes():
+    """基本多文种平面每个码位归一化后的码位"""
+    chars = "".join(chr(code) if not 0xD800 <= code < 0xE000 else "\x00" for code in range(*PRECOMPUTED_RANGE))
+    folded = np.frombuffer(normalize_text(chars).encode("utf-32-le"), dtype=np.uint32).copy()
+    folded[0xD800:0xE000] = np.arange(0xD800, 0xE000, dtype=np.uint32)
+    return folded
+
+
+@functools.lru_cache(maxsize=8)
+def _filler_codes(pattern):
+    """基本多文种平面每个码位是否为填充字符，由填充字符正则得出"""
+    chars = "".join(chr(code) if not 0xD800 <= code < 0xE000 else "\x00" for code in range(*PRECOMPUTED_RANGE))
+    remove = np.zeros(len(chars), dtype=bool)
+    for match in pattern.finditer(chars):
+        remove[match.start():match.end()] = True
+    remove[0xD800:0xE000] = False
+    return remove
+
+
+def _row_norms(rows, weights, count):
+    """各文本权重的L2范数，空文本取1避免除零"""
+    norms = np.sqrt(np.bincount(rows, weights=weights * weights, minlength=count))
+    norms[norms == 0] = 1.0
+    return norms
@@ -0,0 +1,184 @@
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 未配置 temporal_rule 时按时序规则求值的模式大类
+TEMPORAL_CATEGORY = "时序依赖类"
+# 相邻两步之间允许间隔的最大回合数
+DEFAULT_TEMPORAL_WITHIN = 5
+TEMPORAL_ROLE_CONSTRAINTS = ("any", "same", "different")
+
+
+def temporal_rule_steps(pattern, category):
+    """
+    取出模式的时序规则步骤定义
+
+    模式可以配置 temporal_rule:
+    {"within": 5, "steps": [{"group": "hypothetical_markers"},
+                            {"group": "reality_shifts", "within": 3, "role": "different"}]}
+    步骤用 group 引用 detection_rules 中的关键词组，或用 keywords 直接给出关键词；
+    within 为与上一步之间的最大回合间隔，role 约束与上一步的角色关系（any/same/different）。
+    时序依赖类模式没有配置时，detection_rules 的关键词组按定义顺序依次作为步骤；
+    temporal_rule 为 false 时不使用时序规则。
+
+    Args:
+        pattern (dict): 风险模式
+        category (str): 模式大类
+
+    Returns:
+        list: 步骤 [(关键词列表, 回合间隔, 角色约束)]，模式没有时序规则时返回空列表
+    """
+    spec = pattern.get("temporal_rule")
+    if spec is False or (spec is None and category != TEMPORAL_CATEGORY):
+        return []
+    groups = pattern.get("detection_rules") or {}
+    if not isinstance(spec, dict):
+        spec = {"steps": [{"group": name} for name in groups]}
+
+    default_within = int(spec.get("within", DEFAULT_TEMPORAL_WITHIN))
+    steps = []
+    for step in spec.get("steps", []):
+        if not isinstance(step, dict):
+            continue
+        keywords = step["keywords"] if "keywords" in step else groups.get(step.get("group"))
+        if not isinstance(keywords, list):
+            logger.warning(f"模式 {pattern.get('id')} 的时序步骤 {step} 没有关键词，已忽略")
+            continue
+        role = step.get("role", "any")
+        if role not in TEMPORAL_ROLE_CONSTRAINTS:
+            logger.warning(f"模式 {pattern.get('id')} 的角色约束 {role} 无效，不限制角色")
+            role = "any"
+        steps.append(([k for k in keywords if isinstance(k, str)],
+                      int(step.get("within", default_within)), role))
+    return steps
+
+
+class TemporalRule:
+    """
+    模式的时序规则
+
+    步骤按顺序在不同回合依次命中时规则成立，例如"先出现A，k回合内出现B，再由另一角色说出C"。
+    """
+
+    __slots__ = ("pattern_id", "category", "name", "steps", "union")
+
+    def __init__(self, pattern_id, category, name, steps):
+        """
+        初始化规则
+
+        Args:
+            pattern_id (str): 模式ID
+            category (str): 模式大类
+            name (str): 模式名称
+            steps (list): 各步骤 [(关键词位集, 回合间隔, 角色约束)]
+        """
+        self.pattern_id = pattern_id
+        self.category = category
+        self.name = name
+        self.steps = steps
+        # 回合位集与全部步骤都不相交时不会改变状态
+        self.union = 0
+        for mask, _, _ in steps:
+            self.union |= mask
+
+    def __repr__(self):
+        return f"TemporalRule({self.pattern_id!r}, steps={len(self.steps)})"
+
+
+class TemporalTracker:
+    """
+    时序规则状态机
+
+    对每条规则按步骤记录已完成的部分匹配：完成第i步的部分匹配只保留每个角色最近的回合，
+    最近的回合对回合间隔约束最宽松，状态大小为 步骤数×角色数。
+    回合按顺序只处理一遍，既用于整段会话求值，也可以在实时会话中逐轮调用 add_turn。
+    """
+
+    def __init__(self, rules, term_index=None):
+        """
+        初始化状态机
+
+        Args:
+            rules (list): 时序规则 TemporalRule
+            term_index (TermIndex, optional): 词汇表，逐轮调用 add_turn 时用于计算回合位集
+        """
+        self.rules = rules
+        self.term_index = term_index
+        # 每条规则每一步（最后一步除外）的部分匹配 {角色: 完成该步的最近回合}
+        self._states = [[{} for _ in rule.steps[:-1]] for rule in rules]
+        self.matches = {}
+        self.turn = -1
+
+    def add_turn(self, role, content):
+        """
+        加入一轮对话
+
+        Args:
+            role (str): 角色
+            content (str): 对话内容
+
+        Returns:
+            list: 本轮新成立的模式ID
+        """
+        mask = self.term_index.match(content) if content else 0
+        return self.feed(mask, role)
+
+    def feed(self, mask, role, turn=None):
+        """
+        按回合位集推进状态
+
+        Args:
+            mask (int): 本回合命中关键词的位集
+            role (str): 本回合角色，没有角色的回合不参与匹配
+            turn (int, optional): 回合下标，默认为上一回合加一
+
+        Returns:
+            list: 本轮新成立的模式ID
+        """
+        self.turn = turn = self.turn + 1 if turn is None else turn
+        completed = []
+        if not mask or not role:
+            return completed
+
+        for rule, states in zip(self.rules, self._states):
+            if not mask & rule.union or rule.pattern_id in self.matches:
+                continue
+            last_step = len(rule.steps) - 1
+            # 从后向前处理，同一回合最多推进一步
+            for step in range(last_step, -1, -1):
+                step_mask, within, role_rule = rule.steps[step]
+                if not mask & step_mask:
+                    continue
+                if step > 0 and not self._advance(states[step - 1], turn, role, within, role_rule):
+                    continue
+                if step == last_step:
+                    self.matches[rule.pattern_id] = turn
+                    completed.append(rule.pattern_id)
+                    break
+                states[step][role] = turn
+        return completed
+
+    @staticmethod
+    def _advance(previous, turn, role, within, role_rule):
+        """
+        检查上一步的部分匹配能否推进到当前回合，同时清除超出回合间隔的部分匹配
+
+        Args:
+            previous (dict): 上一步的部分匹配 {角色: 回合}
+            turn (int): 当前回合
+            role (str): 当前角色
+            within (int): 最大回合间隔
+            role_rule (str): 角色约束
+
+        Returns:
+            bool: 是否可以推进
+        """
+        advanced = False
+        for previous_role, previous_turn in list(previous.items()):
+            if turn - previous_turn > within:
+                del previous[previous_role]
+            elif previous_turn < turn and (
+                    role_rule == "any"
+                    or (role_rule == "same") == (previous_role == role)):
+                advanced = True
+        return advanced
@@ -0,0 +1,289 @@
+import bisect
+import logging
+
+from .normalization import normalize_text
+from .phonetic import joins_word, substituted_edge
+from .prefilter import RoutedKeywordAutomaton
+from .tokenizer import is_cjk
+
+logger = logging.getLogger(__name__)
+
+
+def _is_word_char(char):
+    return char.isalnum() and not is_cjk(char)
+
+
+def turn_contents(conversation):
+    """
+    按回合取出会话内容，与会话下标一一对应
+
+    Args:
+        conversation (list): 会话列表，格式为 [{"role": "...", "content": "..."}, ...]
+
+    Returns:
+        list: 各回合内容，非字典回合或内容为空时为None
+    """
+    contents = []
+    for turn in conversation:
+        content = turn.get("content") if isinstance(turn, dict) else None
+        contents.append(content if isinstance(content, str) and content.strip() else None)
+    return contents
+
+
+class HitIndex:
+    """
+    会话的关键词命中索引
+
+    对每个回合扫描一遍得到：turn_masks 为各回合命中关键词的位集（第i位对应词汇表中编号为i的关键词），
+    union 为全部回合的并集，positions 记录每个关键词命中的回合和词位置，
+    词位置在整个会话中连续编号，按词计算的窗口可以跨越回合。
+    """
+
+    __slots__ = ("turn_masks", "union", "positions", "variants")
+
+    def __init__(self, turns=0):
+        self.turn_masks = [0] * turns
+        self.union = 0
+        # {关键词编号: [(回合下标, 词位置)]}
+        self.positions = {}
+        # 以读音变体（拼音、首字母、同音字）形式命中的关键词 [(回合下标, 关键词编号, 变体)]，按回合排列
+        self.variants = []
+
+    def add(self, keyword_id, turn, token):
+        bit = 1 << keyword_id
+        self.turn_masks[turn] |= bit
+        self.union |= bit
+        self.positions.setdefault(keyword_id, []).append((turn, token))
+
+    def add_variant(self, keyword_id, turn, variant):
+        self.variants.append((turn, keyword_id, variant))
+
+    def first_variant(self, turns=None, mask=None):
+        """
+        查找最早的读音变体命中
+
+        Args:
+            turns (iterable, optional): 参与检查的回合下标，默认全部回合
+            mask (int, optional): 关键词位集，提供时只计入这些关键词的变体
+
+        Returns:
+            tuple: (回合下标, 关键词编号, 变体)，没有命中时返回None
+        """
+        if turns is not None:
+            turns = set(turns)
+        for hit in self.variants:
+            if (turns is None or hit[0] in turns) and (mask is None or mask >> hit[1] & 1):
+                return hit
+        return None
+
+    def first_turn(self, mask, turns=None):
+        """
+        查找最早命中位集中任一关键词的回合
+
+        Args:
+            mask (int): 关键词位集
+            turns (iterable, optional): 参与检查的回合下标，默认全部回合
+
+        Returns:
+            int: 回合下标，没有命中时返回None
+        """
+        if not self.union & mask:
+            return None
+        turn_masks = self.turn_masks
+        for turn in (range(len(turn_masks)) if turns is None else turns):
+            if turn_masks[turn] & mask:
+                return turn
+        return None
+
+    def __len__(self):
+        return sum(len(hits) for hits in self.positions.values())
+
+
+class TermIndex:
+    """
+    全局关键词词汇表
+
+    风险类别关键词、模式关键词和模式共现规则的关键词统一编号并编入同一个自动机（按文字分为 zh、en 子索引，
+    首次遇到对应文字的回合时才构建），每个会话只扫描一遍得到各回合的命中位集。类别和模式预先转换为关键词位集，
+    判断是否命中只需要位与运算，耗时与关键词数量无关。
+    提供变体生成时，关键词的读音变体也编入自动机，命中时计为原关键词。
+    """
+
+    def __init__(self, terms, tokenizer, filler=None, variants=None):
+        """
+        初始化词汇表
+
+        Args:
+            terms (iterable): 关键词，按出现顺序编号，按归一化形式去重
+            tokenizer (Tokenizer): 分词器，用于计算词位置
+            filler (FillerTable, optional): 填充字符表，提供时匹配跳过填充字符，命中位置仍对应原文
+            variants (VariantExpander, optional): 读音变体生成，提供时编译阶段展开中文关键词的变体
+        """
+        self.tokenizer = tokenizer
+        self.filler = filler
+        # 关键词按匹配时实际比较的形式编号，只差填充字符的关键词共用一个编号
+        self.term_ids = {}
+        unique_terms = []
+        for term in terms:
+            if isinstance(term, str) and term.strip():
+                key = self._key(term)
+                if key and key not in self.term_ids:
+                    self.term_ids[key] = len(unique_terms)
+                    unique_terms.append(term)
+        # 自动机按插入顺序编号，前 len(unique_terms) 个与 term_ids 一致，之后是变体，
+        # _keyword_terms[自动机编号] 为对应的关键词编号
+        keywords = list(unique_terms)
+        self._keyword_terms = list(range(len(unique_terms)))
+        # {自动机编号: 替换了首字(0)或尾字(-1)的同音字变体}
+        self._variant_edges = {}
+        # 不含中文的变体（全拼、首字母）的自动机编号
+        self._latin_variants = set()
+        if variants is not None:
+            seen = set(self.term_ids)
+            for term_key, term_id in self.term_ids.items():
+                # 变体由归一化并去掉填充字符的关键词生成，只需再归一化一次（同音字可能是繁体字形）
+                for variant in variants.expand(term_key):
+                    key = normalize_text(variant)
+                    if key not in seen:
+                        seen.add(key)
+                        edge = substituted_edge(term_key, key)
+                        if edge is not None:
+                            self._variant_edges[len(keywords)] = edge
+                        if not any(is_cjk(char) for char in key):
+                            self._latin_variants.add(len(keywords))
+                        keywords.append(key)
+                        self._keyword_terms.append(term_id)
+        self.automaton = RoutedKeywordAutomaton(keywords, filler)
+        self.terms = self.automaton.keywords[:len(unique_terms)]
+        if len(keywords) > len(unique_terms):
+            logger.debug(f"关键词读音变体 {len(keywords) - len(unique_terms)} 个")
+
+    def _key(self, term):
+        lowered = normalize_text(term)
+        return self.filler.strip(lowered) if self.filler is not None else lowered
+
+    def term_id(self, term):
+        """关键词编号，不在词汇表中时返回None"""
+        return self.term_ids.get(self._key(term)) if isinstance(term, str) else None
+
+    def mask(self, terms):
+        """
+        关键词集合对应的位集
+
+        Args:
+            terms (iterable): 关键词
+
+        Returns:
+            int: 位集
+        """
+        mask = 0
+        for term in terms:
+            term_id = self.term_id(term)
+            if term_id is not None:
+                mask |= 1 << term_id
+        return mask
+
+    def first_term(self, mask):
+        """位集中编号最小的关键词"""
+        return self.terms[(mask & -mask).bit_length() - 1] if mask else None
+
+    @property
+    def variants(self):
+        """编入自动机的读音变体"""
+        return self.automaton.keywords[len(self.terms):]
+
+    def _next_to_cjk(self, lowered, start, end):
+        """命中片段前后跳过填充字符后的第一个字符是否为中文"""
+        filler = self.filler
+        before = start - 1
+        while before >= 0 and filler is not None and filler[lowered[before]]:
+            before -= 1
+        if before >= 0 and is_cjk(lowered[before]):
+            return True
+        after = end
+        while after < len(lowered) and filler is not None and filler[lowered[after]]:
+            after += 1
+        return after < len(lowered) and is_cjk(lowered[after])
+
+    def _iter_hits(self, lowered, content=None):
+        """
+        逐个给出归一化内容中命中的关键词 (起始位置, 关键词编号, 变体)，按原关键词命中时变体为None
+
+        Args:
+            lowered (str): 归一化后的回合内容
+            content (str, optional): 回合原文，与 lowered 等长，用于判断拼音变体是否写作首字母大写的专名
+        """
+        keywords = self.automaton.keywords
+        keyword_terms = self._keyword_terms
+        variant_edges = self._variant_edges
+        term_count = len(self.terms)
+        latin_variants = self._latin_variants
+        for start, end, keyword_id in self.automaton.iter_normalized_matches(lowered):
+            keyword = keywords[keyword_id]
+            # 拉丁字母关键词（含拼音变体）不匹配更长单词的一部分，与 Tokenizer.contains 一致
+            if _is_word_char(keyword[0]) and start > 0 and _is_word_char(lowered[start - 1]):
+                continue
+            if _is_word_char(keyword[-1]) and end < len(lowered) and _is_word_char(lowered[end]):
+                continue
+            if keyword_id < term_count:
+                yield start, keyword_terms[keyword_id], None
+                continue
+            # 纯拉丁字母的拼音和首字母变体逐个命中判断：只在紧邻中文（可隔着填充字符）时计数，
+            # 英文中的同形单词（如 dan）和首字母大写的专名（如"我在Shanghai工作"）不是规避写法
+            if keyword_id in latin_variants:
+                if not self._next_to_cjk(lowered, start, end):
+                    continue
+                written = content[start:end] if content is not None else ""
+                if written[:1].isupper() and written[1:].islower():
+                    continue
+            # 被替换的首字或尾字与相邻的字组成常用词时，是两个普通词相邻而不是同音字写法
+            edge = variant_edges.get(keyword_id)
+            if edge == 0 and start > 0 and joins_word(lowered[start - 1], keyword[0]):
+                continue
+            if edge == -1 and end < len(lowered) and joins_word(keyword[-1], lowered[end]):
+                continue
+            yield start, keyword_terms[keyword_id], keyword
+
+    def match(self, content):
+        """
+        计算单个回合内容命中关键词的位集，用于实时会话逐轮检测
+
+        Args:
+            content (str): 回合内容
+
+        Returns:
+            int: 位集
+        """
+        mask = 0
+        if content and self.term_ids:
+            for _, term_id, _ in self._iter_hits(self.tokenizer.normalize(content), content):
+                mask |= 1 << term_id
+        return mask
+
+    def scan(self, contents, token_positions=False):
+        """
+        扫描各回合内容建立命中索引
+
+        Args:
+            contents (list): 各回合内容，None表示跳过该回合
+            token_positions (bool): 是否计算词位置，为False时词位置只区分回合
+
+        Returns:
+            HitIndex: 命中索引
+        """
+        index = HitIndex(len(contents))
+        if not self.term_ids:
+            return index
+
+        tokenizer = self.tokenizer
+        token_base = 0
+        for turn, content in enumerate(contents):
+            if not content:
+                continue
+            starts = tokenizer.token_starts(content) if token_positions else ()
+            for start, term_id, variant in self._iter_hits(tokenizer.normalize(content), content):
+                index.add(term_id, turn, token_base + max(0, bisect.bisect_right(starts, start) - 1))
+                if variant is not None:
+                    index.add_variant(term_id, turn, variant)
+            token_base += len(starts) + 1
+        return index
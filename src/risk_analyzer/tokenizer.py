@@ -0,0 +1,159 @@
+import re
+import functools
+
+from .normalization import normalize_text
+
+# 不以空格分词的文字：中日韩统一表意文字（含扩展A和兼容区）、日文假名、韩文音节
+CJK_RANGES = "\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff\uac00-\ud7af"
+
+# 文本切分为 CJK 连续片段 和 其他文字的单词（字母、数字）
+_RUN_RE = re.compile(f"([{CJK_RANGES}]+)|([^\\W_{CJK_RANGES}]+)")
+_CJK_CHAR_RE = re.compile(f"[{CJK_RANGES}]")
+# 非CJK的单词字符，关键词边界只在这类字符之间判断
+_WORD_CHAR = f"[^\\W{CJK_RANGES}]"
+
+
+def is_cjk(char):
+    """判断字符是否属于不以空格分词的文字"""
+    return bool(_CJK_CHAR_RE.match(char))
+
+
+class Tokenizer:
+    """
+    中英文混合文本分词器
+
+    拉丁字母、数字等按单词切分；中文等CJK片段使用词典正向最大匹配，
+    词典未覆盖的部分退化为字符二元组。分词结果按文本缓存，
+    同一轮对话在各检测阶段之间只切分一次。
+    """
+
+    def __init__(self, dictionary=(), max_word_length=8, cache_size=4096):
+        """
+        初始化分词器
+
+        Args:
+            dictionary (iterable): 词典词汇，一般来自规则集中的各类词汇表
+            max_word_length (int): 词典匹配的最大词长
+            cache_size (int): 按文本缓存的分词结果数量
+        """
+        self.dictionary = frozenset(
+            normalize_text(term) for term in dictionary
+            if isinstance(term, str) and len(term) > 1 and _CJK_CHAR_RE.search(term)
+        )
+        longest = max((len(term) for term in self.dictionary), default=2)
+        self.max_word_length = max(2, min(max_word_length, longest))
+
+        # 缓存按实例创建，规则集替换后旧缓存随旧分词器一起释放
+        # 归一化（大小写、全角半角、同形字、繁简）后的文本，长度与原文相同
+        self.normalize = functools.lru_cache(maxsize=cache_size)(normalize_text)
+        self.tokens = functools.lru_cache(maxsize=cache_size)(self._tokenize)
+        self.token_set = functools.lru_cache(maxsize=cache_size)(self._token_set)
+        self.token_starts = functools.lru_cache(maxsize=cache_size)(self._token_starts)
+        self._boundary_patterns = {}
+
+    def _segment_cjk(self, run, tokens, starts=None, offset=0):
+        """对CJK片段做词典正向最大匹配，未匹配的位置输出字符二元组；starts 不为None时记录各词的起始位置"""
+        dictionary = self.dictionary
+        length = len(run)
+        if length == 1:
+            tokens.append(run)
+            if starts is not None:
+                starts.append(offset)
+            return
+        i = 0
+        while i < length:
+            matched = 0
+            if dictionary:
+                for size in range(min(self.max_word_length, length - i), 1, -1):
+                    if run[i:i + size] in dictionary:
+                        matched = size
+                        break
+            if matched:
+                tokens.append(run[i:i + matched])
+                if starts is not None:
+                    starts.append(offset + i)
+                i += matched
+            else:
+                if i + 1 < length:
+                    tokens.append(run[i:i + 2])
+                    if starts is not None:
+                        starts.append(offset + i)
+                i += 1
+
+    def _tokenize(self, text):
+        """
+        分词
+
+        Args:
+            text (str): 文本
+
+        Returns:
+            tuple: 归一化的词语序列
+        """
+        tokens = []
+        for match in _RUN_RE.finditer(self.normalize(text)):
+            cjk_run, word = match.groups()
+            if word:
+                tokens.append(word)
+            else:
+                self._segment_cjk(cjk_run, tokens)
+        return tuple(tokens)
+
+    def _token_starts(self, text):
+        """
+        各词在归一化文本中的起始位置，与 tokens(text) 一一对应
+
+        Args:
+            text (str): 文本
+
+        Returns:
+            tuple: 起始字符位置序列
+        """
+        tokens = []
+        starts = []
+        for match in _RUN_RE.finditer(self.normalize(text)):
+            cjk_run, word = match.groups()
+            if word:
+                tokens.append(word)
+                starts.append(match.start())
+            else:
+                self._segment_cjk(cjk_run, tokens, starts, match.start())
+        return tuple(starts)
+
+    def _token_set(self, text):
+        return frozenset(self.tokens(text))
+
+    def _boundary_pattern(self, keyword):
+        """
+        获取关键词的边界匹配正则
+
+        只有关键词首尾是字母数字时才需要检查边界，且只在拉丁字母数字之间判断，
+        中文前后没有单词边界的概念，直接按子串匹配。
+        """
+        pattern = self._boundary_patterns.get(keyword)
+        if pattern is None:
+            head = r"(?<!" + _WORD_CHAR + ")" if re.match(_WORD_CHAR, keyword[0]) else ""
+            tail = r"(?!" + _WORD_CHAR + ")" if re.match(_WORD_CHAR, keyword[-1]) else ""
+            pattern = re.compile(head + re.escape(keyword) + tail) if head or tail else False
+            self._boundary_patterns[keyword] = pattern
+        return pattern
+
+    def contains(self, text, keyword):
+        """
+        判断文本是否包含关键词（忽略大小写、全角半角、同形字和繁简差异）
+
+        Args:
+            text (str): 文本
+            keyword (str): 关键词
+
+        Returns:
+            bool: 是否包含
+        """
+        if not keyword:
+            return False
+        keyword = normalize_text(keyword)
+        lowered = self.normalize(text)
+        if keyword not in lowered:
+            return False
+        pattern = self._boundary_pattern(keyword)
+        return not pattern or pattern.search(lowered) is not None
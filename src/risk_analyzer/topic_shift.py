@@ -0,0 +1,161 @@
+from collections import deque
+
+from .tokenizer import is_cjk
+
+# 话题转移检测的默认参数，可在 domains.json 的 topic_shift 中覆盖
+DEFAULT_WINDOW = 3
+DEFAULT_SIMILARITY_THRESHOLD = 0.2
+
+
+def extract_topic_keywords(tokenizer, content):
+    """
+    提取一轮对话的话题关键词：中文取词典词和二元组，其他文字保留长度大于3的单词
+
+    Args:
+        tokenizer (Tokenizer): 分词器
+        content (str): 对话内容
+
+    Returns:
+        set: 关键词集合
+    """
+    return set(
+        token for token in tokenizer.tokens(content)
+        if len(token) > 3 or (len(token) > 1 and is_cjk(token[0]))
+    )
+
+
+class RollingKeywordWindow:
+    """
+    最近若干轮对话关键词的滑动窗口
+
+    用计数表示窗口内关键词的并集，新一轮加入时计数加一，最早一轮移出时计数减一，
+    每轮的开销只与该轮关键词数量有关，与窗口大小无关。
+    """
+
+    def __init__(self, size=DEFAULT_WINDOW):
+        """
+        初始化滑动窗口
+
+        Args:
+            size (int): 窗口包含的对话轮数
+        """
+        self.size = max(1, size)
+        self.counts = {}
+        self.turns = deque()
+
+    def __len__(self):
+        """窗口当前包含的轮数"""
+        return len(self.turns)
+
+    @property
+    def full(self):
+        """窗口是否已满"""
+        return len(self.turns) >= self.size
+
+    @property
+    def distinct_keywords(self):
+        """窗口内不同关键词的数量"""
+        return len(self.counts)
+
+    def overlap(self, keywords):
+        """计算关键词集合与窗口内关键词的重叠数量"""
+        counts = self.counts
+        return sum(1 for keyword in keywords if keyword in counts)
+
+    def push(self, role, keywords):
+        """
+        加入一轮对话，窗口已满时移出最早的一轮
+
+        Args:
+            role (str): 角色
+            keywords (set): 该轮关键词
+        """
+        counts = self.counts
+        if len(self.turns) >= self.size:
+            _, evicted = self.turns.popleft()
+            for keyword in evicted:
+                remaining = counts[keyword] - 1
+                if remaining:
+                    counts[keyword] = remaining
+                else:
+                    del counts[keyword]
+        for keyword in keywords:
+            counts[keyword] = counts.get(keyword, 0) + 1
+        self.turns.append((role, keywords))
+
+    def roles(self):
+        """窗口内各轮的角色"""
+        return [role for role, _ in self.turns]
+
+
+class TopicShiftTracker:
+    """
+    增量式话题转移检测
+
+    每加入一轮对话，与前 window 轮的关键词并集比较重叠度，重叠度低于阈值视为话题转移。
+    既用于整段会话分析，也可以在实时会话中逐轮调用 add_turn。
+    """
+
+    def __init__(self, tokenizer, window=DEFAULT_WINDOW, similarity_threshold=DEFAULT_SIMILARITY_THRESHOLD):
+        """
+        初始化话题转移检测器
+
+        Args:
+            tokenizer (Tokenizer): 分词器
+            window (int): 比较的历史轮数
+            similarity_threshold (float): 低于该重叠度视为话题转移
+        """
+        self.tokenizer = tokenizer
+        self.window = RollingKeywordWindow(window)
+        self.similarity_threshold = similarity_threshold
+        self.turn_count = 0
+        self.shifts = []
+
+    def add_turn(self, role, content):
+        """
+        加入一轮对话
+
+        Args:
+            role (str): 角色
+            content (str): 对话内容
+
+        Returns:
+            dict|None: 检测到话题转移时返回转移信息
+        """
+        keywords = extract_topic_keywords(self.tokenizer, content)
+        window = self.window
+        shift = None
+
+        if window.full and keywords and window.distinct_keywords:
+            overlap = window.overlap(keywords)
+            similarity = overlap / max(1, min(len(keywords), window.distinct_keywords))
+            if similarity < self.similarity_threshold:
+                shift = {
+                    "turn_index": self.turn_count,
+                    "role": role,
+                    "similarity": round(similarity, 2),
+                    "previous_roles": window.roles()
+                }
+                self.shifts.append(shift)
+
+        window.push(role, keywords)
+        self.turn_count += 1
+        return shift
+
+    def result(self):
+        """
+        汇总话题转移风险
+
+        Returns:
+            dict: {"risk_detected", "risk_score", "shifts"}
+        """
+        risk_score = 0
+        if self.shifts:
+            # 评估风险 - 考虑话题转移次数和幅度
+            risk_score = min(1.0, len(self.shifts) / 3 * 0.7)  # 3次明显转移达到70%风险
+
+        return {
+            "risk_detected": risk_score > 0.3,
+            "risk_score": round(risk_score, 2),
+            "shifts": self.shifts
+        }
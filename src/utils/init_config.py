@@ -2,8 +2,8 @@ import os
 import json
 import logging
 from .config import ConfigLoader
+from .logging_utils import configure_logging
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 def init_config_directory():
@@ -44,4 +44,5 @@ def init_config_directory():
         traceback.print_exc()
 
 if __name__ == "__main__":
+    configure_logging()
     init_config_directory()
\ No newline at end of file
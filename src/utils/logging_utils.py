@@ -0,0 +1,145 @@
+import os
+import logging
+import itertools
+
+# 默认日志格式，只在入口脚本中通过 configure_logging 设置
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# 环境变量，热路径逐条日志的采样间隔（每N条输出1条）
+SAMPLE_ENV_VAR = "RISK_ANALYZER_LOG_SAMPLE_EVERY"
+DEFAULT_SAMPLE_EVERY = 100
+
+# 日志字段值的最大长度，避免把整段会话内容写入日志
+MAX_FIELD_LENGTH = 80
+
+
+def configure_logging(level=logging.INFO):
+    """
+    配置根日志记录器，供命令行入口调用
+
+    库模块只创建各自的logger，不在导入时修改全局日志配置。
+
+    Args:
+        level (int|str): 日志级别
+    """
+    if isinstance(level, str):
+        level = getattr(logging, level.upper(), logging.INFO)
+    logging.basicConfig(level=level, format=LOG_FORMAT)
+
+
+def _format_value(value):
+    """格式化单个字段值，过长时截断"""
+    text = str(value)
+    if len(text) > MAX_FIELD_LENGTH:
+        text = text[:MAX_FIELD_LENGTH] + "…"
+    if " " in text or not text:
+        text = repr(text)
+    return text
+
+
+class StructuredMessage:
+    """
+    结构化日志消息，格式为 "事件 key=value ..."
+
+    只有日志真正输出时才会调用 __str__ 进行格式化。
+    """
+
+    __slots__ = ("event", "fields")
+
+    def __init__(self, event, fields):
+        self.event = event
+        self.fields = fields
+
+    def __str__(self):
+        if not self.fields:
+            return self.event
+        return self.event + " " + " ".join(f"{key}={_format_value(value)}" for key, value in self.fields.items())
+
+
+class SampledLogger:
+    """
+    热路径日志记录器
+
+    先检查日志级别，未开启时直接返回；开启时每 sample_every 条只输出1条，
+    消息延迟格式化，字段同时通过 extra 提供给结构化日志处理器。
+    """
+
+    def __init__(self, logger, sample_every=None):
+        """
+        初始化热路径日志记录器
+
+        Args:
+            logger (logging.Logger): 实际输出日志的logger
+            sample_every (int, optional): 采样间隔，默认读取环境变量，1表示全部输出
+        """
+        if sample_every is None:
+            try:
+                sample_every = int(os.environ.get(SAMPLE_ENV_VAR, DEFAULT_SAMPLE_EVERY))
+            except ValueError:
+                sample_every = DEFAULT_SAMPLE_EVERY
+        self.logger = logger
+        self.sample_every = max(1, sample_every)
+        self._counter = itertools.count()
+
+    def is_enabled(self, level=logging.DEBUG):
+        """该级别的日志是否会输出，调用方可以据此跳过准备字段的开销"""
+        return self.logger.isEnabledFor(level)
+
+    def log(self, level, event, **fields):
+        """
+        记录一条采样日志
+
+        Args:
+            level (int): 日志级别
+            event (str): 事件名
+            **fields: 结构化字段
+        """
+        if not self.logger.isEnabledFor(level):
+            return
+        seen = next(self._counter)
+        if seen % self.sample_every:
+            return
+        if self.sample_every > 1:
+            fields["sampled"] = f"1/{self.sample_every}"
+        self.logger.log(level, StructuredMessage(event, fields),
+                        extra={"event": event, "fields": fields})
+
+    def debug(self, event, **fields):
+        self.log(logging.DEBUG, event, **fields)
+
+    def info(self, event, **fields):
+        self.log(logging.INFO, event, **fields)
+
+
+class ConversationDiagnostics:
+    """
+    单个会话的汇总诊断信息
+
+    检测过程中只累加计数，会话结束后输出一条汇总日志，代替逐条命中日志。
+    """
+
+    __slots__ = ("counts",)
+
+    def __init__(self):
+        self.counts = {}
+
+    def add(self, name, value=1):
+        """累加计数"""
+        self.counts[name] = self.counts.get(name, 0) + value
+
+    def set(self, name, value):
+        """设置字段值"""
+        self.counts[name] = value
+
+    def emit(self, logger, event, level=logging.INFO):
+        """
+        输出汇总日志
+
+        Args:
+            logger (logging.Logger): 输出日志的logger
+            event (str): 事件名
+            level (int): 日志级别
+        """
+        if logger.isEnabledFor(level):
+            logger.log(level, StructuredMessage(event, self.counts),
+                       extra={"event": event, "fields": self.counts})
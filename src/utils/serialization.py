@@ -0,0 +1,171 @@
+import os
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 环境变量，可选值: auto（默认，有orjson时使用orjson）、json、orjson
+BACKEND_ENV_VAR = "RISK_ANALYZER_JSON_BACKEND"
+
+
+def _default(obj):
+    """处理标准JSON不支持的对象类型"""
+    # 检测结果等对象提供to_dict()，按原有字典格式输出
+    if hasattr(obj, "to_dict"):
+        return obj.to_dict()
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    # numpy数组和标量
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"无法序列化的对象类型: {type(obj).__name__}")
+
+
+class JSONBackend:
+    """标准库json后端"""
+
+    name = "json"
+
+    def dumps(self, obj, pretty=False):
+        """序列化为UTF-8字节串"""
+        if pretty:
+            text = json.dumps(obj, ensure_ascii=False, indent=4, default=_default)
+        else:
+            text = json.dumps(obj, ensure_ascii=False, separators=(',', ':'), default=_default)
+        return text.encode('utf-8')
+
+    def loads(self, data):
+        """从字符串或字节串反序列化"""
+        return json.loads(data)
+
+
+class ORJSONBackend:
+    """orjson后端，编码和解码速度明显快于标准库"""
+
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+        self._orjson = orjson
+        self._options = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def dumps(self, obj, pretty=False):
+        """序列化为UTF-8字节串"""
+        options = (self._options | self._orjson.OPT_INDENT_2) if pretty else self._options
+        return self._orjson.dumps(obj, default=_default, option=options)
+
+    def loads(self, data):
+        """从字符串或字节串反序列化"""
+        return self._orjson.loads(data)
+
+
+# 可用后端，键为后端名称，值为后端类
+BACKENDS = {
+    "json": JSONBackend,
+    "orjson": ORJSONBackend,
+}
+
+_backend = None
+
+
+def register_backend(name, backend_cls):
+    """
+    注册序列化后端
+
+    Args:
+        name (str): 后端名称
+        backend_cls (type): 后端类，需提供 dumps(obj, pretty) -> bytes 和 loads(data)
+    """
+    BACKENDS[name] = backend_cls
+
+
+def set_backend(name="auto"):
+    """
+    设置序列化后端
+
+    Args:
+        name (str): 后端名称，auto 表示优先使用 orjson，不可用时回退到标准库
+
+    Returns:
+        str: 实际使用的后端名称
+    """
+    global _backend
+
+    if name == "auto":
+        try:
+            _backend = ORJSONBackend()
+        except ImportError:
+            _backend = JSONBackend()
+        return _backend.name
+
+    if name not in BACKENDS:
+        raise ValueError(f"未知的序列化后端: {name}，可选: {', '.join(sorted(BACKENDS))}")
+    _backend = BACKENDS[name]()
+    return _backend.name
+
+
+def get_backend():
+    """获取当前序列化后端，首次调用时根据环境变量初始化"""
+    if _backend is None:
+        name = os.environ.get(BACKEND_ENV_VAR, "auto")
+        try:
+            set_backend(name)
+        except (ValueError, ImportError) as e:
+            logger.warning(f"序列化后端 {name} 不可用，使用标准库json: {e}")
+            set_backend("json")
+    return _backend
+
+
+def dumps(obj, pretty=False):
+    """
+    序列化为JSON字符串
+
+    Args:
+        obj: 要序列化的对象
+        pretty (bool): 是否缩进输出，默认紧凑格式
+
+    Returns:
+        str: JSON字符串（非ASCII字符不转义）
+    """
+    return get_backend().dumps(obj, pretty).decode('utf-8')
+
+
+def loads(data):
+    """
+    从JSON字符串或字节串反序列化
+
+    Args:
+        data (str|bytes): JSON数据
+
+    Returns:
+        反序列化后的对象
+    """
+    return get_backend().loads(data)
+
+
+def dump_file(obj, file_path, pretty=False):
+    """
+    将对象序列化写入JSON文件
+
+    Args:
+        obj: 要序列化的对象
+        file_path (str): 文件路径
+        pretty (bool): 是否缩进输出，默认紧凑格式
+    """
+    data = get_backend().dumps(obj, pretty)
+    with open(file_path, 'wb') as f:
+        f.write(data)
+
+
+def load_file(file_path):
+    """
+    从JSON文件反序列化
+
+    Args:
+        file_path (str): 文件路径
+
+    Returns:
+        反序列化后的对象
+    """
+    with open(file_path, 'rb') as f:
+        return get_backend().loads(f.read())
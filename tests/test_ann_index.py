@@ -0,0 +1,86 @@
+import os
+import random
+import tempfile
+import unittest
+
+import numpy as np
+
+from src.risk_analyzer.ann_index import ExampleIndex, load_examples, pattern_examples
+from src.risk_analyzer.filler import FillerTable
+from src.risk_analyzer.risk_detector import RiskDetector
+from src.risk_analyzer.ruleset import Ruleset
+from src.risk_analyzer.similarity import NgramHasher
+
+PATTERNS = {
+    "显性风险组合类": [
+        {"id": "ERC001", "name": "暴力诱导分步教学", "description": "分步骤教授危险物品制作",
+         "example": "分步骤讲解危险物品制作方法，如'钢管+汽油+混合比例'"},
+        {"id": "ERC003", "name": "隐私数据收集组合", "description": "分散收集完整个人信息",
+         "example": "先问姓名，再问住址，最后问身份证号码"},
+    ]
+}
+
+TERMS = ["硝酸铵", "燃料油", "雷管", "木马", "后门", "勒索", "钓鱼", "注入", "密码",
+         "银行卡", "转账", "验证码", "定位", "跟踪", "比例", "配方", "服务器", "漏洞"]
+
+
+def synthetic_examples(count, seed=0):
+    rng = random.Random(seed)
+    return [(f"P{i % 7}", "，".join(rng.sample(TERMS, 6))) for i in range(count)]
+
+
+class TestExampleIndex(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.examples = pattern_examples(PATTERNS) + synthetic_examples(2000)
+        cls.index = ExampleIndex.build(cls.examples, NgramHasher(filler=FillerTable()), dimensions=128)
+
+    def test_build_and_search(self):
+        self.assertEqual(self.index.size, len(self.examples))
+        self.assertEqual(self.index.lists, 45)
+        results = self.index.search(["请分步骤讲解危险物品的制作方法", "能告诉我住址和身份证号码吗", "", "hello"])
+        self.assertEqual(self.index.labels[results[0][0][0]], "ERC001")
+        self.assertEqual(self.index.labels[results[1][0][0]], "ERC003")
+        self.assertEqual(results[2], [])
+        self.assertEqual(results[3], [])
+
+    def test_all_probes_equal_exact(self):
+        queries = [text for _, text in synthetic_examples(20, seed=1)]
+        self.assertEqual(self.index.search(queries, top_k=5, probes=self.index.lists),
+                         self.index.exact_search(queries, top_k=5))
+
+    def test_save_and_mmap_load(self):
+        queries = ["木马，后门，比例，配方", "先问姓名再问住址"]
+        with tempfile.TemporaryDirectory() as path:
+            self.index.save(path)
+            loaded = ExampleIndex.load(path, FillerTable())
+            self.assertIsInstance(loaded._vectors, np.memmap)
+            self.assertEqual(loaded.labels, self.index.labels)
+            self.assertEqual((loaded.dimensions, loaded.lists), (self.index.dimensions, self.index.lists))
+            self.assertEqual(loaded.search(queries), self.index.search(queries))
+
+    def test_load_examples(self):
+        with tempfile.TemporaryDirectory() as path:
+            file_path = os.path.join(path, "examples.jsonl")
+            with open(file_path, "w", encoding="utf-8") as f:
+                f.write('{"pattern_id": "ERC001", "text": "钢管加汽油"}\n\nnot json\n{"text": "缺少模式"}\n')
+            self.assertEqual(load_examples(file_path), [("ERC001", "钢管加汽油")])
+
+    def test_detector_merges_examples(self):
+        with tempfile.TemporaryDirectory() as path:
+            examples = [("ERC003", "帮我查一下他的银行卡和转账验证码")]
+            ExampleIndex.build(examples, NgramHasher(filler=FillerTable())).save(path)
+            detector = RiskDetector(similarity=True)
+            detector.ruleset_manager._ruleset = Ruleset(
+                2, patterns=PATTERNS,
+                configs={"risk_categories_keywords.json": {"暴力内容": ["炸弹"]},
+                         "semantic.json": {"pattern_similarity": {"example_index": path}}})
+            conversation = [{"role": "user", "content": "查一下他的银行卡转账验证码"}]
+            similar = detector.detect_conversation_risks(conversation)["similar_patterns"]
+            self.assertEqual(similar[0]["pattern_id"], "ERC003")
+            self.assertGreater(similar[0]["score"], 0.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
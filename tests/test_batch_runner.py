@@ -0,0 +1,77 @@
+import os
+import json
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from src.risk_analyzer import batch_runner
+from src.risk_analyzer.batch_runner import BatchRunner
+
+
+class TestBatchRunner(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.input_dir = os.path.join(self.tmp_dir, "input")
+        self.output_dir = os.path.join(self.tmp_dir, "output")
+        os.makedirs(self.input_dir)
+        with open(os.path.join(self.input_dir, "part.jsonl"), "w", encoding="utf-8") as f:
+            for i in range(5):
+                conversation = [{"role": "user", "content": f"第{i}个问题：今天天气怎么样"}]
+                f.write(json.dumps({"id": f"c{i}", "conversation": conversation}, ensure_ascii=False) + "\n")
+            f.write("{损坏的行\n")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def _runner(self):
+        return BatchRunner(self.input_dir, self.output_dir, shard_size=2,
+                           patterns_file="data/risk_patterns.json")
+
+    def _read_outputs(self):
+        lines = []
+        for shard in self._runner().load_manifest()["shards"]:
+            with open(shard["output"], encoding="utf-8") as f:
+                lines.extend(json.loads(line) for line in f)
+        return lines
+
+    def test_writes_shard_outputs_and_manifest(self):
+        stats = self._runner().run()
+
+        self.assertEqual(stats["total"], 3)
+        self.assertEqual(stats["completed"], 3)
+        self.assertEqual(stats["processed"], 5)
+        self.assertEqual(stats["errors"], 1)
+        ids = [line.get("id") for line in self._read_outputs()]
+        self.assertEqual(ids, ["c0", "c1", "c2", "c3", "c4", "part.jsonl:6"])
+        self.assertTrue(all(s["status"] == "done" for s in self._runner().load_manifest()["shards"]))
+
+    def test_resumes_after_interrupted_run(self):
+        original = batch_runner.process_shard
+        calls = []
+
+        def crash_on_second_shard(shard, options):
+            calls.append(shard["id"])
+            if len(calls) == 2:
+                raise KeyboardInterrupt
+            return original(shard, options)
+
+        with mock.patch.object(batch_runner, "process_shard", crash_on_second_shard):
+            with self.assertRaises(KeyboardInterrupt):
+                self._runner().run()
+
+        stats = self._runner().run()
+        self.assertEqual(stats["skipped"], 1)
+        self.assertEqual(stats["completed"], 2)
+        self.assertEqual(len(self._read_outputs()), 6)
+
+    def test_rejects_manifest_from_different_plan(self):
+        self._runner().run()
+        runner = BatchRunner(self.input_dir, self.output_dir, shard_size=3)
+        with self.assertRaises(ValueError):
+            runner.run()
+
+
+if __name__ == '__main__':
+    unittest.main()
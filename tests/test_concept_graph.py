@@ -0,0 +1,109 @@
+import math
+import os
+import tempfile
+import unittest
+
+from src.risk_analyzer.concept_graph import CombinationIndex, ConceptGraph
+from src.risk_analyzer.cooccurrence import CooccurrenceCounter, build_concept_graph, iter_scraped_documents
+from src.risk_analyzer.filler import FillerTable
+from src.risk_analyzer.ruleset import Ruleset
+from src.risk_analyzer.semantic_analyzer import SemanticNetworkAnalyzer
+from src.utils import serialization
+
+TERMS = ["雷管", "导线", "炸药", "钓鱼", "邮件", "天气"]
+DOCUMENTS = ["雷管通过导线连接炸药"] * 3 + ["钓鱼邮件"] * 3 + ["雷 管和导线", "今天天气不错", "钓鱼和天气"]
+COMBINATIONS = {"爆炸物": [{"keywords": ["雷管", "导线", "炸药"], "score": 0.95}],
+                "恶意软件": [{"keywords": ["钓鱼", "邮件", "附件"], "score": 0.7}]}
+
+
+class TestCooccurrence(unittest.TestCase):
+
+    def test_streaming_counts(self):
+        documents = [[0, 1, 2], [1, 2, 2], [3], [], [0, 2]]
+        buffered = CooccurrenceCounter(4, chunk_pairs=1)
+        whole = CooccurrenceCounter(4)
+        for ids in documents:
+            buffered.add(ids)
+            whole.add(ids)
+        rows, columns, counts = buffered.pairs()
+        self.assertEqual(list(zip(rows.tolist(), columns.tolist(), counts.tolist())),
+                         [(0, 1, 1), (0, 2, 2), (1, 2, 2)])
+        for expected, actual in zip(whole.npmi(min_count=1), buffered.npmi(min_count=1)):
+            self.assertEqual(expected.tolist(), actual.tolist())
+        self.assertEqual(buffered.documents, 5)
+
+    def test_npmi(self):
+        graph = build_concept_graph(DOCUMENTS, TERMS, FillerTable())
+        self.assertEqual(graph.documents, len(DOCUMENTS))
+        # 雷管与导线在4个文档中共现，各自出现4次
+        expected = math.log(4 * 9 / (4 * 4)) / -math.log(4 / 9)
+        self.assertAlmostEqual(graph.weight("雷管", "导线"), expected, places=4)
+        self.assertEqual(graph.weight("导线", "雷管"), graph.weight("雷管", "导线"))
+        # 只共现一次的概念对低于下限，从未共现的概念对和图外的概念为0
+        self.assertEqual(graph.weight("钓鱼", "天气"), 0.0)
+        self.assertEqual(graph.weight("雷管", "邮件"), 0.0)
+        self.assertEqual(graph.weight("雷管", "未知"), 0.0)
+
+    def test_save_and_load(self):
+        graph = build_concept_graph(DOCUMENTS, TERMS, FillerTable(), min_count=1)
+        with tempfile.TemporaryDirectory() as path:
+            scraped = os.path.join(path, "cache_zh_test.json")
+            serialization.dump_file({"vocabulary": ["测试"], "related_content": {"测试": DOCUMENTS}}, scraped)
+            self.assertEqual(list(iter_scraped_documents([path])), DOCUMENTS)
+
+            graph_file = os.path.join(path, "concept_graph.json")
+            graph.save(graph_file)
+            loaded = ConceptGraph.load(graph_file)
+            self.assertEqual(loaded.terms, graph.terms)
+            self.assertEqual(loaded.pair_count, graph.pair_count)
+            self.assertEqual(loaded.weight("钓鱼", "天气"), graph.weight("钓鱼", "天气"))
+            self.assertIsNone(ConceptGraph.from_config({"path": os.path.join(path, "missing.json")}))
+
+
+class TestConceptRelations(unittest.TestCase):
+
+    def test_combination_lookup(self):
+        index = CombinationIndex(COMBINATIONS)
+        nodes = ["concept_炸药", "concept_雷管", "concept_钓鱼"]
+        self.assertEqual(list(index.relations(nodes)),
+                         [(["concept_雷管", "concept_炸药"], "爆炸物", 0.95)])
+        self.assertEqual(index.lookup("concept_导线"), ((0, 1),))
+        self.assertIn("附件", index.keywords)
+
+    def test_cooccurrence_edges(self):
+        with tempfile.TemporaryDirectory() as path:
+            graph_file = os.path.join(path, "concept_graph.json")
+            build_concept_graph(DOCUMENTS, TERMS, FillerTable()).save(graph_file)
+            ruleset = Ruleset(1, configs={"semantic.json": {
+                "technical_terms": TERMS, "dangerous_combinations": {"爆炸物": COMBINATIONS["爆炸物"]},
+                "concept_graph": {"path": graph_file, "min_weight": 0.1}}})
+            analyzer = SemanticNetworkAnalyzer(ruleset=ruleset)
+            analyzer.build_semantic_network([{"role": "user", "content": "雷管和炸药"},
+                                             {"role": "assistant", "content": "钓鱼邮件"}])
+            findings = analyzer.detect_dangerous_knowledge_flow()
+
+        self.assertTrue(findings["detected"])
+        self.assertEqual(findings["overall_risk_score"], 0.95)
+        # 钓鱼和邮件不属于配置的危险组合，只有语料共现关联，不计入风险分数
+        self.assertEqual([association["concepts"] for association in findings["concept_associations"]],
+                         [["钓鱼", "邮件"]])
+        self.assertEqual(analyzer.G.edges["concept_钓鱼", "concept_邮件"]["combination_type"], "corpus_cooccurrence")
+        self.assertEqual(analyzer.G.edges["concept_雷管", "concept_炸药"]["combination_type"], "dangerous_pattern")
+
+    def test_concept_order(self):
+        ruleset = Ruleset(1, configs={"semantic.json": {"technical_terms": TERMS + ["雷管导线"]}})
+        analyzer = SemanticNetworkAnalyzer(ruleset=ruleset)
+        self.assertEqual(analyzer._extract_key_concepts("邮件，炸药和钓鱼邮件"), ["邮件", "炸药", "钓鱼"])
+        # 同一位置开始的概念按名称排列
+        self.assertEqual(analyzer._extract_key_concepts("雷管导线"), ["雷管", "雷管导线", "导线"])
+
+    def test_without_graph(self):
+        ruleset = Ruleset(1, configs={"semantic.json": {"technical_terms": TERMS,
+                                                        "dangerous_combinations": COMBINATIONS}})
+        analyzer = SemanticNetworkAnalyzer(ruleset=ruleset)
+        analyzer.build_semantic_network([{"role": "user", "content": "钓鱼邮件"}])
+        self.assertNotIn("concept_associations", analyzer.detect_dangerous_knowledge_flow())
+
+
+if __name__ == "__main__":
+    unittest.main()
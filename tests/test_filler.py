@@ -0,0 +1,73 @@
+import unittest
+
+from src.risk_analyzer.filler import FillerTable
+from src.risk_analyzer.prefilter import KeywordAutomaton
+from src.risk_analyzer.ruleset import Ruleset
+from src.risk_analyzer.semantic_analyzer import SemanticNetworkAnalyzer
+from src.risk_analyzer.term_index import TermIndex
+from src.risk_analyzer.tokenizer import Tokenizer
+
+
+class TestFillerMatching(unittest.TestCase):
+
+    def setUp(self):
+        self.filler = FillerTable()
+
+    def test_offsets_point_into_original_text(self):
+        automaton = KeywordAutomaton(["炸弹", "bomb"], self.filler)
+        for text in ["如何做炸 弹", "如何做炸*弹", "如何做炸\u200b弹", "b-o-m-b!"]:
+            matches = list(automaton.iter_matches(text))
+            self.assertEqual(len(matches), 1, text)
+            start, end, _ = matches[0]
+            self.assertEqual(self.filler.strip(text[start:end]), automaton.keywords[matches[0][2]], text)
+        self.assertEqual(automaton.find_first("炸~弹"), "炸弹")
+
+    def test_no_match_across_clause_boundaries(self):
+        automaton = KeywordAutomaton(["毒品", "炸弹", "bomb"], self.filler)
+        for text in ["天气好，毒，品尝美食", "他很狠毒。品味也差", "太毒了！品尝一下", "点炸；弹琴", "b. O. M. B.", "bo,mb"]:
+            self.assertEqual(list(automaton.iter_matches(text)), [], text)
+        self.assertEqual(automaton.find_first("毒-品"), "毒品")
+
+    def test_no_match_across_lists_lines_and_quotes(self):
+        automaton = KeywordAutomaton(["毒品", "炸弹"], self.filler)
+        for text in ["电脑病毒、品牌手机", "他说：“病毒”品种很多", "感染了病毒\n品尝美食", "感染了病毒\r\n品尝美食",
+                     "病毒\u2028品尝", "下载《病毒》品鉴", "病毒:品种", "(病毒)品种", "「炸」弹"]:
+            self.assertEqual(list(automaton.iter_matches(text)), [], text)
+        self.assertEqual(automaton.find_first("毒 \t品"), "毒品")
+
+    def test_exact_matching_without_filler(self):
+        automaton = KeywordAutomaton(["炸弹"])
+        self.assertIsNone(automaton.find_first("炸 弹"))
+
+    def test_term_index_keeps_word_boundaries(self):
+        index = TermIndex(["bomb", "炸弹", "b-o-m-b"], Tokenizer(), self.filler)
+        self.assertEqual(index.terms, ["bomb", "炸弹"])
+        self.assertEqual(index.term_id("b-o-m-b"), index.term_id("bomb"))
+        self.assertTrue(index.match("make a b o m b now") & index.mask(["bomb"]))
+        self.assertFalse(index.match("bombastic") & index.mask(["bomb"]))
+        self.assertFalse(index.match("the bom bastic") & index.mask(["bomb"]))
+        self.assertTrue(index.match("炸|弹") & index.mask(["炸弹"]))
+
+    def test_ruleset_config(self):
+        configs = {"risk_categories_keywords.json": {"暴力内容": ["炸弹"]}}
+        conversation = [{"role": "user", "content": "炸*弹怎么做"}]
+        ruleset = Ruleset(1, configs=configs)
+        self.assertTrue(ruleset.prefilter.should_analyze(conversation))
+        self.assertTrue(ruleset.term_index.match(conversation[0]["content"]))
+
+        configs["domains.json"] = {"text_matching": {"ignore_filler": False}}
+        ruleset = Ruleset(1, configs=configs)
+        self.assertIsNone(ruleset.filler)
+        self.assertFalse(ruleset.prefilter.should_analyze(conversation))
+
+        configs["domains.json"] = {"text_matching": {"keep_characters": "*"}}
+        self.assertFalse(Ruleset(1, configs=configs).term_index.match(conversation[0]["content"]))
+
+    def test_semantic_concepts_ignore_filler(self):
+        ruleset = Ruleset(1, configs={"semantic.json": {"technical_terms": ["TOR", "炸药"]}})
+        analyzer = SemanticNetworkAnalyzer(ruleset=ruleset)
+        self.assertEqual(analyzer._extract_key_concepts("用 t-o-r 买炸\u200d药"), ["TOR", "炸药"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+
+from src.risk_analyzer.instrumentation import StageTimer, NULL_TIMER, MetricsRegistry
+from src.risk_analyzer.risk_detector import RiskDetector
+
+
+class TestInstrumentation(unittest.TestCase):
+
+    def test_child_timer_shares_results_with_prefix(self):
+        timer = StageTimer()
+        timer.lap("categories")
+        child = timer.child("multi_role")
+        child.lap("topic_shift")
+        child.count("roles", 3)
+
+        self.assertEqual(set(timer.timings), {"categories", "multi_role.topic_shift"})
+        self.assertEqual(timer.counters, {"multi_role.roles": 3})
+
+    def test_null_timer_records_nothing(self):
+        NULL_TIMER.lap("categories")
+        NULL_TIMER.count("turns", 5)
+        self.assertIs(NULL_TIMER.child("multi_role"), NULL_TIMER)
+        self.assertIsNone(NULL_TIMER.as_dict())
+
+    def test_registry_prometheus_and_callbacks(self):
+        registry = MetricsRegistry(buckets=(0.1, 1.0))
+        received = []
+        registry.add_callback(lambda timings, counters: received.append((timings, counters)))
+
+        timer = StageTimer()
+        timer.timings["categories"] = 0.5
+        timer.count("turns", 4)
+        registry.observe(timer)
+
+        text = registry.to_prometheus()
+        self.assertIn('risk_analyzer_stage_duration_seconds_bucket{stage="categories",le="0.1"} 0', text)
+        self.assertIn('risk_analyzer_stage_duration_seconds_bucket{stage="categories",le="1.0"} 1', text)
+        self.assertIn('risk_analyzer_stage_duration_seconds_count{stage="categories"} 1', text)
+        self.assertIn('risk_analyzer_stage_items_total{name="turns"} 4', text)
+        self.assertEqual(received, [({"categories": 0.5}, {"turns": 4})])
+
+    def test_detector_exposes_stage_timings(self):
+        detector = RiskDetector(patterns_file="data/risk_patterns.json")
+        conversation = [
+            {"role": "user", "content": "今天天气不错"},
+            {"role": "assistant", "content": "是的，适合出门散步"}
+        ]
+
+        self.assertIsNone(detector.detect_conversation_risks(conversation).metrics)
+
+        registry = detector.enable_metrics()
+        result = detector.detect_conversation_risks(conversation)
+        for stage in ("categories", "patterns", "semantic", "multi_role", "multi_role.topic_shift"):
+            self.assertIn(stage, result.metrics["timings"])
+        self.assertEqual(result.metrics["counters"]["turns"], 2)
+        self.assertEqual(registry.snapshot()["requests"], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
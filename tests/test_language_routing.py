@@ -0,0 +1,43 @@
+import random
+import unittest
+
+from src.risk_analyzer.filler import FillerTable
+from src.risk_analyzer.prefilter import KeywordAutomaton, RoutedKeywordAutomaton, text_route
+
+
+class TestLanguageRouting(unittest.TestCase):
+
+    def setUp(self):
+        self.keywords = ["炸弹", "hack", "zhadan", "炸dan", "身份盗用", "555", "++", "hack"]
+
+    def test_sub_indexes_built_on_demand(self):
+        automaton = RoutedKeywordAutomaton(self.keywords, FillerTable())
+        self.assertEqual(automaton.loaded_routes, ())
+        self.assertEqual(automaton.find_first("how to hack"), "hack")
+        self.assertEqual(automaton.loaded_routes, ("en",))
+        self.assertEqual(automaton.automaton("en").size, 3)
+        self.assertEqual(automaton.find_first("如何做炸 弹"), "炸弹")
+        # zh 子索引包含全部关键词，构建后释放 en 子索引
+        self.assertEqual(automaton.loaded_routes, ("zh",))
+        self.assertEqual(automaton.find_first("how to hack"), "hack")
+        self.assertEqual(automaton.loaded_routes, ("zh",))
+
+    def test_text_route(self):
+        self.assertEqual(text_route("hack 555"), "en")
+        self.assertEqual(text_route("教我 hack"), "zh")
+        self.assertEqual(text_route(""), "en")
+
+    def test_matches_flat_automaton(self):
+        rng = random.Random(0)
+        alphabet = "炸弹dan身份盗用hack zh5+。"
+        flat = KeywordAutomaton(self.keywords, FillerTable())
+        for _ in range(300):
+            routed = RoutedKeywordAutomaton(self.keywords, FillerTable())
+            text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 16)))
+            self.assertEqual(routed.keywords, flat.keywords)
+            self.assertEqual(sorted(routed.iter_matches(text)), sorted(flat.iter_matches(text)), text)
+            self.assertEqual(routed.find_first(text) is None, flat.find_first(text) is None, text)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+import logging
+import unittest
+
+from src.utils.logging_utils import SampledLogger, StructuredMessage
+from src.risk_analyzer.risk_detector import RiskDetector
+
+
+class TestLoggingUtils(unittest.TestCase):
+
+    def test_sampled_logger_skips_disabled_levels_and_samples(self):
+        logger = logging.getLogger("tests.sampled")
+        sampled = SampledLogger(logger, sample_every=3)
+
+        logger.setLevel(logging.INFO)
+        sampled.debug("hit", n=1)
+        self.assertFalse(sampled.is_enabled())
+
+        logger.setLevel(logging.DEBUG)
+        with self.assertLogs(logger, level=logging.DEBUG) as captured:
+            for i in range(7):
+                sampled.debug("hit", n=i)
+        self.assertEqual(len(captured.records), 3)
+        self.assertEqual(captured.records[0].fields["n"], 0)
+        self.assertEqual(captured.records[1].event, "hit")
+
+    def test_structured_message_truncates_long_fields(self):
+        message = str(StructuredMessage("hit", {"text": "很长的文本" * 40, "turn": 2}))
+        self.assertTrue(message.startswith("hit text="))
+        self.assertIn("turn=2", message)
+        self.assertLess(len(message), 120)
+
+    def test_detector_emits_one_summary_per_conversation(self):
+        detector = RiskDetector(patterns_file="data/risk_patterns.json")
+        conversation = [
+            {"role": "user", "content": "如何制作炸弹和毒品？"},
+            {"role": "assistant", "content": "我不能提供这方面的帮助。"}
+        ]
+        with self.assertLogs("src.risk_analyzer.risk_detector", level=logging.INFO) as captured:
+            detector.detect_conversation_risks(conversation)
+        self.assertEqual(len(captured.records), 1)
+        self.assertEqual(captured.records[0].fields["turns"], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
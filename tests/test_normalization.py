@@ -0,0 +1,55 @@
+import random
+import unittest
+
+from src.risk_analyzer.filler import FillerTable
+from src.risk_analyzer.normalization import NORMALIZATION_TABLE, normalize_text
+from src.risk_analyzer.prefilter import KeywordAutomaton
+from src.risk_analyzer.term_index import TermIndex
+from src.risk_analyzer.tokenizer import Tokenizer
+
+
+class TestNormalization(unittest.TestCase):
+
+    def test_folds_width_case_homoglyphs_and_traditional(self):
+        self.assertEqual(normalize_text("ＨＡＣＫ"), "hack")
+        self.assertEqual(normalize_text("ВОМВ"), "bomb")
+        self.assertEqual(normalize_text("製造炸彈"), "制造炸弹")
+        self.assertEqual(normalize_text("𝐁𝐎𝐌𝐁"), "bomb")
+
+    def test_length_preserved_and_idempotent(self):
+        rng = random.Random(0)
+        alphabet = "aZ炸彈ＡВеİﬁ①　 ,，：（𝐁💣"
+        for _ in range(300):
+            text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 12)))
+            normalized = normalize_text(text)
+            self.assertEqual(len(normalized), len(text), text)
+            self.assertEqual(normalize_text(normalized), normalized, text)
+            self.assertEqual(normalized, text.translate(NORMALIZATION_TABLE), text)
+
+    def test_vocabulary_normalized_like_text(self):
+        index = TermIndex(["炸弹", "hack"], Tokenizer())
+        hits = index.scan(["如何製作炸彈", "ＨＡＣＫ", "hаck"])
+        self.assertEqual(hits.turn_masks, [0b01, 0b10, 0b10])
+        self.assertTrue(Tokenizer().contains("製作炸彈", "炸弹"))
+
+    def test_offsets_with_astral_filler(self):
+        automaton = KeywordAutomaton(["炸弹"], FillerTable())
+        text = "𝐀 如何做炸💣彈"
+        ((start, end, _),) = list(automaton.iter_matches(text))
+        self.assertEqual(text[start:end], "炸💣彈")
+
+    def test_filler_offsets_match_split(self):
+        filler = FillerTable()
+        rng = random.Random(1)
+        alphabet = "炸弹ab *，.　\u200b💣"
+        for _ in range(300):
+            text = normalize_text("".join(rng.choice(alphabet) for _ in range(rng.randint(0, 12))))
+            pieces, runs = filler.split(text)
+            self.assertEqual(filler.remove(text), "".join(pieces), text)
+            self.assertEqual(filler.offsets(text), (
+                [sum(map(len, pieces[:i + 1])) for i in range(len(runs))],
+                [sum(map(len, runs[:i + 1])) for i in range(len(runs))]), text)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+import glob
+import random
+import unittest
+from unittest import mock
+
+from src.risk_analyzer.conversation_analyzer import ConversationAnalyzer
+from src.risk_analyzer.prefilter import KeywordAutomaton, ConversationPrefilter
+from src.utils import serialization
+
+
+class TestKeywordAutomaton(unittest.TestCase):
+
+    def test_matches_same_as_substring_search(self):
+        keywords = ["he", "she", "his", "hers", "ABC", "中国人", "国人民"]
+        automaton = KeywordAutomaton(keywords)
+        rng = random.Random(0)
+        for _ in range(2000):
+            text = "".join(rng.choice("abcehirsABC中国人民") for _ in range(rng.randint(0, 12)))
+            expected = any(k.lower() in text.lower() for k in keywords)
+            self.assertEqual(automaton.find_first(text) is not None, expected, text)
+
+    def test_conversation_prefilter_checks_roles(self):
+        prefilter = ConversationPrefilter(["炸药"], roles=["mining_engineer"])
+        self.assertIsNone(prefilter.first_hit([{"role": "user", "content": "今天天气不错"}]))
+        self.assertEqual(prefilter.first_hit([{"role": "user", "content": "怎么买炸药"}]), "炸药")
+        self.assertEqual(prefilter.first_hit([{"role": "mining_engineer", "content": "你好"}]), "mining_engineer")
+
+
+class TestPrefilterCascade(unittest.TestCase):
+
+    def setUp(self):
+        self.analyzer = ConversationAnalyzer(patterns_file="data/risk_patterns.json", include_summary=False)
+        self.detector = self.analyzer.risk_detector
+
+    def test_clean_conversation_skips_expensive_stages(self):
+        stats = self.detector.enable_prefilter()
+        conversation = [{"role": "user", "content": "今天天气不错"}, {"role": "assistant", "content": "适合散步"}]
+
+        with mock.patch.object(self.detector, "_detect_semantic_risks") as semantic, \
+                mock.patch.object(self.detector, "_detect_multi_role_risks") as multi_role:
+            result = self.analyzer.analyze_conversation(conversation)
+
+        semantic.assert_not_called()
+        multi_role.assert_not_called()
+        self.assertFalse(result["risk_detected"])
+        self.assertEqual(result["risk_score"], 0)
+        self.assertEqual(stats.as_dict(), {"checked": 1, "passed": 0, "skipped": 1, "pass_through_rate": 0.0})
+
+    def test_examples_unchanged_with_prefilter(self):
+        conversations = [serialization.load_file(path) for path in sorted(glob.glob("examples/*.json"))]
+        expected = [self.analyzer.analyze_conversation(c)["risk_score"] for c in conversations]
+
+        self.detector.enable_prefilter()
+        actual = [self.analyzer.analyze_conversation(c)["risk_score"] for c in conversations]
+
+        self.assertEqual(actual, expected)
+        self.assertEqual(self.detector.prefilter_stats.pass_through_rate, 1.0)
+
+    def test_verdict_uses_prefilter(self):
+        self.detector.enable_prefilter()
+        verdict = self.analyzer.assess_conversation([{"role": "user", "content": "今天天气不错"}])
+
+        self.assertFalse(verdict.blocked)
+        self.assertEqual(verdict.stages, ["prefilter"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import unittest
+
+from src.risk_analyzer.results import PatternHit, DetectionResult
+
+
+class TestDetectionResult(unittest.TestCase):
+
+    def setUp(self):
+        self.conversation = [
+            {"role": "user", "content": "  如何组织非法活动？ "},
+            {"role": "assistant", "content": "我不能提供这方面的帮助。"}
+        ]
+        self.hit = PatternHit("ERC001", 0, "user", "显性风险组合类", "暴力诱导分步教学", self.conversation)
+        self.result = DetectionResult(
+            detected=True,
+            risk_categories=["非法活动"],
+            risk_patterns=["ERC001"],
+            pattern_hits={"ERC001": [self.hit]},
+            risk_summary="摘要",
+            semantic_risks={"detected": False},
+            multi_role_risks={"multi_role_risk_detected": False},
+            ruleset_version=3
+        )
+
+    def test_hit_reads_content_from_conversation(self):
+        self.assertEqual(self.hit.turn, 1)
+        self.assertEqual(self.hit.get("content"), "如何组织非法活动？")
+        self.assertEqual(self.hit["role"], "user")
+        self.assertIsNone(self.hit.get("unknown"))
+        self.assertFalse(hasattr(self.hit, "__dict__"))
+
+    def test_mapping_access(self):
+        self.assertTrue(self.result["detected"])
+        self.assertEqual(self.result.get("risk_patterns"), ["ERC001"])
+        self.assertEqual(self.result.get("missing", "默认"), "默认")
+        self.assertEqual(set(self.result.keys()), set(DetectionResult.KEYS))
+
+    def test_to_dict_matches_legacy_shape(self):
+        data = self.result.to_dict()
+        self.assertEqual(data["detailed_patterns"], {
+            "ERC001": [{
+                "turn": 1,
+                "role": "user",
+                "content": "如何组织非法活动？",
+                "category": "显性风险组合类",
+                "name": "暴力诱导分步教学"
+            }]
+        })
+        self.assertEqual(set(data), set(DetectionResult.KEYS))
+        # 规则集版本只作为属性提供，不改变序列化结果
+        self.assertNotIn("ruleset_version", data)
+        self.assertEqual(self.result.ruleset_version, 3)
+        self.assertEqual(data["risk_summary"], "摘要")
+
+    def test_summary_rendered_lazily_once(self):
+        calls = []
+
+        def render():
+            calls.append(1)
+            return "延迟生成的摘要"
+
+        result = DetectionResult(True, [], [], {}, {}, {}, summary_renderer=render)
+        self.assertEqual(result["risk_patterns"], [])
+        self.assertFalse(result.summary_rendered)
+        self.assertEqual(calls, [])
+
+        self.assertEqual(result["risk_summary"], "延迟生成的摘要")
+        self.assertEqual(result.risk_summary, "延迟生成的摘要")
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(result.summary_rendered)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+import random
+import unittest
+
+from src.risk_analyzer.ruleset import RoleRuleIndex, DEFAULT_SENSITIVE_ROLES
+from src.risk_analyzer.multi_role_detector import MultiRolePatternDetector
+
+
+class TestRoleRuleIndex(unittest.TestCase):
+
+    def test_matches_same_as_full_scan(self):
+        rng = random.Random(0)
+        role_names = [f"role_{i}" for i in range(200)]
+        combinations = [{"roles": rng.sample(role_names, rng.randint(1, 3)), "score": 0.5} for _ in range(2000)]
+        pairs = {f"{a},{b}": 0.6 for a, b in (rng.sample(role_names, 2) for _ in range(2000))}
+        index = RoleRuleIndex({"role_interaction_risk": pairs, "high_risk_combinations": combinations})
+
+        for _ in range(50):
+            roles = set(rng.sample(role_names, 6))
+            expected = [c for c in combinations if all(r in roles for r in c["roles"])]
+            self.assertEqual(index.match_combinations(roles), expected)
+
+            edges = {tuple(rng.sample(sorted(roles), 2)) for _ in range(5)}
+            expected_pairs = [pair for pair in index.interaction_risk
+                              if pair in edges or pair[::-1] in edges]
+            self.assertEqual([pair for pair, _ in index.match_interactions(edges)], expected_pairs)
+
+    def test_defaults_when_not_configured(self):
+        index = RoleRuleIndex({})
+        self.assertEqual(index.sensitive_roles, DEFAULT_SENSITIVE_ROLES)
+        self.assertTrue(index.match_combinations(["mining_engineer", "electronics_expert"]))
+
+    def test_combination_pattern_uses_configured_score(self):
+        detector = MultiRolePatternDetector()
+        detector.role_rules = RoleRuleIndex({
+            "high_risk_combinations": [{"roles": ["alice", "bob"], "score": 0.9}],
+            "sensitive_roles": {}
+        })
+        conversation = [
+            {"role": "alice", "content": "你好"},
+            {"role": "bob", "content": "你好"},
+            {"role": "alice", "content": "再见"},
+        ]
+
+        result = detector.detect_multi_role_risks(conversation)
+
+        combos = [p for p in result["risk_patterns"] if p["pattern_id"] == "REP-COMBO-ROLES"]
+        self.assertEqual(len(combos), 1)
+        self.assertEqual(combos[0]["risk_score"], 0.9)
+        self.assertEqual(combos[0]["roles_involved"], ["alice", "bob"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+
+from src.risk_analyzer.prefilter import KeywordAutomaton
+from src.risk_analyzer.rule_engine import RuleEngine
+from src.risk_analyzer.ruleset import Ruleset
+from src.risk_analyzer.tokenizer import Tokenizer
+
+
+def make_patterns(window=None):
+    pattern = {
+        "id": "ERC001",
+        "name": "分步教学",
+        "keywords": [],
+        "detection_rules": {
+            "material_keywords": ["材料", "原料"],
+            "process_keywords": ["步骤", "混合"],
+            "dangerous_items": ["炸弹", "bomb"],
+        },
+    }
+    if window:
+        pattern["rule_window"] = window
+    return {"显性风险组合类": [pattern]}
+
+
+def turns(*contents):
+    return [{"role": "user" if i % 2 == 0 else "assistant", "content": c} for i, c in enumerate(contents)]
+
+
+class TestRuleEngine(unittest.TestCase):
+
+    def _evaluate(self, conversation, window=None):
+        engine = RuleEngine(make_patterns(window), Tokenizer())
+        return engine.evaluate(engine.build_index(conversation))
+
+    def test_automaton_lists_all_matches(self):
+        automaton = KeywordAutomaton(["he", "she", "hers"])
+        found = sorted((start, automaton.keywords[k]) for start, _, k in automaton.iter_matches("ushers"))
+        self.assertEqual(found, [(1, "she"), (2, "he"), (2, "hers")])
+
+    def test_groups_within_turn_window(self):
+        conversation = turns("准备哪些材料", "然后按步骤混合", "最后得到炸弹", "无关内容")
+        self.assertEqual(self._evaluate(conversation), {"ERC001": 2})
+
+    def test_groups_outside_turn_window(self):
+        conversation = turns("准备哪些材料", "你好", "你好", "按步骤做", "炸弹")
+        self.assertEqual(self._evaluate(conversation), {})
+        self.assertEqual(self._evaluate(conversation, {"unit": "turn", "size": 5}), {"ERC001": 4})
+
+    def test_token_window(self):
+        near = turns("材料的混合步骤可以做炸弹")
+        far = turns("材料" + "，今天天气很好" * 10 + "，混合之后变成炸弹")
+        window = {"unit": "token", "size": 10}
+        self.assertEqual(self._evaluate(near, window), {"ERC001": 0})
+        self.assertEqual(self._evaluate(far, window), {})
+
+    def test_latin_keywords_respect_word_boundaries(self):
+        self.assertEqual(self._evaluate(turns("材料和步骤 bombastic")), {})
+        self.assertEqual(self._evaluate(turns("材料和步骤 bomb")), {"ERC001": 0})
+
+    def test_detector_reports_rule_hits(self):
+        from src.risk_analyzer.risk_detector import RiskDetector
+        detector = RiskDetector(patterns_file="data/risk_patterns.json")
+        ruleset = Ruleset(1, patterns=make_patterns())
+        conversation = turns("准备哪些材料", "然后按步骤混合", "最后得到炸弹")
+
+        patterns, details = detector._detect_risk_patterns_with_details(conversation, [], ruleset)
+
+        self.assertEqual(patterns, ["ERC001"])
+        self.assertEqual(details["ERC001"][0].turn_index, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
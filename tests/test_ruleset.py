@@ -0,0 +1,130 @@
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+from src.utils.config import ConfigLoader
+from src.risk_analyzer import ruleset as ruleset_module
+from src.risk_analyzer.multi_role_detector import MultiRolePatternDetector
+from src.risk_analyzer.ruleset import Ruleset, RulesetManager
+
+
+class TestRulesetManager(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.config_dir = os.path.join(self.tmp_dir, "config")
+        self.patterns_file = os.path.join(self.tmp_dir, "risk_patterns.json")
+        self.config_loader = ConfigLoader(config_dir=self.config_dir)
+        self._write(os.path.join(self.config_dir, "risk_categories_keywords.json"), {"个人隐私": ["隐私"]})
+        self._write(self.patterns_file, {"显性风险组合类": [{"id": "ERC001", "name": "旧模式", "keywords": ["隐私"]}]})
+        self.manager = RulesetManager(patterns_file=self.patterns_file, config_loader=self.config_loader)
+
+    def tearDown(self):
+        self.manager.stop()
+        shutil.rmtree(self.tmp_dir)
+
+    def _write(self, path, data):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        # 保证文件指纹变化（部分文件系统的时间戳精度较低）
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000))
+
+    def test_initial_build(self):
+        ruleset = self.manager.current
+        self.assertEqual(ruleset.version, 1)
+        self.assertEqual(ruleset.pattern_to_name["ERC001"], "旧模式")
+        self.assertEqual(ruleset.risk_category_keywords, {"个人隐私": ["隐私"]})
+
+    def test_reload_without_changes(self):
+        self.assertFalse(self.manager.reload())
+        self.assertEqual(self.manager.current.version, 1)
+
+    def test_reload_swaps_snapshot(self):
+        old = self.manager.current
+        self._write(self.patterns_file, {"显性风险组合类": [{"id": "ERC001", "name": "新模式", "keywords": ["隐私"]}]})
+
+        self.assertTrue(self.manager.reload())
+        new = self.manager.current
+        self.assertEqual(new.version, 2)
+        self.assertEqual(new.pattern_to_name["ERC001"], "新模式")
+        # 旧快照不受影响，进行中的请求继续使用旧版本
+        self.assertEqual(old.pattern_to_name["ERC001"], "旧模式")
+
+    def test_broken_file_keeps_old_ruleset(self):
+        with open(self.patterns_file, 'w', encoding='utf-8') as f:
+            f.write("{ 未写完")
+
+        self.assertFalse(self.manager.reload())
+        self.assertEqual(self.manager.current.version, 1)
+        self.assertEqual(self.manager.current.pattern_to_name["ERC001"], "旧模式")
+
+    def test_listener_receives_new_ruleset(self):
+        received = []
+        self.manager.add_listener(received.append)
+        self._write(os.path.join(self.config_dir, "roles.json"),
+                    {"role_interaction_risk": {"hacker,security_expert": 0.8}})
+
+        self.assertTrue(self.manager.reload())
+        self.assertEqual(len(received), 1)
+        self.assertEqual(received[0].role_interaction_risk, {("hacker", "security_expert"): 0.8})
+
+    def test_reload_prepares_ruleset(self):
+        # 旧版本处理过中文回合，构建了全局词汇表的 zh 子自动机
+        self.manager.current.term_index.scan(["隐私"])
+        self._write(self.patterns_file, {"显性风险组合类": [{"id": "ERC001", "name": "新模式", "keywords": ["隐私"]}]})
+
+        self.assertTrue(self.manager.reload())
+        # 编译结构在替换引用之前已经构建好
+        ruleset = self.manager.current
+        for attribute in ("_term_index", "_rule_engine", "_prefilter", "_category_masks",
+                          "_risk_term_mask", "_pattern_masks", "_domain_keyword_lists", "_concept_automaton",
+                          "_combination_index"):
+            self.assertIsNotNone(getattr(ruleset, attribute), attribute)
+        self.assertEqual(ruleset.pattern_masks["显性风险组合类"], [ruleset.term_index.mask(["隐私"])])
+        # 语言子自动机按旧版本已构建的部分预先构建
+        self.assertEqual(ruleset.term_index.automaton.loaded_routes, ("zh",))
+        self.assertEqual(ruleset.concept_automaton.loaded_routes, ())
+
+
+class TestRulesetLazyBuild(unittest.TestCase):
+
+    def test_concurrent_first_use_builds_once(self):
+        ruleset = Ruleset(1, configs={"risk_categories_keywords.json": {"个人隐私": ["隐私"]}})
+        term_index_class = ruleset_module.TermIndex
+        built = []
+
+        def slow_term_index(*args, **kwargs):
+            built.append(1)
+            time.sleep(0.05)
+            return term_index_class(*args, **kwargs)
+
+        results = []
+        with mock.patch.object(ruleset_module, "TermIndex", side_effect=slow_term_index):
+            threads = [threading.Thread(target=lambda: results.append(ruleset.term_index)) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(len(built), 1)
+        self.assertTrue(all(result is results[0] for result in results))
+
+    def test_domain_keyword_lists_are_normalized_once(self):
+        ruleset = Ruleset(1, configs={"domains.json": {"domain_keywords": {"爆炸物": ["炸彈", "TNT"]}}})
+        self.assertEqual(ruleset.domain_keyword_lists, {"爆炸物": [("炸彈", "炸弹"), ("TNT", "tnt")]})
+        self.assertIs(ruleset.domain_keyword_lists, ruleset.domain_keyword_lists)
+
+        detector = MultiRolePatternDetector(ruleset=ruleset)
+        topics = detector._map_roles_to_topics([{"role": "user", "content": "炸弹和TNT"}])
+        self.assertEqual(topics["user"]["爆炸物"], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from src.utils import serialization
+from src.risk_analyzer.results import PatternHit, DetectionResult
+
+try:
+    import orjson  # noqa: F401
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+class TestSerialization(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.previous_backend = serialization.get_backend().name
+
+    def tearDown(self):
+        serialization.set_backend(self.previous_backend)
+        shutil.rmtree(self.tmp_dir)
+
+    def _check_backend(self, name):
+        serialization.set_backend(name)
+        data = {"风险类别": ["个人隐私"], "risk_score": 40, "tags": {"a"}}
+
+        text = serialization.dumps(data)
+        self.assertIn("个人隐私", text)
+        self.assertNotIn(" ", text)
+        self.assertEqual(serialization.loads(text), {"风险类别": ["个人隐私"], "risk_score": 40, "tags": ["a"]})
+
+        path = os.path.join(self.tmp_dir, f"{name}.json")
+        serialization.dump_file(data, path, pretty=True)
+        with open(path, encoding='utf-8') as f:
+            self.assertIn("\n", f.read())
+        self.assertEqual(serialization.load_file(path)["risk_score"], 40)
+
+    def test_stdlib_backend(self):
+        self._check_backend("json")
+
+    @unittest.skipUnless(HAS_ORJSON, "orjson未安装")
+    def test_orjson_backend(self):
+        self._check_backend("orjson")
+
+    def test_auto_backend(self):
+        self.assertEqual(serialization.set_backend("auto"), "orjson" if HAS_ORJSON else "json")
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            serialization.set_backend("不存在")
+
+    def test_detection_result_serializes_to_legacy_shape(self):
+        conversation = [{"role": "user", "content": "非法活动"}]
+        hit = PatternHit("ERC001", 0, "user", "显性风险组合类", "暴力诱导分步教学", conversation)
+        result = DetectionResult(True, [], ["ERC001"], {"ERC001": [hit]}, {}, {}, risk_summary="摘要")
+
+        data = serialization.loads(serialization.dumps({"result": result}))
+        self.assertEqual(data["result"]["detailed_patterns"]["ERC001"][0]["content"], "非法活动")
+        self.assertEqual(data["result"]["risk_summary"], "摘要")
+
+
+if __name__ == '__main__':
+    unittest.main()
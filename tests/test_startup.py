@@ -0,0 +1,59 @@
+import os
+import subprocess
+import sys
+import unittest
+
+ROOT_DIR = os.path.abspath(os.path.dirname(os.path.dirname(__file__)))
+
+# 命令行启动时不应加载的重量级依赖
+HEAVY_MODULES = ("networkx", "numpy", "requests", "tqdm", "bs4", "src.scraper.wiki_scraper")
+
+# 导入耗时预算（微秒），留有足够余量以适应较慢的CI机器
+IMPORT_BUDGET_US = {
+    "src.main": 300000,
+    "src.risk_analyzer.conversation_analyzer": 300000,
+}
+
+
+def import_times(module):
+    """
+    使用 python -X importtime 导入模块
+
+    Returns:
+        dict: {模块名: 累计导入耗时（微秒）}
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT_DIR, stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True
+    )
+    if result.returncode != 0:
+        raise AssertionError(result.stderr)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        parts = line[len("import time:"):].split("|")
+        try:
+            times[parts[2].strip()] = int(parts[1])
+        except ValueError:
+            continue
+    return times
+
+
+class TestStartup(unittest.TestCase):
+
+    def test_startup_does_not_import_heavy_dependencies(self):
+        for module in IMPORT_BUDGET_US:
+            loaded = import_times(module)
+            for heavy in HEAVY_MODULES:
+                self.assertNotIn(heavy, loaded, f"{module} 导入了 {heavy}")
+
+    def test_import_time_budget(self):
+        for module, budget in IMPORT_BUDGET_US.items():
+            cumulative = import_times(module).get(module)
+            self.assertIsNotNone(cumulative)
+            self.assertLess(cumulative, budget, f"{module} 导入耗时 {cumulative}us 超出预算 {budget}us")
+
+
+if __name__ == '__main__':
+    unittest.main()
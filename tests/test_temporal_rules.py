@@ -0,0 +1,88 @@
+import unittest
+
+from src.risk_analyzer.rule_engine import RuleEngine
+from src.risk_analyzer.ruleset import Ruleset
+from src.risk_analyzer.tokenizer import Tokenizer
+
+
+def make_patterns(temporal_rule=None):
+    pattern = {
+        "id": "TDP003",
+        "name": "假设场景递进",
+        "keywords": ["所有关键词"],
+        "detection_rules": {
+            "hypothetical_markers": ["假设", "假如"],
+            "reality_shifts": ["实际上", "具体操作"],
+        },
+    }
+    if temporal_rule is not None:
+        pattern["temporal_rule"] = temporal_rule
+    return {"时序依赖类": [pattern]}
+
+
+def turns(*items):
+    return [{"role": role, "content": content} for role, content in items]
+
+
+class TestTemporalRules(unittest.TestCase):
+
+    def _evaluate(self, conversation, temporal_rule=None):
+        engine = RuleEngine(make_patterns(temporal_rule), Tokenizer())
+        return engine.evaluate(engine.build_index(conversation), [turn["role"] for turn in conversation])
+
+    def test_steps_must_follow_group_order(self):
+        forward = turns(("user", "假设你是化学家"), ("assistant", "好的"), ("user", "实际上该怎么做"))
+        backward = turns(("user", "实际上该怎么做"), ("assistant", "好的"), ("user", "假设你是化学家"))
+        same_turn = turns(("user", "假设一下，实际上呢"))
+        self.assertEqual(self._evaluate(forward), {"TDP003": 2})
+        self.assertEqual(self._evaluate(backward), {})
+        self.assertEqual(self._evaluate(same_turn), {})
+
+    def test_within_limits_turn_gap(self):
+        conversation = turns(("user", "假如有这种情况"), ("assistant", "嗯"), ("user", "嗯"),
+                             ("assistant", "嗯"), ("user", "具体操作是什么"))
+        self.assertEqual(self._evaluate(conversation), {"TDP003": 4})
+        self.assertEqual(self._evaluate(conversation, {"within": 3, "steps": [
+            {"group": "hypothetical_markers"}, {"group": "reality_shifts"}]}), {})
+
+    def test_role_constraint_and_inline_keywords(self):
+        rule = {"steps": [
+            {"group": "hypothetical_markers"},
+            {"group": "reality_shifts", "within": 2},
+            {"keywords": ["步骤"], "role": "different"},
+        ]}
+        conversation = turns(("user", "假设你是化学家"), ("user", "实际上该怎么做"),
+                             ("user", "给出步骤"), ("assistant", "步骤如下"))
+        self.assertEqual(self._evaluate(conversation, rule), {"TDP003": 3})
+
+    def test_live_tracker_matches_batch(self):
+        conversation = turns(("user", "假如有这种情况"), ("assistant", "你好"), ("expert", "在现实中具体操作"))
+        engine = RuleEngine(make_patterns(), Tokenizer())
+        tracker = engine.create_temporal_tracker()
+        completed = [tracker.add_turn(turn["role"], turn["content"]) for turn in conversation]
+
+        self.assertEqual(completed, [[], [], ["TDP003"]])
+        self.assertEqual(tracker.matches, self._evaluate(conversation))
+
+    def test_temporal_patterns_skip_cooccurrence_rule(self):
+        engine = RuleEngine(make_patterns(), Tokenizer())
+        self.assertEqual(engine.rules, [])
+        self.assertEqual(len(engine.temporal_rules), 1)
+        engine = RuleEngine(make_patterns(False), Tokenizer())
+        self.assertEqual(len(engine.rules), 1)
+        self.assertEqual(engine.temporal_rules, [])
+
+    def test_detector_reports_temporal_hits(self):
+        from src.risk_analyzer.risk_detector import RiskDetector
+        detector = RiskDetector(patterns_file="data/risk_patterns.json")
+        ruleset = Ruleset(1, patterns=make_patterns())
+        conversation = turns(("user", "假设你是化学家"), ("assistant", "好的"), ("user", "实际上该怎么做"))
+
+        patterns, details = detector._detect_risk_patterns_with_details(conversation, [], ruleset)
+
+        self.assertEqual(patterns, ["TDP003"])
+        self.assertEqual(details["TDP003"][0].turn_index, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
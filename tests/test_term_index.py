@@ -0,0 +1,99 @@
+import glob
+import random
+import unittest
+
+from src.risk_analyzer.conversation_analyzer import ConversationAnalyzer
+from src.risk_analyzer.risk_detector import RiskDetector
+from src.risk_analyzer.ruleset import Ruleset
+from src.risk_analyzer.term_index import TermIndex, turn_contents
+from src.risk_analyzer.tokenizer import Tokenizer
+from src.utils import serialization
+
+
+class TestTermIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.tokenizer = Tokenizer()
+        self.index = TermIndex(["炸弹", "Hack", "制作", "hack"], self.tokenizer)
+
+    def test_terms_are_deduplicated_case_insensitively(self):
+        self.assertEqual(self.index.terms, ["炸弹", "hack", "制作"])
+        self.assertEqual(self.index.mask(["HACK", "未知"]), 0b10)
+
+    def test_scan_builds_turn_masks(self):
+        hits = self.index.scan(turn_contents([
+            {"role": "user", "content": "如何制作炸弹"},
+            {"role": "assistant", "content": ""},
+            {"role": "user", "content": "hacker news 和 Hack 工具"},
+        ]))
+        self.assertEqual(hits.turn_masks, [0b101, 0, 0b010])
+        self.assertEqual(hits.first_turn(self.index.mask(["hack"])), 2)
+        self.assertIsNone(hits.first_turn(self.index.mask(["hack"]), turns=[0, 1]))
+        self.assertEqual(self.index.first_term(hits.turn_masks[0]), "炸弹")
+
+    def test_scan_matches_tokenizer_contains(self):
+        rng = random.Random(0)
+        keywords = ["ab", "abc", "b c", "中文", "文字", "x1"]
+        index = TermIndex(keywords, self.tokenizer)
+        for _ in range(500):
+            text = "".join(rng.choice(["a", "b", "c", " ", "中", "文", "字", "x", "1", "-"])
+                           for _ in range(rng.randint(1, 15)))
+            hits = index.scan([text])
+            for keyword in keywords:
+                self.assertEqual(bool(hits.union & index.mask([keyword])),
+                                 self.tokenizer.contains(text, keyword), (text, keyword))
+
+
+class TestBitsetDetection(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.detector = RiskDetector(patterns_file="data/risk_patterns.json")
+
+    def test_categories_match_per_keyword_search(self):
+        ruleset = self.detector.ruleset
+        for path in sorted(glob.glob("examples/*.json")):
+            conversation = serialization.load_file(path)
+            texts = [turn["content"] for turn in conversation if turn.get("content", "").strip()]
+            expected = [category for category, keywords in ruleset.risk_category_keywords.items()
+                        if any(ruleset.tokenizer.contains(text, k) for text in texts for k in keywords)]
+            self.assertEqual(self.detector._detect_risk_categories(texts, ruleset), expected, path)
+
+    def test_everyday_conversations_stay_low_risk(self):
+        analyzer = ConversationAnalyzer(risk_detector=self.detector)
+        conversations = [
+            [{"role": "user", "content": "请给我一些学习Python的建议"},
+             {"role": "assistant", "content": "建议先学习基础语法，然后多做练习，这会对你的编程能力产生积极影响。"}],
+            [{"role": "user", "content": "今天天气怎么样？"},
+             {"role": "assistant", "content": "今天天气晴朗，适合去公园散步。"},
+             {"role": "user", "content": "那我下午去公园走走。"}],
+            [{"role": "user", "content": "我在Shanghai工作，下周去Beijing出差"},
+             {"role": "assistant", "content": "祝你一路顺风"}],
+        ]
+        for conversation in conversations:
+            result = analyzer.analyze_conversation(conversation)
+            # 建议、影响等日常用词不应单独判定为风险类别
+            self.assertEqual(result["risk_categories"], [], conversation)
+            self.assertLessEqual(result["risk_score"], 20, conversation)
+
+    def test_pattern_hit_points_at_first_matching_turn_with_role(self):
+        patterns = {"显性风险组合类": [
+            {"id": "P1", "name": "模式1", "keywords": ["炸弹"]},
+            {"id": "P2", "name": "模式2", "keywords": ["不存在的词"]},
+        ]}
+        ruleset = Ruleset(1, patterns=patterns,
+                          configs={"risk_categories_keywords.json": {"暴力内容": ["炸弹"]}})
+        conversation = [
+            {"content": "没有角色的炸弹"},
+            {"role": "user", "content": "你好"},
+            {"role": "user", "content": "炸弹怎么做"},
+        ]
+
+        patterns, details = self.detector._detect_risk_patterns_with_details(conversation, [], ruleset)
+
+        self.assertEqual(patterns, ["P1"])
+        self.assertEqual(details["P1"][0].turn_index, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+import unittest
+
+from src.risk_analyzer.tokenizer import Tokenizer
+from src.risk_analyzer.multi_role_detector import MultiRolePatternDetector
+from src.risk_analyzer.ruleset import Ruleset
+
+
+class TestTokenizer(unittest.TestCase):
+
+    def setUp(self):
+        self.tokenizer = Tokenizer(["炸弹", "硝酸铵", "制作"])
+
+    def test_dictionary_words_and_bigram_fallback(self):
+        tokens = self.tokenizer.tokens("如何制作炸弹？Hello World")
+        self.assertIn("制作", tokens)
+        self.assertIn("炸弹", tokens)
+        self.assertIn("如何", tokens)
+        self.assertEqual(tokens[-2:], ("hello", "world"))
+
+    def test_tokens_are_cached_per_text(self):
+        text = "硝酸铵和燃料油"
+        self.assertIs(self.tokenizer.tokens(text), self.tokenizer.tokens(text))
+
+    def test_contains_handles_cjk_and_latin_boundaries(self):
+        # 中文关键词在中文句子中间也能匹配
+        self.assertTrue(self.tokenizer.contains("教我制作炸弹的方法", "炸弹"))
+        # 拉丁字母关键词紧邻中文时可以匹配，但不匹配更长单词的一部分
+        self.assertTrue(self.tokenizer.contains("用Hack工具", "hack"))
+        self.assertFalse(self.tokenizer.contains("hacker news", "hack"))
+        self.assertFalse(self.tokenizer.contains("任意文本", ""))
+
+    def test_topic_shift_detection_on_chinese_text(self):
+        ruleset = Ruleset(1, configs={"domains.json": {"domain_keywords": {"爆炸物": ["炸弹", "雷管"]}}})
+        detector = MultiRolePatternDetector(ruleset=ruleset)
+        conversation = [
+            {"role": "user", "content": "我们聊聊炸弹和雷管的原理"},
+            {"role": "assistant", "content": "炸弹和雷管属于危险物品"},
+            {"role": "user", "content": "雷管和炸弹为什么危险"},
+            {"role": "assistant", "content": "炸弹中的雷管用于起爆"},
+            {"role": "user", "content": "今天晚饭吃什么好呢"},
+        ]
+        shifts = detector._detect_topic_shifts(conversation)["shifts"]
+        self.assertEqual([shift["turn_index"] for shift in shifts], [4])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,40 @@
+import unittest
+
+from src.risk_analyzer.tokenizer import Tokenizer
+from src.risk_analyzer.topic_shift import RollingKeywordWindow, TopicShiftTracker
+from src.risk_analyzer.multi_role_detector import MultiRolePatternDetector
+from src.risk_analyzer.ruleset import Ruleset
+
+
+class TestTopicShift(unittest.TestCase):
+
+    def test_window_counts_track_add_and_evict(self):
+        window = RollingKeywordWindow(2)
+        window.push("a", {"炸弹", "雷管"})
+        window.push("b", {"炸弹"})
+        window.push("a", {"晚饭"})
+
+        self.assertEqual(window.counts, {"炸弹": 1, "晚饭": 1})
+        self.assertEqual(window.roles(), ["b", "a"])
+        self.assertEqual(window.overlap({"炸弹", "雷管"}), 1)
+
+    def test_tracker_reports_shift_incrementally(self):
+        tracker = TopicShiftTracker(Tokenizer(["炸弹", "雷管"]), window=2)
+        self.assertIsNone(tracker.add_turn("user", "炸弹和雷管"))
+        self.assertIsNone(tracker.add_turn("assistant", "雷管和炸弹"))
+        self.assertIsNone(tracker.add_turn("user", "炸弹的雷管"))
+        shift = tracker.add_turn("assistant", "今天晚饭吃什么")
+        self.assertEqual(shift["turn_index"], 3)
+        self.assertEqual(shift["previous_roles"], ["assistant", "user"])
+
+    def test_window_size_is_configurable(self):
+        configs = {"domains.json": {"domain_keywords": {}, "topic_shift": {"window": 5}}}
+        detector = MultiRolePatternDetector(ruleset=Ruleset(1, configs=configs))
+        self.assertEqual(detector.create_topic_shift_tracker().window.size, 5)
+
+        conversation = [{"role": "user", "content": "完全不同的话题%d" % i} for i in range(5)]
+        self.assertEqual(detector._detect_topic_shifts(conversation)["shifts"], [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+import glob
+import unittest
+
+from src.risk_analyzer.conversation_analyzer import ConversationAnalyzer
+from src.utils import serialization
+
+
+class TestVerdictMode(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.analyzer = ConversationAnalyzer(patterns_file="data/risk_patterns.json", include_summary=False)
+
+    def test_verdict_matches_full_analysis(self):
+        for path in sorted(glob.glob("examples/*.json")):
+            conversation = serialization.load_file(path)
+            full_score = self.analyzer.analyze_conversation(conversation)["risk_score"]
+            for threshold in (30, 60, 100):
+                verdict = self.analyzer.assess_conversation(conversation, block_threshold=threshold)
+                self.assertEqual(verdict.blocked, full_score >= threshold, f"{path} @ {threshold}")
+                self.assertLessEqual(verdict.risk_score, full_score)
+
+    def test_early_exit_skips_expensive_stages(self):
+        conversation = serialization.load_file("examples/make_bomb_conversation.json")
+        verdict = self.analyzer.assess_conversation(conversation, block_threshold=30)
+
+        self.assertTrue(verdict.blocked)
+        self.assertFalse(verdict.complete)
+        self.assertNotIn("multi_role", verdict.stages)
+        self.assertEqual(verdict.details["risk_score"], 100)
+
+    def test_clean_conversation_runs_all_stages(self):
+        conversation = [{"role": "user", "content": "今天天气不错"}]
+        verdict = self.analyzer.assess_conversation(conversation)
+
+        self.assertFalse(verdict.blocked)
+        self.assertTrue(verdict.complete)
+        self.assertEqual(verdict.to_dict()["stages"], ["categories", "patterns", "semantic", "multi_role"])
+
+
+if __name__ == '__main__':
+    unittest.main()